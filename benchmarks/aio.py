@@ -0,0 +1,122 @@
+"""Measures the throughput of reading many small objects with :mod:`gcspathlib.aio`.
+
+Objects are served by the fake server from :mod:`gcspathlib.testing`, running in a
+separate process so that it doesn't compete with the client for the GIL.  Reads are
+timed at several :class:`gcspathlib.aio.Client` concurrency limits, and compared
+against sequential blocking reads with :mod:`urllib.request` (i.e. a new connection
+per object, as typical for ad hoc wrappers).
+
+Note that the fake server itself is the bottleneck at high concurrency, so absolute
+numbers are far below what the real API can sustain; the point is the relative cost
+of connection setup and sequential round trips.
+
+Usage::
+
+    poetry run python -m benchmarks.aio [--count 10000 --size 1024 --concurrency 8]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import subprocess
+import sys
+import time
+import urllib.request
+from collections.abc import Iterator
+from gcspathlib import PureGCSPath
+from gcspathlib._jsonapi import object_target
+from gcspathlib.aio import Client
+
+BUCKET = 'bucket'
+DEFAULT_COUNT = 10_000
+DEFAULT_SIZE = 1024
+DEFAULT_CONCURRENCIES = [1, 8, 32, 64]
+
+
+@contextlib.contextmanager
+def _fake_server() -> Iterator[str]:
+    with subprocess.Popen(
+        [sys.executable, '-m', 'gcspathlib.testing'], stdout=subprocess.PIPE, text=True
+    ) as process:
+        assert process.stdout is not None
+        try:
+            yield process.stdout.readline().strip()
+        finally:
+            process.terminate()
+
+
+def _paths(count: int) -> list[PureGCSPath]:
+    return [PureGCSPath(f'gs://{BUCKET}/objects/{i:08d}.bin') for i in range(count)]
+
+
+async def _populate(
+    url: str,
+    paths: list[PureGCSPath],
+    size: int,
+) -> None:
+    async with Client(url) as client:
+        await asyncio.gather(*(client.write(path, bytes(size)) for path in paths))
+
+
+async def _read_all(
+    url: str,
+    paths: list[PureGCSPath],
+    concurrency: int,
+) -> int:
+    async with Client(url, max_connections=concurrency) as client:
+        contents = await asyncio.gather(*(client.read(path) for path in paths))
+    return sum(map(len, contents))
+
+
+def _read_all_urllib(
+    url: str,
+    paths: list[PureGCSPath],
+) -> int:
+    total = 0
+    for path in paths:
+        target = object_target(path.bucket, path.obj, alt='media')
+        with urllib.request.urlopen(f'{url}{target}') as response:
+            total += len(response.read())
+    return total
+
+
+def _report(
+    label: str,
+    count: int,
+    total_bytes: int,
+    seconds: float,
+) -> None:
+    objects_per_s = count / seconds
+    mb_per_s = total_bytes / seconds / 1e6
+    print(f'{label:<16} {seconds:>8.2f} {objects_per_s:>10.0f} {mb_per_s:>8.2f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--concurrency', type=int, action='append')
+    parser.add_argument('--no-urllib', action='store_true', help='skip urllib baseline')
+    args = parser.parse_args()
+
+    paths = _paths(args.count)
+    with _fake_server() as url:
+        asyncio.run(_populate(url, paths, args.size))
+        print('client'.ljust(16), 's'.rjust(8), 'objects/s'.rjust(10), 'MB/s'.rjust(8))
+        if not args.no_urllib:
+            start = time.perf_counter()
+            total_bytes = _read_all_urllib(url, paths)
+            _report('urllib', args.count, total_bytes, time.perf_counter() - start)
+        for concurrency in args.concurrency or DEFAULT_CONCURRENCIES:
+            start = time.perf_counter()
+            total_bytes = asyncio.run(_read_all(url, paths, concurrency))
+            _report(
+                f'aio x{concurrency}',
+                args.count,
+                total_bytes,
+                time.perf_counter() - start,
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Measures the throughput of bulk deletes with :class:`gcspathlib.aio.BatchExecutor`.
+
+Objects are deleted from the fake server from :mod:`gcspathlib.testing` (running in a
+separate process, see :mod:`benchmarks.aio`), once with concurrent individual
+``DELETE`` requests and once with batch requests.
+
+Usage::
+
+    poetry run python -m benchmarks.batch [--count 10000]
+"""
+
+import argparse
+import asyncio
+import time
+from .aio import _fake_server
+from .aio import _paths
+from .aio import _populate
+from gcspathlib import PureGCSPath
+from gcspathlib.aio import DEFAULT_MAX_CONNECTIONS
+from gcspathlib.aio import BatchExecutor
+from gcspathlib.aio import Client
+
+DEFAULT_COUNT = 10_000
+
+
+async def _delete_all(
+    url: str,
+    paths: list[PureGCSPath],
+) -> None:
+    async with Client(url) as client:
+        await asyncio.gather(*(client.delete(path) for path in paths))
+
+
+async def _delete_all_batched(
+    url: str,
+    paths: list[PureGCSPath],
+) -> None:
+    async with Client(url) as client:
+        async for result in BatchExecutor(client).delete(paths):
+            assert result.error is None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    args = parser.parse_args()
+
+    paths = _paths(args.count)
+    with _fake_server() as url:
+        print('deletes'.ljust(16), 's'.rjust(8), 'objects/s'.rjust(10))
+        for label, delete_all in [
+            (f'individual x{DEFAULT_MAX_CONNECTIONS}', _delete_all),
+            ('batched', _delete_all_batched),
+        ]:
+            asyncio.run(_populate(url, paths, 0))
+            start = time.perf_counter()
+            asyncio.run(delete_all(url, paths))
+            seconds = time.perf_counter() - start
+            print(f'{label:<16} {seconds:>8.2f} {args.count / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import pytest
+
+BUCKET = 'bucket'
+DEPTHS = [1, 4, 16]
+
+
+def make_obj_parts(
+    depth: int,
+) -> tuple[str, ...]:
+    """Object name parts of the given depth, e.g. ``('dir1', 'dir2', 'file.txt')``."""
+    return (*(f'dir{i}' for i in range(1, depth)), 'file.txt')
+
+
+@pytest.fixture(params=DEPTHS, ids=lambda depth: f'depth{depth}')
+def depth(request: pytest.FixtureRequest) -> int:
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.fixture
+def obj_parts(depth: int) -> tuple[str, ...]:
+    return make_obj_parts(depth)
+
+
+@pytest.fixture
+def obj(obj_parts: tuple[str, ...]) -> str:
+    return '/'.join(obj_parts)
+
+
+@pytest.fixture
+def uri(obj: str) -> str:
+    return f'gs://{BUCKET}/{obj}'
+
+
+@pytest.fixture
+def posix_str(obj: str) -> str:
+    """The :class:`pathlib.PurePosixPath` baseline counterpart of :func:`uri`."""
+    return f'/{BUCKET}/{obj}'
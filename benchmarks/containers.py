@@ -0,0 +1,96 @@
+"""Compares a ``set`` of :class:`PureGCSPath` objects with :class:`gcspathlib.PathSet`.
+
+Both are built from the same synthetic ``gs://`` URIs, and then looked up with URI
+strings (as they come in, e.g. from messages or logs) and scanned for the paths under
+a prefix, twice.  The memory of each (including the strings it holds) is measured with
+:mod:`tracemalloc`.
+
+Usage::
+
+    poetry run python -m benchmarks.containers [--count 200000 --lookups 100000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from gcspathlib import PathSet
+from gcspathlib import PureGCSPath
+from typing import Any
+
+DEFAULT_COUNT = 200_000
+DEFAULT_LOOKUPS = 100_000
+
+PREFIX = 'gs://bucket/data/part=7/'
+
+
+def _uri(i: int) -> str:
+    return f'gs://bucket/data/part={i % 100}/object-{i:08d}.json'
+
+
+def _build_set(count: int) -> set[PureGCSPath]:
+    paths = {PureGCSPath(_uri(i)) for i in range(count)}
+    for path in paths:
+        hash(path)  # (cached along with the string, as in use)
+    return paths
+
+
+def _build_path_set(count: int) -> PathSet[PureGCSPath]:
+    return PathSet(_uri(i) for i in range(count))
+
+
+def _measure(build: Callable[[int], Any], count: int) -> tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        container = build(count)
+        return container, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def _time(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    parser.add_argument('--lookups', type=int, default=DEFAULT_LOOKUPS)
+    args = parser.parse_args()
+
+    paths, set_bytes = _measure(_build_set, args.count)
+    path_set, path_set_bytes = _measure(_build_path_set, args.count)
+    queries = [_uri(i * 7 % args.count) for i in range(args.lookups)]
+    print(f'{args.count} paths, {args.lookups} lookups')
+    print(
+        'container'.ljust(10),
+        'MiB'.rjust(8),
+        'lookup s'.rjust(9),
+        'scan s'.rjust(8),
+        'rescan s'.rjust(9),
+    )
+    for label, nbytes, lookup, scan in [
+        (
+            'set',
+            set_bytes,
+            lambda: sum(PureGCSPath(uri) in paths for uri in queries),
+            lambda: sorted(path for path in paths if str(path).startswith(PREFIX)),
+        ),
+        (
+            'PathSet',
+            path_set_bytes,
+            lambda: sum(uri in path_set for uri in queries),
+            lambda: list(path_set.scan(PREFIX)),
+        ),
+    ]:
+        # (The first scan of a PathSet sorts it, while later ones don't.)
+        print(
+            f'{label:<10} {nbytes / 2**20:>8.1f} {_time(lookup):>9.3f}'
+            f' {_time(scan):>8.3f} {_time(scan):>9.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
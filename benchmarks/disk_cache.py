@@ -0,0 +1,84 @@
+"""Measures repeated reads of an object through :class:`gcspathlib.DiskCache`.
+
+An object is read whole several times from an in-memory backend that sleeps for a
+fixed latency on every ranged read, standing in for the round trip to the real API -
+streamed with :func:`gcspathlib.open` (with the default read-ahead), and through a disk
+cache in a temporary directory (the first read of which is a miss).
+
+Usage::
+
+    poetry run python -m benchmarks.disk_cache [--size 64 --rounds 5]
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from gcspathlib import DEFAULT_READ_CHUNK_SIZE
+from gcspathlib import DiskCache
+from gcspathlib import PureGCSPath
+from gcspathlib import open as open_object
+from gcspathlib.testing import MemoryBackend
+
+DEFAULT_SIZE = 64  # (MiB)
+DEFAULT_ROUNDS = 5
+DEFAULT_LATENCY = 0.02
+
+
+class _SlowBackend(MemoryBackend):
+    def __init__(
+        self,
+        latency: float,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+
+    def read(
+        self,
+        path: PureGCSPath,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> memoryview:
+        time.sleep(self.latency)
+        return super().read(path, start, end, generation=generation)
+
+
+def _stream(
+    backend: _SlowBackend,
+    path: PureGCSPath,
+) -> bytes:
+    with open_object(path, 'rb', backend) as file:
+        return file.read()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY)
+    args = parser.parse_args()
+
+    backend = _SlowBackend(args.latency)
+    path = PureGCSPath('gs://bucket/weights.bin')
+    backend.write(path, bytes(args.size * 2**20))
+    print(f'{args.size} MiB in {DEFAULT_READ_CHUNK_SIZE // 2**20} MiB chunks')
+    print('read'.ljust(16), 's'.rjust(8), 'MiB/s'.rjust(10))
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskCache(directory, backend)
+        for round_ in range(args.rounds):
+            readers: list[tuple[str, Callable[[], bytes | memoryview]]] = [
+                ('stream', lambda: _stream(backend, path)),
+                ('disk cache', lambda: cache.read(path)),
+            ]
+            for label, read in readers:
+                start = time.perf_counter()
+                sum(memoryview(read())[:: 2**12].tolist())  # (touch every page)
+                seconds = time.perf_counter() - start
+                label = f'{label} #{round_ + 1}'
+                print(f'{label:<16} {seconds:>8.3f} {args.size / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
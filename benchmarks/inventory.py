@@ -0,0 +1,98 @@
+"""Measures turning inventory report shards into paths with
+:func:`gcspathlib.read_inventory`.
+
+Shards of a synthetic CSV inventory report are written to a temporary directory, and
+turned into paths (including their string representation, as when writing them out)
+by parsing a ``gs://`` URI per row with :mod:`csv` - as a baseline - and with
+:func:`gcspathlib.read_inventory_paths`, in a single process and in parallel.
+
+Usage::
+
+    poetry run python -m benchmarks.inventory [--rows 200000 --shards 4]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+from gcspathlib import PureGCSPath
+from gcspathlib import read_inventory_paths
+
+DEFAULT_ROWS = 200_000
+DEFAULT_SHARDS = 4
+
+
+def _write_shards(
+    directory: str,
+    rows: int,
+    shards: int,
+) -> list[str]:
+    filenames = []
+    for shard in range(shards):
+        filename = os.path.join(directory, f'shard-{shard}.csv')
+        with open(filename, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(['project', 'bucket', 'name', 'size', 'updated'])
+            for i in range(rows // shards):
+                writer.writerow(
+                    [
+                        'project',
+                        f'bucket-{i % 3}',
+                        f'data/part={i % 100}/shard-{shard}/object-{i}.json',
+                        '51200',
+                        '2024-01-01T00:00:00Z',
+                    ]
+                )
+        filenames.append(filename)
+    return filenames
+
+
+def _baseline(filenames: list[str]) -> int:
+    count = 0
+    for filename in filenames:
+        with open(filename, newline='', encoding='utf-8') as file:
+            rows = csv.DictReader(file)
+            for row in rows:
+                str(PureGCSPath(f'gs://{row["bucket"]}/{row["name"]}'))
+                count += 1
+    return count
+
+
+def _inventory(
+    filenames: list[str],
+    processes: int | None,
+) -> int:
+    count = 0
+    for path in read_inventory_paths(filenames, processes=processes):
+        str(path)
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--shards', type=int, default=DEFAULT_SHARDS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = _write_shards(directory, args.rows, args.shards)
+        print(f'{args.rows} rows in {args.shards} shards')
+        print('reader'.ljust(24), 's'.rjust(8), 'rows/s'.rjust(10))
+        for label, read in [
+            ('csv + parse', lambda: _baseline(filenames)),
+            ('read_inventory', lambda: _inventory(filenames, None)),
+            (
+                f'read_inventory ({args.shards} proc)',
+                lambda: _inventory(filenames, args.shards),
+            ),
+        ]:
+            start = time.perf_counter()
+            count = read()
+            seconds = time.perf_counter() - start
+            print(f'{label:<24} {seconds:>8.2f} {count / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
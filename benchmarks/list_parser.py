@@ -0,0 +1,111 @@
+"""Measures turning listing pages into paths with :class:`gcspathlib.ListPageParser`.
+
+Synthetic pages of full object resources (as returned by the JSON API) are turned into
+paths and sizes by decoding each page with :func:`json.loads` - as a baseline - and
+with :class:`gcspathlib.ListPageParser`.  The peak memory of processing a single page
+is measured with :mod:`tracemalloc`.
+
+Usage::
+
+    poetry run python -m benchmarks.list_parser [--pages 50 --page-size 1000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from gcspathlib import ListPageParser
+from gcspathlib import PureGCSPath
+
+DEFAULT_PAGES = 50
+DEFAULT_PAGE_SIZE = 1000
+
+BUCKET = PureGCSPath('gs://bucket/')
+
+
+def _page(
+    index: int,
+    size: int,
+) -> bytes:
+    items = []
+    for i in range(size):
+        name = f'data/part={i % 100}/page-{index}/object-{i}.json'
+        generation = str(1700000000000000 + i)
+        items.append(
+            {
+                'kind': 'storage#object',
+                'id': f'bucket/{name}/{generation}',
+                'selfLink': f'https://www.googleapis.com/storage/v1/b/bucket/o/{i}',
+                'mediaLink': f'https://storage.googleapis.com/download/b/bucket/o/{i}',
+                'name': name,
+                'bucket': 'bucket',
+                'generation': generation,
+                'metageneration': '1',
+                'contentType': 'application/json',
+                'storageClass': 'STANDARD',
+                'size': '51200',
+                'md5Hash': 'XUFAKrxLKna5cZ2REBfFkg==',
+                'crc32c': 'yZRlqg==',
+                'etag': 'CJjn0Z3q+4MDEAE=',
+                'timeCreated': '2024-01-01T00:00:00.000Z',
+                'updated': '2024-01-01T00:00:00.000Z',
+                'timeStorageClassUpdated': '2024-01-01T00:00:00.000Z',
+                'metadata': {'source': 'ingest', 'schema': 'v2'},
+            }
+        )
+    return json.dumps(
+        {'kind': 'storage#objects', 'nextPageToken': 'CgRmaWxl', 'items': items}
+    ).encode()
+
+
+def _baseline(page: bytes) -> int:
+    total = 0
+    for item in json.loads(page)['items']:
+        # pylint: disable-next=protected-access
+        str(BUCKET._make_child_relpath(item['name']))
+        total += int(item['size'])
+    return total
+
+
+def _parser(page: bytes) -> int:
+    total = 0
+    for path, (size,) in ListPageParser(page, BUCKET, ['size']):
+        str(path)
+        total += size
+    return total
+
+
+def _peak(
+    read: Callable[[bytes], int],
+    page: bytes,
+) -> int:
+    tracemalloc.start()
+    try:
+        read(page)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=DEFAULT_PAGES)
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+
+    pages = [_page(i, args.page_size) for i in range(args.pages)]
+    print(f'{args.pages} pages of {args.page_size} objects')
+    print('parser'.ljust(16), 's'.rjust(8), 'objects/s'.rjust(10), 'peak MiB'.rjust(9))
+    for label, read in [('json.loads', _baseline), ('ListPageParser', _parser)]:
+        start = time.perf_counter()
+        for page in pages:
+            read(page)
+        seconds = time.perf_counter() - start
+        count = args.pages * args.page_size
+        peak = _peak(read, pages[0]) / 2**20
+        print(f'{label:<16} {seconds:>8.2f} {count / seconds:>10.0f} {peak:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
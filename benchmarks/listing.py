@@ -0,0 +1,92 @@
+"""Measures the wall time of streaming listings with :func:`gcspathlib.rglob`.
+
+Objects are listed from an in-memory backend that sleeps for a fixed latency on every
+listing page, standing in for the round trip to the real API, while the caller spends
+a fixed amount of time per object.  Listings are timed without prefetching, with
+prefetching of the next page, and with sub-prefixes listed concurrently.
+
+Usage::
+
+    poetry run python -m benchmarks.listing [--count 20000 --latency 0.05]
+"""
+
+import argparse
+import time
+from gcspathlib import ListPage
+from gcspathlib import PureGCSPath
+from gcspathlib import rglob
+from gcspathlib.testing import MemoryBackend
+from typing import Any
+
+DEFAULT_COUNT = 20_000
+DEFAULT_PREFIXES = 100
+DEFAULT_LATENCY = 0.05
+DEFAULT_WORK = 20e-6
+DEFAULT_CONCURRENCIES = [4, 16]
+
+
+class _SlowBackend(MemoryBackend):
+    def __init__(
+        self,
+        latency: float,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+
+    def list_page(
+        self,
+        bucket: str,
+        **kwargs: Any,
+    ) -> ListPage:
+        time.sleep(self.latency)
+        return super().list_page(bucket, **kwargs)
+
+
+def _busy_wait(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _run(
+    backend: _SlowBackend,
+    work: float,
+    **kwargs: Any,
+) -> tuple[int, float]:
+    start = time.perf_counter()
+    count = 0
+    for _ in rglob(PureGCSPath('gs://bucket'), '*', backend, **kwargs):
+        _busy_wait(work)
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    parser.add_argument('--prefixes', type=int, default=DEFAULT_PREFIXES)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY)
+    parser.add_argument('--work', type=float, default=DEFAULT_WORK)
+    parser.add_argument('--concurrency', type=int, action='append')
+    args = parser.parse_args()
+
+    backend = _SlowBackend(args.latency)
+    for i in range(args.count):
+        backend.write(PureGCSPath(f'gs://bucket/{i % args.prefixes:04d}/{i:08d}'), b'')
+    print('listing'.ljust(16), 's'.rjust(8), 'objects/s'.rjust(10))
+    runs: list[tuple[str, dict[str, Any]]] = [
+        ('sequential', {'prefetch': False}),
+        ('prefetch', {}),
+        *(
+            (f'prefetch x{concurrency}', {'concurrency': concurrency})
+            for concurrency in args.concurrency or DEFAULT_CONCURRENCIES
+        ),
+    ]
+    for label, kwargs in runs:
+        count, seconds = _run(backend, args.work, **kwargs)
+        assert count == args.count
+        print(f'{label:<16} {seconds:>8.2f} {count / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""Measures the memory footprint of large :class:`PureGCSPath` populations.
+
+Each container kind is built from the same synthetic inventory of ``gs://`` URIs in a
+fresh subprocess, so that measurements don't interfere with each other:
+
+* ``str_list``: a ``list`` of the raw URI strings (baseline);
+* ``path_list``: a ``list`` of (lazily parsed) :class:`PureGCSPath` objects;
+* ``path_list_parsed``: same, but with ``bucket``/``obj`` accessed on each path;
+* ``path_set``: a ``set`` of :class:`PureGCSPath` objects.
+
+For each, the resident set size (RSS) growth, the :mod:`tracemalloc` bytes per path
+(in a separate run, since tracing inflates RSS), and garbage collector pause times are
+reported.
+
+Usage::
+
+    poetry run python -m benchmarks.memory [--count 1000000 --count 10000000]
+"""
+
+import argparse
+import faker
+import gc
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from collections.abc import Collection
+from collections.abc import Iterator
+from gcspathlib import PureGCSPath
+from typing import Any
+
+DEFAULT_COUNTS = [1_000_000, 10_000_000]
+SEED = 0
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, falling back to peak RSS on non-Linux platforms."""
+    rss: int
+    try:
+        with open('/proc/self/statm', encoding='ascii') as file:
+            rss = int(file.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return rss
+
+
+def generate_uris(
+    count: int,
+    seed: int = SEED,
+) -> Iterator[str]:
+    """Yields ``count`` synthetic but realistic ``gs://`` URIs.
+
+    Similar to ``PureGCSPathFactory`` in the tests - ``bucket-??????`` bucket names
+    and word-based object names with file extensions - but with shared prefixes and
+    date partitions, as found in actual bucket inventories, and fast enough to
+    generate millions of URIs.
+    """
+    rng = random.Random(seed)
+    fake = faker.Faker()
+    fake.seed_instance(seed)
+    words = fake.get_words_list()
+    extensions = ['csv', 'gz', 'jpg', 'json', 'parquet', 'png', 'txt']
+    buckets = [fake.lexify(text='bucket-??????') for _ in range(8)]
+    prefixes = ['/'.join(rng.choices(words, k=rng.randint(1, 4))) for _ in range(1_000)]
+    for i in range(count):
+        prefix = rng.choice(prefixes)
+        if rng.random() < 0.5:
+            prefix += f'/dt=2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}'
+        name = f'{rng.choice(words)}-{i:08d}.{rng.choice(extensions)}'
+        yield f'gs://{rng.choice(buckets)}/{prefix}/{name}'
+
+
+def _build_str_list(uris: Iterator[str]) -> Collection[object]:
+    return list(uris)
+
+
+def _build_path_list(uris: Iterator[str]) -> Collection[object]:
+    return [PureGCSPath(uri) for uri in uris]
+
+
+def _build_path_list_parsed(uris: Iterator[str]) -> Collection[object]:
+    paths = [PureGCSPath(uri) for uri in uris]
+    for path in paths:
+        path.bucket, path.obj  # pylint: disable=pointless-statement
+    return paths
+
+
+def _build_path_set(uris: Iterator[str]) -> Collection[object]:
+    return {PureGCSPath(uri) for uri in uris}
+
+
+BUILDERS: dict[str, Callable[[Iterator[str]], Collection[object]]] = {
+    'str_list': _build_str_list,
+    'path_list': _build_path_list,
+    'path_list_parsed': _build_path_list_parsed,
+    'path_set': _build_path_set,
+}
+
+
+def measure(
+    kind: str,
+    count: int,
+    trace: bool,
+) -> dict[str, Any]:
+    """Builds a single container and measures it; meant to run in a fresh process."""
+    builder = BUILDERS[kind]
+    pauses: list[float] = []
+    start_times: list[float] = []
+
+    def on_gc(phase: str, info: dict[str, int]) -> None:
+        del info
+        if phase == 'start':
+            start_times.append(time.perf_counter())
+        else:
+            pauses.append(time.perf_counter() - start_times.pop())
+
+    result: dict[str, Any] = {'kind': kind, 'count': count}
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+        container = builder(generate_uris(count))
+        gc.collect()
+        result['traced_bytes_per_path'] = tracemalloc.get_traced_memory()[0] / count
+        tracemalloc.stop()
+    else:
+        rss_before = _rss_bytes()
+        gc.callbacks.append(on_gc)
+        container = builder(generate_uris(count))
+        gc.callbacks.remove(on_gc)
+        result['rss_bytes_per_path'] = (_rss_bytes() - rss_before) / count
+        result['gc_pause_total_s'] = sum(pauses)
+        result['gc_pause_max_s'] = max(pauses, default=0.0)
+        start = time.perf_counter()
+        gc.collect()
+        result['full_gc_s'] = time.perf_counter() - start
+    assert len(container) == count
+    return result
+
+
+def _measure_in_subprocess(
+    kind: str,
+    count: int,
+    trace: bool,
+) -> dict[str, Any]:
+    args = [sys.executable, '-m', __spec__.name, '--child', kind, '--count', str(count)]
+    if trace:
+        args.append('--trace')
+    output = subprocess.run(args, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, action='append')
+    parser.add_argument('--kind', choices=list(BUILDERS), action='append')
+    parser.add_argument('--no-trace', action='store_true', help='skip tracemalloc runs')
+    parser.add_argument('--child', choices=list(BUILDERS), help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.count[0], args.trace)))
+        return
+
+    print(
+        'count'.rjust(10),
+        'kind'.ljust(16),
+        'rss B/path'.rjust(10),
+        'traced B/path'.rjust(13),
+        'gc total s'.rjust(10),
+        'gc max s'.rjust(9),
+        'full gc s'.rjust(9),
+    )
+    for count in args.count or DEFAULT_COUNTS:
+        for kind in args.kind or list(BUILDERS):
+            result = _measure_in_subprocess(kind, count, trace=False)
+            traced = (
+                _measure_in_subprocess(kind, count, trace=True)['traced_bytes_per_path']
+                if not args.no_trace
+                else float('nan')
+            )
+            rss = result['rss_bytes_per_path']
+            gc_total = result['gc_pause_total_s']
+            gc_max = result['gc_pause_max_s']
+            full_gc = result['full_gc_s']
+            print(
+                f'{count:>10} {kind:<16} {rss:>10.1f} {traced:>13.1f}'
+                f' {gc_total:>10.3f} {gc_max:>9.3f} {full_gc:>9.3f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
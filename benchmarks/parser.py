@@ -0,0 +1,87 @@
+"""Compares the Python 3.12+ :class:`pathlib.PurePath`-based :class:`PureGCSPath`
+against the legacy :mod:`gcspathlib._old_pathlib`-based implementation.
+
+Usage::
+
+    poetry run python -m benchmarks.parser [--number N]
+
+Only meaningful on Python 3.12+; on Python 3.11 both sides would be the legacy
+implementation.
+"""
+
+import argparse
+import gcspathlib
+import sys
+import timeit
+from collections.abc import Callable
+from gcspathlib import _old_pathlib
+from typing import Any
+
+URI = 'gs://bucket/dir1/dir2/dir3/file.txt'
+
+_gcs_flavour = gcspathlib._gcs_flavour  # pylint: disable=protected-access
+
+
+class _LegacyGCSFlavour(
+    _old_pathlib._PosixFlavour,  # type: ignore[misc,name-defined]  # pylint: disable=protected-access
+):
+    is_supported = False
+
+    def splitroot(
+        self,
+        part: str,
+        sep: str = '/',
+    ) -> tuple[str, str, str]:
+        return _gcs_flavour.splitroot(part)  # type: ignore[no-any-return,unused-ignore]
+
+
+class _LegacyPureGCSPath(
+    _old_pathlib.PurePath,  # type: ignore[misc,name-defined]
+):
+    _flavour = _LegacyGCSFlavour()
+    __slots__ = ()
+
+
+def _make_cases(
+    cls: type[Any],
+) -> dict[str, Callable[[], object]]:
+    path = cls(URI)
+    str(path)
+    hash(path)
+    return {
+        'construct': lambda: cls(URI),
+        'construct+str': lambda: str(cls(URI)),
+        'construct+hash': lambda: hash(cls(URI)),
+        'join': lambda: path / 'file2.txt',
+        'join+str': lambda: str(path / 'file2.txt'),
+        'str (cached)': lambda: str(path),
+        'hash (cached)': lambda: hash(path),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200_000)
+    args = parser.parse_args()
+
+    if sys.version_info < (3, 12):
+        sys.exit(
+            'Python 3.12+ is required to compare against the legacy implementation'
+        )
+
+    legacy_cases = _make_cases(_LegacyPureGCSPath)
+    native_cases = _make_cases(gcspathlib.PureGCSPath)
+    print('case'.ljust(16), 'legacy (ns)'.rjust(12), 'native (ns)'.rjust(12), 'speedup')
+    for name, legacy_func in legacy_cases.items():
+        legacy_ns = timeit.timeit(legacy_func, number=args.number) / args.number * 1e9
+        native_ns = (
+            timeit.timeit(native_cases[name], number=args.number) / args.number * 1e9
+        )
+        print(
+            f'{name:<16} {legacy_ns:>12.1f} {native_ns:>12.1f} '
+            f'{legacy_ns / native_ns:>7.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Measures the throughput of reading many small objects with
+:func:`gcspathlib.read_many`.
+
+Objects are read from an in-memory backend that sleeps for a fixed latency on every
+read, standing in for the round trip to the real API - one after the other, and
+through the pipeline at several concurrency limits, in and out of order.
+
+Usage::
+
+    poetry run python -m benchmarks.prefetch [--count 2000 --size 50 --latency 0.005]
+"""
+
+import argparse
+import time
+from gcspathlib import PureGCSPath
+from gcspathlib import read_many
+from gcspathlib.testing import MemoryBackend
+
+DEFAULT_COUNT = 2000
+DEFAULT_SIZE = 50  # (KiB)
+DEFAULT_LATENCY = 0.005
+DEFAULT_CONCURRENCIES = [8, 32, 128]
+
+
+class _SlowBackend(MemoryBackend):
+    def __init__(
+        self,
+        latency: float,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+
+    def read(
+        self,
+        path: PureGCSPath,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> memoryview:
+        time.sleep(self.latency)
+        return super().read(path, start, end, generation=generation)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY)
+    parser.add_argument('--concurrency', type=int, action='append')
+    args = parser.parse_args()
+
+    backend = _SlowBackend(args.latency)
+    paths = [PureGCSPath(f'gs://bucket/samples/{i}.bin') for i in range(args.count)]
+    for path in paths:
+        backend.write(path, bytes(args.size * 2**10))
+    print(f'{args.count} objects of {args.size} KiB')
+    print('read'.ljust(20), 's'.rjust(8), 'objects/s'.rjust(10))
+    start = time.perf_counter()
+    for path in paths:
+        backend.read(path)
+    seconds = time.perf_counter() - start
+    print(f'{"sequential":<20} {seconds:>8.2f} {args.count / seconds:>10.0f}')
+    for concurrency in args.concurrency or DEFAULT_CONCURRENCIES:
+        for ordered in (True, False):
+            start = time.perf_counter()
+            for _ in read_many(
+                paths, backend, concurrency=concurrency, ordered=ordered
+            ):
+                pass
+            seconds = time.perf_counter() - start
+            label = f'{concurrency} {"ordered" if ordered else "unordered"}'
+            print(f'{label:<20} {seconds:>8.2f} {args.count / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
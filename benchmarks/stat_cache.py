@@ -0,0 +1,75 @@
+"""Measures repeated metadata lookups with :class:`gcspathlib.StatCache`.
+
+A working set of paths is looked up several times over from an in-memory backend that
+sleeps for a fixed latency on every ``stat()``, standing in for the round trip to the
+real API - directly, and through caches of several sizes.
+
+Usage::
+
+    poetry run python -m benchmarks.stat_cache [--paths 1000 --rounds 10]
+"""
+
+import argparse
+import time
+from gcspathlib import ObjectInfo
+from gcspathlib import PureGCSPath
+from gcspathlib import StatCache
+from gcspathlib.testing import MemoryBackend
+
+DEFAULT_PATHS = 1000
+DEFAULT_ROUNDS = 10
+DEFAULT_LATENCY = 0.0005
+
+
+class _SlowBackend(MemoryBackend):
+    def __init__(
+        self,
+        latency: float,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+        self.calls = 0
+
+    def stat(
+        self,
+        path: PureGCSPath,
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        time.sleep(self.latency)
+        self.calls += 1
+        return super().stat(path, generation=generation)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paths', type=int, default=DEFAULT_PATHS)
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY)
+    args = parser.parse_args()
+
+    backend = _SlowBackend(args.latency)
+    paths = [PureGCSPath(f'gs://bucket/dir/{i}.json') for i in range(args.paths)]
+    for path in paths:
+        backend.write(path, b'{}')
+    print(f'{args.paths} paths x {args.rounds} rounds')
+    print('cache'.ljust(16), 's'.rjust(8), 'backend calls'.rjust(14))
+    for label, cache in [
+        ('none', None),
+        ('half', StatCache(args.paths // 2)),
+        ('full', StatCache(args.paths)),
+    ]:
+        backend.calls = 0
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for path in paths:
+                if cache is None:
+                    backend.stat(path)
+                else:
+                    cache.stat(path, backend)
+        seconds = time.perf_counter() - start
+        print(f'{label:<16} {seconds:>8.2f} {backend.calls:>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Measures the throughput of sequential scans with :func:`gcspathlib.open`.
+
+An object is read in small pieces from an in-memory backend that sleeps for a fixed
+latency on every ranged read, standing in for the round trip to the real API.  Scans
+are timed without read-ahead (i.e. one round trip per chunk) and with several
+read-ahead windows.
+
+Usage::
+
+    poetry run python -m benchmarks.streams [--size 64 --latency 0.02]
+"""
+
+import argparse
+import time
+from gcspathlib import DEFAULT_READ_CHUNK_SIZE
+from gcspathlib import PureGCSPath
+from gcspathlib import open as open_object
+from gcspathlib.testing import MemoryBackend
+
+DEFAULT_SIZE = 64  # (MiB)
+DEFAULT_LATENCY = 0.02
+DEFAULT_READ_SIZE = 64 * 2**10
+DEFAULT_READ_AHEADS = [0, 1, 4, 16]
+
+
+class _SlowBackend(MemoryBackend):
+    def __init__(
+        self,
+        latency: float,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+
+    def read(
+        self,
+        path: PureGCSPath,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> memoryview:
+        time.sleep(self.latency)
+        return super().read(path, start, end, generation=generation)
+
+
+def _scan(
+    backend: _SlowBackend,
+    path: PureGCSPath,
+    read_size: int,
+    read_ahead: int,
+) -> float:
+    start = time.perf_counter()
+    buffer = bytearray(read_size)
+    with open_object(path, 'rb', backend, read_ahead=read_ahead) as file:
+        while file.readinto(buffer):
+            pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY)
+    parser.add_argument('--read-size', type=int, default=DEFAULT_READ_SIZE)
+    parser.add_argument('--read-ahead', type=int, action='append')
+    args = parser.parse_args()
+
+    backend = _SlowBackend(args.latency)
+    path = PureGCSPath('gs://bucket/large.bin')
+    backend.write(path, bytes(args.size * 2**20))
+    print(f'{args.size} MiB in {DEFAULT_READ_CHUNK_SIZE // 2**20} MiB chunks')
+    print('read-ahead'.ljust(16), 's'.rjust(8), 'MiB/s'.rjust(10))
+    for read_ahead in args.read_ahead or DEFAULT_READ_AHEADS:
+        seconds = _scan(backend, path, args.read_size, read_ahead)
+        print(f'{read_ahead:<16} {seconds:>8.2f} {args.size / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
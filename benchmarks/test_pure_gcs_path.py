@@ -0,0 +1,230 @@
+"""Micro-benchmarks for :class:`gcspathlib.PureGCSPath` hot paths.
+
+Each operation is measured at several path depths for three implementations:
+
+* ``gcs``: :class:`gcspathlib.PureGCSPath`;
+* ``posix``: :class:`pathlib.PurePosixPath`, with the bucket as the first part;
+* ``str``: the equivalent raw string manipulation.
+
+Run with ``scripts/benchmark``; see there for saving and comparing results.
+"""
+
+import fnmatch
+import gcspathlib
+import pytest
+import urllib.parse
+from .conftest import BUCKET
+from .conftest import make_obj_parts
+from collections.abc import Callable
+from gcspathlib import PureGCSPath
+from pathlib import PurePosixPath
+from typing import Any
+
+IMPLS = ['gcs', 'posix', 'str']
+
+pytestmark = pytest.mark.parametrize('impl', IMPLS)
+
+
+def _run(
+    benchmark: Any,
+    impl: str,
+    funcs: dict[str, Callable[[], object]],
+) -> None:
+    benchmark(funcs[impl])
+
+
+@pytest.mark.benchmark(group='construct_uri')
+def test_construct_uri(benchmark, impl, uri, posix_str):
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: PureGCSPath(uri),
+            'posix': lambda: PurePosixPath(posix_str),
+            'str': lambda: uri.removeprefix(gcspathlib.URI_PREFIX).partition('/'),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='construct_parts')
+def test_construct_parts(benchmark, impl, obj_parts):
+    drive = f'gs://{BUCKET}'
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: PureGCSPath(drive, *obj_parts),
+            'posix': lambda: PurePosixPath('/', BUCKET, *obj_parts),
+            'str': lambda: '/'.join((drive, *obj_parts)),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='str')
+def test_str(benchmark, impl, uri, posix_str):
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: str(PureGCSPath(uri)),
+            'posix': lambda: str(PurePosixPath(posix_str)),
+            'str': lambda: str(uri),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='join')
+def test_join(benchmark, impl, uri, posix_str):
+    gcs_path = PureGCSPath(uri)
+    posix_path = PurePosixPath(posix_str)
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: str(gcs_path / 'child.txt'),
+            'posix': lambda: str(posix_path / 'child.txt'),
+            'str': lambda: f'{uri}/child.txt',
+        },
+    )
+
+
+@pytest.mark.benchmark(group='with_bucket')
+def test_with_bucket(benchmark, impl, uri, posix_str, obj):
+    gcs_path = PureGCSPath(uri)
+    posix_path = PurePosixPath(posix_str)
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: gcs_path.with_bucket('other-bucket'),
+            'posix': lambda: PurePosixPath('/other-bucket', *posix_path.parts[2:]),
+            'str': lambda: f'gs://other-bucket/{obj}',
+        },
+    )
+
+
+@pytest.mark.benchmark(group='with_obj')
+def test_with_obj(benchmark, impl, uri, posix_str, depth):
+    gcs_path = PureGCSPath(uri)
+    posix_path = PurePosixPath(posix_str)
+    new_obj = '/'.join(make_obj_parts(depth)).replace('file', 'other')
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: gcs_path.with_obj(new_obj),
+            'posix': lambda: PurePosixPath(*posix_path.parts[:2], new_obj),
+            'str': lambda: f'gs://{BUCKET}/{new_obj}',
+        },
+    )
+
+
+@pytest.mark.benchmark(group='as_uri')
+def test_as_uri(benchmark, impl, uri, posix_str, obj):
+    gcs_path = PureGCSPath(uri)
+    posix_path = PurePosixPath(posix_str)
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': gcs_path.as_uri,
+            'posix': posix_path.as_uri,
+            'str': lambda: gcspathlib.URI_PREFIX
+            + urllib.parse.quote(f'{BUCKET}/{obj}'),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='bucket_obj')
+def test_bucket_obj(benchmark, impl, uri, posix_str):
+    gcs_path = PureGCSPath(uri)
+    posix_path = PurePosixPath(posix_str)
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: (gcs_path.bucket, gcs_path.obj),
+            'posix': lambda: (posix_path.parts[1], '/'.join(posix_path.parts[2:])),
+            'str': lambda: uri.removeprefix(gcspathlib.URI_PREFIX).partition('/')[::2],
+        },
+    )
+
+
+@pytest.mark.benchmark(group='hash')
+def test_hash(benchmark, impl, uri, posix_str):
+    # Hash a fresh object each time, so that the cached hash doesn't skew results.
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: hash(PureGCSPath(uri)),
+            'posix': lambda: hash(PurePosixPath(posix_str)),
+            'str': lambda: hash(uri[:]),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='eq')
+def test_eq(benchmark, impl, uri, posix_str):
+    gcs_paths = PureGCSPath(uri), PureGCSPath(uri)
+    posix_paths = PurePosixPath(posix_str), PurePosixPath(posix_str)
+    strs = uri, ''.join(uri)  # distinct but equal objects
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: gcs_paths[0] == gcs_paths[1],
+            'posix': lambda: posix_paths[0] == posix_paths[1],
+            'str': lambda: strs[0] == strs[1],
+        },
+    )
+
+
+@pytest.mark.benchmark(group='sort')
+def test_sort(benchmark, impl, uri, posix_str):
+    names = [f'{i * 7919 % 100:02d}.txt' for i in range(100)]
+    gcs_paths = [PureGCSPath(uri).with_name(name) for name in names]
+    posix_paths = [PurePosixPath(posix_str).with_name(name) for name in names]
+    strs = [str(path) for path in gcs_paths]
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: sorted(gcs_paths),
+            'posix': lambda: sorted(posix_paths),
+            'str': lambda: sorted(strs),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='match')
+def test_match(benchmark, impl, uri, posix_str):
+    gcs_path = PureGCSPath(uri)
+    posix_path = PurePosixPath(posix_str)
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: gcs_path.match('dir*/*.txt'),
+            'posix': lambda: posix_path.match('dir*/*.txt'),
+            'str': lambda: fnmatch.fnmatchcase(uri, '*/dir*/*.txt'),
+        },
+    )
+
+
+@pytest.mark.benchmark(group='relative_to')
+def test_relative_to(benchmark, impl, uri, posix_str):
+    gcs_path = PureGCSPath(uri)
+    gcs_parent = PureGCSPath(f'gs://{BUCKET}')
+    posix_path = PurePosixPath(posix_str)
+    posix_parent = PurePosixPath(f'/{BUCKET}')
+    prefix = f'gs://{BUCKET}/'
+    _run(
+        benchmark,
+        impl,
+        {
+            'gcs': lambda: gcs_path.relative_to(gcs_parent),
+            'posix': lambda: posix_path.relative_to(posix_parent),
+            'str': lambda: uri.removeprefix(prefix),
+        },
+    )
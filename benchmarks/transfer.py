@@ -0,0 +1,84 @@
+"""Measures the throughput of large transfers with :func:`gcspathlib.aio.download` and
+:func:`gcspathlib.aio.upload`.
+
+A single large object is transferred to and from the fake server from
+:mod:`gcspathlib.testing` (running in a separate process, see :mod:`benchmarks.aio`).
+Downloads are timed as a single stream and as concurrently fetched byte ranges, and
+uploads as a single request and as a parallel composite upload.
+
+Note that on a loopback connection the fake server is the bottleneck rather than the
+network, so the gains are much smaller than against the real API - where each stream
+is limited to a fraction of the available bandwidth.
+
+Usage::
+
+    poetry run python -m benchmarks.transfer [--size 128 --chunk-size 8 --concurrency 8]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from .aio import BUCKET
+from .aio import _fake_server
+from gcspathlib import PureGCSPath
+from gcspathlib.aio import DEFAULT_TRANSFER_CONCURRENCY
+from gcspathlib.aio import Client
+from gcspathlib.aio import download
+from gcspathlib.aio import upload
+from typing import Any
+
+DEFAULT_SIZE = 128  # (MiB)
+DEFAULT_CHUNK_SIZE = 8  # (MiB)
+
+
+async def _transfer(
+    url: str,
+    function: Any,
+    path: PureGCSPath,
+    filename: str,
+    **kwargs: Any,
+) -> float:
+    async with Client(url) as client:
+        start = time.perf_counter()
+        await function(client, path, filename, **kwargs)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_TRANSFER_CONCURRENCY)
+    args = parser.parse_args()
+
+    size = args.size * 2**20
+    chunk_size = args.chunk_size * 2**20
+    path = PureGCSPath(f'gs://{BUCKET}/large.bin')
+    with _fake_server() as url, tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'source')
+        with open(source, 'wb') as file:
+            file.write(os.urandom(size))
+        destination = os.path.join(tmp, 'destination')
+        print('transfer'.ljust(20), 's'.rjust(8), 'MiB/s'.rjust(10))
+        sliced = {'chunk_size': chunk_size, 'concurrency': args.concurrency}
+        runs: list[tuple[str, Any, str, dict[str, Any]]] = [
+            ('upload single', upload, source, {'chunk_size': size}),
+            (f'upload composite x{args.concurrency}', upload, source, sliced),
+            ('download single', download, destination, {'chunk_size': size}),
+            (f'download sliced x{args.concurrency}', download, destination, sliced),
+            (
+                f'download mmap x{args.concurrency}',
+                download,
+                destination,
+                {**sliced, 'use_mmap': True},
+            ),
+        ]
+        for label, function, filename, kwargs in runs:
+            seconds = asyncio.run(_transfer(url, function, path, filename, **kwargs))
+            print(f'{label:<20} {seconds:>8.2f} {args.size / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Measures the throughput and peak memory of streaming uploads with
+:class:`gcspathlib.aio.ObjectWriter`.
+
+An object is written in small pieces to the fake server from :mod:`gcspathlib.testing`
+(running in a separate process, see :mod:`benchmarks.aio`), once by buffering the
+whole object in memory and uploading it with a single request, and once streamed
+through a resumable upload (with and without CRC32C checksums).  Peak memory is the
+``tracemalloc`` peak of the client process.
+
+Usage::
+
+    poetry run python -m benchmarks.writer [--size 64 --piece-size 65536]
+"""
+
+import argparse
+import asyncio
+import functools
+import time
+import tracemalloc
+from .aio import BUCKET
+from .aio import _fake_server
+from gcspathlib import PureGCSPath
+from gcspathlib.aio import DEFAULT_UPLOAD_CHUNK_SIZE
+from gcspathlib.aio import Client
+from gcspathlib.aio import ObjectWriter
+from typing import Any
+
+DEFAULT_SIZE = 64  # (MiB)
+DEFAULT_PIECE_SIZE = 64 * 2**10
+
+
+async def _buffered(
+    client: Client,
+    path: PureGCSPath,
+    piece: bytes,
+    count: int,
+) -> None:
+    buffer = bytearray()
+    for _ in range(count):
+        buffer += piece
+    await client.write(path, buffer)
+
+
+async def _streamed(
+    client: Client,
+    path: PureGCSPath,
+    piece: bytes,
+    count: int,
+    checksum: bool = True,
+) -> None:
+    async with ObjectWriter(client, path, checksum=checksum) as writer:
+        for _ in range(count):
+            await writer.write(piece)
+
+
+async def _run(
+    url: str,
+    upload: Any,
+    path: PureGCSPath,
+    piece: bytes,
+    count: int,
+) -> None:
+    async with Client(url) as client:
+        await upload(client, path, piece, count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--piece-size', type=int, default=DEFAULT_PIECE_SIZE)
+    args = parser.parse_args()
+
+    piece = bytes(args.piece_size)
+    count = args.size * 2**20 // args.piece_size
+    path = PureGCSPath(f'gs://{BUCKET}/export.bin')
+    with _fake_server() as url:
+        print(f'{args.size} MiB in {DEFAULT_UPLOAD_CHUNK_SIZE // 2**20} MiB chunks')
+        print('upload'.ljust(20), 's'.rjust(8), 'MiB/s'.rjust(10), 'peak MiB'.rjust(10))
+        streamed = functools.partial(_streamed, checksum=False)
+        # (Peak memory is measured in a separate run without checksums, which don't
+        # use memory but are slowed down a lot by tracing.)
+        for label, upload, traced_upload in [
+            ('buffered', _buffered, _buffered),
+            ('streamed', streamed, streamed),
+            ('streamed + crc32c', _streamed, streamed),
+        ]:
+            start = time.perf_counter()
+            asyncio.run(_run(url, upload, path, piece, count))
+            seconds = time.perf_counter() - start
+            tracemalloc.start()
+            asyncio.run(_run(url, traced_upload, path, piece, count))
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+            print(
+                f'{label:<20} {seconds:>8.2f} {args.size / seconds:>10.0f} {peak:>10.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
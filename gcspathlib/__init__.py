@@ -1,78 +1,227 @@
+import fnmatch
+import hashlib
+import os
+import pathlib
+import posixpath
+import re
+import sys
 import urllib.parse
-from . import _old_pathlib
+from ._backend import Backend
+from ._bloom import DEFAULT_BLOOM_ERROR_RATE
+from ._bloom import PathBloomFilter
+from ._cache import DEFAULT_PATH_CACHE_SIZE
+from ._cache import DEFAULT_STAT_CACHE_SIZE
+from ._cache import DEFAULT_STAT_TTL
+from ._cache import PathCache
+from ._cache import StatCache
+from ._coalesce import CoalesceInfo
+from ._coalesce import CoalescingBackend
+from ._coalesce import SingleFlight
+from ._containers import PathDict
+from ._containers import PathSet
+from ._disk_cache import DEFAULT_DISK_CACHE_SIZE
+from ._disk_cache import DiskCache
+from ._inventory import DEFAULT_INVENTORY_CHUNK_SIZE
+from ._inventory import InventoryChunk
+from ._inventory import InventorySource
+from ._inventory import read_inventory
+from ._inventory import read_inventory_paths
+from ._inventory import read_inventory_shard
+from ._jsonapi import ListPage
+from ._jsonapi import ObjectInfo
+from ._key_ranges import DEFAULT_KEY_PREFIX_LENGTH
+from ._key_ranges import DEFAULT_KEY_RANGE_TOP
+from ._key_ranges import KeyRangeReport
+from ._key_ranges import analyze_key_ranges
+from ._list_parser import ListPageParser
+from ._listing import iter_pages
+from ._listing import iterdir
+from ._listing import rglob
+from ._notifications import NotificationMessage
+from ._notifications import ObjectNotification
+from ._notifications import parse_notifications
+from ._partitions import parse_partitions
+from ._partitions import partition_columns
+from ._partitions import prune_partitions
+from ._prefetch import DEFAULT_PREFETCH_BUFFER_SIZE
+from ._prefetch import DEFAULT_PREFETCH_CONCURRENCY
+from ._prefetch import read_many
+from ._stats import Stat
+from ._stats import disable_stats
+from ._stats import enable_stats
+from ._stats import reset_stats
+from ._stats import stats
+from ._streams import DEFAULT_READ_AHEAD
+from ._streams import DEFAULT_READ_CHUNK_SIZE
+from ._streams import ObjectReader
+from ._streams import open as open  # pylint: disable=redefined-builtin
+from ._templates import PathTemplate
+from collections.abc import Mapping
+from typing import Any
 from typing import ClassVar
 from typing import Self
+from typing import cast
 
 URI_PREFIX = 'gs://'
 
+_GENERATION_SUFFIX = re.compile(r'#(\d+)\Z')
+# A `#digits` ending of an object name, which strings escape as `%23digits` (so that
+# it isn't taken for a generation) - and escapes of it, which are escaped again.
+_ESCAPED_SUFFIX = re.compile(r'(?:#|%(?:25)*23)\d+\Z')
+_UNPINNED: Any = object()  # (constructs a path without parsing a generation suffix)
+_HASH_DIGITS = 32  # (of an MD5 hash)
+
+if sys.version_info >= (3, 12):
+
+    class _GCSParser:
+        """Cloud Storage counterpart of :mod:`posixpath`, used as the low-level parser
+        of :class:`PureGCSPath` on Python 3.12+.
+
+        Python 3.12 made :class:`pathlib.PurePath` officially subclassable, with the
+        drive/root splitting and joining delegated to a module-like parser object
+        (``PurePath._flavour`` in Python 3.12, ``PurePath.parser`` as of Python 3.13).
+        Supplying a custom parser lets :class:`PureGCSPath` inherit the lazy parsing,
+        join-by-concatenation, and cached string/hash behavior of the standard library
+        without reaching into legacy :mod:`_old_pathlib` internals.
+
+        ``gs://bucket`` is treated as the drive, ``/`` as the root, and everything else
+        as the (POSIX-like) object name.  Unlike :mod:`posixpath`, a leading ``/`` is
+        *not* a root, since Cloud Storage object names are always relative to a bucket.
+        """
 
-class _GCSFlavour(
-    _old_pathlib._PosixFlavour,  # type: ignore[misc,name-defined]  # pylint: disable=protected-access
-):
-    """Implementation of the core :mod:`_old_pathlib` functionality for Cloud Storage
-    paths.
-
-    Warning:
-        :class:`pathlib._Flavour` is an internal implementation detail of the legacy
-        Python 3.11 :mod:`pathlib`, which has completely changed as of Python 3.14.
-        For now, the legacy Python 3.11 pathlib has been pulled forward to
-        ``_old_pathlib.py``.  This is a nasty, nasty hack to enable transition for
-        projects that need :mod:`gcspathlib` but are still on Python 3.11, while working
-        seamlessly with Python 3.14+ as well.
-
-        The original intent of leveraging :class:`pathlib._Flavour` was to be able to
-        subclass/extend :class:`pathlib.PurePath` to inherit the standard pathlib base
-        functionality without having to reinvent the wheel.
-
-    Todo:
-        Eliminate legacy :mod:`_old_pathlib` dependency.
-    """
-
-    is_supported: ClassVar[bool] = False  # only "Pure" implementation is allowed
-
-    def splitroot(
-        self,
-        part: str,
-        sep: str = '/',
-    ) -> tuple[str, str, str]:
-        drive: str
-        root: str
-        rel: str
-        if part and part.startswith(URI_PREFIX):
-            bucket, _, rel = part.removeprefix(URI_PREFIX).partition(sep)
-            if not bucket:
-                raise ValueError(f'Invalid bucket name in URI: {part}')
-            drive = URI_PREFIX + bucket
-            root = sep
-            # part = sep + root + rel
-            rel = sep + rel  # TBD
-        else:
-            drive = ''
-            root = ''
-            rel = part
-        return drive, root, rel
-
-    def make_uri(
-        self,
-        path: _old_pathlib.PurePath,  # type: ignore
-    ) -> str:
-        assert isinstance(path, PureGCSPath)
-        assert path.is_absolute()
-        return URI_PREFIX + urllib.parse.quote(f'{path.bucket}{self.sep}{path.obj}')
+        sep: ClassVar[str] = '/'
+        altsep: ClassVar[str | None] = None
+
+        def splitroot(
+            self,
+            path: str,
+        ) -> tuple[str, str, str]:
+            drive: str
+            root: str
+            rel: str
+            if path.startswith(URI_PREFIX):
+                bucket, _, rel = path.removeprefix(URI_PREFIX).partition(self.sep)
+                if not bucket:
+                    raise ValueError(f'Invalid bucket name in URI: {path}')
+                drive = URI_PREFIX + bucket
+                root = self.sep
+            else:
+                drive = ''
+                root = ''
+                rel = path
+            return drive, root, rel
+
+        def splitdrive(
+            self,
+            path: str,
+        ) -> tuple[str, str]:
+            drive, root, rel = self.splitroot(path)
+            return drive, root + rel
+
+        def join(
+            self,
+            path: str,
+            *paths: str,
+        ) -> str:
+            """Joins path segments, with any ``gs://`` segment discarding everything
+            before it - just like an absolute segment in :func:`posixpath.join`.
+            """
+            segments = (path, *paths)
+            for i in range(len(segments) - 1, 0, -1):
+                if segments[i].startswith(URI_PREFIX):
+                    segments = segments[i:]
+                    break
+            return self.sep.join(segments)
+
+        def split(
+            self,
+            path: 'str | os.PathLike[str]',
+        ) -> tuple[str, str]:
+            return posixpath.split(os.fspath(path))
+
+        def splitext(
+            self,
+            path: 'str | os.PathLike[str]',
+        ) -> tuple[str, str]:
+            return posixpath.splitext(os.fspath(path))
+
+        def normcase(
+            self,
+            path: 'str | os.PathLike[str]',
+        ) -> str:
+            return os.fspath(path)  # bucket and object names are case-sensitive
+
+        def isabs(
+            self,
+            path: 'str | os.PathLike[str]',
+        ) -> bool:
+            drive, _, rel = self.splitroot(os.fspath(path))
+            return bool(drive) and bool(rel.strip(self.sep))
+
+    _gcs_flavour = _GCSParser()
+    _PurePath = pathlib.PurePath
+
+else:
+    from . import _old_pathlib
+
+    class _GCSFlavour(
+        _old_pathlib._PosixFlavour,  # type: ignore[misc,name-defined]  # pylint: disable=protected-access
+    ):
+        """Implementation of the core :mod:`_old_pathlib` functionality for Cloud
+        Storage paths on Python 3.11.
+
+        Warning:
+            :class:`pathlib._Flavour` is an internal implementation detail of the legacy
+            Python 3.11 :mod:`pathlib`, which has completely changed as of Python 3.12.
+            The legacy Python 3.11 pathlib has been pulled forward to
+            ``_old_pathlib.py`` for projects that need :mod:`gcspathlib` but are still
+            on Python 3.11.  Python 3.12+ uses :class:`_GCSParser` with the standard
+            library :class:`pathlib.PurePath` instead.
 
+        Todo:
+            Eliminate legacy :mod:`_old_pathlib` dependency once Python 3.11 support is
+            dropped.
+        """
 
-_gcs_flavour = _GCSFlavour()
+        is_supported: ClassVar[bool] = False  # only "Pure" implementation is allowed
+
+        def splitroot(
+            self,
+            part: str,
+            sep: str = '/',
+        ) -> tuple[str, str, str]:
+            drive: str
+            root: str
+            rel: str
+            if part and part.startswith(URI_PREFIX):
+                bucket, _, rel = part.removeprefix(URI_PREFIX).partition(sep)
+                if not bucket:
+                    raise ValueError(f'Invalid bucket name in URI: {part}')
+                drive = URI_PREFIX + bucket
+                root = sep
+                # part = sep + root + rel
+                rel = sep + rel  # TBD
+            else:
+                drive = ''
+                root = ''
+                rel = part
+            return drive, root, rel
+
+    _gcs_flavour = _GCSFlavour()
+    _PurePath = _old_pathlib.PurePath  # type: ignore
+
+_path_caches: dict[type, PathCache[Any]] = {}
 
 
 class PureGCSPath(
-    _old_pathlib.PurePath,  # type: ignore
+    _PurePath,  # type: ignore[misc,valid-type,unused-ignore]
 ):
-    """A :class:`_old_pathlib.PurePath` subclass that represents Cloud Storage paths.
+    """A :class:`pathlib.PurePath` subclass that represents Cloud Storage paths.
 
-    The purpose of this class is to provide a :class:`_old_pathlib.PurePath` compatible
+    The purpose of this class is to provide a :class:`pathlib.PurePath` compatible
     interface for manipulating Cloud Storage bucket and object names as paths.
 
-    Just like :class:`_old_pathlib.PurePath`, this is a "pure" path because it performs no
+    Just like :class:`pathlib.PurePath`, this is a "pure" path because it performs no
     I/O operations on its own. The main goal is to handle the path manipulation part,
     while actual I/O with Google Cloud Storage is considered outside the scope of this
     class, keeping the library lightweight.
@@ -81,6 +230,17 @@ class PureGCSPath(
     bucket and an object - whereas bucketless, bucket-only, and empty paths are
     incomplete.
 
+    Complete paths can be pinned to an object generation, e.g. with a ``#generation``
+    suffix on a ``gs://`` URI; see :attr:`generation`.  So that the string of every
+    path parses back into it, the string of a path whose object name ends with
+    ``#digits`` (which a URI would pin) has the ``#`` escaped as ``%23`` - as does
+    :meth:`as_uri` - and a name ending with such an escape has the ``%`` escaped as
+    ``%25``.
+
+    On Python 3.12+ this subclasses the standard library :class:`pathlib.PurePath`
+    directly (via :class:`_GCSParser`); on Python 3.11 it subclasses the legacy
+    :class:`_old_pathlib.PurePath` (via :class:`_GCSFlavour`).
+
     Note:
         Cloud Storage doesn'technically have directories in a strictly technical sense,
         but in practice they're a valid consideration for paths, behaving reasonably
@@ -90,13 +250,246 @@ class PureGCSPath(
         Does it really make sense to support bucketless and bucket-only paths?  Might be
         a little silly and potentially complicates usage because applications may need
         to safeguard against incomplete paths.  An alternative would be to rely solely
-        on :class:`_old_pathlib.PurePosixPath` as a way of representing bucketless paths
+        on :class:`pathlib.PurePosixPath` as a way of representing bucketless paths
         that can be joined to :class:`PureGCSPath`, so that every :class:`PureGCSPath` is
         guaranteed to be complete - requiring both a bucket and object.
     """
 
-    _flavour = _gcs_flavour
-    __slots__ = ()
+    if sys.version_info >= (3, 13):
+        parser = _gcs_flavour  # type: ignore[assignment]
+    else:
+        _flavour = _gcs_flavour
+    _sep: ClassVar[str] = '/'
+    _generation: int
+    _partitions: Mapping[str, str]
+    __slots__ = ('_generation', '_partitions')
+
+    if sys.version_info >= (3, 12):
+
+        def __init__(
+            self,
+            *args: 'str | os.PathLike[str]',
+            generation: int | None = None,
+        ) -> None:
+            if generation is None and args:
+                last = args[-1]
+                if not isinstance(last, str) or '#' in last or '%' in last:
+                    args, generation = _split_generation(args)
+            super().__init__(*args)
+            # Parsing is lazy as of Python 3.12, but malformed URIs should still be
+            # rejected up front, as with the legacy implementation.
+            for arg in args:
+                if (
+                    isinstance(arg, str)
+                    and arg.startswith(URI_PREFIX)
+                    and arg[len(URI_PREFIX) : len(URI_PREFIX) + 1] in ('', self._sep)
+                ):
+                    raise ValueError(f'Invalid bucket name in URI: {arg}')
+            if generation is not None and generation is not _UNPINNED:
+                self._pin(generation)
+
+        def with_segments(
+            self,
+            *pathsegments: 'str | os.PathLike[str]',
+        ) -> Self:
+            # Paths derived from others (e.g. by joining) are never pinned, and never
+            # parse a generation suffix - which may well be part of an object name.
+            return type(self)(*pathsegments, generation=_UNPINNED)
+
+        @property
+        def _str_normcase(self) -> str:
+            # The standard library lowercases paths for any parser other than
+            # `posixpath`, but Cloud Storage names are case-sensitive.  (Unescaped,
+            # and without any generation, which is compared separately.)
+            return super().__str__()
+
+    else:
+
+        def __new__(
+            cls,
+            *args: 'str | os.PathLike[str]',
+            generation: int | None = None,
+        ) -> Self:
+            if generation is None and args:
+                last = args[-1]
+                if not isinstance(last, str) or '#' in last or '%' in last:
+                    args, generation = _split_generation(args)
+            path = cls._from_parts(args)
+            if generation is not None:
+                path._pin(generation)
+            return path  # type: ignore[no-any-return]
+
+        def with_segments(
+            self,
+            *pathsegments: 'str | os.PathLike[str]',
+        ) -> Self:
+            """Constructs a path from segments, like the constructor - but without
+            parsing a generation suffix (as with the Python 3.12+ method).
+            """
+            return self._from_parts(pathsegments)  # type: ignore[no-any-return]
+
+    def __str__(self) -> str:
+        string: str = super().__str__()
+        if ('#' in string or '%' in string) and self.drive:
+            string = _escape_suffix(string)
+        generation = self.generation
+        return string if generation is None else f'{string}#{generation}'
+
+    def __hash__(self) -> int:
+        generation = self.generation
+        hashed: int = super().__hash__()
+        return hashed if generation is None else hash((hashed, generation))
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        # Pinned paths are compared by the unpinned path and the generation, rather
+        # than by their strings - which couldn't tell `x` pinned to generation 5 from
+        # an object named `x#5` if they weren't escaped.
+        equal = super().__eq__(other)
+        if equal is True:
+            equal = self.generation == cast(PureGCSPath, other).generation
+        return equal  # type: ignore[no-any-return,unused-ignore]
+
+    @property
+    def _sort_key(self) -> tuple[list[str], int]:
+        if sys.version_info >= (3, 12):
+            # pylint: disable-next=no-member
+            parts = self._parts_normcase  # type: ignore[attr-defined]
+        else:
+            parts = self._cparts
+        generation = self.generation
+        return parts, -1 if generation is None else generation
+
+    def __lt__(
+        self,
+        other: object,
+    ) -> bool:
+        return (
+            self._sort_key < other._sort_key
+            if isinstance(other, PureGCSPath)
+            else NotImplemented
+        )
+
+    def __le__(
+        self,
+        other: object,
+    ) -> bool:
+        return (
+            self._sort_key <= other._sort_key
+            if isinstance(other, PureGCSPath)
+            else NotImplemented
+        )
+
+    def __gt__(
+        self,
+        other: object,
+    ) -> bool:
+        return (
+            self._sort_key > other._sort_key
+            if isinstance(other, PureGCSPath)
+            else NotImplemented
+        )
+
+    def __ge__(
+        self,
+        other: object,
+    ) -> bool:
+        return (
+            self._sort_key >= other._sort_key
+            if isinstance(other, PureGCSPath)
+            else NotImplemented
+        )
+
+    def match(
+        self,
+        path_pattern: str,
+        *,
+        case_sensitive: bool | None = None,
+    ) -> bool:
+        """Matches the path against a glob-style pattern, like
+        :meth:`pathlib.PurePath.match` on Python 3.11 - with a relative pattern matched
+        from the right, and its leading segments matched against the ``gs://bucket/``
+        anchor as well.
+
+        Implemented here rather than inherited, since the matching of the standard
+        library differs between Python versions (e.g. ``*`` doesn't match the anchor as
+        of Python 3.13), and guesses case sensitivity from the parser.  Names are
+        case-sensitive unless ``case_sensitive`` is false.
+        """
+        pattern = self.with_segments(path_pattern)
+        pattern_parts = pattern.parts
+        if not pattern_parts:
+            raise ValueError('empty pattern')
+        parts = self.parts
+        matches = True
+        if pattern.anchor:
+            matches = pattern.anchor == self.anchor and len(pattern_parts) == len(parts)
+            pattern_parts = pattern_parts[1:]
+        elif len(pattern_parts) > len(parts):
+            matches = False
+        if case_sensitive is False:
+            parts = tuple(part.lower() for part in parts)
+            pattern_parts = tuple(part.lower() for part in pattern_parts)
+        return matches and all(
+            fnmatch.fnmatchcase(part, pattern_part)
+            for part, pattern_part in zip(reversed(parts), reversed(pattern_parts))
+        )
+
+    @classmethod
+    def path_cache(cls) -> PathCache[Self]:
+        """Returns the default :class:`PathCache` used by :meth:`cached` for this class,
+        e.g. for its :meth:`~PathCache.cache_info` statistics.
+        """
+        try:
+            cache = _path_caches[cls]
+        except KeyError:
+            cache = _path_caches.setdefault(cls, PathCache(cls))
+        return cache
+
+    @classmethod
+    def cached(
+        cls,
+        uri: str,
+    ) -> Self:
+        """Constructs a path from a string, reusing a previously constructed instance for
+        the same string if available.
+
+        Meant for hot loops that see the same paths over and over again, such as log
+        and event processing.  Instances come from a bounded LRU cache (see
+        :meth:`path_cache`), with their parts, string representation, and hash already
+        computed.  Use a dedicated :class:`PathCache` for a different cache size.
+        """
+        return cls.path_cache()(uri)
+
+    def _make_child_relpath(
+        self,
+        name: str,
+    ) -> Self:
+        """Returns ``self / name`` for a relative, ``/``-separated object name ``name``,
+        building on the already parsed parts of this path instead of re-parsing the
+        joined string.
+
+        Meant for listing results, which are always relative to a known parent.  The
+        name is never parsed (e.g. for a ``gs://`` prefix or a generation suffix).
+
+        Raises:
+            ValueError: If the name has empty or ``.`` segments (e.g. ``a//b``), which
+                regular parsing would normalize away - so that no path can stand for
+                the object.
+        """
+        parts = name.split(self._sep)
+        if '' in parts or '.' in parts:
+            raise ValueError(f'Object name with empty or "." segments: {name!r}')
+        if sys.version_info >= (3, 12):
+            tail = self._tail  # type: ignore[attr-defined]  # pylint: disable=no-member
+            child = self._from_parsed_parts(  # type: ignore[attr-defined]
+                self.drive, self.root, [*tail, *parts]
+            )
+        else:
+            child = self._from_parsed_parts(self._drv, self._root, self._parts + parts)
+        return child  # type: ignore[no-any-return,unused-ignore]
 
     @property
     def _bucket_parts(self) -> tuple[str, ...]:
@@ -104,7 +497,7 @@ class PureGCSPath(
 
     @property
     def _obj_parts(self) -> tuple[str, ...]:
-        return self.parts[1:] if self.drive else self.parts  # type: ignore
+        return self.parts[1:] if self.drive else self.parts  # type: ignore[no-any-return,unused-ignore]
 
     @property
     def bucket(self) -> str:
@@ -112,18 +505,18 @@ class PureGCSPath(
 
         If the path has no bucket (i.e. a relative path), an empty string is returned.
         """
-        return self.drive.removeprefix(URI_PREFIX).removesuffix(self._flavour.sep)  # type: ignore
+        return self.drive.removeprefix(URI_PREFIX).removesuffix(self._sep)  # type: ignore[no-any-return,unused-ignore]
 
     def with_bucket(
         self,
         new_bucket: str,
     ) -> Self:
         """Returns a new :class:`PureGCSPath` object with the specified bucket."""
-        new_drive = f'{URI_PREFIX}{new_bucket}{self._flavour.sep}'
-        return type(self)(new_drive, *self._obj_parts)
+        new_drive = f'{URI_PREFIX}{new_bucket}{self._sep}'
+        return self.with_segments(new_drive, *self._obj_parts)
 
     def without_bucket(self) -> Self:
-        return type(self)(*self._obj_parts)
+        return self.with_segments(*self._obj_parts)
 
     @property
     def obj(self) -> str:
@@ -131,7 +524,7 @@ class PureGCSPath(
 
         If the path is bucket-only, an empty string is returned.
         """
-        sep: str = self._flavour.sep
+        sep: str = self._sep
         return sep.join(self._obj_parts)
 
     def with_obj(
@@ -153,17 +546,112 @@ class PureGCSPath(
             and requires careful consideration; might be better to just reject it.
             However, the same issue applies when joining paths - e.g. via the ``/``
             operator, which allows changing to a different bucket - just like in other
-            :class:`_old_pathlib.PurePath` implementations.
+            :class:`pathlib.PurePath` implementations.
 
             One way or another though, there needs to be a way for a caller to reliably
             build GCS URIs without having to manually check for such oddities.
         """
-        return type(self)(*self._bucket_parts, *obj_parts)
+        return self.with_segments(*self._bucket_parts, *obj_parts)
 
     def without_obj(
         self,
     ) -> Self:
-        return type(self)(*self._bucket_parts)
+        return self.with_segments(*self._bucket_parts)
+
+    def with_hash_prefix(
+        self,
+        length: int,
+    ) -> Self:
+        """Constructs a new path with the object name under a hash prefix.
+
+        The prefix is the first ``length`` hex digits of the MD5 hash of the object
+        name, as a leading "directory" - e.g. ``gs://bucket/3f2a/logs/0001.json`` - so
+        that sequential names (like timestamps or incrementing IDs) are spread across
+        the key range of the bucket rather than hitting a single range, which Cloud
+        Storage throttles.  The prefix is deterministic, and removed again by
+        :meth:`strip_hash_prefix`.
+
+        Raises:
+            ValueError: If the path has no object name, or ``length`` isn't between 1
+                and 32.
+        """
+        obj = self.obj
+        if not obj:
+            raise ValueError(f'Path has no object name: {self!r}')
+        if not 1 <= length <= _HASH_DIGITS:
+            raise ValueError(f'Invalid hash prefix length: {length}')
+        return self.with_obj(_hash_prefix(obj, length), obj)
+
+    def strip_hash_prefix(
+        self,
+    ) -> Self:
+        """Constructs a new path with the hash prefix added by :meth:`with_hash_prefix`
+        removed from the object name.
+
+        Raises:
+            ValueError: If the object name has no (valid) hash prefix.
+        """
+        prefix, _, obj = self.obj.partition(self._sep)
+        if (
+            not obj
+            or not 1 <= len(prefix) <= _HASH_DIGITS
+            or _hash_prefix(obj, len(prefix)) != prefix
+        ):
+            raise ValueError(f'Path has no hash prefix: {self!r}')
+        return self.with_obj(obj)
+
+    @property
+    def partitions(self) -> Mapping[str, str]:
+        """The Hive-style partitions of the path: the ``key=value`` segments of the
+        object name, e.g. ``{'dt': '2026-10-16', 'hr': '07'}`` for
+        ``gs://lake/events/dt=2026-10-16/hr=07/part-0001.parquet``.
+
+        The segments are parsed on first access, and the (read-only) result is cached.
+        See :func:`partition_columns` and :func:`prune_partitions` for batches of paths.
+        """
+        partitions = getattr(self, '_partitions', None)
+        if partitions is None:
+            partitions = self._partitions = parse_partitions(self._obj_parts)
+        return partitions
+
+    @property
+    def generation(self) -> int | None:
+        """The object generation that the path is pinned to, if any.
+
+        A generation-pinned path names immutable content: the given generation of the
+        object, rather than whatever its current generation is - so that anything read
+        through it can be cached indefinitely.  Backends and caches use the generation
+        of a pinned path unless given one explicitly.
+        """
+        return getattr(self, '_generation', None)
+
+    def with_generation(
+        self,
+        generation: int,
+    ) -> Self:
+        """Returns the path pinned to ``generation``."""
+        path = self.with_segments(self)
+        path._pin(generation)  # pylint: disable=protected-access
+        return path
+
+    def without_generation(self) -> Self:
+        """Returns the path without a generation."""
+        return self if self.generation is None else self.with_segments(self)
+
+    def _pin(
+        self,
+        generation: int,
+    ) -> None:
+        if not self.is_absolute():
+            raise ValueError(f'Only object paths can have a generation: {self}')
+        if generation < 0:
+            raise ValueError(f'Invalid generation: {generation}')
+        self._generation = generation
+
+    def __reduce__(self) -> str | tuple[Any, ...]:
+        # (Pickled by the string, since the parts of a pinned path lack the generation.)
+        reduced = super().__reduce__()
+        return reduced if self.generation is None else (type(self), (str(self),))
 
     def is_absolute(self) -> bool:
         """Determines whether the path is complete with a bucket, an object, and a
@@ -171,12 +659,120 @@ class PureGCSPath(
         """
         return bool(self.bucket) and bool(self.obj)
 
+    def as_uri(self) -> str:
+        """Returns the ``gs://`` URI of the path, with the object name URL-quoted."""
+        if not self.is_absolute():
+            raise ValueError('relative path can\'t be expressed as a file URI')
+        uri = URI_PREFIX + urllib.parse.quote(f'{self.bucket}{self._sep}{self.obj}')
+        return uri if self.generation is None else f'{uri}#{self.generation}'
+
     def __bool__(self) -> bool:
         """Determines whether the path is complete; alias for :meth:`.is_absolute`."""
         return self.is_absolute()
 
 
+def _hash_prefix(
+    obj: str,
+    length: int,
+) -> str:
+    digest = hashlib.md5(obj.encode(), usedforsecurity=False).hexdigest()
+    return digest[:length]
+
+
+def _escape_suffix(string: str) -> str:
+    """Escapes a ``#digits`` ending of the string of a path, or an escape of one."""
+    match = _ESCAPED_SUFFIX.search(string)
+    if match is not None:
+        start = match.start()
+        escape = '%23' if string[start] == '#' else '%25'
+        string = f'{string[:start]}{escape}{string[start + 1 :]}'
+    return string
+
+
+def _unescape_suffix(uri: str) -> str:
+    """Reverses :func:`_escape_suffix` on a ``gs://`` URI (without any generation)."""
+    match = _ESCAPED_SUFFIX.search(uri)
+    if (
+        match is not None
+        and uri[match.start()] == '%'
+        and '/' in uri[len(URI_PREFIX) : match.start()]
+    ):
+        start = match.start()
+        unescaped = '#' if uri[start + 1 : start + 3] == '23' else '%'
+        uri = f'{uri[:start]}{unescaped}{uri[start + 3 :]}'
+    return uri
+
+
+def _split_generation(
+    args: 'tuple[str | os.PathLike[str], ...]',
+) -> 'tuple[tuple[str | os.PathLike[str], ...], int | None]':
+    """Splits the generation off the constructor arguments of a path: either from a
+    ``gs://bucket/obj#generation`` URI as the last argument (unescaping the end of the
+    object name, as escaped by :meth:`PureGCSPath.__str__`), or from a single path.
+    """
+    generation = None
+    last = args[-1]
+    if isinstance(last, str):
+        if last.startswith(URI_PREFIX):
+            match = _GENERATION_SUFFIX.search(last) if '#' in last else None
+            if match is not None:
+                last = last[: match.start()]
+                generation = int(match[1])
+            args = (*args[:-1], _unescape_suffix(last) if '%' in last else last)
+    elif len(args) == 1 and isinstance(last, PureGCSPath):
+        generation = last.generation
+    return args, generation
+
+
 __all__ = [
+    'Backend',
+    'CoalesceInfo',
+    'CoalescingBackend',
+    'DEFAULT_BLOOM_ERROR_RATE',
+    'DEFAULT_DISK_CACHE_SIZE',
+    'DEFAULT_INVENTORY_CHUNK_SIZE',
+    'DEFAULT_KEY_PREFIX_LENGTH',
+    'DEFAULT_KEY_RANGE_TOP',
+    'DEFAULT_PATH_CACHE_SIZE',
+    'DEFAULT_PREFETCH_BUFFER_SIZE',
+    'DEFAULT_PREFETCH_CONCURRENCY',
+    'DEFAULT_READ_AHEAD',
+    'DEFAULT_READ_CHUNK_SIZE',
+    'DEFAULT_STAT_CACHE_SIZE',
+    'DEFAULT_STAT_TTL',
+    'DiskCache',
+    'InventoryChunk',
+    'InventorySource',
+    'KeyRangeReport',
+    'ListPage',
+    'ListPageParser',
+    'NotificationMessage',
+    'ObjectInfo',
+    'ObjectNotification',
+    'ObjectReader',
+    'PathBloomFilter',
+    'PathCache',
+    'PathDict',
+    'PathSet',
+    'PathTemplate',
     'PureGCSPath',
+    'SingleFlight',
+    'Stat',
+    'StatCache',
     'URI_PREFIX',
+    'analyze_key_ranges',
+    'disable_stats',
+    'enable_stats',
+    'iter_pages',
+    'iterdir',
+    'parse_notifications',
+    'partition_columns',
+    'prune_partitions',
+    'read_inventory',
+    'read_inventory_paths',
+    'read_inventory_shard',
+    'read_many',
+    'reset_stats',
+    'rglob',
+    'stats',
 ]
@@ -0,0 +1,80 @@
+from ._jsonapi import ListPage
+from ._jsonapi import ObjectInfo
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+
+class Backend(Protocol):
+    """Interface of synchronous Cloud Storage backends, i.e. anything that can store
+    and list objects by :class:`PureGCSPath`.
+
+    Errors are raised as :class:`OSError` subclasses, e.g. :class:`FileNotFoundError`
+    for missing objects (or object generations).
+    """
+
+    def stat(
+        self,
+        path: 'PureGCSPath',
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        """Retrieves the metadata of the object at ``path``, optionally requiring a
+        specific ``generation`` (by default, that of a generation-pinned ``path``).
+        """
+
+    def read(
+        self,
+        path: 'PureGCSPath',
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> bytes | memoryview:
+        """Reads the contents of the object at ``path``, or only the byte range
+        ``[start, end)`` of it if given, optionally requiring a specific ``generation``
+        (by default, that of a generation-pinned ``path``).
+        """
+
+    def write(
+        self,
+        path: 'PureGCSPath',
+        data: bytes | bytearray | memoryview,
+    ) -> ObjectInfo:
+        """Writes ``data`` as a new generation of the object at ``path``."""
+
+    def delete(
+        self,
+        path: 'PureGCSPath',
+    ) -> None:
+        """Deletes the object at ``path``."""
+
+    def patch(
+        self,
+        path: 'PureGCSPath',
+        metadata: Mapping[str, Any],
+    ) -> ObjectInfo:
+        """Updates the writable metadata fields of the object at ``path`` (e.g.
+        ``contentType``, or custom ``metadata`` - where keys with ``None`` values are
+        removed), like the ``objects.patch`` JSON API method.
+        """
+
+    def list_page(  # pylint: disable=too-many-arguments
+        self,
+        bucket: str,
+        *,
+        prefix: str = '',
+        delimiter: str = '',
+        start_offset: str = '',
+        end_offset: str = '',
+        page_token: str | None = None,
+        max_results: int | None = None,
+    ) -> ListPage:
+        """Lists a single page of the objects in ``bucket`` - with names starting with
+        ``prefix`` and within ``[start_offset, end_offset)``, in lexicographic order of
+        their UTF-8 encoding - like the ``objects.list`` JSON API method.
+        """
@@ -0,0 +1,273 @@
+"""Bloom filters of paths, for ruling out objects that don't exist without a request.
+
+A filter built from a listing (or an inventory report) answers whether a path is
+*definitely absent* from it - so that e.g. ``stat()`` requests for objects that most
+likely don't exist can be skipped.  False positives (paths reported as possibly
+present) occur at the configured rate; false negatives never do.
+
+Paths are hashed by their canonical string, without any generation, with BLAKE2b - so
+filters are stable across processes and Python versions, and can be saved, shared,
+and merged.  Saved filters are a small header followed by the bit array, which can be
+memory-mapped rather than read.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from ._containers import is_canonical
+from collections.abc import Collection
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Self
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_BLOOM_ERROR_RATE = 0.01
+
+_HEADER = struct.Struct('<8sIIQ')  # magic, version, hash count, bit count
+_MAGIC = b'GCSBLOOM'
+_DIGEST = struct.Struct('<QQ')  # (the two hashes of double hashing)
+_VERSION = 1
+
+
+def _key(path: 'str | PureGCSPath') -> bytes:
+    """Returns the canonical string of ``path`` without any generation, encoded."""
+    if isinstance(path, str) and not is_canonical(path):
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from . import PureGCSPath
+
+        path = PureGCSPath(path)
+    if not isinstance(path, str):
+        path = str(path.without_generation())
+    return path.encode()
+
+
+class PathBloomFilter:
+    """A Bloom filter of paths: ``path in bloom_filter`` is false if the path was
+    definitely never added, and true if it probably was.
+
+    Example:
+        >>> bloom_filter = PathBloomFilter.from_paths(iterdir(prefix, backend))
+        >>> bloom_filter.save('objects.bloom')
+        >>> bloom_filter = PathBloomFilter.load('objects.bloom')
+        >>> if path in bloom_filter:
+        ...     info = backend.stat(path)
+    """
+
+    hash_count: int
+    """The number of bits set per path."""
+    bit_count: int
+    """The size of the filter, in bits."""
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+    ) -> None:
+        """
+        Args:
+            capacity: The number of paths to be added, for which the filter is sized.
+            error_rate: The rate of false positives once ``capacity`` paths have been
+                added, between 0 and 1 (exclusive).
+
+        Raises:
+            ValueError: If ``capacity`` or ``error_rate`` are out of range.
+        """
+        if capacity < 1:
+            raise ValueError(f'Invalid capacity: {capacity}')
+        if not 0 < error_rate < 1:
+            raise ValueError(f'Invalid error rate: {error_rate}')
+        # The optimal number of bits, rounded up to whole bytes, and of hashes.
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        size = (bits + 7) // 8
+        hash_count = max(1, round(size * 8 / capacity * math.log(2)))
+        self._init(hash_count, bytearray(size))
+
+    def _init(
+        self,
+        hash_count: int,
+        bits: 'bytearray | memoryview',
+        mapped: mmap.mmap | None = None,
+    ) -> None:
+        self.hash_count = hash_count
+        self.bit_count = len(bits) * 8
+        self._bits = bits
+        self._mmap = mapped
+
+    @classmethod
+    def from_paths(
+        cls,
+        paths: 'Iterable[str | PureGCSPath]',
+        error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+        *,
+        capacity: int | None = None,
+    ) -> Self:
+        """Builds a filter of ``paths``, e.g. from :func:`iterdir`, :func:`rglob`, or
+        :func:`read_inventory_paths`.
+
+        Args:
+            paths: The paths.
+            error_rate: See the constructor.
+            capacity: See the constructor.  If omitted, it's the number of ``paths`` -
+                which, unless they're a collection, are held (as strings) to count
+                them first.
+        """
+        keys: Collection[Any] | Iterable[Any] = paths
+        if capacity is None:
+            if not isinstance(keys, Collection):
+                keys = [_key(path) for path in paths]
+            capacity = max(1, len(keys))
+        bloom_filter = cls(capacity, error_rate)
+        add = bloom_filter._add  # pylint: disable=protected-access
+        for key in keys:
+            add(key if isinstance(key, bytes) else _key(key))
+        return bloom_filter
+
+    def _positions(
+        self,
+        key: bytes,
+    ) -> range:
+        """The bits of ``key`` (by double hashing), as a progression of offsets to be
+        wrapped around the size of the filter.
+        """
+        start, step = _DIGEST.unpack(hashlib.blake2b(key, digest_size=16).digest())
+        bit_count = self.bit_count
+        start %= bit_count
+        step = step % (bit_count - 1) + 1
+        return range(start, start + step * self.hash_count, step)
+
+    def _add(
+        self,
+        key: bytes,
+    ) -> None:
+        bits, bit_count = self._bits, self.bit_count
+        for position in self._positions(key):
+            position %= bit_count
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def add(
+        self,
+        path: 'str | PureGCSPath',
+    ) -> None:
+        """Adds ``path`` to the filter.
+
+        Raises:
+            TypeError: If the filter is memory-mapped, and so read-only.
+        """
+        self._add(_key(path))
+
+    def __contains__(
+        self,
+        path: object,
+    ) -> bool:
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from . import PureGCSPath
+
+        contained = isinstance(path, (str, PureGCSPath))
+        if contained:
+            bits, bit_count = self._bits, self.bit_count
+            for position in self._positions(_key(path)):  # type: ignore[arg-type]
+                position %= bit_count
+                if not bits[position >> 3] >> (position & 7) & 1:
+                    contained = False
+                    break
+        return contained
+
+    def __ior__(
+        self,
+        other: 'PathBloomFilter',
+    ) -> Self:
+        """Merges ``other`` (e.g. of another shard of a listing) into this filter.
+
+        Raises:
+            ValueError: If the filters differ in size or hash count.
+        """
+        if (other.bit_count, other.hash_count) != (self.bit_count, self.hash_count):
+            raise ValueError('Only filters of the same size and hash count can merge')
+        merged = int.from_bytes(self._bits, 'little') | int.from_bytes(
+            other._bits, 'little'
+        )
+        self._bits[:] = merged.to_bytes(len(self._bits), 'little')
+        return self
+
+    def __or__(
+        self,
+        other: 'PathBloomFilter',
+    ) -> Self:
+        merged = type(self).__new__(type(self))
+        merged._init(self.hash_count, bytearray(self._bits))
+        merged |= other
+        return merged
+
+    @property
+    def fill_ratio(self) -> float:
+        """The fraction of bits set - where the false positive rate is about the fill
+        ratio to the power of :attr:`hash_count`.
+        """
+        ones = int.from_bytes(self._bits, 'little').bit_count()
+        return ones / self.bit_count
+
+    def save(
+        self,
+        filename: 'str | os.PathLike[str]',
+    ) -> None:
+        """Writes the filter to ``filename``, to be loaded with :meth:`load`."""
+        with open(filename, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, self.hash_count, self.bit_count))
+            file.write(self._bits)
+
+    @classmethod
+    def load(
+        cls,
+        filename: 'str | os.PathLike[str]',
+        *,
+        mapped: bool = True,
+    ) -> Self:
+        """Loads a filter saved with :meth:`save`.
+
+        Args:
+            filename: The filename.
+            mapped: Whether to memory-map the file (read-only) rather than read it -
+                so that the filter can be queried right away, with the pages of it
+                that are needed read in on demand, and shared across processes.
+
+        Raises:
+            ValueError: If the file isn't a saved filter.
+        """
+        bloom_filter = cls.__new__(cls)
+        with open(filename, 'rb') as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f'Not a saved path Bloom filter: {filename}')
+            magic, version, hash_count, bit_count = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f'Not a saved path Bloom filter: {filename}')
+            if not hash_count or not bit_count or bit_count % 8:
+                raise ValueError(f'Invalid path Bloom filter: {filename}')
+            if os.fstat(file.fileno()).st_size != _HEADER.size + bit_count // 8:
+                raise ValueError(f'Truncated path Bloom filter: {filename}')
+            if mapped:
+                view = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                bits = memoryview(view)[_HEADER.size :]
+                bloom_filter._init(hash_count, bits, view)
+            else:
+                bloom_filter._init(hash_count, bytearray(file.read()))
+        return bloom_filter
+
+    def close(self) -> None:
+        """Unmaps the file of a memory-mapped filter; the filter is unusable after."""
+        if self._mmap is not None:
+            if isinstance(self._bits, memoryview):
+                self._bits.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
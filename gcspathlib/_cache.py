@@ -0,0 +1,326 @@
+import collections
+import errno
+import functools
+import math
+import threading
+import time
+from ._backend import Backend
+from ._jsonapi import ObjectInfo
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from typing import Generic
+from typing import NamedTuple
+from typing import Protocol
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_PATH_CACHE_SIZE = 2**16
+DEFAULT_STAT_CACHE_SIZE = 2**16
+DEFAULT_STAT_TTL = 60.0
+
+PathT = TypeVar('PathT')
+
+
+class PathCache(Generic[PathT]):
+    """Memoizing path factory, backed by a size-bounded LRU cache keyed on the input
+    string.
+
+    Paths are immutable, so a cache hit returns the existing instance as-is - including
+    its already parsed parts and cached string and hash - instead of parsing and
+    allocating a new one.  Newly constructed paths are eagerly parsed, stringified, and
+    hashed before being cached, so that every instance handed out has done that work
+    exactly once.
+
+    This is thread-safe, since it is backed by :func:`functools.lru_cache`.
+
+    Example:
+        >>> cache = PathCache(PureGCSPath, maxsize=100_000)
+        >>> cache('gs://bucket/dir/file.txt') is cache('gs://bucket/dir/file.txt')
+        True
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=100000, currsize=1)
+    """
+
+    def __init__(
+        self,
+        path_type: Callable[[str], PathT],
+        maxsize: int | None = DEFAULT_PATH_CACHE_SIZE,
+    ) -> None:
+        """
+        Args:
+            path_type: The path type (or factory) to construct on cache misses.
+            maxsize: The maximum number of cached paths, or ``None`` for unbounded.
+        """
+        self.path_type = path_type
+        self._get: 'functools._lru_cache_wrapper[PathT]' = functools.lru_cache(
+            maxsize=maxsize
+        )(self._create)
+
+    def _create(
+        self,
+        uri: str,
+    ) -> PathT:
+        path = self.path_type(uri)
+        str(path)
+        hash(path)
+        return path
+
+    def __call__(
+        self,
+        uri: str,
+    ) -> PathT:
+        """Returns the cached path for ``uri``, constructing it on a cache miss."""
+        return self._get(uri)
+
+    def cache_info(self) -> 'functools._CacheInfo':
+        """Returns the hit/miss statistics; see :func:`functools.lru_cache`."""
+        return self._get.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clears the cache and its statistics."""
+        self._get.cache_clear()
+
+
+class _AsyncStat(Protocol):
+    def stat(
+        self,
+        path: 'PureGCSPath',
+        *,
+        generation: int | None = None,
+    ) -> Awaitable[ObjectInfo]: ...
+
+
+_Key = tuple['PureGCSPath', int | None]
+
+
+class _Entry(NamedTuple):
+    info: ObjectInfo | None  # (``None`` if the object doesn't exist)
+    expires: float
+
+
+class _Node:
+    """A node of the trie of cached paths by their parts, holding the cache keys of
+    the path it stands for.
+    """
+
+    __slots__ = ('children', 'keys')
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.keys: set[_Key] = set()
+
+
+class StatCache:
+    """Cache of object metadata (i.e. ``stat()`` results) by path, with a TTL and a
+    size-bounded LRU eviction policy.
+
+    Negative results (i.e. missing objects) are cached as well, for ``negative_ttl``.
+    Metadata looked up for a specific ``generation`` (or by a generation-pinned path)
+    never expires, since object generations are immutable.  Entries are additionally
+    indexed in a trie of path parts, so that :meth:`invalidate` can drop everything
+    under a prefix in time proportional to the number of entries dropped, rather than
+    to the cache size.
+
+    The cache is thread-safe, and can be used from both synchronous code (with a
+    :class:`Backend`, see :meth:`stat`) and asynchronous code (with a
+    :class:`gcspathlib.aio.Client`, see :meth:`astat`).
+
+    Example:
+        >>> cache = StatCache(ttl=30)
+        >>> cache.stat(PureGCSPath('gs://bucket/dir/file.txt'), backend)
+        ObjectInfo(...)
+        >>> cache.invalidate(PureGCSPath('gs://bucket/dir'))
+        1
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = DEFAULT_STAT_CACHE_SIZE,
+        *,
+        ttl: float = DEFAULT_STAT_TTL,
+        negative_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            maxsize: The maximum number of cached entries, or ``None`` for unbounded.
+            ttl: The number of seconds to cache metadata for.
+            negative_ttl: The number of seconds to cache missing objects for; ``ttl``
+                if omitted.
+            clock: The monotonic clock to measure expiry with, in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self._clock = clock
+        self._entries: collections.OrderedDict[_Key, _Entry] = collections.OrderedDict()
+        self._root = _Node()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        path: 'PureGCSPath',
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo | None:
+        """Returns the cached metadata of the object at ``path`` (or its
+        ``generation``), or ``None`` if it's cached as missing.
+
+        Raises:
+            KeyError: If there's no unexpired entry for the object.
+        """
+        key = (path, generation)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                raise KeyError(path)
+            self._hits += 1
+            self._entries.move_to_end(key)
+        return entry.info
+
+    def put(
+        self,
+        path: 'PureGCSPath',
+        info: ObjectInfo | None,
+        *,
+        generation: int | None = None,
+    ) -> None:
+        """Caches the metadata of the object at ``path`` (or its ``generation``), or
+        ``None`` if it doesn't exist.
+        """
+        if info is None:
+            expires = self._clock() + self.negative_ttl
+        elif generation is None and path.generation is None:
+            expires = self._clock() + self.ttl
+        else:
+            expires = math.inf
+        key = (path, generation)
+        with self._lock:
+            if key not in self._entries:
+                node = self._root
+                for part in path.parts:
+                    node = node.children.setdefault(part, _Node())
+                node.keys.add(key)
+            self._entries[key] = _Entry(info, expires)
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: _Key) -> None:
+        """Removes the entry of ``key``, along with the trie nodes left empty."""
+        del self._entries[key]
+        nodes = [self._root]
+        for part in key[0].parts:
+            nodes.append(nodes[-1].children[part])
+        nodes[-1].keys.discard(key)
+        for parent, node, part in zip(
+            reversed(nodes[:-1]), reversed(nodes[1:]), reversed(key[0].parts)
+        ):
+            if node.keys or node.children:
+                break
+            del parent.children[part]
+
+    def invalidate(
+        self,
+        path: 'PureGCSPath',
+        *,
+        recursive: bool = True,
+    ) -> int:
+        """Drops the entries of ``path`` (of any generation), and - if ``recursive`` -
+        of all paths under it, and returns the number of entries dropped.
+        """
+        count = 0
+        with self._lock:
+            node: _Node | None = self._root
+            for part in path.parts:
+                node = node.children.get(part) if node is not None else None
+            nodes = [node] if node is not None else []
+            while nodes:
+                node = nodes.pop()
+                for key in list(node.keys):
+                    self._remove(key)
+                    count += 1
+                if recursive:
+                    nodes.extend(node.children.values())
+        return count
+
+    def cache_info(self) -> 'functools._CacheInfo':
+        """Returns the hit/miss statistics, like :func:`functools.lru_cache`."""
+        # pylint: disable-next=protected-access
+        return functools._CacheInfo(
+            self._hits, self._misses, self.maxsize, len(self._entries)
+        )
+
+    def cache_clear(self) -> None:
+        """Clears the cache and its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._root = _Node()
+            self._hits = 0
+            self._misses = 0
+
+    def stat(
+        self,
+        path: 'PureGCSPath',
+        backend: Backend,
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        """Returns the metadata of the object at ``path`` (or its ``generation``) from
+        the cache, or from ``backend`` on a cache miss.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist (or is cached as missing).
+        """
+        try:
+            info = self.get(path, generation=generation)
+        except KeyError:
+            try:
+                info = backend.stat(path, generation=generation)
+            except FileNotFoundError:
+                self.put(path, None, generation=generation)
+                raise
+            self.put(path, info, generation=generation)
+        return _found(path, info)
+
+    async def astat(
+        self,
+        path: 'PureGCSPath',
+        client: _AsyncStat,
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        """Like :meth:`stat`, but with an asynchronous ``client`` (e.g. a
+        :class:`gcspathlib.aio.Client`) instead of a backend.
+        """
+        try:
+            info = self.get(path, generation=generation)
+        except KeyError:
+            try:
+                info = await client.stat(path, generation=generation)
+            except FileNotFoundError:
+                self.put(path, None, generation=generation)
+                raise
+            self.put(path, info, generation=generation)
+        return _found(path, info)
+
+
+def _found(
+    path: 'PureGCSPath',
+    info: ObjectInfo | None,
+) -> ObjectInfo:
+    if info is None:
+        raise FileNotFoundError(errno.ENOENT, 'No such object (cached)', str(path))
+    return info
@@ -0,0 +1,199 @@
+"""Coalescing of concurrent identical requests ("single-flight").
+
+When many callers ask for the same thing at the same moment - e.g. the metadata of a
+hot manifest - only the first one makes the request, and the others wait for its
+result instead of making their own.  Unlike a cache, nothing is kept once the request
+has finished, so results are never older than the request in flight when asked for.
+"""
+
+import concurrent.futures
+import threading
+from ._backend import Backend
+from ._jsonapi import ListPage
+from ._jsonapi import ObjectInfo
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import ParamSpec
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+_P = ParamSpec('_P')
+_T = TypeVar('_T')
+
+
+class CoalesceInfo(NamedTuple):
+    """Statistics of a single-flight group, as returned by ``coalesce_info()``."""
+
+    calls: int
+    """The number of calls made."""
+    coalesced: int
+    """The number of calls that waited for the result of an equal call in flight."""
+    in_flight: int
+    """The number of distinct calls currently in flight."""
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with equal keys across threads, so that only one of
+    them runs at a time and the others share its result (or exception).
+
+    The first caller for a key runs the call in its own thread; the others block until
+    it has finished.  Keys are compared by hash and equality, so e.g. equal
+    :class:`PureGCSPath` instances are coalesced regardless of their identity.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> with ThreadPoolExecutor(16) as executor:
+        ...     infos = list(executor.map(
+        ...         lambda path: flight.call(path, backend.stat, path), [path] * 16
+        ...     ))
+        >>> flight.coalesce_info()
+        CoalesceInfo(calls=16, coalesced=15, in_flight=0)
+    """
+
+    def __init__(self) -> None:
+        self._futures: dict[Hashable, concurrent.futures.Future[Any]] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._coalesced = 0
+
+    def call(
+        self,
+        key: Hashable,
+        function: Callable[_P, _T],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _T:
+        """Calls ``function(*args, **kwargs)``, unless a call with an equal ``key`` is
+        already in flight - in which case its result is returned (or its exception
+        raised) instead.
+        """
+        with self._lock:
+            self._calls += 1
+            future: concurrent.futures.Future[_T] | None = self._futures.get(key)
+            leader = future is None
+            if future is None:
+                future = self._futures[key] = concurrent.futures.Future()
+            else:
+                self._coalesced += 1
+        if leader:
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._futures[key]
+        return future.result()
+
+    def coalesce_info(self) -> CoalesceInfo:
+        """Returns the call statistics."""
+        with self._lock:
+            return CoalesceInfo(self._calls, self._coalesced, len(self._futures))
+
+
+class CoalescingBackend:
+    """A :class:`Backend` wrapper that coalesces concurrent :meth:`stat` and
+    :meth:`read` calls with equal arguments (e.g. from a thread pool) into a single
+    call to the wrapped backend.
+
+    All other calls are passed through as-is.  Note that a read coalesced with one
+    that started before a concurrent write may return the previous contents, just as
+    if it had been made a moment earlier.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        flight: SingleFlight | None = None,
+    ) -> None:
+        """
+        Args:
+            backend: The backend to wrap.
+            flight: The single-flight group to coalesce calls in; a new one if omitted.
+        """
+        self.backend = backend
+        self.flight = flight or SingleFlight()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.backend!r})'
+
+    def coalesce_info(self) -> CoalesceInfo:
+        """Returns the call statistics of :attr:`flight`."""
+        return self.flight.coalesce_info()
+
+    def stat(
+        self,
+        path: 'PureGCSPath',
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        return self.flight.call(
+            ('stat', path, generation),
+            self.backend.stat,
+            path,
+            generation=generation,
+        )
+
+    def read(
+        self,
+        path: 'PureGCSPath',
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> bytes | memoryview:
+        return self.flight.call(
+            ('read', path, start, end, generation),
+            self.backend.read,
+            path,
+            start,
+            end,
+            generation=generation,
+        )
+
+    def write(
+        self,
+        path: 'PureGCSPath',
+        data: bytes | bytearray | memoryview,
+    ) -> ObjectInfo:
+        return self.backend.write(path, data)
+
+    def delete(
+        self,
+        path: 'PureGCSPath',
+    ) -> None:
+        self.backend.delete(path)
+
+    def patch(
+        self,
+        path: 'PureGCSPath',
+        metadata: Mapping[str, Any],
+    ) -> ObjectInfo:
+        return self.backend.patch(path, metadata)
+
+    def list_page(  # pylint: disable=too-many-arguments
+        self,
+        bucket: str,
+        *,
+        prefix: str = '',
+        delimiter: str = '',
+        start_offset: str = '',
+        end_offset: str = '',
+        page_token: str | None = None,
+        max_results: int | None = None,
+    ) -> ListPage:
+        return self.backend.list_page(
+            bucket,
+            prefix=prefix,
+            delimiter=delimiter,
+            start_offset=start_offset,
+            end_offset=end_offset,
+            page_token=page_token,
+            max_results=max_results,
+        )
@@ -0,0 +1,302 @@
+"""Sets and dicts of paths, keyed by the canonical string of each path.
+
+Plain sets and dicts of paths hold a path object per entry, and looking up a string
+means constructing (and parsing) a path from it first, just to hash it.  These
+containers hold the strings instead - which take a fraction of the memory of the
+paths - and look up strings that are already in canonical form as-is.  Paths are
+only constructed when iterating.
+
+Keys are also kept in lexicographic order on demand, for prefix scans: sorting is
+deferred until a scan, and keys added after the last scan are merged in by the next.
+"""
+
+import bisect
+import contextlib
+import os
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from collections.abc import MutableSet
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+from typing import cast
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+PathT = TypeVar('PathT', bound='PureGCSPath')
+ValueT = TypeVar('ValueT')
+
+
+def is_canonical(key: str) -> bool:
+    """Returns whether ``key`` is certainly the string of the path constructed from
+    it (some canonical strings aren't recognized, e.g. of bucket-only paths, or of
+    generation-pinned ones).
+    """
+    uri = key.startswith('gs://')
+    rel = key[5:] if uri else key
+    return bool(rel) and not (
+        (uri and '/' not in rel)  # (bucket-only)
+        or rel[0] == '/'
+        or '#' in rel
+        or '//' in rel
+        or '/./' in rel
+        or rel[-1] == '/'
+        or rel.endswith('/.')
+        or rel.startswith('./')
+        or rel == '.'
+    )
+
+
+class _PathKeys(Generic[PathT]):
+    """Base of the containers: conversion between paths and their keys, and the
+    sorted keys for prefix scans.
+    """
+
+    def __init__(
+        self,
+        path_type: 'type[PathT] | None',
+    ) -> None:
+        if path_type is None:
+            # pylint: disable-next=import-outside-toplevel,cyclic-import
+            from . import PureGCSPath
+
+            path_type = cast('type[PathT]', PureGCSPath)
+        self.path_type = path_type
+        self._sorted: list[str] | None = None
+        self._unsorted: list[str] = []
+
+    def _key(
+        self,
+        path: 'str | os.PathLike[str]',
+    ) -> str:
+        """Returns the key of ``path`` - constructing a path from it only if it's a
+        string that may not be canonical.
+        """
+        if isinstance(path, str) and not is_canonical(path):
+            path = self.path_type(path)
+        return str(path)
+
+    def _lookup_key(
+        self,
+        path: object,
+    ) -> str | None:
+        """Returns the key of ``path``, or ``None`` if it can't be a path - including
+        strings that don't parse as one, so lookups never raise on a malformed key.
+        """
+        key = None
+        if isinstance(path, (str, os.PathLike)):
+            with contextlib.suppress(ValueError):
+                key = self._key(path)
+        return key
+
+    def _added(
+        self,
+        key: str,
+    ) -> None:
+        if self._sorted is not None:
+            self._unsorted.append(key)
+
+    def _removed(self) -> None:
+        self._sorted = None
+        self._unsorted.clear()
+
+    def _scan_keys(
+        self,
+        keys: Iterable[str],
+        prefix: 'str | PureGCSPath',
+    ) -> Iterator[str]:
+        """Yields the keys among ``keys`` (all of them) that start with ``prefix``, or
+        are under it if it's a path, in lexicographic order.
+        """
+        if not isinstance(prefix, str):
+            prefix = str(prefix)
+            prefix = prefix if prefix.endswith('/') else f'{prefix}/'
+        if self._sorted is None:
+            self._sorted = sorted(keys)
+        elif self._unsorted:
+            # (Sorting two sorted runs merges them, in linear time.)
+            self._unsorted.sort()
+            self._sorted += self._unsorted
+            self._sorted.sort()
+            self._unsorted.clear()
+        ordered = self._sorted
+        for i in range(bisect.bisect_left(ordered, prefix), len(ordered)):
+            key = ordered[i]
+            if not key.startswith(prefix):
+                break
+            yield key
+
+
+class PathSet(_PathKeys[PathT], MutableSet[PathT]):
+    """A set of paths, which holds the string of each path rather than the path.
+
+    Membership can be tested with paths or with strings, e.g. ``'gs://b/x' in paths``
+    - which, for canonical strings, doesn't construct a path.  Iterating constructs
+    paths of ``path_type`` (:class:`PureGCSPath` if omitted), in arbitrary order;
+    :meth:`scan` iterates over the paths under a prefix in lexicographic order.
+
+    Example:
+        >>> paths = PathSet(['gs://b/x/1', 'gs://b/x/2', 'gs://b/y'])
+        >>> 'gs://b/x/1' in paths
+        True
+        >>> list(paths.scan('gs://b/x/'))
+        [PureGCSPath('gs://b/x/1'), PureGCSPath('gs://b/x/2')]
+    """
+
+    def __init__(
+        self,
+        paths: 'Iterable[str | PureGCSPath]' = (),
+        *,
+        path_type: 'type[PathT] | None' = None,
+    ) -> None:
+        super().__init__(path_type)
+        self._set: set[str] = {self._key(path) for path in paths}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({sorted(self._set)!r})'
+
+    def __contains__(
+        self,
+        path: object,
+    ) -> bool:
+        key = self._lookup_key(path)
+        return key is not None and key in self._set
+
+    def __iter__(self) -> Iterator[PathT]:
+        path_type = self.path_type
+        for key in self._set:
+            yield path_type(key)
+
+    def __len__(self) -> int:
+        return len(self._set)
+
+    def add(
+        self,
+        value: 'str | PureGCSPath',
+    ) -> None:
+        key = self._key(value)
+        if key not in self._set:
+            self._set.add(key)
+            self._added(key)
+
+    def discard(
+        self,
+        value: object,
+    ) -> None:
+        key = self._lookup_key(value)
+        if key is not None and key in self._set:
+            self._set.remove(key)
+            self._removed()
+
+    def scan(
+        self,
+        prefix: 'str | PureGCSPath' = '',
+    ) -> Iterator[PathT]:
+        """Yields the paths whose strings start with ``prefix`` - or if it's a path,
+        the paths under it - in lexicographic order.
+
+        The set must not be modified during the scan.
+        """
+        path_type = self.path_type
+        for key in self._scan_keys(self._set, prefix):
+            yield path_type(key)
+
+
+class PathDict(_PathKeys[PathT], MutableMapping[PathT, ValueT]):
+    """A dict keyed by paths, which holds the string of each path rather than the path.
+
+    Items can be looked up with paths or with strings, e.g. ``sizes['gs://b/x']`` -
+    which, for canonical strings, doesn't construct a path.  Iterating constructs paths
+    of ``path_type`` (:class:`PureGCSPath` if omitted), in insertion order;
+    :meth:`scan` and :meth:`scan_items` iterate over the paths under a prefix in
+    lexicographic order.
+
+    Example:
+        >>> sizes = PathDict({'gs://b/x/1': 10, 'gs://b/x/2': 20, 'gs://b/y': 30})
+        >>> sizes['gs://b/x/1']
+        10
+        >>> sum(size for _, size in sizes.scan_items(PureGCSPath('gs://b/x')))
+        30
+    """
+
+    def __init__(
+        self,
+        items: Mapping[Any, ValueT] | Iterable[tuple[Any, ValueT]] = (),
+        *,
+        path_type: 'type[PathT] | None' = None,
+    ) -> None:
+        super().__init__(path_type)
+        self._dict: dict[str, ValueT] = {}
+        self.update(items)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._dict!r})'
+
+    def __getitem__(
+        self,
+        path: object,
+    ) -> ValueT:
+        key = self._lookup_key(path)
+        if key is None:
+            raise KeyError(path)
+        try:
+            return self._dict[key]
+        except KeyError:
+            raise KeyError(path) from None
+
+    def __setitem__(
+        self,
+        path: 'str | PureGCSPath',
+        value: ValueT,
+    ) -> None:
+        key = self._key(path)
+        if key not in self._dict:
+            self._added(key)
+        self._dict[key] = value
+
+    def __delitem__(
+        self,
+        path: object,
+    ) -> None:
+        key = self._lookup_key(path)
+        if key is None or key not in self._dict:
+            raise KeyError(path)
+        del self._dict[key]
+        self._removed()
+
+    def __iter__(self) -> Iterator[PathT]:
+        path_type = self.path_type
+        for key in self._dict:
+            yield path_type(key)
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def scan(
+        self,
+        prefix: 'str | PureGCSPath' = '',
+    ) -> Iterator[PathT]:
+        """Yields the paths whose strings start with ``prefix`` - or if it's a path,
+        the paths under it - in lexicographic order.
+
+        The dict must not be modified during the scan.
+        """
+        path_type = self.path_type
+        for key in self._scan_keys(self._dict, prefix):
+            yield path_type(key)
+
+    def scan_items(
+        self,
+        prefix: 'str | PureGCSPath' = '',
+    ) -> Iterator[tuple[PathT, ValueT]]:
+        """Yields the ``(path, value)`` pairs of the paths under ``prefix``, like
+        :meth:`scan`.
+        """
+        path_type = self.path_type
+        data = self._dict
+        for key in self._scan_keys(self._dict, prefix):
+            yield path_type(key), data[key]
@@ -0,0 +1,97 @@
+"""CRC32C (Castagnoli) checksums, as used by Cloud Storage to verify object contents.
+
+The ``google_crc32c`` C extension is used if it's installed; otherwise, checksums are
+computed with a table-driven ("slicing-by-8") pure-Python implementation, which is
+much slower (a few MB/s, i.e. more than a second per 8 MiB upload chunk).
+"""
+
+import base64
+import importlib
+import struct
+from collections.abc import Callable
+from typing import Any
+
+_POLYNOMIAL = 0x82F63B78  # (reversed)
+_MASK = 0xFFFFFFFF
+
+
+def _tables() -> tuple[tuple[int, ...], ...]:
+    """The lookup tables for slicing-by-8: the first for single bytes, and each further
+    one for a byte that many positions further from the end of an 8-byte word.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ _POLYNOMIAL if crc & 1 else crc >> 1
+        table.append(crc)
+    tables = [table]
+    while len(tables) < 8:
+        tables.append([(crc >> 8) ^ table[crc & 0xFF] for crc in tables[-1]])
+    return tuple(tuple(table) for table in tables)
+
+
+_TABLES = _tables()
+
+
+def _extend_python(  # pylint: disable=too-many-locals
+    value: int,
+    data: Any,
+) -> int:
+    t0, t1, t2, t3, t4, t5, t6, t7 = _TABLES
+    crc = value ^ _MASK
+    with memoryview(data) as view, view.cast('B') as octets:
+        split = len(octets) - len(octets) % 8
+        for (word,) in struct.iter_unpack('<Q', octets[:split]):
+            word ^= crc
+            crc = (
+                t7[word & 0xFF]
+                ^ t6[(word >> 8) & 0xFF]
+                ^ t5[(word >> 16) & 0xFF]
+                ^ t4[(word >> 24) & 0xFF]
+                ^ t3[(word >> 32) & 0xFF]
+                ^ t2[(word >> 40) & 0xFF]
+                ^ t1[(word >> 48) & 0xFF]
+                ^ t0[word >> 56]
+            )
+        for byte in octets[split:]:
+            crc = t0[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ _MASK
+
+
+def _extend_function() -> Callable[[int, Any], int]:
+    extend = _extend_python
+    try:
+        module = importlib.import_module('google_crc32c')
+    except ImportError:
+        pass
+    else:
+        # (The package falls back to pure Python as well, which is slower than ours.)
+        if getattr(module, 'implementation', None) == 'c':
+            extend = module.extend
+    return extend
+
+
+_extend = _extend_function()
+
+ACCELERATED = _extend is not _extend_python
+"""Whether checksums are computed by the ``google_crc32c`` C extension, rather than
+in pure Python.
+"""
+
+
+def crc32c(
+    data: bytes | bytearray | memoryview,
+    value: int = 0,
+) -> int:
+    """Computes the CRC32C checksum of ``data`` - or, given the checksum ``value`` of
+    preceding data, the checksum of the concatenation (i.e. incrementally).
+    """
+    return _extend(value, data)
+
+
+def encode_crc32c(value: int) -> str:
+    """Encodes a CRC32C checksum as in the API, i.e. as base64 of its big-endian
+    bytes.
+    """
+    return base64.b64encode(value.to_bytes(4, 'big')).decode()
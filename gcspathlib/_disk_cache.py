@@ -0,0 +1,301 @@
+"""Local disk cache of object contents.
+
+Object generations are immutable, so ``(bucket, object, generation)`` identifies the
+contents of an object for good: cached files never need to be revalidated, only the
+current generation of an object has to be looked up (unless it's pinned).
+"""
+
+import collections
+import contextlib
+import functools
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+from ._backend import Backend
+from ._streams import DEFAULT_READ_AHEAD
+from ._streams import DEFAULT_READ_CHUNK_SIZE
+from ._streams import ObjectReader
+from collections.abc import Iterator
+from typing import IO
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_DISK_CACHE_SIZE = 10 * 2**30
+
+_FILENAME = re.compile(r'[0-9a-f]{64}')  # (see `DiskCache.filename`)
+_TEMP_PREFIX = 'tmp'
+_TEMP_SUFFIX = '.tmp'
+
+_Key = tuple[str, str, int]
+
+
+class DiskCache:
+    """Cache of object contents in a local directory, keyed by bucket, object name, and
+    generation, with a total size-bounded LRU eviction policy.
+
+    Objects are downloaded with an :class:`ObjectReader` (i.e. in ranged reads of
+    ``chunk_size``, ``read_ahead`` of them concurrently) into a temporary file,
+    which is renamed into place once complete - so that cached files are never seen
+    partially written, even by other processes sharing the directory.  Concurrent
+    misses for the same object generation in different threads wait for a single
+    download.  Hits are served straight from the cached file, e.g. memory-mapped with
+    :meth:`read`.
+
+    Cache files already in the directory are picked up on construction, least recently
+    used first by their modification time (which is updated on every hit); other files
+    are left alone.  Cached files that are still open (or mapped) when evicted stay
+    readable until closed.
+
+    Example:
+        >>> cache = DiskCache('/var/cache/weights', backend, max_size=50 * 2**30)
+        >>> with cache.open(PureGCSPath('gs://bucket/model.bin')) as file:
+        ...     header = file.read(16)
+        >>> weights = cache.read(PureGCSPath('gs://bucket/model.bin'))
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        backend: Backend,
+        max_size: int = DEFAULT_DISK_CACHE_SIZE,
+        *,
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> None:
+        """
+        Args:
+            directory: The directory to keep cached files in; created if missing.
+            backend: The backend to download objects from.
+            max_size: The maximum total size of cached files, in bytes.  The most
+                recently cached file is kept even if it exceeds it on its own.
+            chunk_size: The size of the ranged reads to download objects with.
+            read_ahead: The number of ranged reads to make ahead of the current one.
+        """
+        if chunk_size <= 0 or read_ahead < 0:
+            raise ValueError('Chunk size must be positive, and read-ahead not negative')
+        self.directory = os.fspath(directory)
+        self.backend = backend
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+        self._entries: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._key_locks: dict[_Key, tuple[threading.Lock, int]] = {}
+        self._hits = 0
+        self._misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.directory!r}>'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached files, in bytes."""
+        return self._size
+
+    def _scan(self) -> None:
+        """Indexes the files already in the directory, and removes leftover temporary
+        files of interrupted downloads.
+        """
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                name = entry.name
+                if name.startswith(_TEMP_PREFIX) and name.endswith(_TEMP_SUFFIX):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(entry.path)
+                elif _FILENAME.fullmatch(name):
+                    stat = entry.stat(follow_symlinks=False)
+                    files.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, filename, size in sorted(files):
+            self._entries[filename] = size
+            self._size += size
+
+    def filename(
+        self,
+        path: 'PureGCSPath',
+        generation: int,
+    ) -> str:
+        """The name of the cache file of the ``generation`` of the object at ``path``
+        (whether it's cached or not).
+        """
+        key = f'{path.bucket}/{path.obj}#{generation}'.encode()
+        return os.path.join(self.directory, hashlib.sha256(key).hexdigest())
+
+    @contextlib.contextmanager
+    def _key_lock(self, key: _Key) -> Iterator[None]:
+        """Holds the lock of ``key``, which only exists while it's held or waited
+        for.
+        """
+        with self._lock:
+            lock, users = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._key_locks[key]
+                if users == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (lock, users - 1)
+
+    def open(
+        self,
+        path: 'PureGCSPath',
+        *,
+        generation: int | None = None,
+    ) -> IO[bytes]:
+        """Opens the cached file of the object at ``path`` (or of its ``generation``)
+        for reading, downloading it first on a cache miss.
+
+        Unless ``generation`` is given, or ``path`` is pinned to one, the current
+        generation of the object is looked up with a ``stat()`` on every call.
+
+        Raises:
+            FileNotFoundError: If the object (generation) doesn't exist.
+        """
+        if generation is None:
+            generation = path.generation
+        if generation is None:
+            generation = self.backend.stat(path).generation
+        filename = self.filename(path, generation)
+        file = self._open_cached(filename)
+        if file is None:
+            with self._key_lock((path.bucket, path.obj, generation)):
+                # (Another thread may have downloaded it while waiting for the lock.)
+                file = self._open_cached(filename)
+                if file is None:
+                    file = self._download(path, generation, filename)
+        return file
+
+    def read(
+        self,
+        path: 'PureGCSPath',
+        *,
+        generation: int | None = None,
+    ) -> memoryview:
+        """Returns the contents of the object at ``path`` (or of its ``generation``) as
+        a read-only, memory-mapped view of its cached file, downloading it first on a
+        cache miss.
+
+        Raises:
+            FileNotFoundError: If the object (generation) doesn't exist.
+        """
+        with self.open(path, generation=generation) as file:
+            data = memoryview(b'')
+            if os.fstat(file.fileno()).st_size:
+                data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return data
+
+    def _open_cached(self, filename: str) -> IO[bytes] | None:
+        """Opens the cached file ``filename`` if it exists - including one cached by
+        another process - and marks it as recently used.
+        """
+        file: IO[bytes] | None
+        with self._lock:
+            try:
+                file = open(filename, 'rb')  # pylint: disable=consider-using-with
+            except FileNotFoundError:
+                file = None
+            else:
+                self._hits += 1
+                if filename not in self._entries:
+                    self._add(filename, os.fstat(file.fileno()).st_size)
+                self._entries.move_to_end(filename)
+        if file is not None:
+            with contextlib.suppress(OSError):
+                os.utime(file.fileno())
+        return file
+
+    def _download(
+        self,
+        path: 'PureGCSPath',
+        generation: int,
+        filename: str,
+    ) -> IO[bytes]:
+        descriptor, temp_filename = tempfile.mkstemp(
+            suffix=_TEMP_SUFFIX, prefix=_TEMP_PREFIX, dir=self.directory
+        )
+        try:
+            with (
+                os.fdopen(descriptor, 'wb') as temp_file,
+                ObjectReader(
+                    path,
+                    self.backend,
+                    chunk_size=self.chunk_size,
+                    read_ahead=self.read_ahead,
+                    generation=generation,
+                ) as reader,
+            ):
+                shutil.copyfileobj(reader, temp_file, self.chunk_size)
+                size = reader.info.size
+            os.replace(temp_filename, filename)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_filename)
+            raise
+        with self._lock:
+            file = open(filename, 'rb')  # pylint: disable=consider-using-with
+            self._misses += 1
+            if filename not in self._entries:
+                self._add(filename, size)
+        return file
+
+    def _add(self, filename: str, size: int) -> None:
+        """Indexes the cached file ``filename``, and evicts the least recently used
+        files as needed to stay within the maximum size.
+        """
+        self._entries[filename] = size
+        self._size += size
+        while self._size > self.max_size and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, filename: str) -> None:
+        self._size -= self._entries.pop(filename)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(filename)
+
+    def evict(
+        self,
+        path: 'PureGCSPath',
+        generation: int,
+    ) -> bool:
+        """Removes the cached file of the ``generation`` of the object at ``path``, and
+        returns whether it was cached.
+        """
+        filename = self.filename(path, generation)
+        with self._lock:
+            cached = filename in self._entries
+            if cached:
+                self._remove(filename)
+        return cached
+
+    def cache_info(self) -> 'functools._CacheInfo':
+        """Returns the hit/miss statistics, like :func:`functools.lru_cache` - but with
+        the maximum and current size in bytes rather than entries.
+        """
+        # pylint: disable-next=protected-access
+        return functools._CacheInfo(self._hits, self._misses, self.max_size, self._size)
+
+    def cache_clear(self) -> None:
+        """Removes all cached files, and clears the statistics."""
+        with self._lock:
+            while self._entries:
+                self._remove(next(iter(self._entries)))
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,247 @@
+"""Streaming readers of Storage Insights inventory reports.
+
+Inventory reports list the objects of a bucket as CSV or Parquet shards, with a row
+per object.  Shards are parsed in bounded chunks of rows into columns of bucket and
+object names (see :class:`InventoryChunk`), from which paths are built on the already
+parsed path of each bucket - without formatting and re-parsing a ``gs://`` URI per
+row.
+
+See https://cloud.google.com/storage/docs/insights/inventory-reports for the report
+format.
+"""
+
+import concurrent.futures
+import csv
+import dataclasses
+import importlib
+import io
+import multiprocessing
+import os
+from ._listing import child_path
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_INVENTORY_CHUNK_SIZE = 2**16
+
+InventorySource = str | os.PathLike[str] | IO[bytes]
+"""An inventory report shard: a local file name, or a binary file object (e.g. a
+stream opened with :func:`gcspathlib.open`).
+"""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class InventoryChunk:
+    """A chunk of rows of an inventory report, as columns of bucket and object names.
+
+    Equal bucket names within a shard are the same string object, so that the column
+    of bucket names costs no more than a list of references.
+    """
+
+    buckets: list[str]
+    names: list[str]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def paths(
+        self,
+        path_type: 'type[PureGCSPath] | None' = None,
+    ) -> 'list[PureGCSPath]':
+        """Builds the paths of the objects, as instances of ``path_type``
+        (:class:`PureGCSPath` if omitted).
+
+        Each path is built on the already parsed path of its bucket (see
+        :meth:`PureGCSPath._make_child_relpath`), rather than by parsing a URI.  Like
+        in listings, objects that no path can stand for (with empty or ``.``
+        segments, e.g. ``a//b``) are skipped - with a warning, unless they're
+        placeholders with a trailing ``/`` - so there may be fewer paths than names.
+        """
+        if path_type is None:
+            # pylint: disable-next=import-outside-toplevel,cyclic-import
+            from . import PureGCSPath
+
+            path_type = PureGCSPath
+        parents: dict[str, PureGCSPath] = {}
+        paths = []
+        for bucket, name in zip(self.buckets, self.names):
+            parent = parents.get(bucket)
+            if parent is None:
+                parent = parents[bucket] = path_type(f'gs://{bucket}/')
+            path = child_path(parent, name)
+            if path is not None:
+                paths.append(path)
+        return paths
+
+
+def _format(
+    source: InventorySource,
+    format: str | None,  # pylint: disable=redefined-builtin
+) -> str:
+    if format is None:
+        name = os.fspath(source) if isinstance(source, (str, os.PathLike)) else ''
+        format = 'parquet' if name.endswith('.parquet') else 'csv'
+    if format not in ('csv', 'parquet'):
+        raise ValueError(f'Unsupported inventory report format: {format!r}')
+    return format
+
+
+def _read_csv(
+    file: IO[bytes],
+    bucket_column: str,
+    name_column: str,
+    chunk_size: int,
+) -> Iterator[InventoryChunk]:
+    if isinstance(file, io.RawIOBase):
+        file = io.BufferedReader(file)  # (e.g. an ObjectReader)
+    with io.TextIOWrapper(file, encoding='utf-8', newline='') as text:
+        rows = csv.reader(text)
+        header = next(rows, [])
+        try:
+            bucket_index = header.index(bucket_column)
+            name_index = header.index(name_column)
+        except ValueError:
+            raise ValueError(
+                f'Inventory report lacks {bucket_column!r} or {name_column!r} column'
+            ) from None
+        bucket_names: dict[str, str] = {}
+        buckets: list[str] = []
+        names: list[str] = []
+        for row in rows:
+            bucket = row[bucket_index]
+            buckets.append(bucket_names.setdefault(bucket, bucket))
+            names.append(row[name_index])
+            if len(names) == chunk_size:
+                yield InventoryChunk(buckets, names)
+                buckets, names = [], []
+        if names:
+            yield InventoryChunk(buckets, names)
+
+
+def _read_parquet(
+    file: IO[bytes],
+    bucket_column: str,
+    name_column: str,
+    chunk_size: int,
+) -> Iterator[InventoryChunk]:
+    try:
+        parquet: Any = importlib.import_module('pyarrow.parquet')
+    except ImportError as e:
+        raise ImportError('Reading Parquet inventory reports requires pyarrow') from e
+    bucket_names: dict[str, str] = {}
+    for batch in parquet.ParquetFile(file).iter_batches(
+        batch_size=chunk_size, columns=[bucket_column, name_column]
+    ):
+        buckets = [
+            bucket_names.setdefault(bucket, bucket)
+            for bucket in batch.column(bucket_column).to_pylist()
+        ]
+        yield InventoryChunk(buckets, batch.column(name_column).to_pylist())
+
+
+def read_inventory_shard(  # pylint: disable=too-many-arguments
+    source: InventorySource,
+    *,
+    format: str | None = None,  # pylint: disable=redefined-builtin
+    bucket_column: str = 'bucket',
+    name_column: str = 'name',
+    chunk_size: int = DEFAULT_INVENTORY_CHUNK_SIZE,
+) -> Iterator[InventoryChunk]:
+    """Parses an inventory report shard, and yields chunks of up to ``chunk_size``
+    rows.
+
+    Args:
+        source: The shard to read; file objects are closed once read.
+        format: ``'csv'`` or ``'parquet'`` - by default, ``'parquet'`` if the file
+            name ends with ``.parquet``, and ``'csv'`` otherwise.  Reading Parquet
+            requires ``pyarrow``.
+        bucket_column: The column of bucket names.
+        name_column: The column of object names.
+        chunk_size: The maximum number of rows per chunk.
+    """
+    if chunk_size <= 0:
+        raise ValueError('Chunk size must be positive')
+    read = _read_parquet if _format(source, format) == 'parquet' else _read_csv
+    if isinstance(source, (str, os.PathLike)):
+        file: IO[bytes] = open(source, 'rb')  # pylint: disable=consider-using-with
+    else:
+        file = source
+    with file:
+        yield from read(file, bucket_column, name_column, chunk_size)
+
+
+def _read_whole_shard(
+    source: str | os.PathLike[str],
+    options: dict[str, Any],
+) -> list[InventoryChunk]:
+    return list(read_inventory_shard(source, **options))
+
+
+def read_inventory(  # pylint: disable=too-many-arguments
+    sources: Iterable[InventorySource],
+    *,
+    format: str | None = None,  # pylint: disable=redefined-builtin
+    bucket_column: str = 'bucket',
+    name_column: str = 'name',
+    chunk_size: int = DEFAULT_INVENTORY_CHUNK_SIZE,
+    processes: int | None = None,
+) -> Iterator[InventoryChunk]:
+    """Parses the shards of an inventory report one after the other, and yields chunks
+    of up to ``chunk_size`` rows; see :func:`read_inventory_shard` for the options.
+
+    With ``processes``, shards (which must be local files then) are parsed in parallel
+    by a pool of that many processes instead, and their chunks yielded shard by shard
+    in order.  Each process parses a whole shard before handing it back, so that up to
+    ``processes`` shards are held in memory at a time - and the paths are still built
+    in the calling process, from the chunks.
+
+    Example:
+        >>> for chunk in read_inventory(glob.glob('inventory/*.csv'), processes=8):
+        ...     for path in chunk.paths():
+        ...         ...
+    """
+    options: dict[str, Any] = {
+        'format': format,
+        'bucket_column': bucket_column,
+        'name_column': name_column,
+        'chunk_size': chunk_size,
+    }
+    if processes is None:
+        for source in sources:
+            yield from read_inventory_shard(source, **options)
+    else:
+        # (Spawned rather than forked, since the caller may well run threads.)
+        context = multiprocessing.get_context('spawn')
+        with concurrent.futures.ProcessPoolExecutor(processes, context) as executor:
+            pending: list[concurrent.futures.Future[list[InventoryChunk]]] = []
+            try:
+                for source in sources:
+                    if not isinstance(source, (str, os.PathLike)):
+                        raise TypeError('Only local files can be read in processes')
+                    pending.append(executor.submit(_read_whole_shard, source, options))
+                    if len(pending) == processes:
+                        yield from pending.pop(0).result()
+                for future in pending:
+                    yield from future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+def read_inventory_paths(
+    sources: Iterable[InventorySource],
+    *,
+    path_type: 'type[PureGCSPath] | None' = None,
+    **kwargs: Any,
+) -> 'Iterator[PureGCSPath]':
+    """Yields the paths of the objects listed by an inventory report, as instances of
+    ``path_type`` (:class:`PureGCSPath` if omitted); see :func:`read_inventory` for
+    the other options.
+    """
+    for chunk in read_inventory(sources, **kwargs):
+        yield from chunk.paths(path_type)
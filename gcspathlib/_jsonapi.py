@@ -0,0 +1,289 @@
+"""I/O-free helpers for the Cloud Storage JSON API, shared by the clients and the
+fake server.
+
+See https://cloud.google.com/storage/docs/json_api for the API reference.
+"""
+
+import dataclasses
+import datetime
+import errno
+import json
+import os
+import urllib.parse
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_ENDPOINT = 'https://storage.googleapis.com'
+EMULATOR_HOST_ENV = 'STORAGE_EMULATOR_HOST'
+
+BATCH_TARGET = '/batch/storage/v1'
+MAX_BATCH_SIZE = 100  # (the maximum number of calls per batch request)
+MAX_COMPOSE_SOURCES = 32  # (the maximum number of source objects per compose request)
+RESUMABLE_CHUNK_ALIGNMENT = 256 * 2**10  # (resumable upload chunks are multiples of it)
+
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+_STATUS_ERRORS: dict[int, tuple[type[OSError], int]] = {
+    401: (PermissionError, errno.EACCES),
+    403: (PermissionError, errno.EACCES),
+    404: (FileNotFoundError, errno.ENOENT),
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ObjectInfo:
+    """Metadata of a Cloud Storage object, as returned by ``stat()``.
+
+    The ``st_size`` and ``st_mtime`` aliases allow for duck-typed use in place of
+    :class:`os.stat_result`.
+    """
+
+    path: 'PureGCSPath'
+    size: int
+    generation: int
+    metageneration: int = 1
+    content_type: str | None = None
+    crc32c: str | None = None
+    md5_hash: str | None = None
+    updated: datetime.datetime | None = None
+
+    @classmethod
+    def from_resource(
+        cls,
+        path: 'PureGCSPath',
+        resource: Mapping[str, Any],
+    ) -> 'ObjectInfo':
+        """Constructs from an object resource, as returned by the JSON API."""
+        updated = resource.get('updated')
+        return cls(
+            path=path,
+            size=int(resource.get('size', 0)),
+            generation=int(resource.get('generation', 0)),
+            metageneration=int(resource.get('metageneration', 1)),
+            content_type=resource.get('contentType'),
+            crc32c=resource.get('crc32c'),
+            md5_hash=resource.get('md5Hash'),
+            updated=datetime.datetime.fromisoformat(updated) if updated else None,
+        )
+
+    def to_resource(self) -> dict[str, Any]:
+        """Converts to an object resource, as returned by the JSON API."""
+        resource: dict[str, Any] = {
+            'kind': 'storage#object',
+            'bucket': self.path.bucket,
+            'name': self.path.obj,
+            'size': str(self.size),
+            'generation': str(self.generation),
+            'metageneration': str(self.metageneration),
+        }
+        optional_fields = {
+            'contentType': self.content_type,
+            'crc32c': self.crc32c,
+            'md5Hash': self.md5_hash,
+            'updated': self.updated and self.updated.isoformat(),
+        }
+        resource.update((key, value) for key, value in optional_fields.items() if value)
+        return resource
+
+    @property
+    def st_size(self) -> int:
+        return self.size
+
+    @property
+    def st_mtime(self) -> float:
+        return self.updated.timestamp() if self.updated else 0.0
+
+
+class ListPage(NamedTuple):
+    """A single page of an object listing."""
+
+    items: list[dict[str, Any]]
+    """Object resources, in lexicographic order of their names."""
+
+    prefixes: list[str]
+    """Delimiter-terminated "directory" prefixes, if listing with a delimiter."""
+
+    next_page_token: str | None
+    """Token to request the next page with, or ``None`` for the last page."""
+
+
+def default_endpoint() -> str:
+    """The API endpoint to use by default: ``$STORAGE_EMULATOR_HOST`` if set (as with
+    the official client libraries), or the production endpoint otherwise.
+    """
+    emulator_host = os.environ.get(EMULATOR_HOST_ENV, '')
+    if emulator_host and '://' not in emulator_host:
+        emulator_host = f'http://{emulator_host}'
+    return emulator_host.rstrip('/') or DEFAULT_ENDPOINT
+
+
+def _quote(name: str) -> str:
+    return urllib.parse.quote(name, safe='')
+
+
+def _query(params: Mapping[str, object]) -> str:
+    query = urllib.parse.urlencode(
+        {key: value for key, value in params.items() if value not in (None, '')}
+    )
+    return f'?{query}' if query else ''
+
+
+def bucket_target(
+    bucket: str,
+    **params: object,
+) -> str:
+    """The request target for the objects collection of ``bucket`` (i.e. listing)."""
+    return f'/storage/v1/b/{_quote(bucket)}/o{_query(params)}'
+
+
+def object_target(
+    bucket: str,
+    obj: str,
+    **params: object,
+) -> str:
+    """The request target for a single object resource (or its media)."""
+    return f'/storage/v1/b/{_quote(bucket)}/o/{_quote(obj)}{_query(params)}'
+
+
+def copy_target(
+    source: 'PureGCSPath',
+    destination: 'PureGCSPath',
+    **params: object,
+) -> str:
+    """The request target for copying an object to another (within the same location
+    and storage class) - the generation of the source if it's generation-pinned.
+    """
+    source_target = object_target(source.bucket, source.obj)
+    destination_path = f'b/{_quote(destination.bucket)}/o/{_quote(destination.obj)}'
+    query = _query({'sourceGeneration': source.generation, **params})
+    return f'{source_target}/copyTo/{destination_path}{query}'
+
+
+def upload_target(
+    bucket: str,
+    obj: str,
+    upload_type: str = 'media',
+    **params: object,
+) -> str:
+    """The request target for uploading an object."""
+    query = _query({'uploadType': upload_type, 'name': obj, **params})
+    return f'/upload/storage/v1/b/{_quote(bucket)}/o{query}'
+
+
+class BatchPart(NamedTuple):
+    """A sub-request or sub-response of a batch request: an HTTP message embedded in a
+    ``multipart/mixed`` body, with lowercased header names.
+    """
+
+    content_id: str
+    """Identifies the sub-request, and its sub-response as ``response-<content_id>``."""
+
+    start_line: str
+    """The request line (e.g. ``DELETE /storage/v1/b/bucket/o/obj HTTP/1.1``) or the
+    status line (e.g. ``HTTP/1.1 204 No Content``) of the message.
+    """
+
+    headers: dict[str, str]
+    body: bytes
+
+
+def encode_batch(
+    parts: Iterable[BatchPart],
+    boundary: str,
+) -> bytes:
+    """Encodes the parts of a batch request or response as a ``multipart/mixed`` body,
+    for a ``Content-Type`` of ``multipart/mixed; boundary=<boundary>``.
+    """
+    chunks: list[bytes] = []
+    for part in parts:
+        lines = [
+            f'--{boundary}',
+            'Content-Type: application/http',
+            f'Content-ID: <{part.content_id}>',
+            '',
+            part.start_line,
+            *(f'{name}: {value}' for name, value in part.headers.items()),
+            f'Content-Length: {len(part.body)}',
+            '',
+            '',
+        ]
+        chunks += ['\r\n'.join(lines).encode(), part.body, b'\r\n']
+    chunks.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(chunks)
+
+
+def decode_batch(
+    body: bytes,
+    content_type: str,
+) -> list[BatchPart]:
+    """Decodes the parts of a batch request or response from a ``multipart/mixed`` body.
+
+    Raises:
+        ValueError: If the body is malformed.
+    """
+    _, _, boundary = content_type.partition('boundary=')
+    boundary = boundary.split(';')[0].strip().strip('"')
+    if not boundary:
+        raise ValueError(f'Not a multipart content type: {content_type!r}')
+    parts: list[BatchPart] = []
+    for chunk in body.split(f'--{boundary}'.encode())[1:]:
+        if chunk.startswith(b'--'):
+            break  # (the closing delimiter)
+        # (The line break before each delimiter belongs to the delimiter.)
+        chunk = chunk.removeprefix(b'\r\n').removesuffix(b'\r\n')
+        part_headers, message = _split_message(chunk)
+        message_headers, message_body = _split_message(message)
+        start_line, _, header_lines = message_headers.partition('\r\n')
+        headers = _parse_headers(header_lines)
+        length = int(headers.get('content-length', len(message_body)))
+        content_id = _parse_headers(part_headers).get('content-id', '')
+        parts.append(
+            BatchPart(
+                content_id.strip('<>'), start_line, headers, message_body[:length]
+            )
+        )
+    return parts
+
+
+def _split_message(data: bytes) -> tuple[str, bytes]:
+    head, separator, body = data.partition(b'\r\n\r\n')
+    if not separator:
+        raise ValueError('Malformed batch part')
+    return head.decode('latin-1'), body
+
+
+def _parse_headers(lines: str) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for line in lines.split('\r\n'):
+        name, _, value = line.partition(':')
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def error_message(body: bytes) -> str:
+    """Extracts the error message from a JSON API error response body."""
+    message: str
+    try:
+        message = str(json.loads(body)['error']['message'])
+    except (ValueError, KeyError, TypeError):
+        message = body.decode('utf-8', 'replace').strip()
+    return message
+
+
+def status_error(
+    status: int,
+    message: str,
+    filename: object,
+) -> OSError:
+    """Maps an HTTP error status onto the closest built-in :class:`OSError` subclass,
+    e.g. :class:`FileNotFoundError` for 404.
+    """
+    error_type, error_code = _STATUS_ERRORS.get(status, (OSError, errno.EIO))
+    return error_type(error_code, f'{message} (HTTP {status})', filename)
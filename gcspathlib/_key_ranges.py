@@ -0,0 +1,96 @@
+"""Analysis of how object names are spread across key ranges.
+
+Cloud Storage scales request rates by splitting the (lexicographic) key range of a
+bucket as the load on it grows, which takes time - so workloads that keep writing to a
+narrow key range, e.g. with timestamps or incrementing IDs as names under a single
+prefix, are throttled.  See
+https://cloud.google.com/storage/docs/request-rate#naming-convention.
+"""
+
+import dataclasses
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_KEY_PREFIX_LENGTH = 4
+DEFAULT_KEY_RANGE_TOP = 10
+
+_DIGITS = re.compile(r'\d+')
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class KeyRangeReport:
+    """The spread of object names across key ranges, as returned by
+    :func:`analyze_key_ranges`.
+    """
+
+    count: int
+    """The number of paths analyzed."""
+    prefixes: list[tuple[str, int]]
+    """The most common key prefixes (``gs://`` URIs of a bucket and the start of an
+    object name), with the number of paths under each, most common first.
+    """
+    sequential: float
+    """The fraction of paths whose name follows the previous name in the same bucket
+    sequentially: it sorts after it, and only differs from it in runs of digits.
+    """
+    patterns: list[tuple[str, int]]
+    """The most common sequential naming patterns (names with runs of digits replaced
+    by ``#``), with the number of sequential paths of each, most common first.
+    """
+
+    @property
+    def concentration(self) -> float:
+        """The fraction of paths under the most common key prefix."""
+        return self.prefixes[0][1] / self.count if self.prefixes else 0.0
+
+
+def analyze_key_ranges(
+    paths: Iterable['PureGCSPath'],
+    *,
+    prefix_length: int = DEFAULT_KEY_PREFIX_LENGTH,
+    top: int = DEFAULT_KEY_RANGE_TOP,
+) -> KeyRangeReport:
+    """Reports how concentrated the object names of ``paths`` are in key ranges, and
+    how sequentially they're named.
+
+    ``paths`` are consumed as a stream, in the order they're written (or read) in; only
+    the counters and the previous name of each bucket are kept.  A high
+    :attr:`~KeyRangeReport.concentration` or :attr:`~KeyRangeReport.sequential`
+    fraction in a high request-rate workload suggests spreading the names, e.g. with
+    :meth:`PureGCSPath.with_hash_prefix`.
+
+    Args:
+        paths: The paths, with object names.
+        prefix_length: The number of leading characters of object names that make up
+            a key prefix.
+        top: The number of prefixes and patterns to report.
+
+    Example:
+        >>> report = analyze_key_ranges(path for path, _ in written)
+        >>> if report.sequential > 0.9:
+        ...     print('Sequential names:', report.patterns[0][0])
+    """
+    prefixes: Counter[str] = Counter()
+    patterns: Counter[str] = Counter()
+    previous: dict[str, tuple[str, str]] = {}
+    count = 0
+    for path in paths:
+        bucket, obj = path.bucket, path.obj
+        shape = _DIGITS.sub('#', obj)
+        prefixes[f'gs://{bucket}/{obj[:prefix_length]}'] += 1
+        last = previous.get(bucket)
+        if last is not None and last[1] == shape and last[0] < obj:
+            patterns[f'gs://{bucket}/{shape}'] += 1
+        previous[bucket] = (obj, shape)
+        count += 1
+    return KeyRangeReport(
+        count,
+        prefixes.most_common(top),
+        patterns.total() / count if count else 0.0,
+        patterns.most_common(top),
+    )
@@ -0,0 +1,213 @@
+"""Incremental parsing of object listing pages of the JSON API.
+
+Listing pages are large JSON documents, of which usually only the names (and maybe a
+few other fields) of the objects are needed.  Rather than decoding the whole page into
+a dict per object up front, the items are decoded one at a time as they're iterated
+(by the C-accelerated scanner of :mod:`json`), and only the requested fields are kept
+- so no more than one item is held in decoded form at a time, besides the paths and
+values handed out.
+
+(Skipping the unrequested fields without decoding them is slower than decoding them
+in C: a pure-Python scanner takes several times as long as :func:`json.loads`.)
+"""
+
+import json
+import json.decoder
+import re
+from ._listing import child_path
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+PathT = TypeVar('PathT', bound='PureGCSPath')
+
+INT64_FIELDS = frozenset({'generation', 'metageneration', 'size'})
+"""Object resource fields that are 64-bit integers - which the API encodes as strings,
+and which are converted to :class:`int`.
+"""
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+
+_scanstring = json.decoder.scanstring  # type: ignore[attr-defined]
+
+
+class _Scanner:
+    """Cursor over a JSON document, which the caller steers through the structure."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+    def _skip_whitespace(self) -> None:
+        match = _WHITESPACE.match(self.text, self.pos)
+        assert match is not None
+        self.pos = match.end()
+
+    def _next(self) -> str:
+        """Returns the next non-whitespace character, and moves past it."""
+        self._skip_whitespace()
+        if self.pos >= len(self.text):
+            raise self._error('Unexpected end of document')
+        self.pos += 1
+        return self.text[self.pos - 1]
+
+    def _expect(self, char: str) -> None:
+        if self._next() != char:
+            self.pos -= 1
+            raise self._error(f'Expecting {char!r}')
+
+    def _more(self, close: str) -> bool:
+        """Moves past the separator after a member or element, and returns whether
+        another one follows (rather than ``close``).
+        """
+        char = self._next()
+        if char not in (',', close):
+            self.pos -= 1
+            raise self._error(f'Expecting \',\' or {close!r}')
+        return char == ','
+
+    def _empty(self, close: str) -> bool:
+        """Moves past ``close`` if it's next, and returns whether it was."""
+        empty = self._next() == close
+        if not empty:
+            self.pos -= 1
+        return empty
+
+    def members(self) -> Iterator[str]:
+        """Iterates over the keys of the object at the cursor, leaving the cursor at
+        the value of each - which the caller must consume (see :meth:`value`) before
+        iterating further.
+        """
+        self._expect('{')
+        more = not self._empty('}')
+        while more:
+            self._expect('"')
+            key, self.pos = _scanstring(self.text, self.pos)
+            self._expect(':')
+            yield key
+            more = self._more('}')
+
+    def values(self) -> Iterator[Any]:
+        """Iterates over the decoded elements of the array at the cursor, decoding
+        each only once it's asked for.
+        """
+        self._expect('[')
+        if self._empty(']'):
+            return
+        self._skip_whitespace()
+        # (Calling the C scanner directly saves the overhead of raw_decode per item.)
+        scan_once = _DECODER.scan_once  # type: ignore[attr-defined]
+        text, separator = self.text, _SEPARATOR.match
+        more = True
+        while more:
+            try:
+                value, self.pos = scan_once(text, self.pos)
+            except StopIteration as e:
+                raise json.JSONDecodeError('Expecting value', text, e.value) from None
+            yield value
+            match = separator(text, self.pos)
+            if match is None:
+                raise self._error("Expecting ',' or ']'")
+            self.pos = match.end()
+            more = match.group(1) == ','
+
+    def value(self) -> Any:
+        """Decodes the value at the cursor, and moves past it."""
+        self._skip_whitespace()
+        value, self.pos = _DECODER.raw_decode(self.text, self.pos)
+        return value
+
+
+class ListPageParser(Generic[PathT]):
+    """Iterates over the objects of a listing page (i.e. the response of the
+    ``objects.list`` JSON API method), yielding ``(path, values)`` pairs - where
+    ``values`` are the requested ``fields`` of the object resource, or ``None`` for
+    fields it lacks.
+
+    Paths are built on ``bucket`` without re-parsing it (see
+    :meth:`PureGCSPath._make_child_relpath`).  Objects that no path can stand for
+    (with empty or ``.`` segments, e.g. ``a//b``) are skipped - with a warning, unless
+    they're placeholders with a trailing ``/``.  The prefixes and the next page token
+    of the page are available once the iteration is complete.
+
+    Example:
+        >>> parser = ListPageParser(body, PureGCSPath('gs://bucket'), ['size'])
+        >>> total = sum(size for path, (size,) in parser)
+        >>> parser.next_page_token
+        'CgRmaWxl'
+    """
+
+    def __init__(
+        self,
+        data: bytes | bytearray | memoryview | str,
+        bucket: PathT,
+        fields: Sequence[str] = (),
+    ) -> None:
+        """
+        Args:
+            data: The page, as UTF-8 encoded bytes or a string.  Only the decoding of
+                the items is incremental, while the page is held in memory whole - which
+                the API bounds to 1000 objects per page - so files must be read first.
+            bucket: The (bucket-only) path of the listed bucket.
+            fields: The fields of the object resources to decode, e.g.
+                ``['size', 'generation']``; see :data:`INT64_FIELDS`.
+
+        Raises:
+            TypeError: If ``data`` isn't bytes or a string (e.g. a file object).
+            ValueError: If ``bucket`` isn't bucket-only.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview, str)):
+            raise TypeError(
+                f'Page must be bytes or a string, not {type(data).__name__}'
+            )
+        if not bucket.bucket or bucket.obj:
+            raise ValueError(f'Path must be bucket-only: {bucket!r}')
+        self._text = data if isinstance(data, str) else str(data, 'utf-8')
+        self.bucket = bucket
+        self.fields = tuple(fields)
+        self.prefixes: list[str] = []
+        """The delimiter-terminated "directory" prefixes, once iterated."""
+        self.next_page_token: str | None = None
+        """The token to request the next page with, once iterated."""
+
+    def __iter__(self) -> Iterator[tuple[PathT, tuple[Any, ...]]]:
+        scanner = _Scanner(self._text)
+        for key in scanner.members():
+            if key == 'items':
+                yield from self._items(scanner)
+            elif key == 'prefixes':
+                self.prefixes = scanner.value()
+            elif key == 'nextPageToken':
+                self.next_page_token = scanner.value()
+            else:
+                scanner.value()
+
+    def _items(
+        self,
+        scanner: _Scanner,
+    ) -> Iterator[tuple[PathT, tuple[Any, ...]]]:
+        bucket = self.bucket
+        fields = [(field, field in INT64_FIELDS) for field in self.fields]
+        for item in scanner.values():
+            name = item.get('name') if isinstance(item, dict) else None
+            if not isinstance(name, str):
+                raise ValueError('Object resource without a name')
+            path = child_path(bucket, name)
+            if path is None:
+                continue
+            values = []
+            for field, int64 in fields:
+                value = item.get(field)
+                values.append(int(value) if int64 and value is not None else value)
+            yield path, tuple(values)
@@ -0,0 +1,296 @@
+"""Streaming listings over a :class:`gcspathlib.Backend`.
+
+Listing pages are chained by page tokens, so they can only be fetched one after the
+other.  To hide that latency, the next page is requested in a background thread as
+soon as the previous one arrives, while the caller is still consuming it.  Listings
+of whole subtrees can additionally be split by ``/``-delimited sub-prefix, and the
+sub-prefixes listed concurrently.
+"""
+
+import collections
+import concurrent.futures
+import fnmatch
+import functools
+import pathlib
+import warnings
+from ._backend import Backend
+from ._jsonapi import ListPage
+from collections.abc import Callable
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+PathT = TypeVar('PathT', bound='PureGCSPath')
+
+_Fetch = Callable[[str | None], ListPage]
+"""Fetches the listing page for a page token."""
+
+
+class _Pages:
+    """Iterator over the pages of a listing, requesting each next page from
+    ``executor`` as soon as the previous one has arrived - or from the calling thread
+    on demand if there's no ``executor``.
+    """
+
+    def __init__(
+        self,
+        fetch: _Fetch,
+        executor: concurrent.futures.Executor | None,
+    ) -> None:
+        self._fetch = fetch
+        self._executor = executor
+        self._future: concurrent.futures.Future[ListPage] | None = None
+        self._page_token: str | None = ''
+        self._submit()
+
+    def _submit(self) -> None:
+        if self._executor is not None and self._page_token is not None:
+            self._future = self._executor.submit(self._fetch, self._page_token or None)
+
+    def __iter__(self) -> Iterator[ListPage]:
+        return self
+
+    def __next__(self) -> ListPage:
+        if self._page_token is None:
+            raise StopIteration
+        if self._future is None:
+            page = self._fetch(self._page_token or None)
+        else:
+            page = self._future.result()
+        self._page_token = page.next_page_token
+        self._submit()
+        return page
+
+
+def _executor(workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(
+        workers, thread_name_prefix='gcspathlib-listing'
+    )
+
+
+def _entries(page: ListPage) -> list[tuple[str, bool]]:
+    """The object names and prefixes of ``page`` in lexicographic order, along with
+    whether each is a prefix.
+    """
+    return sorted(
+        [
+            *((item['name'], False) for item in page.items),
+            *((prefix, True) for prefix in page.prefixes),
+        ]
+    )
+
+
+def iter_pages(  # pylint: disable=too-many-arguments
+    backend: Backend,
+    bucket: str,
+    *,
+    prefix: str = '',
+    delimiter: str = '',
+    start_offset: str = '',
+    end_offset: str = '',
+    max_results: int | None = None,
+    prefetch: bool = True,
+) -> Iterator[ListPage]:
+    """Yields all pages of a listing (see :meth:`Backend.list_page`).
+
+    With ``prefetch``, each next page is requested in a background thread as soon as
+    the previous one has arrived, so that the caller's processing of a page overlaps
+    with fetching the next one.
+    """
+    fetch = functools.partial(
+        _list_page,
+        backend,
+        bucket,
+        prefix=prefix,
+        delimiter=delimiter,
+        start_offset=start_offset,
+        end_offset=end_offset,
+        max_results=max_results,
+    )
+    executor = _executor(1) if prefetch else None
+    try:
+        yield from _Pages(fetch, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _list_page(  # pylint: disable=too-many-arguments
+    backend: Backend,
+    bucket: str,
+    page_token: str | None,
+    *,
+    prefix: str,
+    delimiter: str = '',
+    start_offset: str = '',
+    end_offset: str = '',
+    max_results: int | None = None,
+) -> ListPage:
+    return backend.list_page(
+        bucket,
+        prefix=prefix,
+        delimiter=delimiter,
+        start_offset=start_offset,
+        end_offset=end_offset,
+        page_token=page_token,
+        max_results=max_results,
+    )
+
+
+def _check_bucket(path: 'PureGCSPath') -> str:
+    """Returns the listing prefix for the objects under ``path``."""
+    if not path.bucket:
+        raise ValueError(f'Path must have a bucket: {path!r}')
+    return f'{path.obj}/' if path.obj else ''
+
+
+def child_path(
+    path: PathT,
+    rel: str,
+) -> PathT | None:
+    """Returns the path of the listed object (or prefix) named ``rel`` relative to
+    ``path`` - or ``None`` if the name has empty or ``.`` segments (e.g. ``a//b``),
+    which no path can stand for.  Such names are skipped with a warning, except for
+    placeholder objects (i.e. with a trailing ``/``), which listings skip anyway.
+    """
+    try:
+        child = path._make_child_relpath(rel)  # pylint: disable=protected-access
+    except ValueError:
+        if not rel.endswith('/'):
+            warnings.warn(
+                f'Skipping object that has no path: {rel!r} under {str(path)!r}',
+                stacklevel=3,
+            )
+        child = None
+    return child
+
+
+def iterdir(
+    path: PathT,
+    backend: Backend,
+    *,
+    prefetch: bool = True,
+) -> Iterator[PathT]:
+    """Yields the objects and "subdirectories" directly under ``path``, which may be
+    bucket-only, in lexicographic order.
+
+    "Subdirectories" are the common prefixes of object names up to the next ``/``, as
+    in the Cloud Storage console.  Placeholder objects named after the directory itself
+    (i.e. with a trailing ``/``) are skipped, as are - with a warning - names that no
+    path can stand for (with empty or ``.`` segments, e.g. ``a//b``).  Children are
+    built from ``path`` without re-parsing it.  See :func:`iter_pages` for
+    ``prefetch``.
+    """
+    prefix = _check_bucket(path)
+    for page in iter_pages(
+        backend, path.bucket, prefix=prefix, delimiter='/', prefetch=prefetch
+    ):
+        for name, _ in _entries(page):
+            # (Prefixes end with the delimiter, and an empty name is the placeholder.)
+            rel = name[len(prefix) :]
+            if rel:
+                child = child_path(path, rel[:-1] if rel.endswith('/') else rel)
+                if child is not None:
+                    yield child
+
+
+def rglob(
+    path: PathT,
+    pattern: str,
+    backend: Backend,
+    *,
+    concurrency: int = 1,
+    prefetch: bool = True,
+) -> Iterator[PathT]:
+    """Yields the objects anywhere under ``path``, which may be bucket-only, whose
+    names relative to ``path`` match ``pattern``, in lexicographic order.
+
+    Like :meth:`pathlib.Path.rglob`, a pattern without ``/`` (e.g. ``*.txt``) matches
+    the last segment of the name, and a pattern with ``/`` matches the trailing
+    segments (see :meth:`pathlib.PurePath.match`).  Only objects are yielded, since
+    "directories" only exist as the prefixes of object names; placeholder objects
+    (i.e. with a trailing ``/``) are skipped, as are - with a warning - names that no
+    path can stand for (with empty or ``.`` segments, e.g. ``a//b``).
+
+    By default, the objects are listed in a single flat listing.  With a
+    ``concurrency`` greater than 1, each ``/``-delimited sub-prefix directly under
+    ``path`` is listed separately instead, with up to ``concurrency`` of them being
+    fetched ahead concurrently - which helps with many moderately sized
+    "subdirectories", such as date partitions.  See :func:`iter_pages` for
+    ``prefetch``.
+    """
+    prefix = _check_bucket(path)
+    matches = functools.partial(
+        _match_segments if '/' in pattern else _match_name, pattern=pattern
+    )
+    fetch = functools.partial(_list_page, backend, path.bucket)
+    workers = max(concurrency, 1) + 1
+    executor = _executor(workers) if prefetch or concurrency > 1 else None
+    try:
+        if concurrency > 1:
+            names = _split_names(fetch, prefix, concurrency, executor)
+        else:
+            names = _names(_Pages(functools.partial(fetch, prefix=prefix), executor))
+        for name in names:
+            rel = name[len(prefix) :]
+            if rel and not rel.endswith('/') and matches(rel):
+                if (child := child_path(path, rel)) is not None:
+                    yield child
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _match_name(
+    rel: str,
+    pattern: str,
+) -> bool:
+    return fnmatch.fnmatchcase(rel.rpartition('/')[2], pattern)
+
+
+def _match_segments(
+    rel: str,
+    pattern: str,
+) -> bool:
+    return pathlib.PurePosixPath(rel).match(pattern)
+
+
+def _names(pages: Iterator[ListPage]) -> Iterator[str]:
+    for page in pages:
+        for item in page.items:
+            yield item['name']
+
+
+def _split_names(
+    fetch: Callable[..., ListPage],
+    prefix: str,
+    concurrency: int,
+    executor: concurrent.futures.Executor | None,
+) -> Iterator[str]:
+    """Yields the object names under ``prefix`` in lexicographic order, listing each
+    ``/``-delimited sub-prefix separately - with the listings of up to
+    ``concurrency`` upcoming entries started ahead.
+    """
+    top = _Pages(functools.partial(fetch, prefix=prefix, delimiter='/'), executor)
+    window: collections.deque[tuple[str, _Pages | None]] = collections.deque()
+    for page in top:
+        for name, is_prefix in _entries(page):
+            sub_pages = None
+            if is_prefix:
+                sub_pages = _Pages(functools.partial(fetch, prefix=name), executor)
+            window.append((name, sub_pages))
+            if len(window) >= concurrency:
+                yield from _drain(window.popleft())
+    while window:
+        yield from _drain(window.popleft())
+
+
+def _drain(entry: tuple[str, _Pages | None]) -> Iterator[str]:
+    name, sub_pages = entry
+    if sub_pages is None:
+        yield name
+    else:
+        yield from _names(sub_pages)
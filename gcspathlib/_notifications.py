@@ -0,0 +1,154 @@
+"""Batch parsing of Pub/Sub notifications of object changes.
+
+Cloud Storage publishes a message per object change, with the bucket, name, and
+generation of the object in the attributes, and (with the ``JSON_API_V1`` payload
+format) its object resource as the JSON payload.  Batches of messages are turned into
+paths built on the already parsed path of each bucket - without formatting and
+re-parsing a ``gs://`` URI per message.
+
+See https://cloud.google.com/storage/docs/pubsub-notifications for the message format.
+"""
+
+import dataclasses
+import datetime
+import json
+from ._jsonapi import ObjectInfo
+from ._listing import child_path
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+JSON_PAYLOAD_FORMAT = 'JSON_API_V1'
+
+
+class NotificationMessage(Protocol):
+    """A Pub/Sub message, e.g. a ``google.cloud.pubsub_v1.subscriber.message.Message``.
+
+    The data of push deliveries is base64-encoded, and must be decoded first.
+    """
+
+    @property
+    def attributes(self) -> Mapping[str, str]: ...
+
+    @property
+    def data(self) -> bytes | bytearray | memoryview: ...
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ObjectNotification:
+    """A notification of an object change."""
+
+    path: 'PureGCSPath'
+    event_type: str
+    """``OBJECT_FINALIZE``, ``OBJECT_METADATA_UPDATE``, ``OBJECT_DELETE``, or
+    ``OBJECT_ARCHIVE``.
+    """
+    generation: int | None = None
+    event_time: datetime.datetime | None = None
+    overwrote_generation: int | None = None
+    """The generation of the object this one replaced, if any."""
+    overwritten_by_generation: int | None = None
+    """The generation of the object that replaced this one, if any."""
+    info: ObjectInfo | None = None
+    """The metadata of the object, if the message has a JSON payload."""
+
+
+def _resource(
+    message: NotificationMessage,
+    attributes: Mapping[str, str],
+) -> dict[str, Any] | None:
+    data = message.data
+    resource = None
+    if attributes.get('payloadFormat') == JSON_PAYLOAD_FORMAT and data:
+        # (Decoded once into a string, since json.loads() doesn't take memoryviews.)
+        resource = json.loads(str(data, 'utf-8'))
+        if not isinstance(resource, dict):
+            raise ValueError('Notification payload must be an object resource')
+    return resource
+
+
+def parse_notifications(  # pylint: disable=too-many-locals
+    messages: Iterable[NotificationMessage],
+    *,
+    path_type: 'type[PureGCSPath] | None' = None,
+    payloads: bool = True,
+) -> list[ObjectNotification]:
+    """Parses a batch of object change notifications.
+
+    The bucket, name, and generation of each object are taken from the attributes -
+    or, if they lack them, from the payload.  Paths are instances of ``path_type``
+    (:class:`PureGCSPath` if omitted), built on a single path per bucket, and so share
+    its bucket string.  Notifications of objects that no path can stand for (with
+    empty or ``.`` segments, e.g. ``a//b``) are skipped - with a warning, unless
+    they're placeholders with a trailing ``/``.
+
+    Args:
+        messages: The messages, as received from a subscription.
+        path_type: The type of the paths.
+        payloads: Whether to decode the JSON payloads into
+            :attr:`ObjectNotification.info` - or skip them if the attributes suffice.
+
+    Example:
+        >>> response = subscriber.pull(subscription=subscription, max_messages=1000)
+        >>> for notification in parse_notifications(
+        ...     received.message for received in response.received_messages
+        ... ):
+        ...     if notification.event_type == 'OBJECT_FINALIZE':
+        ...         process(notification.path)
+
+    Raises:
+        ValueError: If a message lacks the bucket or the name of the object, or its
+            payload is invalid.
+    """
+    if path_type is None:
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from . import PureGCSPath
+
+        path_type = PureGCSPath
+    parents: dict[str, PureGCSPath] = {}
+    fromisoformat = datetime.datetime.fromisoformat
+    notifications = []
+    for message in messages:
+        get = message.attributes.get
+        bucket = get('bucketId')
+        name = get('objectId')
+        generation = get('objectGeneration')
+        resource = None
+        if payloads or not (bucket and name):
+            resource = _resource(message, message.attributes)
+        if resource is not None:
+            bucket = bucket or resource.get('bucket')
+            name = name or resource.get('name')
+            generation = generation or resource.get('generation')
+        if not bucket or not name:
+            raise ValueError('Notification lacks the bucket or name of the object')
+        parent = parents.get(bucket)
+        if parent is None:
+            parent = parents[bucket] = path_type(f'gs://{bucket}/')
+        path = child_path(parent, name)
+        if path is None:
+            continue
+        event_time = get('eventTime')
+        overwrote = get('overwroteGeneration')
+        overwritten_by = get('overwrittenByGeneration')
+        notifications.append(
+            ObjectNotification(
+                path,
+                get('eventType', ''),
+                int(generation) if generation else None,
+                fromisoformat(event_time) if event_time else None,
+                int(overwrote) if overwrote else None,
+                int(overwritten_by) if overwritten_by else None,
+                (
+                    ObjectInfo.from_resource(path, resource)
+                    if payloads and resource is not None
+                    else None
+                ),
+            )
+        )
+    return notifications
@@ -0,0 +1,120 @@
+"""Hive-style partitions of object names, e.g. ``events/dt=2026-10-16/hr=07/part-0``.
+
+The ``key=value`` segments of a name are parsed once per path, and cached on it.  The
+batch functions additionally parse the segments of each "directory" once for all the
+paths under it, and cache the result on each path - so that a batch of many objects
+in few partitions is parsed in about the time of just the partitions.
+"""
+
+import types
+import urllib.parse
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+PathT = TypeVar('PathT', bound='PureGCSPath')
+
+Partitions = Mapping[str, str]
+
+_NO_PARTITIONS: Partitions = types.MappingProxyType({})
+
+
+def parse_partitions(parts: Iterable[str]) -> Partitions:
+    """Parses the ``key=value`` segments among ``parts`` into a read-only mapping, with
+    ``%``-escaped characters (as escaped by Hive) unescaped.
+    """
+    partitions = {}
+    for part in parts:
+        if '=' in part:
+            key, _, value = part.partition('=')
+            if '%' in part:
+                key, value = urllib.parse.unquote(key), urllib.parse.unquote(value)
+            if key:
+                partitions[key] = value
+    return types.MappingProxyType(partitions) if partitions else _NO_PARTITIONS
+
+
+def _iter_partitions(
+    paths: Iterable[PathT],
+) -> Iterator[tuple[PathT, Partitions]]:
+    """Yields the partitions of each of ``paths``, parsing the segments of each
+    "directory" only once.
+    """
+    parents: dict[tuple[str, ...], Partitions] = {}
+    for path in paths:
+        partitions = getattr(path, '_partitions', None)
+        if partitions is None:
+            parts = path._obj_parts  # pylint: disable=protected-access
+            parent = parts[:-1]
+            partitions = parents.get(parent)
+            if partitions is None:
+                partitions = parents[parent] = parse_partitions(parent)
+            if parts and '=' in parts[-1]:
+                partitions = types.MappingProxyType(
+                    {**partitions, **parse_partitions(parts[-1:])}
+                )
+            path._partitions = partitions  # pylint: disable=protected-access
+        yield path, partitions
+
+
+def partition_columns(
+    paths: Iterable['PureGCSPath'],
+    keys: Sequence[str] | None = None,
+) -> dict[str, list[str | None]]:
+    """Returns the partition values of ``paths`` as columns: a list per key, with the
+    value of each path in order - or ``None`` for paths without the key.
+
+    Args:
+        paths: The paths.
+        keys: The keys of the columns, or ``None`` for all the keys of any of the
+            paths, in the order they're first seen in.
+
+    Example:
+        >>> partition_columns(paths)
+        {'dt': ['2026-10-16', '2026-10-16', '2026-10-17'], 'hr': ['07', '08', '00']}
+    """
+    columns: dict[str, list[str | None]] = {key: [] for key in keys or ()}
+    count = 0
+    for _, partitions in _iter_partitions(paths):
+        if keys is None:
+            for key in partitions:
+                if key not in columns:
+                    columns[key] = [None] * count
+        for key, column in columns.items():
+            column.append(partitions.get(key))
+        count += 1
+    return columns
+
+
+def prune_partitions(
+    paths: Iterable[PathT],
+    predicate: Callable[[Partitions], bool],
+) -> Iterator[PathT]:
+    """Yields the paths whose partitions satisfy ``predicate`` - e.g. to filter a
+    listing or an inventory report down to the objects to read, before reading any.
+
+    The predicate is called once per partition "directory", rather than once per path
+    - unless the partitions of the paths have already been parsed one by one.
+
+    Example:
+        >>> paths = prune_partitions(
+        ...     rglob(PureGCSPath('gs://lake/events'), '*.parquet', backend),
+        ...     lambda partitions: partitions.get('dt', '') >= '2026-10-01',
+        ... )
+    """
+    # (Keyed by identity, since the partitions of the paths in a "directory" are
+    # shared - and kept along with the result, so that the identity isn't reused.)
+    results: dict[int, tuple[Partitions, bool]] = {}
+    for path, partitions in _iter_partitions(paths):
+        cached = results.get(id(partitions))
+        if cached is None:
+            cached = results[id(partitions)] = (partitions, predicate(partitions))
+        if cached[1]:
+            yield path
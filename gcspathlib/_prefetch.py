@@ -0,0 +1,171 @@
+"""Bounded-concurrency reads of many (small) objects.
+
+Reading small objects one after the other spends most of the time waiting for round
+trips, so a pipeline keeps a number of reads in flight at all times instead.  To bound
+memory, no further reads are started while the contents read but not yet consumed add
+up to a maximum size - so memory use is capped by that size plus the objects in
+flight, regardless of how far the reads get ahead of the consumer.
+"""
+
+import concurrent.futures
+from ._backend import Backend
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import Protocol
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+DEFAULT_PREFETCH_CONCURRENCY = 32
+DEFAULT_PREFETCH_BUFFER_SIZE = 64 * 2**20
+
+PathT = TypeVar('PathT', bound='PureGCSPath')
+
+
+class _Future(Protocol):
+    def done(self) -> bool: ...
+
+    def cancelled(self) -> bool: ...
+
+    def exception(self) -> BaseException | None: ...
+
+    def result(self) -> Any: ...
+
+
+FutureT = TypeVar('FutureT', bound=_Future)
+
+
+class ReadWindow(Generic[PathT, FutureT]):
+    """Bookkeeping of a read pipeline - which reads to start, and which finished read
+    to hand out next - shared by the thread-pool (:func:`read_many`) and the asyncio
+    (:func:`gcspathlib.aio.read_many`) implementations.
+
+    Reads are represented by futures (or tasks) resolving to the contents of objects.
+    In order, finished reads are only handed out once all earlier ones have been, and
+    reads are only started up to ``window`` paths ahead of the oldest one not handed
+    out yet - bounding the reorder buffer.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        max_buffered: int,
+        ordered: bool,
+        window: int | None,
+    ) -> None:
+        if concurrency <= 0 or max_buffered <= 0 or (window or 1) <= 0:
+            raise ValueError('Concurrency, buffer size, and window must be positive')
+        self.concurrency = concurrency
+        self.max_buffered = max_buffered
+        self.ordered = ordered
+        self.window = 2 * concurrency if window is None else window
+        self.in_flight: dict[FutureT, tuple[int, PathT]] = {}
+        self.buffered = 0
+        """The total size of the finished reads not handed out yet."""
+        self._finished: dict[int, tuple[PathT, FutureT]] = {}
+        self._started = 0
+        self._handed_out = 0
+
+    def __bool__(self) -> bool:
+        """Determines whether there are reads in flight or not handed out yet."""
+        return bool(self.in_flight or self._finished)
+
+    def can_start(self) -> bool:
+        return (
+            len(self.in_flight) < self.concurrency
+            and self.buffered < self.max_buffered
+            and (not self.ordered or self._started - self._handed_out < self.window)
+        )
+
+    def start(self, path: PathT, future: FutureT) -> None:
+        self.in_flight[future] = (self._started, path)
+        self._started += 1
+
+    def finish(self, future: FutureT) -> None:
+        index, path = self.in_flight.pop(future)
+        self._finished[index] = (path, future)
+        if not future.cancelled() and future.exception() is None:
+            self.buffered += len(future.result())
+
+    def pop(self) -> tuple[PathT, FutureT] | None:
+        """Takes the next finished read to hand out, if any."""
+        index = self._handed_out if self.ordered else next(iter(self._finished), -1)
+        item = self._finished.pop(index, None)
+        if item is not None:
+            self._handed_out += 1
+            if not item[1].cancelled() and item[1].exception() is None:
+                self.buffered -= len(item[1].result())
+        return item
+
+    def clear(self) -> list[FutureT]:
+        """Forgets all reads, and returns their futures - e.g. to cancel them."""
+        futures = [*self.in_flight, *(future for _, future in self._finished.values())]
+        self.in_flight.clear()
+        self._finished.clear()
+        self.buffered = 0
+        return futures
+
+
+def read_many(  # pylint: disable=too-many-arguments
+    paths: Iterable[PathT],
+    backend: Backend,
+    *,
+    concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+    ordered: bool = True,
+    max_buffered: int = DEFAULT_PREFETCH_BUFFER_SIZE,
+    window: int | None = None,
+) -> Iterator[tuple[PathT, bytes | memoryview]]:
+    """Reads the objects at ``paths`` with up to ``concurrency`` reads in flight in a
+    thread pool, and yields ``(path, contents)`` pairs - in the order of ``paths``, or
+    in the order the reads finish unless ``ordered``.
+
+    ``paths`` is consumed lazily, as reads are started.  No further reads are started
+    while the contents read ahead but not yet yielded add up to ``max_buffered`` bytes,
+    or - if ``ordered`` - while the reads started are ``window`` (by default twice the
+    ``concurrency``) paths ahead of the oldest one not yielded yet.
+
+    Example:
+        >>> for path, data in read_many(paths, backend, concurrency=64):
+        ...     samples.append(decode(data))
+
+    Raises:
+        FileNotFoundError: If an object doesn't exist - when it would've been yielded
+            if ``ordered``.
+    """
+    reads: ReadWindow[PathT, concurrent.futures.Future[bytes | memoryview]]
+    reads = ReadWindow(
+        concurrency=concurrency,
+        max_buffered=max_buffered,
+        ordered=ordered,
+        window=window,
+    )
+    iterator = iter(paths)
+    exhausted = False
+    executor = concurrent.futures.ThreadPoolExecutor(
+        concurrency, thread_name_prefix='gcspathlib-prefetch'
+    )
+    try:
+        while not exhausted or reads:
+            while not exhausted and reads.can_start():
+                path = next(iterator, None)
+                exhausted = path is None
+                if path is not None:
+                    reads.start(path, executor.submit(backend.read, path))
+            item = reads.pop()
+            if item is not None:
+                yield item[0], item[1].result()
+            elif reads.in_flight:
+                done, _ = concurrent.futures.wait(
+                    reads.in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    reads.finish(future)
+    finally:
+        for future in reads.clear():
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
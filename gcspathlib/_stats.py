@@ -0,0 +1,228 @@
+"""Opt-in instrumentation of :class:`gcspathlib.PureGCSPath` hot paths.
+
+Instrumentation works by swapping counting wrappers into the relevant classes on
+:func:`enable_stats` and restoring the original methods on :func:`disable_stats`, so
+that it costs nothing at all while disabled.
+"""
+
+import functools
+import os
+import pathlib
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+from typing import TypedDict
+
+# Note: `pathlib` is a package as of Python 3.13, and a single module before that.
+_SKIPPED_CALLER_DIRS = tuple(
+    os.path.dirname(path) + os.sep
+    for path in (__file__, pathlib.__file__)
+    if os.path.basename(path) in ('_stats.py', '__init__.py')
+)
+_SKIPPED_CALLER_FILES = (pathlib.__file__, functools.__file__)
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_local = threading.local()  # `active`: names of calls in progress, to avoid recounting
+_calls: Counter[str] = Counter()
+_time_ns: Counter[str] = Counter()
+_callers: dict[str, Counter[str]] = {}
+_options: dict[str, bool] = {'timing': False, 'callers': False}
+_patches: list[tuple[type, str, object]] = []
+
+
+class Stat(TypedDict, total=False):
+    """Counters for one kind of call, as returned by :func:`stats`."""
+
+    calls: int
+    time_ns: int
+    callers: dict[str, int]
+
+
+def _caller() -> str:
+    """Describes the first stack frame outside of :mod:`gcspathlib` and
+    :mod:`pathlib`.
+    """
+    frame = sys._getframe(2)  # pylint: disable=protected-access
+    while frame.f_back is not None and (
+        frame.f_code.co_filename.startswith(_SKIPPED_CALLER_DIRS)
+        or frame.f_code.co_filename in _SKIPPED_CALLER_FILES
+    ):
+        frame = frame.f_back
+    code = frame.f_code
+    return f'{code.co_filename}:{frame.f_lineno} ({code.co_name})'
+
+
+def _record(
+    name: str,
+    start_ns: int,
+) -> None:
+    # (Timed before walking the stack, which isn't part of the call.)
+    elapsed_ns = time.perf_counter_ns() - start_ns if _options['timing'] else 0
+    caller = _caller() if _options['callers'] else None
+    with _lock:
+        _calls[name] += 1
+        if _options['timing']:
+            _time_ns[name] += elapsed_ns
+        if caller is not None:
+            _callers.setdefault(name, Counter())[caller] += 1
+
+
+def _counted(
+    name: str,
+    func: Callable[..., Any],
+    is_miss: Callable[[Any], bool] | None = None,
+) -> Callable[..., Any]:
+    """Wraps ``func`` to record each call as ``name``; if ``is_miss`` is given, only
+    calls for which ``is_miss(self)`` is true (checked before the call) are recorded.
+
+    Nested calls recorded as the same ``name`` - e.g. ``/`` implemented in terms of
+    :meth:`~pathlib.PurePath.joinpath` - are only recorded once.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        active: set[str] = _local.__dict__.setdefault('active', set())
+        if name in active or (is_miss is not None and not is_miss(args[0])):
+            result = func(*args, **kwargs)
+        else:
+            active.add(name)
+            start_ns = time.perf_counter_ns() if _options['timing'] else 0
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                active.discard(name)
+                _record(name, start_ns)
+        return result
+
+    return wrapper
+
+
+def _is_uncached(attr: str) -> Callable[[Any], bool]:
+    def is_miss(self: Any) -> bool:
+        return getattr(self, attr, _MISSING) is _MISSING
+
+    return is_miss
+
+
+def _patch(
+    owner: type,
+    attr: str,
+    name: str,
+    is_miss: Callable[[Any], bool] | None = None,
+) -> None:
+    original = owner.__dict__.get(attr, _MISSING)
+    inherited = getattr(owner, attr)
+    wrapped: object
+    if isinstance(original, classmethod):
+        wrapped = classmethod(_counted(name, original.__func__, is_miss))
+    elif original is _MISSING and hasattr(inherited, '__func__'):  # classmethod
+        wrapped = classmethod(_counted(name, inherited.__func__, is_miss))
+    else:
+        wrapped = _counted(name, inherited, is_miss)
+    _patches.append((owner, attr, original))
+    setattr(owner, attr, wrapped)
+
+
+def enable_stats(
+    *,
+    timing: bool = False,
+    callers: bool = False,
+) -> None:
+    """Starts counting :class:`gcspathlib.PureGCSPath` hot path calls.
+
+    The following are counted, and reported by :func:`stats`:
+
+    * ``parse``: parsing of raw path strings into drive, root, and parts;
+    * ``splitroot``: splitting of a ``gs://bucket`` drive off a path string;
+    * ``join``: ``/`` operator and :meth:`~pathlib.PurePath.joinpath` calls;
+    * ``quote``: URL-quoting of object names by :meth:`~PureGCSPath.as_uri`;
+    * ``str_miss``: ``str()`` calls that had to format the path string (i.e. the
+      cached string representation was not yet available);
+    * ``hash_miss``: ``hash()`` calls that had to compute the hash.
+
+    Args:
+        timing: Also accumulate the (inclusive) time spent in each kind of call.
+        callers: Also count calls by the first calling stack frame outside of
+            :mod:`gcspathlib` and :mod:`pathlib` - e.g. to find out where re-parses
+            come from.  This is relatively expensive.
+
+    Calling this again while enabled only updates the options.  Counters are kept
+    until :func:`reset_stats` is called.
+    """
+    from . import PureGCSPath  # pylint: disable=import-outside-toplevel,cyclic-import
+    from . import _gcs_flavour  # pylint: disable=import-outside-toplevel
+
+    with _lock:
+        _options.update(timing=timing, callers=callers)
+        if _patches:
+            return
+        flavour_type = type(_gcs_flavour)
+        if sys.version_info >= (3, 12):
+            _patch(PureGCSPath, '_parse_path', 'parse')
+        else:
+            _patch(flavour_type, 'parse_parts', 'parse')
+        _patch(flavour_type, 'splitroot', 'splitroot')
+        _patch(PureGCSPath, '__truediv__', 'join')
+        _patch(PureGCSPath, '__rtruediv__', 'join')
+        _patch(PureGCSPath, 'joinpath', 'join')
+        _patch(PureGCSPath, 'as_uri', 'quote', lambda self: self.is_absolute())
+        _patch(PureGCSPath, '__str__', 'str_miss', _is_uncached('_str'))
+        _patch(PureGCSPath, '__hash__', 'hash_miss', _is_uncached('_hash'))
+
+
+def disable_stats() -> None:
+    """Stops counting, restoring the original uninstrumented methods.
+
+    Counters are kept until :func:`reset_stats` is called.
+    """
+    with _lock:
+        while _patches:
+            owner, attr, original = _patches.pop()
+            if original is _MISSING:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+
+
+def reset_stats() -> None:
+    """Resets all counters to zero."""
+    with _lock:
+        _calls.clear()
+        _time_ns.clear()
+        _callers.clear()
+
+
+def stats(
+    *,
+    reset: bool = False,
+) -> dict[str, Stat]:
+    """Returns a snapshot of the counters collected since :func:`enable_stats`.
+
+    For example::
+
+        {'parse': {'calls': 3, 'time_ns': 5120, 'callers': {'app.py:12 (main)': 3}}}
+
+    ``time_ns`` and ``callers`` are only included if enabled in :func:`enable_stats`.
+
+    Args:
+        reset: Atomically reset the counters after taking the snapshot.
+    """
+    with _lock:
+        result: dict[str, Stat] = {}
+        for name, calls in sorted(_calls.items()):
+            stat: Stat = {'calls': calls}
+            if name in _time_ns:
+                stat['time_ns'] = _time_ns[name]
+            if name in _callers:
+                stat['callers'] = dict(_callers[name].most_common())
+            result[name] = stat
+        if reset:
+            _calls.clear()
+            _time_ns.clear()
+            _callers.clear()
+    return result
@@ -0,0 +1,216 @@
+"""File-like streams over the objects of a :class:`gcspathlib.Backend`.
+
+Reads are served from fixed-size chunks of the object, fetched with ranged reads.  As
+long as the object is read sequentially, the chunks following the current one are
+requested ahead in background threads, so that each ``read()`` doesn't wait for a
+full round trip.
+"""
+
+import concurrent.futures
+import errno
+import io
+from ._backend import Backend
+from ._jsonapi import ObjectInfo
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+    from _typeshed import WriteableBuffer
+
+DEFAULT_READ_CHUNK_SIZE = 2 * 2**20
+DEFAULT_READ_AHEAD = 4
+
+_Chunk = concurrent.futures.Future[bytes | memoryview]
+
+
+class ObjectReader(io.RawIOBase):
+    """A seekable, read-only raw stream over an object, as returned by :func:`open`.
+
+    The object is read in chunks of ``chunk_size``.  After sequential reads, the next
+    ``read_ahead`` chunks are fetched concurrently in the background; after a seek
+    elsewhere, only the chunks covering the requested range are fetched, so that small
+    random reads (e.g. of Parquet footers) don't download more than a chunk.  Data is
+    copied straight from the fetched chunks into the caller's buffer with
+    :meth:`readinto`.
+
+    All chunks are read from the object generation that was current when the stream
+    was opened (or ``generation``), so that a concurrent overwrite fails the read with
+    :class:`FileNotFoundError` rather than mixing up contents.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: 'PureGCSPath',
+        backend: Backend,
+        *,
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Args:
+            path: The object to read.
+            backend: The backend to read from.
+            chunk_size: The size of the ranged reads.
+            read_ahead: The number of chunks to fetch ahead of the current one.
+            generation: The object generation to read; the current one if omitted.
+
+        Raises:
+            FileNotFoundError: If the object (generation) doesn't exist.
+        """
+        super().__init__()
+        if chunk_size <= 0 or read_ahead < 0:
+            raise ValueError('Chunk size must be positive, and read-ahead not negative')
+        self._chunks: dict[int, _Chunk] = {}
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self.path = path
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+        self.info: ObjectInfo = backend.stat(path, generation=generation)
+        """The metadata of the object generation being read."""
+        self._position = 0
+        self._expected = 0  # (the position following the previous read)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            read_ahead + 1, thread_name_prefix='gcspathlib-read'
+        )
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.path!r}>'
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+
+    def seek(
+        self,
+        offset: int,
+        whence: int = io.SEEK_SET,
+    ) -> int:
+        self._check_open()
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.info.size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f'Invalid whence: {whence}')
+        if offset < 0:
+            raise ValueError(f'Negative seek position: {offset}')
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._position
+
+    def readinto(self, buffer: 'WriteableBuffer') -> int:
+        """Reads up to ``len(buffer)`` bytes into ``buffer``, and returns the number of
+        bytes read - which is only less at the end of the object.
+        """
+        self._check_open()
+        with memoryview(buffer) as view, view.cast('B') as target:
+            end = min(self._position + len(target), self.info.size)
+            count = 0
+            for data in self._views(end):
+                target[count : count + len(data)] = data
+                count += len(data)
+        return count
+
+    def readall(self) -> bytes:
+        """Reads the rest of the object, joining the fetched chunks straight into the
+        result (rather than copying them into a buffer, and that into the result).
+        """
+        self._check_open()
+        return b''.join(self._views(self.info.size))
+
+    def _views(
+        self,
+        end: int,
+    ) -> Iterator[memoryview]:
+        """Yields the contents from the position up to ``end`` (advancing the
+        position), as views of the fetched chunks - without copying them.
+        """
+        sequential = self._position == self._expected
+        while self._position < end:
+            index, offset = divmod(self._position, self.chunk_size)
+            if sequential:
+                last = index + self.read_ahead
+            else:
+                last = min((end - 1) // self.chunk_size, index + self.read_ahead)
+            data = self._chunk(index, last).result()
+            size = min(len(data) - offset, end - self._position)
+            if size <= 0:
+                raise OSError(errno.EIO, 'Short read', str(self.path))
+            self._position += size
+            yield memoryview(data)[offset : offset + size]
+        self._expected = self._position
+
+    def _chunk(
+        self,
+        index: int,
+        last: int,
+    ) -> _Chunk:
+        """Returns the chunk at ``index``, after requesting the chunks up to ``last``
+        and dropping all others.
+        """
+        assert self._executor is not None
+        last = min(last, (self.info.size - 1) // self.chunk_size)
+        for stale in [i for i in self._chunks if not index <= i <= last]:
+            self._chunks.pop(stale).cancel()
+        for ahead in range(index, last + 1):
+            if ahead not in self._chunks:
+                start = ahead * self.chunk_size
+                self._chunks[ahead] = self._executor.submit(
+                    self.backend.read,
+                    self.path,
+                    start,
+                    min(start + self.chunk_size, self.info.size),
+                    generation=self.info.generation,
+                )
+        return self._chunks[index]
+
+    def close(self) -> None:
+        for chunk in self._chunks.values():
+            chunk.cancel()
+        self._chunks.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+
+def open(  # pylint: disable=redefined-builtin,too-many-arguments
+    path: 'PureGCSPath',
+    mode: str,
+    backend: Backend,
+    *,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    read_ahead: int = DEFAULT_READ_AHEAD,
+    generation: int | None = None,
+) -> ObjectReader:
+    """Opens the object at ``path`` for reading - the only supported ``mode`` is
+    ``'rb'`` - as a seekable :class:`ObjectReader`.
+
+    Example:
+        >>> with open(PureGCSPath('gs://bucket/data.parquet'), 'rb', backend) as file:
+        ...     file.seek(-8, io.SEEK_END)
+        ...     footer = file.read(8)
+
+    Raises:
+        FileNotFoundError: If the object (generation) doesn't exist.
+    """
+    if mode != 'rb':
+        raise ValueError(f'Unsupported mode: {mode!r}')
+    return ObjectReader(
+        path,
+        backend,
+        chunk_size=chunk_size,
+        read_ahead=read_ahead,
+        generation=generation,
+    )
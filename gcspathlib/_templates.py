@@ -0,0 +1,172 @@
+"""Lazy expansion of path templates, e.g. ``gs://b/logs/{date}/{hour:02d}/*.gz``.
+
+The fixed leading segments of a template are parsed into a path once, and each
+expansion only formats the templated remainder and appends it to that path - rather
+than formatting and re-parsing a whole ``gs://`` URI per expansion.
+"""
+
+import itertools
+import re
+import string
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+from typing import cast
+
+if TYPE_CHECKING:
+    from . import PureGCSPath
+
+PathT = TypeVar('PathT', bound='PureGCSPath')
+
+_WILDCARD = re.compile(r'[*?[]')
+
+
+class PathTemplate(Generic[PathT]):
+    """A template of paths, with :meth:`str.format` fields in the object name, which
+    expands into a path per combination of field values.
+
+    Expansions are generated lazily, so that expanding e.g. a month of hourly
+    "directories" never holds more than one path at a time.  Wildcards (``*``, ``?``
+    and ``[``) are kept as-is, for matching listed objects against (see
+    :meth:`pathlib.PurePath.match`); :meth:`prefixes` returns the listing prefixes that
+    cover the expansions.
+
+    Example:
+        >>> template = PathTemplate('gs://b/logs/{date:%Y-%m-%d}/{hour:02d}/*.gz')
+        >>> days = (start + datetime.timedelta(days=i) for i in range(31))
+        >>> for path in template.expand(date=days, hour=range(24)):
+        ...     print(path)
+        gs://b/logs/2026-10-01/00/*.gz
+        gs://b/logs/2026-10-01/01/*.gz
+        ...
+    """
+
+    def __init__(
+        self,
+        template: str,
+        *,
+        path_type: 'type[PathT] | None' = None,
+    ) -> None:
+        """
+        Args:
+            template: The template - a ``gs://`` URI or a relative path, with named
+                fields in the object name.
+            path_type: The type of the paths (:class:`PureGCSPath` if omitted).
+
+        Raises:
+            ValueError: If the template has unnamed fields, or fields in the bucket.
+        """
+        if path_type is None:
+            # pylint: disable-next=import-outside-toplevel,cyclic-import
+            from . import PureGCSPath
+
+            path_type = cast('type[PathT]', PureGCSPath)
+        fields: dict[str, None] = {}  # (ordered set)
+        for _, field, _, _ in string.Formatter().parse(template):
+            if field is not None:
+                # (The name is followed by any attribute or index, e.g. `{date.year}`.)
+                name = field.partition('.')[0].partition('[')[0]
+                if not name.isidentifier():
+                    raise ValueError(f'Template fields must be named: {template!r}')
+                fields[name] = None
+        head = template.partition('{')[0]
+        if head.startswith('gs://') and '/' not in head.removeprefix('gs://'):
+            raise ValueError(f'Template must have a fixed bucket: {template!r}')
+        # The fixed segments are those before the first one with a field.
+        split = head.rfind('/')
+        self.template = template
+        self.fields = tuple(fields)
+        """The names of the fields, in the order of their first occurrence."""
+        self.root: PathT = path_type(template[:split] if split >= 0 else '')
+        """The path of the fixed leading segments."""
+        self._tail = template[split + 1 :]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.template!r})'
+
+    def _formatted(
+        self,
+        values: dict[str, Any],
+    ) -> Iterator[str]:
+        """Yields the formatted templated segments, for each combination of values."""
+        missing = set(self.fields) - values.keys()
+        unknown = values.keys() - set(self.fields)
+        if missing or unknown:
+            raise ValueError(
+                f'Values must be given for exactly the fields {self.fields}:'
+                f' missing {sorted(missing)}, unknown {sorted(unknown)}'
+            )
+        fields = self.fields
+        tail = self._tail
+        iterables = [
+            (
+                values[field]
+                if isinstance(values[field], Iterable)
+                and not isinstance(values[field], str)
+                else (values[field],)
+            )
+            for field in fields
+        ]
+        if not iterables:
+            yield tail.format_map({})
+            return
+        # Only the values of the inner fields are held, so that e.g. the days of a long
+        # range are only generated as they're expanded.
+        first, *inner = iterables
+        inner = [tuple(iterable) for iterable in inner]
+        for value in first:
+            for combination in itertools.product(*inner):
+                yield tail.format_map(dict(zip(fields, (value, *combination))))
+
+    def expand(
+        self,
+        **values: Any,
+    ) -> Iterator[PathT]:
+        """Yields the path for each combination of the values of the fields, varying
+        the values of the last field fastest.
+
+        Args:
+            values: The values of each field, as an iterable (e.g. a :func:`range`) or
+                a single (non-iterable, or string) value.  The values of the first
+                field are consumed lazily, while those of the others are held.
+
+        Raises:
+            ValueError: If values are missing for some fields, or given for unknown
+                ones - or if an expansion has empty or ``.`` segments (e.g. of an empty
+                value), which regular parsing would normalize away.
+        """
+        make_path = self.root._make_child_relpath  # pylint: disable=protected-access
+        for formatted in self._formatted(values):
+            yield make_path(formatted)
+
+    def prefixes(
+        self,
+        **values: Any,
+    ) -> Iterator[str]:
+        """Yields the object name prefixes to list (see :func:`iter_pages`) to find all
+        objects matching the expansions.
+
+        The prefix of an expansion is its object name up to the first wildcard - which
+        may be in the fixed segments, e.g. ``gs://b/*/logs/{n}`` is covered by the
+        single prefix ``''``.  Prefixes that are covered by the previous prefix
+        (including duplicates, e.g. of expansions that only differ after a wildcard)
+        are skipped - so expansions are best ordered like their names, as with
+        ascending ranges.  Sibling prefixes aren't merged into their parent (e.g. the
+        24 hours of a day into the day), which would list objects outside of the
+        expansions.
+
+        See :meth:`expand` for ``values``.
+        """
+        root = self.root.obj
+        root = f'{root}/' if root else ''
+        last = None
+        for formatted in self._formatted(values):
+            name = root + formatted
+            match = _WILDCARD.search(name)
+            prefix = name if match is None else name[: match.start()]
+            if last is None or not prefix.startswith(last):
+                last = prefix
+                yield prefix
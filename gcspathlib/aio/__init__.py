@@ -0,0 +1,307 @@
+"""Optional asynchronous I/O for Cloud Storage paths.
+
+:class:`AsyncGCSPath` extends :class:`gcspathlib.PureGCSPath` with ``async`` I/O
+methods over the Cloud Storage JSON API.  Requests go through a shared
+:class:`Client`, which pools keep-alive connections and bounds the number of
+concurrent requests.  :class:`BatchExecutor` runs bulk deletes, copies, and metadata
+updates as batch requests, :func:`download`/:func:`upload` transfer large objects in
+parallel chunks, :func:`read_many` reads many small objects concurrently, and
+:class:`ObjectWriter` streams uploads with bounded memory.  Only the standard library
+is used, so importing this subpackage doesn't pull in any third-party dependencies.
+"""
+
+import asyncio
+import functools
+import os
+from .. import PureGCSPath
+from .. import StatCache
+from .._jsonapi import MAX_BATCH_SIZE
+from .._jsonapi import ListPage
+from .._jsonapi import ObjectInfo
+from .._listing import child_path
+from ._batch import DEFAULT_BATCH_CONCURRENCY
+from ._batch import BatchExecutor
+from ._batch import BatchResult
+from ._client import DEFAULT_RETRIES
+from ._client import Client
+from ._client import default_client
+from ._coalesce import AsyncSingleFlight
+from ._http import DEFAULT_CONNECT_TIMEOUT
+from ._http import DEFAULT_MAX_CONNECTIONS
+from ._http import DEFAULT_READ_TIMEOUT
+from ._http import ConnectionPool
+from ._http import Response
+from ._prefetch import read_many
+from ._transfer import DEFAULT_CHUNK_SIZE
+from ._transfer import DEFAULT_TRANSFER_CONCURRENCY
+from ._transfer import download
+from ._transfer import upload
+from ._writer import DEFAULT_UPLOAD_BUFFERS
+from ._writer import DEFAULT_UPLOAD_CHUNK_SIZE
+from ._writer import BufferPool
+from ._writer import ObjectWriter
+from collections.abc import AsyncIterator
+from typing import ClassVar
+from typing import Self
+
+
+class AsyncGCSPath(PureGCSPath):
+    """A :class:`PureGCSPath` with asynchronous I/O methods.
+
+    I/O goes through :attr:`client`, which defaults to :func:`default_client`.  To use a
+    different client - e.g. with credentials or a different endpoint - either assign it
+    to :attr:`AsyncGCSPath.client`, or to the same attribute of a subclass::
+
+        class MyPath(AsyncGCSPath):
+            client = Client(token=get_token)
+
+    Example:
+        >>> path = AsyncGCSPath('gs://bucket/dir/file.txt')
+        >>> await path.write_bytes(b'data')
+        4
+        >>> [child async for child in path.parent.iterdir()]
+        [AsyncGCSPath('gs://bucket/dir/file.txt')]
+    """
+
+    client: ClassVar[Client | None] = None
+    """The client to use for I/O; :func:`default_client` if ``None``."""
+
+    stat_cache: ClassVar[StatCache | None] = None
+    """The cache for :meth:`stat` and :meth:`exists` results, if any; see
+    :class:`StatCache`.  Entries are invalidated by :meth:`write_bytes`,
+    :meth:`upload_from`, and :meth:`unlink`, but otherwise only expire.
+    """
+
+    single_flight: ClassVar[AsyncSingleFlight | None] = None
+    """The single-flight group to coalesce concurrent :meth:`stat` and
+    :meth:`read_bytes` calls for equal paths in, if any; see :class:`AsyncSingleFlight`.
+    """
+
+    __slots__ = ()
+
+    def _get_client(self) -> Client:
+        return type(self).client or default_client()
+
+    def _check_absolute(self) -> None:
+        if not self.is_absolute():
+            raise ValueError(f'Path must have a bucket and an object name: {self!r}')
+
+    async def stat(self) -> ObjectInfo:
+        """Retrieves the metadata of the object.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist.
+        """
+        self._check_absolute()
+        flight = type(self).single_flight
+        if flight is None:
+            info = await self._stat()
+        else:
+            info = await flight.call(('stat', self), self._stat)
+        return info
+
+    async def _stat(self) -> ObjectInfo:
+        cache = type(self).stat_cache
+        if cache is None:
+            info = await self._get_client().stat(self)
+        else:
+            info = await cache.astat(self, self._get_client())
+        return info
+
+    def _invalidate(self) -> None:
+        cache = type(self).stat_cache
+        if cache is not None:
+            cache.invalidate(self, recursive=False)
+
+    async def exists(self) -> bool:
+        """Determines whether the object exists."""
+        exists = True
+        try:
+            await self.stat()
+        except FileNotFoundError:
+            exists = False
+        return exists
+
+    async def read_bytes(self) -> bytes:
+        """Downloads the contents of the object.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist.
+        """
+        self._check_absolute()
+        flight = type(self).single_flight
+        if flight is None:
+            data = await self._get_client().read(self)
+        else:
+            data = await flight.call(('read', self), self._get_client().read, self)
+        return data
+
+    async def write_bytes(
+        self,
+        data: bytes | bytearray | memoryview,
+    ) -> int:
+        """Uploads ``data`` as the contents of the object, replacing any existing object,
+        and returns the number of bytes written.
+        """
+        self._check_absolute()
+        try:
+            await self._get_client().write(self, data)
+        finally:
+            self._invalidate()
+        return len(data)
+
+    async def download_to(
+        self,
+        filename: 'str | os.PathLike[str]',
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        use_mmap: bool = False,
+    ) -> ObjectInfo:
+        """Downloads the object to the local file ``filename``, as byte ranges fetched
+        concurrently; see :func:`download`.
+        """
+        self._check_absolute()
+        return await download(
+            self._get_client(),
+            self,
+            filename,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            use_mmap=use_mmap,
+        )
+
+    async def upload_from(
+        self,
+        filename: 'str | os.PathLike[str]',
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+        content_type: str = 'application/octet-stream',
+    ) -> ObjectInfo:
+        """Uploads the local file ``filename`` as the object, as a parallel composite
+        upload if larger than ``chunk_size``; see :func:`upload`.
+        """
+        self._check_absolute()
+        try:
+            info = await upload(
+                self._get_client(),
+                self,
+                filename,
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+                content_type=content_type,
+            )
+        finally:
+            self._invalidate()
+        return info
+
+    def open_writer(
+        self,
+        *,
+        content_type: str = 'application/octet-stream',
+        pool: BufferPool | None = None,
+        checksum: bool | None = None,
+    ) -> ObjectWriter:
+        """Opens the object for streaming writes through a resumable upload; see
+        :class:`ObjectWriter`.
+
+        Example:
+            >>> async with path.open_writer(content_type='text/csv') as writer:
+            ...     await writer.write(b'a,b\\n')
+        """
+        self._check_absolute()
+        return ObjectWriter(
+            self._get_client(),
+            self,
+            content_type=content_type,
+            pool=pool,
+            checksum=checksum,
+        )
+
+    async def unlink(
+        self,
+        missing_ok: bool = False,
+    ) -> None:
+        """Deletes the object - or if the path is generation-pinned, only if that
+        generation is still current.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist - or the generation it's
+                pinned to isn't current - unless ``missing_ok``.
+        """
+        self._check_absolute()
+        try:
+            await self._get_client().delete(self)
+        except FileNotFoundError:
+            if not missing_ok:
+                raise
+        finally:
+            self._invalidate()
+
+    async def iterdir(self) -> AsyncIterator[Self]:
+        """Yields the objects and "subdirectories" directly under this path, which may
+        be bucket-only, page by page.
+
+        "Subdirectories" are the common prefixes of object names up to the next ``/``,
+        as in the Cloud Storage console.  Placeholder objects named after the directory
+        itself (i.e. with a trailing ``/``) are skipped, as are - with a warning - names
+        that no path can stand for (e.g. ``a//b``).  Each next page is requested as soon
+        as the previous one has arrived, while the caller is still consuming it.
+        """
+        if not self.bucket:
+            raise ValueError(f'Path must have a bucket: {self!r}')
+        client = self._get_client()
+        prefix = f'{self.obj}{self._sep}' if self.obj else ''
+        list_page = functools.partial(
+            client.list_page, self.bucket, prefix=prefix, delimiter=self._sep
+        )
+        next_page: asyncio.Task[ListPage] | None = asyncio.create_task(list_page())
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if page.next_page_token is not None:
+                    next_page = asyncio.create_task(
+                        list_page(page_token=page.next_page_token)
+                    )
+                for name in sorted(
+                    [*(item['name'] for item in page.items), *page.prefixes]
+                ):
+                    rel = name[len(prefix) :]
+                    if rel:
+                        rel = rel[:-1] if rel.endswith(self._sep) else rel
+                        if (child := child_path(self, rel)) is not None:
+                            yield child
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+
+__all__ = [
+    'AsyncGCSPath',
+    'AsyncSingleFlight',
+    'BatchExecutor',
+    'BatchResult',
+    'BufferPool',
+    'Client',
+    'ConnectionPool',
+    'DEFAULT_BATCH_CONCURRENCY',
+    'DEFAULT_CHUNK_SIZE',
+    'DEFAULT_CONNECT_TIMEOUT',
+    'DEFAULT_MAX_CONNECTIONS',
+    'DEFAULT_READ_TIMEOUT',
+    'DEFAULT_RETRIES',
+    'DEFAULT_TRANSFER_CONCURRENCY',
+    'DEFAULT_UPLOAD_BUFFERS',
+    'DEFAULT_UPLOAD_CHUNK_SIZE',
+    'ListPage',
+    'MAX_BATCH_SIZE',
+    'ObjectInfo',
+    'ObjectWriter',
+    'Response',
+    'default_client',
+    'download',
+    'read_many',
+    'upload',
+]
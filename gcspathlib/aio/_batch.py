@@ -0,0 +1,309 @@
+import asyncio
+import json
+import random
+import uuid
+from .. import PureGCSPath
+from .._jsonapi import BATCH_TARGET
+from .._jsonapi import MAX_BATCH_SIZE
+from .._jsonapi import RETRYABLE_STATUSES
+from .._jsonapi import BatchPart
+from .._jsonapi import ObjectInfo
+from .._jsonapi import copy_target
+from .._jsonapi import decode_batch
+from .._jsonapi import encode_batch
+from .._jsonapi import error_message
+from .._jsonapi import object_target
+from .._jsonapi import status_error
+from ._client import Client
+from ._client import default_client
+from ._client import not_current_error
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
+from typing import Generic
+from typing import NamedTuple
+from typing import TypeVar
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+ItemT = TypeVar('ItemT')
+
+_PathPair = tuple[PureGCSPath, PureGCSPath]
+_PathPatch = tuple[PureGCSPath, Mapping[str, Any]]
+
+# Failures of a batch request that may have been applied, or not.
+_TRANSIENT_ERRORS = (ConnectionError, asyncio.IncompleteReadError, TimeoutError)
+
+
+class BatchResult(NamedTuple, Generic[ItemT]):
+    """The outcome of a single operation of a batch."""
+
+    item: ItemT
+    """The input item, e.g. the path to delete or the pair of paths to copy."""
+
+    info: ObjectInfo | None
+    """The metadata of the resulting object (for copies and patches)."""
+
+    error: OSError | None
+    """The error if the operation failed, e.g. :class:`FileNotFoundError`."""
+
+
+class _Call(NamedTuple, Generic[ItemT]):
+    item: ItemT
+    bucket: str  # (to group by)
+    path: PureGCSPath  # (the resulting object)
+    filename: PureGCSPath  # (for errors)
+    method: str
+    target: str
+    body: bytes
+
+
+class BatchExecutor:
+    """Runs many object operations as batch requests - which bundle up to
+    :data:`MAX_BATCH_SIZE` calls into a single HTTP request.
+
+    Operations are grouped by bucket, and the batches sent concurrently (up to
+    ``concurrency`` at a time, further bounded by the client's connection limit).
+    Calls that fail transiently (HTTP 408, 429, and 5xx) are retried in a new batch of
+    their own with exponential backoff and jitter, without repeating the calls that
+    succeeded - as are the calls of batch requests that fail as a whole.  Since a
+    failed call may have taken effect nonetheless, a retried delete that finds the
+    object missing is taken to have succeeded.
+
+    Input is consumed lazily and results are yielded as soon as their batch completes
+    (i.e. not in input order), so that memory stays flat for any number of operations:
+    at most one pending batch per bucket plus ``concurrency`` in-flight batches are
+    held at a time.  Failed operations are yielded with an :attr:`BatchResult.error`
+    rather than raised.
+
+    Example:
+        >>> batch = BatchExecutor(client)
+        >>> async for result in batch.delete(paths):
+        ...     if result.error is not None:
+        ...         print(f'Failed to delete {result.item}: {result.error}')
+    """
+
+    def __init__(
+        self,
+        client: Client | None = None,
+        *,
+        batch_size: int = MAX_BATCH_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        retries: int | None = None,
+    ) -> None:
+        """
+        Args:
+            client: The client to send the batch requests with; :func:`default_client`
+                if omitted.
+            batch_size: The maximum number of calls per batch request, at most
+                :data:`MAX_BATCH_SIZE`.
+            concurrency: The maximum number of batch requests in flight.
+            retries: The maximum number of retries of transiently failed calls; the
+                client's :attr:`Client.retries` if omitted.
+        """
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f'Batch size must be between 1 and {MAX_BATCH_SIZE}')
+        self.client = client or default_client()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retries = self.client.retries if retries is None else retries
+
+    def delete(
+        self,
+        paths: Iterable[PureGCSPath] | AsyncIterable[PureGCSPath],
+    ) -> AsyncIterator[BatchResult[PureGCSPath]]:
+        """Deletes the objects at ``paths`` - those that are generation-pinned only if
+        that generation is still current, like :meth:`Client.delete`.
+        """
+        return self._run(_calls(paths, _delete_call))
+
+    def copy(
+        self,
+        pairs: Iterable[_PathPair] | AsyncIterable[_PathPair],
+    ) -> AsyncIterator[BatchResult[_PathPair]]:
+        """Copies objects, given as ``(source, destination)`` pairs (of the generation
+        of a pinned source); grouped by the bucket of the source.
+        """
+        return self._run(_calls(pairs, _copy_call))
+
+    def patch(
+        self,
+        items: Iterable[_PathPatch] | AsyncIterable[_PathPatch],
+    ) -> AsyncIterator[BatchResult[_PathPatch]]:
+        """Updates object metadata, given as ``(path, metadata)`` pairs; see
+        :meth:`gcspathlib.Backend.patch`.
+        """
+        return self._run(_calls(items, _patch_call))
+
+    async def _run(
+        self,
+        calls: AsyncIterator[_Call[ItemT]],
+    ) -> AsyncIterator[BatchResult[ItemT]]:
+        tasks: set[asyncio.Task[list[BatchResult[ItemT]]]] = set()
+        try:
+            async for batch in _batches(calls, self.batch_size):
+                while len(tasks) >= self.concurrency:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        for result in task.result():
+                            yield result
+                tasks.add(asyncio.create_task(self._send(batch)))
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(
+        self,
+        batch: list[_Call[ItemT]],
+    ) -> list[BatchResult[ItemT]]:
+        """Sends the calls of ``batch``, retrying transiently failed calls, and returns
+        their results in order.
+        """
+        results: dict[int, BatchResult[ItemT]] = {}
+        remaining = list(enumerate(batch))
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(random.uniform(0, 0.1 * 2**attempt))
+            final = attempt == self.retries
+            try:
+                responses = await self._send_once([call for _, call in remaining])
+            except (OSError, asyncio.IncompleteReadError) as e:
+                if final or not isinstance(e, _TRANSIENT_ERRORS):
+                    error = e if isinstance(e, OSError) else ConnectionError(str(e))
+                    results.update(
+                        (index, BatchResult(call.item, None, error))
+                        for index, call in remaining
+                    )
+                    break
+                continue
+            retry = []
+            for (index, call), (status, body) in zip(remaining, responses):
+                if status in RETRYABLE_STATUSES and not final:
+                    retry.append((index, call))
+                else:
+                    results[index] = _result(call, status, body, retried=attempt > 0)
+            remaining = retry
+            if not remaining:
+                break
+        return [results[index] for index in range(len(batch))]
+
+    async def _send_once(
+        self,
+        calls: list[_Call[ItemT]],
+    ) -> list[tuple[int, bytes]]:
+        """Sends a single batch request, and returns the status and body of the
+        response to each call - that of the whole request if it failed transiently.
+
+        Raises:
+            OSError: If the batch request itself fails otherwise.
+            asyncio.IncompleteReadError: If the connection is closed mid-response.
+        """
+        boundary = f'batch_{uuid.uuid4().hex}'
+        parts = [
+            BatchPart(
+                str(index),
+                f'{call.method} {call.target} HTTP/1.1',
+                {'Content-Type': 'application/json'} if call.body else {},
+                call.body,
+            )
+            for index, call in enumerate(calls)
+        ]
+        response = await self.client.request(
+            'POST',
+            BATCH_TARGET,
+            headers={'Content-Type': f'multipart/mixed; boundary={boundary}'},
+            body=encode_batch(parts, boundary),
+            ok_statuses=(200, *RETRYABLE_STATUSES),
+            # (Retried here instead, call by call - knowing they may have been applied.)
+            idempotent=False,
+        )
+        # (Calls without a response are treated as transient failures.)
+        responses = [(503, b'')] * len(calls)
+        if response.status in RETRYABLE_STATUSES:
+            responses = [(response.status, response.body)] * len(calls)
+        else:
+            content_type = response.headers.get('content-type', '')
+            for part in decode_batch(response.body, content_type):
+                index = int(part.content_id.removeprefix('response-'))
+                status = int(part.start_line.split(' ', 2)[1])
+                responses[index] = (status, part.body)
+        return responses
+
+
+async def _batches(
+    calls: AsyncIterator[_Call[ItemT]],
+    batch_size: int,
+) -> AsyncIterator[list[_Call[ItemT]]]:
+    """Groups ``calls`` into batches by bucket, yielding each batch as soon as it's
+    full, and the remaining partial batches at the end.
+    """
+    pending: dict[str, list[_Call[ItemT]]] = {}
+    async for call in calls:
+        batch = pending.setdefault(call.bucket, [])
+        batch.append(call)
+        if len(batch) == batch_size:
+            del pending[call.bucket]
+            yield batch
+    for batch in pending.values():
+        yield batch
+
+
+def _result(
+    call: _Call[ItemT],
+    status: int,
+    body: bytes,
+    *,
+    retried: bool = False,
+) -> BatchResult[ItemT]:
+    """The result of a call, given its response - where a ``retried`` delete that
+    finds the object missing was applied by an earlier attempt.
+    """
+    info = None
+    error: OSError | None = None
+    if 200 <= status < 300:
+        if body:
+            info = ObjectInfo.from_resource(call.path, json.loads(body))
+    elif call.method == 'DELETE' and status == 412:
+        error = not_current_error(call.path, call.path.generation)
+    elif not (call.method == 'DELETE' and status == 404 and retried):
+        error = status_error(status, error_message(body), call.filename)
+    return BatchResult(call.item, info, error)
+
+
+async def _calls(
+    items: Iterable[ItemT] | AsyncIterable[ItemT],
+    make_call: Callable[[ItemT], _Call[ItemT]],
+) -> AsyncIterator[_Call[ItemT]]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield make_call(item)
+    else:
+        for item in items:
+            yield make_call(item)
+
+
+def _delete_call(path: PureGCSPath) -> _Call[PureGCSPath]:
+    # (Only the current generation of a pinned path, like `Client.delete`.)
+    target = object_target(path.bucket, path.obj, ifGenerationMatch=path.generation)
+    return _Call(path, path.bucket, path, path, 'DELETE', target, b'')
+
+
+def _copy_call(pair: _PathPair) -> _Call[_PathPair]:
+    source, destination = pair
+    target = copy_target(source, destination)
+    return _Call(pair, source.bucket, destination, source, 'POST', target, b'')
+
+
+def _patch_call(item: _PathPatch) -> _Call[_PathPatch]:
+    path, metadata = item
+    target = object_target(path.bucket, path.obj)
+    body = json.dumps(metadata).encode()
+    return _Call(item, path.bucket, path, path, 'PATCH', target, body)
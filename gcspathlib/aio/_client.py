@@ -0,0 +1,323 @@
+import asyncio
+import errno
+import functools
+import json
+import random
+from .. import URI_PREFIX
+from .. import PureGCSPath
+from .._jsonapi import MAX_COMPOSE_SOURCES
+from .._jsonapi import RETRYABLE_STATUSES
+from .._jsonapi import ListPage
+from .._jsonapi import ObjectInfo
+from .._jsonapi import bucket_target
+from .._jsonapi import default_endpoint
+from .._jsonapi import error_message
+from .._jsonapi import object_target
+from .._jsonapi import status_error
+from .._jsonapi import upload_target
+from ._http import DEFAULT_CONNECT_TIMEOUT
+from ._http import DEFAULT_MAX_CONNECTIONS
+from ._http import DEFAULT_READ_TIMEOUT
+from ._http import ConnectionPool
+from ._http import Response
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Self
+
+DEFAULT_RETRIES = 3
+
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE'})
+
+
+def not_current_error(
+    path: PureGCSPath,
+    generation: int | None,
+) -> FileNotFoundError:
+    """The error of a delete whose ``ifGenerationMatch`` precondition failed - i.e.
+    of a generation that, as far as deleting it goes, doesn't exist (anymore).
+    """
+    message = f'Generation {generation} is not current (HTTP 412)'
+    return FileNotFoundError(errno.ENOENT, message, path)
+
+
+class Client:
+    """Asynchronous Cloud Storage JSON API client, backed by a :class:`ConnectionPool`.
+
+    Transient errors (HTTP 408, 429, and 5xx, and connection failures and timeouts) of
+    idempotent requests are retried up to ``retries`` times with exponential backoff
+    and jitter.  Requests that aren't idempotent - e.g. uploads and compositions without
+    an ``ifGenerationMatch`` precondition, which may have taken effect despite the error
+    - are never retried.  Other errors are raised as the closest built-in
+    :class:`OSError` subclass, e.g. :class:`FileNotFoundError`.
+
+    Example:
+        >>> async with Client() as client:
+        ...     data = await client.read(PureGCSPath('gs://bucket/file.txt'))
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoint: str | None = None,
+        *,
+        token: str | Callable[[], str] | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        retries: int = DEFAULT_RETRIES,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            endpoint: The API endpoint; defaults to ``$STORAGE_EMULATOR_HOST`` if set, or
+                ``https://storage.googleapis.com`` otherwise.
+            token: An OAuth 2.0 access token, or a callable returning one (called for
+                each request, so that it can refresh the token as needed).  Requests are
+                unauthenticated if omitted, which is only useful for emulators and
+                public buckets.
+            max_connections: The maximum number of concurrent requests.
+            retries: The maximum number of retries of transient errors per request.
+            connect_timeout: See :class:`ConnectionPool`.
+            read_timeout: See :class:`ConnectionPool`.
+        """
+        self.endpoint = endpoint or default_endpoint()
+        self.retries = retries
+        self._token = token
+        self._pool = ConnectionPool(
+            self.endpoint,
+            max_connections=max_connections,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes all idle connections; the client remains usable afterwards."""
+        await self._pool.close()
+
+    def _headers(self, headers: Mapping[str, str]) -> dict[str, str]:
+        token = self._token() if callable(self._token) else self._token
+        auth = {'Authorization': f'Bearer {token}'} if token else {}
+        return {**auth, **headers}
+
+    async def request(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        target: str,
+        *,
+        filename: object = None,
+        headers: Mapping[str, str] | None = None,
+        body: bytes | bytearray | memoryview = b'',
+        ok_statuses: tuple[int, ...] = (200,),
+        retries: int | None = None,
+        idempotent: bool | None = None,
+    ) -> Response:
+        """Sends an API request, retrying transient errors up to ``retries`` times
+        (:attr:`retries` if omitted) if the request is ``idempotent``.
+
+        Requests are considered idempotent if omitted when their method is, or when
+        they have an ``ifGenerationMatch`` precondition.
+
+        Raises:
+            OSError: If the final response status isn't one of ``ok_statuses``, with
+                ``filename`` as the :attr:`OSError.filename`.
+        """
+        response: Response | None = None
+        if idempotent is None:
+            idempotent = method in _IDEMPOTENT_METHODS or 'ifGenerationMatch=' in target
+        retries = self.retries if retries is None else retries
+        retries = retries if idempotent else 0
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(random.uniform(0, 0.1 * 2**attempt))
+            try:
+                response = await self._pool.request(
+                    method,
+                    target,
+                    headers=self._headers(headers or {}),
+                    body=body,
+                    idempotent=idempotent,
+                )
+            except (ConnectionError, asyncio.IncompleteReadError, TimeoutError):
+                if attempt == retries:
+                    raise
+                continue
+            if response.status not in RETRYABLE_STATUSES:
+                break
+        assert response is not None
+        if response.status not in ok_statuses:
+            message = error_message(response.body)
+            raise status_error(response.status, message, filename)
+        return response
+
+    async def stat(
+        self,
+        path: PureGCSPath,
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        """Retrieves the metadata of the object at ``path``, optionally requiring a
+        specific ``generation`` (by default, that of a generation-pinned ``path``).
+        """
+        if generation is None:
+            generation = path.generation
+        response = await self.request(
+            'GET',
+            object_target(path.bucket, path.obj, generation=generation),
+            filename=path,
+        )
+        return ObjectInfo.from_resource(path, json.loads(response.body))
+
+    async def read(
+        self,
+        path: PureGCSPath,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> bytes:
+        """Downloads the contents of the object at ``path``, or only the byte range
+        ``[start, end)`` of it if given, optionally requiring a specific ``generation``
+        (by default, that of a generation-pinned ``path``).
+        """
+        if generation is None:
+            generation = path.generation
+        headers = {}
+        if start or end is not None:
+            last = '' if end is None else end - 1
+            headers['Range'] = f'bytes={start}-{last}'
+        response = await self.request(
+            'GET',
+            object_target(path.bucket, path.obj, alt='media', generation=generation),
+            filename=path,
+            headers=headers,
+            ok_statuses=(200, 206, 416),
+        )
+        return response.body if response.status != 416 else b''
+
+    async def write(
+        self,
+        path: PureGCSPath,
+        data: bytes | bytearray | memoryview,
+        *,
+        content_type: str = 'application/octet-stream',
+        idempotent: bool = False,
+    ) -> ObjectInfo:
+        """Uploads ``data`` as the object at ``path``, replacing any existing object.
+
+        The upload is only retried if ``idempotent`` - e.g. for a temporary object with
+        a unique name, which nothing else writes to.
+        """
+        response = await self.request(
+            'POST',
+            upload_target(path.bucket, path.obj),
+            filename=path,
+            headers={'Content-Type': content_type},
+            body=data,
+            idempotent=idempotent,
+        )
+        return ObjectInfo.from_resource(path, json.loads(response.body))
+
+    async def compose(
+        self,
+        path: PureGCSPath,
+        sources: Sequence[PureGCSPath],
+        *,
+        content_type: str = 'application/octet-stream',
+        idempotent: bool = False,
+    ) -> ObjectInfo:
+        """Concatenates up to :data:`MAX_COMPOSE_SOURCES` objects of the same bucket
+        into the object at ``path``, replacing any existing object - only retried if
+        ``idempotent``, like :meth:`write`.
+        """
+        if not 0 < len(sources) <= MAX_COMPOSE_SOURCES:
+            raise ValueError(f'Must compose 1 to {MAX_COMPOSE_SOURCES} objects')
+        if any(source.bucket != path.bucket for source in sources):
+            raise ValueError(f'Composed objects must be in bucket {path.bucket!r}')
+        request = {
+            'sourceObjects': [{'name': source.obj} for source in sources],
+            'destination': {'contentType': content_type},
+        }
+        response = await self.request(
+            'POST',
+            object_target(path.bucket, path.obj) + '/compose',
+            filename=path,
+            headers={'Content-Type': 'application/json'},
+            body=json.dumps(request).encode(),
+            idempotent=idempotent,
+        )
+        return ObjectInfo.from_resource(path, json.loads(response.body))
+
+    async def delete(
+        self,
+        path: PureGCSPath,
+        *,
+        generation: int | None = None,
+    ) -> None:
+        """Deletes the object at ``path`` - or given a ``generation`` (by default, that
+        of a generation-pinned ``path``), only if that generation is still current.
+
+        The generation is an ``ifGenerationMatch`` precondition rather than selecting
+        the generation to delete, so that noncurrent versions (of a bucket with object
+        versioning) are never deleted permanently.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist, or ``generation`` isn't
+                current.
+        """
+        if generation is None:
+            generation = path.generation
+        response = await self.request(
+            'DELETE',
+            object_target(path.bucket, path.obj, ifGenerationMatch=generation),
+            filename=path,
+            ok_statuses=(200, 204, 412),
+        )
+        if response.status == 412:
+            raise not_current_error(path, generation)
+
+    async def list_page(  # pylint: disable=too-many-arguments
+        self,
+        bucket: str,
+        *,
+        prefix: str = '',
+        delimiter: str = '',
+        start_offset: str = '',
+        end_offset: str = '',
+        page_token: str | None = None,
+        max_results: int | None = None,
+    ) -> ListPage:
+        """Lists a single page of the objects in ``bucket``; see
+        :meth:`gcspathlib.Backend.list_page`.
+        """
+        response = await self.request(
+            'GET',
+            bucket_target(
+                bucket,
+                prefix=prefix,
+                delimiter=delimiter,
+                startOffset=start_offset,
+                endOffset=end_offset,
+                pageToken=page_token,
+                maxResults=max_results,
+            ),
+            filename=f'{URI_PREFIX}{bucket}/{prefix}',
+        )
+        page = json.loads(response.body)
+        return ListPage(
+            items=page.get('items', []),
+            prefixes=page.get('prefixes', []),
+            next_page_token=page.get('nextPageToken'),
+        )
+
+
+@functools.cache
+def default_client() -> Client:
+    """The client used by :class:`AsyncGCSPath` unless overridden, created on first use
+    with the default :class:`Client` settings.
+    """
+    return Client()
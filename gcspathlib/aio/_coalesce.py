@@ -0,0 +1,68 @@
+"""Coalescing of concurrent identical requests ("single-flight") across tasks."""
+
+import asyncio
+import functools
+from .._coalesce import CoalesceInfo
+from collections.abc import Callable
+from collections.abc import Coroutine
+from collections.abc import Hashable
+from typing import Any
+from typing import ParamSpec
+from typing import TypeVar
+
+_P = ParamSpec('_P')
+_T = TypeVar('_T')
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent calls with equal keys across tasks, so that only one of
+    them runs at a time and the others share its result (or exception); the
+    asynchronous counterpart of :class:`gcspathlib.SingleFlight`.
+
+    The first call for a key runs as a task of its own, which all callers wait for -
+    so cancelling one of them doesn't cancel the call for the others.
+
+    Example:
+        >>> flight = AsyncSingleFlight()
+        >>> infos = await asyncio.gather(
+        ...     *(flight.call(path, client.stat, path) for _ in range(16))
+        ... )
+        >>> flight.coalesce_info()
+        CoalesceInfo(calls=16, coalesced=15, in_flight=0)
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    async def call(
+        self,
+        key: Hashable,
+        function: Callable[_P, Coroutine[Any, Any, _T]],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _T:
+        """Awaits ``function(*args, **kwargs)``, unless a call with an equal ``key`` is
+        already in flight - in which case its result is returned (or its exception
+        raised) instead.
+        """
+        self._calls += 1
+        task: asyncio.Task[_T] | None = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(function(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(functools.partial(self._done, key))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: 'asyncio.Task[Any]') -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # (retrieved, in case all callers were cancelled)
+
+    def coalesce_info(self) -> CoalesceInfo:
+        """Returns the call statistics."""
+        return CoalesceInfo(self._calls, self._coalesced, len(self._tasks))
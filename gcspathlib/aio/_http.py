@@ -0,0 +1,258 @@
+"""Minimal HTTP/1.1 client over :mod:`asyncio` streams, with a keep-alive connection
+pool - just enough for the Cloud Storage JSON API, without third-party dependencies.
+"""
+
+import asyncio
+import ssl
+import urllib.parse
+from collections.abc import Awaitable
+from collections.abc import Mapping
+from typing import NamedTuple
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_READ_TIMEOUT = 60.0
+
+_CRLF = b'\r\n'
+_READ_SIZE = 1 << 20
+
+
+class Response(NamedTuple):
+    """A fully read HTTP response, with lowercased header names."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class _Connection(NamedTuple):
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+class ConnectionPool:
+    """Pool of keep-alive HTTP/1.1 connections to a single host, with bounded
+    concurrency.
+
+    At most ``max_connections`` requests are in flight at any time; further requests
+    wait for a connection to be released, so that callers can fan out freely (e.g. with
+    :func:`asyncio.gather`) without overwhelming the host or running out of sockets.
+    Idle connections are reused most-recently-released first.
+
+    Connecting times out after ``connect_timeout`` seconds, and sending or receiving
+    after ``read_timeout`` seconds without progress, with a :class:`TimeoutError` - so
+    that a stalled connection can't hang a request (and hold its connection slot)
+    forever.
+
+    A pool binds to the event loop it is first used in; if used from another event loop
+    later on (e.g. across :func:`asyncio.run` calls), the connections of the previous
+    event loop are abandoned.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        ssl_context: ssl.SSLContext | None = None,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            url: The base URL of the host, e.g. ``https://storage.googleapis.com``.
+            max_connections: The maximum number of concurrent connections/requests.
+            ssl_context: The SSL context for ``https`` URLs; defaults to
+                :func:`ssl.create_default_context`.
+            connect_timeout: The timeout of establishing a connection, in seconds, or
+                ``None`` to wait indefinitely.
+            read_timeout: The timeout of each wait for the connection to accept or
+                return data (rather than of the whole request), in seconds, or
+                ``None`` to wait indefinitely.
+        """
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+            raise ValueError(f'Unsupported URL: {url}')
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._host = parsed.hostname
+        self._port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        self._host_header = parsed.netloc
+        self._ssl: ssl.SSLContext | None = None
+        if parsed.scheme == 'https':
+            self._ssl = ssl_context or ssl.create_default_context()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._idle: list[_Connection] = []
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+            self._idle = []
+
+    async def request(
+        self,
+        method: str,
+        target: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        body: bytes | bytearray | memoryview = b'',
+        idempotent: bool = True,
+    ) -> Response:
+        """Sends a request and reads the complete response.
+
+        An ``idempotent`` request that fails on a reused keep-alive connection - which
+        the server may have closed in the meantime - is transparently retried once on a
+        new connection.  Other requests aren't, since the server may have received
+        (and acted on) the request before the connection failed.
+        """
+        self._bind()
+        async with self._semaphore:
+            idle = self._idle.pop() if self._idle else None
+            try:
+                response = await self._send(
+                    idle or await self._connect(), method, target, headers, body
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if idle is None or not idempotent:
+                    raise
+                response = await self._send(
+                    await self._connect(), method, target, headers, body
+                )
+        return response
+
+    async def _send(
+        self,
+        connection: _Connection,
+        method: str,
+        target: str,
+        headers: Mapping[str, str] | None,
+        body: bytes | bytearray | memoryview,
+    ) -> Response:
+        try:
+            response, keep_alive = await self._exchange(
+                connection, method, target, headers or {}, body
+            )
+        except BaseException:
+            connection.writer.close()
+            raise
+        if keep_alive:
+            self._idle.append(connection)
+        else:
+            connection.writer.close()
+        return response
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port, ssl=self._ssl),
+            self.connect_timeout,
+        )
+        return _Connection(reader, writer)
+
+    async def _io(
+        self,
+        operation: Awaitable[bytes],
+    ) -> bytes:
+        """Awaits a single read (or drain) of a connection, up to the read timeout."""
+        return await asyncio.wait_for(operation, self.read_timeout)
+
+    async def _exchange(
+        self,
+        connection: _Connection,
+        method: str,
+        target: str,
+        headers: Mapping[str, str],
+        body: bytes | bytearray | memoryview,
+    ) -> tuple[Response, bool]:
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {self._host_header}']
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        if body or method in ('POST', 'PUT', 'PATCH'):
+            lines.append(f'Content-Length: {len(body)}')
+        connection.writer.write('\r\n'.join(lines).encode('latin-1') + _CRLF * 2)
+        if body:
+            connection.writer.write(body)
+        await asyncio.wait_for(connection.writer.drain(), self.read_timeout)
+        return await self._read_response(connection.reader, method)
+
+    async def _read_response(
+        self,
+        reader: asyncio.StreamReader,
+        method: str,
+    ) -> tuple[Response, bool]:
+        head = (await self._io(reader.readuntil(_CRLF * 2))).decode('latin-1')
+        status_line, *header_lines = head.split('\r\n')[:-2]
+        version, status, *_ = status_line.split(' ', 2)
+        headers: dict[str, str] = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = (
+            version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        )
+        content: bytes
+        if method == 'HEAD' or status in ('204', '304'):
+            content = b''
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            content = await self._read_chunked(reader)
+        elif 'content-length' in headers:
+            content = await self._read_exactly(reader, int(headers['content-length']))
+        else:
+            content = await self._read_to_end(reader)
+            keep_alive = False
+        return Response(int(status), headers, content), keep_alive
+
+    async def _read_exactly(
+        self,
+        reader: asyncio.StreamReader,
+        size: int,
+    ) -> bytes:
+        """Reads ``size`` bytes - in pieces if large, so that the read timeout applies
+        to each wait for data rather than to the whole body.
+        """
+        if size <= _READ_SIZE:
+            content = await self._io(reader.readexactly(size))
+        else:
+            chunks: list[bytes] = []
+            remaining = size
+            while remaining:
+                chunks.append(await self._io(reader.read(min(remaining, _READ_SIZE))))
+                if not chunks[-1]:
+                    raise asyncio.IncompleteReadError(b''.join(chunks), size)
+                remaining -= len(chunks[-1])
+            content = b''.join(chunks)
+        return content
+
+    async def _read_to_end(
+        self,
+        reader: asyncio.StreamReader,
+    ) -> bytes:
+        chunks = []
+        while chunk := await self._io(reader.read(_READ_SIZE)):
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    async def _read_chunked(
+        self,
+        reader: asyncio.StreamReader,
+    ) -> bytes:
+        chunks = []
+        while size := int((await self._io(reader.readuntil(_CRLF))).split(b';')[0], 16):
+            chunks.append(await self._read_exactly(reader, size))
+            await self._io(reader.readexactly(len(_CRLF)))
+        while await self._io(reader.readuntil(_CRLF)) != _CRLF:  # trailers
+            pass
+        return b''.join(chunks)
+
+    async def close(self) -> None:
+        """Closes all idle connections."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.writer.close()
+        for connection in idle:
+            try:
+                await connection.writer.wait_closed()
+            except ConnectionError:
+                pass
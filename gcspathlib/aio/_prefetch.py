@@ -0,0 +1,78 @@
+"""Bounded-concurrency reads of many (small) objects; see :mod:`gcspathlib._prefetch`
+for the synchronous counterpart.
+"""
+
+import asyncio
+from .._prefetch import DEFAULT_PREFETCH_BUFFER_SIZE
+from .._prefetch import DEFAULT_PREFETCH_CONCURRENCY
+from .._prefetch import PathT
+from .._prefetch import ReadWindow
+from ._client import Client
+from ._client import default_client
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+
+
+async def read_many(  # pylint: disable=too-many-arguments
+    paths: Iterable[PathT],
+    client: Client | None = None,
+    *,
+    concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+    ordered: bool = True,
+    max_buffered: int = DEFAULT_PREFETCH_BUFFER_SIZE,
+    window: int | None = None,
+) -> AsyncIterator[tuple[PathT, bytes]]:
+    """Reads the objects at ``paths`` with ``client`` (:func:`default_client` if
+    omitted) with up to ``concurrency`` reads in flight, and yields ``(path, contents)``
+    pairs - in the order of ``paths``, or in the order the reads finish unless
+    ``ordered``.  The arguments are those of the synchronous
+    :func:`gcspathlib.read_many`, with the client in place of the backend.
+
+    ``paths`` is consumed lazily, as reads are started.  No further reads are started
+    while the contents read ahead but not yet yielded add up to ``max_buffered`` bytes,
+    or - if ``ordered`` - while the reads started are ``window`` (by default twice the
+    ``concurrency``) paths ahead of the oldest one not yielded yet.  Reads still in
+    flight are cancelled when the generator is closed.
+
+    Example:
+        >>> async for path, data in read_many(paths, client, concurrency=64):
+        ...     samples.append(decode(data))
+
+    Raises:
+        FileNotFoundError: If an object doesn't exist - when it would've been yielded
+            if ``ordered``.
+    """
+    reads: ReadWindow[PathT, asyncio.Task[bytes]] = ReadWindow(
+        concurrency=concurrency,
+        max_buffered=max_buffered,
+        ordered=ordered,
+        window=window,
+    )
+    client = client or default_client()
+    iterator = iter(paths)
+    exhausted = False
+    try:
+        while not exhausted or reads:
+            while not exhausted and reads.can_start():
+                path = next(iterator, None)
+                exhausted = path is None
+                if path is not None:
+                    reads.start(path, asyncio.create_task(client.read(path)))
+            item = reads.pop()
+            if item is not None:
+                yield item[0], item[1].result()
+            elif reads.in_flight:
+                done, _ = await asyncio.wait(
+                    reads.in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    reads.finish(task)
+    finally:
+        tasks = reads.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+        for task in tasks:
+            if not task.cancelled():
+                task.exception()  # (retrieved, so that it isn't logged as unhandled)
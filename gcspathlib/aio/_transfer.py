@@ -0,0 +1,259 @@
+"""Parallel transfers of large objects between Cloud Storage and local files.
+
+Downloads are sliced into byte ranges that are fetched concurrently and written
+straight to their offsets in a preallocated file.  Uploads are split into chunks that
+are uploaded concurrently as temporary component objects, and then composed into the
+target object.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import errno
+import functools
+import mmap
+import os
+import uuid
+from .. import PureGCSPath
+from .._jsonapi import MAX_COMPOSE_SOURCES
+from .._jsonapi import ObjectInfo
+from ._batch import BatchExecutor
+from ._client import Client
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Coroutine
+from collections.abc import Iterable
+from typing import Any
+from typing import TypeVar
+
+DEFAULT_CHUNK_SIZE = 32 * 2**20
+DEFAULT_TRANSFER_CONCURRENCY = 8
+
+_T = TypeVar('_T')
+
+_Write = Callable[[bytes, int], None]
+"""Writes data at an offset of the target file."""
+
+
+async def download(  # pylint: disable=too-many-arguments
+    client: Client,
+    path: PureGCSPath,
+    filename: 'str | os.PathLike[str]',
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+    use_mmap: bool = False,
+) -> ObjectInfo:
+    """Downloads the object at ``path`` to the local file ``filename``, as byte ranges
+    of ``chunk_size`` of which up to ``concurrency`` are fetched at a time.
+
+    The file is preallocated to the object size, and each range is written to its
+    offset with :func:`os.pwrite` - or copied into a memory mapping of the file with
+    ``use_mmap``.  All ranges are read from the same object generation, so that a
+    concurrent overwrite fails the download with :class:`FileNotFoundError` rather than
+    mixing up contents.  If the download fails, the file is removed - unless it
+    existed before.
+
+    Returns:
+        The metadata of the downloaded object generation.
+    """
+    info = await client.stat(path)
+    flags = os.O_RDWR | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(filename, flags | os.O_EXCL, 0o666)
+        created = True
+    except FileExistsError:
+        fd = os.open(filename, flags, 0o666)
+        created = False
+    try:
+        _preallocate(fd, info.size)
+        with contextlib.ExitStack() as stack:
+            if use_mmap and info.size:
+                target = stack.enter_context(mmap.mmap(fd, info.size))
+                write: _Write = functools.partial(_write_mmap, target)
+            else:
+                write = functools.partial(_pwrite, fd)
+            # (Exiting waits for the writes in progress, before closing the file.)
+            executor = stack.enter_context(_executor(concurrency))
+            await _download_ranges(
+                client,
+                info,
+                functools.partial(_run_in, executor, write),
+                chunk_size,
+                concurrency,
+            )
+    except BaseException:
+        os.close(fd)
+        if created:
+            os.unlink(filename)
+        raise
+    os.close(fd)
+    return info
+
+
+def _executor(workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(
+        workers, thread_name_prefix='gcspathlib-transfer'
+    )
+
+
+async def _run_in(
+    executor: concurrent.futures.Executor,
+    function: Callable[..., _T],
+    *args: Any,
+) -> _T:
+    return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+def _preallocate(
+    fd: int,
+    size: int,
+) -> None:
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):  # (not available, or not supported by the FS)
+        os.ftruncate(fd, size)
+
+
+def _pwrite(
+    fd: int,
+    data: bytes,
+    offset: int,
+) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _write_mmap(
+    target: mmap.mmap,
+    data: bytes,
+    offset: int,
+) -> None:
+    target[offset : offset + len(data)] = data
+
+
+async def _download_ranges(
+    client: Client,
+    info: ObjectInfo,
+    write: Callable[[bytes, int], Awaitable[None]],
+    chunk_size: int,
+    concurrency: int,
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download_range(start: int) -> None:
+        end = min(start + chunk_size, info.size)
+        async with semaphore:
+            data = await client.read(info.path, start, end, generation=info.generation)
+            if len(data) != end - start:
+                message = f'Short read of bytes {start}-{end - 1}'
+                raise OSError(errno.EIO, message, str(info.path))
+            await write(data, start)
+
+    await _gather(download_range(start) for start in range(0, info.size, chunk_size))
+
+
+async def upload(  # pylint: disable=too-many-arguments
+    client: Client,
+    path: PureGCSPath,
+    filename: 'str | os.PathLike[str]',
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    concurrency: int = DEFAULT_TRANSFER_CONCURRENCY,
+    content_type: str = 'application/octet-stream',
+) -> ObjectInfo:
+    """Uploads the local file ``filename`` as the object at ``path``, as chunks of
+    ``chunk_size`` of which up to ``concurrency`` are uploaded at a time.
+
+    Files larger than a single chunk are uploaded as a parallel composite upload: each
+    chunk becomes a temporary component object next to ``path`` (named
+    ``<name>.<random token>.part<index>``), the components are composed into ``path``
+    (in several rounds if there are more than :data:`MAX_COMPOSE_SOURCES`), and then
+    deleted - also if the upload fails.  Since the names of the components (and of
+    intermediate composites) are unique, their uploads are retried like idempotent
+    requests; the final composition into ``path`` isn't.
+
+    Note that composite objects have no MD5 hash, only a CRC32C checksum.
+
+    Returns:
+        The metadata of the uploaded object.
+    """
+    with open(filename, 'rb') as file, _executor(concurrency) as executor:
+        size = os.fstat(file.fileno()).st_size
+        if size <= chunk_size:
+            data = await _run_in(executor, file.read)
+            info = await client.write(path, data, content_type=content_type)
+        else:
+            info = await _composite_upload(
+                client,
+                path,
+                functools.partial(_run_in, executor, os.pread, file.fileno()),
+                range(0, size, chunk_size),
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+                content_type=content_type,
+            )
+    return info
+
+
+async def _composite_upload(  # pylint: disable=too-many-arguments
+    client: Client,
+    path: PureGCSPath,
+    pread: Callable[[int, int], Awaitable[bytes]],
+    offsets: range,
+    *,
+    chunk_size: int,
+    concurrency: int,
+    content_type: str,
+) -> ObjectInfo:
+    token = uuid.uuid4().hex[:16]
+    semaphore = asyncio.Semaphore(concurrency)
+    components = [
+        path.with_name(f'{path.name}.{token}.part{index}')
+        for index in range(len(offsets))
+    ]
+    temporaries = list(components)
+
+    async def upload_chunk(component: PureGCSPath, offset: int) -> None:
+        async with semaphore:
+            data = await pread(chunk_size, offset)
+            await client.write(component, data, idempotent=True)
+
+    async def compose(target: PureGCSPath, sources: list[PureGCSPath]) -> None:
+        async with semaphore:
+            await client.compose(target, sources, idempotent=True)
+
+    try:
+        await _gather(map(upload_chunk, components, offsets))
+        while len(components) > MAX_COMPOSE_SOURCES:
+            groups = [
+                components[i : i + MAX_COMPOSE_SOURCES]
+                for i in range(0, len(components), MAX_COMPOSE_SOURCES)
+            ]
+            # (Intermediate composites are named after their first component, plus a
+            # `c` per round.)
+            components = [group[0].with_name(f'{group[0].name}c') for group in groups]
+            temporaries += components
+            await _gather(map(compose, components, groups))
+        info = await client.compose(path, components, content_type=content_type)
+    finally:
+        async for _ in BatchExecutor(client).delete(temporaries):
+            pass  # (ignoring errors, e.g. for components that were never uploaded)
+    return info
+
+
+async def _gather(coroutines: Iterable[Coroutine[Any, Any, None]]) -> None:
+    """Runs ``coroutines`` concurrently, cancelling the rest (and waiting for them to
+    finish) if any of them fails.
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
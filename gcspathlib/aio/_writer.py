@@ -0,0 +1,374 @@
+"""Streaming uploads through the resumable upload protocol.
+
+See https://cloud.google.com/storage/docs/performing-resumable-uploads for the
+protocol: an upload session is started with a ``POST``, and then the data is sent in
+``PUT`` requests of (multiples of) 256 KiB, each declaring its byte range.  After a
+failure, the server reports how much of the data it has persisted, and the upload
+continues from there.
+"""
+
+import asyncio
+import errno
+import json
+import random
+import urllib.parse
+from .. import PureGCSPath
+from .._crc32c import ACCELERATED
+from .._crc32c import crc32c
+from .._crc32c import encode_crc32c
+from .._jsonapi import RESUMABLE_CHUNK_ALIGNMENT
+from .._jsonapi import RETRYABLE_STATUSES
+from .._jsonapi import ObjectInfo
+from .._jsonapi import error_message
+from .._jsonapi import status_error
+from .._jsonapi import upload_target
+from ._client import Client
+from ._http import Response
+from typing import TYPE_CHECKING
+from typing import Self
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 2**20
+DEFAULT_UPLOAD_BUFFERS = 2
+
+
+class BufferPool:
+    """A fixed number of reusable upload buffers, which can be shared by any number of
+    :class:`ObjectWriter` - so that their memory use is bounded by ``count *
+    buffer_size`` regardless of how many uploads are in progress.
+
+    Buffers are allocated on first use, and handed out again once released.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        count: int = DEFAULT_UPLOAD_BUFFERS,
+    ) -> None:
+        """
+        Args:
+            buffer_size: The size of each buffer, which is the size of the uploaded
+                chunks; a multiple of :data:`RESUMABLE_CHUNK_ALIGNMENT` (256 KiB).
+            count: The number of buffers.  Each writer holds one buffer while it's
+                being filled and one per chunk being uploaded, so at least 2 per
+                concurrent writer are needed to overlap the two.
+        """
+        if buffer_size <= 0 or buffer_size % RESUMABLE_CHUNK_ALIGNMENT:
+            raise ValueError('Buffer size must be a positive multiple of 256 KiB')
+        if count <= 0:
+            raise ValueError('Buffer count must be positive')
+        self.buffer_size = buffer_size
+        self.count = count
+        self._free: list[bytearray] = []
+        self._available = asyncio.Semaphore(count)
+
+    async def acquire(self) -> bytearray:
+        """Takes a buffer from the pool, waiting until one is released if there are
+        none left.
+        """
+        await self._available.acquire()
+        return self._free.pop() if self._free else bytearray(self.buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Returns a buffer taken with :meth:`acquire` to the pool."""
+        self._free.append(buffer)
+        self._available.release()
+
+
+class ObjectWriter:
+    """Writable file-like object that streams data to the object at :attr:`path`
+    through a resumable upload, with bounded memory.
+
+    Data is copied into fixed-size buffers from a :class:`BufferPool`, and each full
+    buffer is uploaded as a chunk in the background while the next one is being filled.
+    Transiently failed chunks (HTTP 408, 429, and 5xx, and connection failures) are
+    resumed from the offset that the server reports as persisted, with exponential
+    backoff and jitter, up to the client's :attr:`Client.retries` times in a row.
+    Objects that fit into a single buffer are uploaded with a single request instead.
+
+    The CRC32C checksum of the data is computed incrementally while writing, and sent
+    along with the last chunk for the server to verify - by default, only if the
+    ``google_crc32c`` C extension is installed: the pure-Python fallback manages a few
+    MB/s, and computes on the event loop, blocking it for more than a second per 8 MiB
+    written.  The object only comes into existence once the writer is closed; if it's
+    aborted (e.g. on an exception in its ``async with`` block), the upload session is
+    cancelled.
+
+    Example:
+        >>> async with ObjectWriter(client, PureGCSPath('gs://bucket/export.csv')) as f:
+        ...     async for row in rows:
+        ...         await f.write(row)
+        >>> f.info.size
+        123456789
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client: Client,
+        path: PureGCSPath,
+        *,
+        content_type: str = 'application/octet-stream',
+        pool: BufferPool | None = None,
+        checksum: bool | None = None,
+    ) -> None:
+        """
+        Args:
+            client: The client to upload with.
+            path: The object to write.
+            content_type: The content type of the object.
+            pool: The pool to take buffers from; a new pool of
+                :data:`DEFAULT_UPLOAD_BUFFERS` buffers of
+                :data:`DEFAULT_UPLOAD_CHUNK_SIZE` if omitted.
+            checksum: Whether to compute and verify the CRC32C checksum; if omitted,
+                only if the ``google_crc32c`` C extension is installed.
+        """
+        self.client = client
+        self.path = path
+        self.content_type = content_type
+        self.pool = pool or BufferPool()
+        self.info: ObjectInfo | None = None
+        """The metadata of the written object, once closed."""
+        self._session: str | None = None  # (the request target of the upload session)
+        self._buffer: bytearray | None = None
+        self._filled = 0
+        self._offset = 0  # (the object offset of the start of the buffer)
+        self._crc = 0 if (ACCELERATED if checksum is None else checksum) else None
+        self._pending: asyncio.Task[ObjectInfo | None] | None = None
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.path!r}>'
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.abort()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def tell(self) -> int:
+        """The number of bytes written so far."""
+        return self._offset + self._filled
+
+    async def write(self, data: 'ReadableBuffer') -> int:
+        """Writes ``data``, waiting for the upload of earlier chunks as needed.
+
+        Raises:
+            OSError: If the upload of an earlier chunk failed.
+        """
+        if self._closed:
+            raise ValueError('I/O operation on closed file')
+        with memoryview(data) as view, view.cast('B') as source:
+            position = 0
+            while position < len(source):
+                if self._buffer is None:
+                    self._buffer = await self.pool.acquire()
+                size = min(len(source) - position, len(self._buffer) - self._filled)
+                piece = source[position : position + size]
+                self._buffer[self._filled : self._filled + size] = piece
+                if self._crc is not None:
+                    self._crc = crc32c(piece, self._crc)
+                self._filled += size
+                position += size
+                if self._filled == len(self._buffer):
+                    await self._flush()
+            return len(source)
+
+    async def _flush(self) -> None:
+        """Starts uploading the (full) buffer in the background, after the upload of
+        the previous one has finished.
+        """
+        await self._wait_pending()
+        if self._session is None:
+            self._session = await self._start()
+        assert self._buffer is not None
+        self._pending = asyncio.create_task(
+            self._upload_chunk(self._buffer, self._filled, self._offset, None)
+        )
+        self._buffer = None
+        self._offset += self._filled
+        self._filled = 0
+
+    async def _wait_pending(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
+
+    async def close(self) -> ObjectInfo:
+        """Uploads the remaining data, and finishes the upload.
+
+        Returns:
+            The metadata of the written object.
+
+        Raises:
+            OSError: If the upload failed, in which case it's cancelled.
+        """
+        if self.info is None:
+            if self._closed:
+                raise ValueError('Upload was aborted')
+            try:
+                self.info = await self._finish()
+            except BaseException:
+                await self.abort()
+                raise
+            self._closed = True
+        return self.info
+
+    async def _finish(self) -> ObjectInfo:
+        await self._wait_pending()
+        buffer, self._buffer = self._buffer or bytearray(), None
+        info: ObjectInfo | None
+        if self._session is None:
+            try:
+                info = await self.client.write(
+                    self.path,
+                    memoryview(buffer)[: self._filled],
+                    content_type=self.content_type,
+                )
+            finally:
+                if buffer:
+                    self.pool.release(buffer)
+        else:
+            total = self._offset + self._filled
+            info = await self._upload_chunk(buffer, self._filled, self._offset, total)
+        if info is None:
+            raise OSError(errno.EIO, 'Upload not finished', str(self.path))
+        if self._crc is not None and info.crc32c not in (
+            None,
+            encode_crc32c(self._crc),
+        ):
+            raise OSError(errno.EIO, 'CRC32C checksum mismatch', str(self.path))
+        return info
+
+    async def abort(self) -> None:
+        """Discards the data written so far, and cancels the upload session."""
+        self._closed = True
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait([pending])
+        if self._buffer is not None:
+            self.pool.release(self._buffer)
+            self._buffer = None
+        session, self._session = self._session, None
+        if session is not None:
+            try:
+                await self.client.request(
+                    'DELETE', session, filename=self.path, ok_statuses=(204, 499)
+                )
+            except OSError:
+                pass  # (abandoned sessions expire after a week anyway)
+
+    async def _start(self) -> str:
+        """Starts an upload session, and returns its request target."""
+        response = await self.client.request(
+            'POST',
+            upload_target(self.path.bucket, self.path.obj, 'resumable'),
+            filename=self.path,
+            headers={
+                'Content-Type': 'application/json',
+                'X-Upload-Content-Type': self.content_type,
+            },
+            body=json.dumps({'contentType': self.content_type}).encode(),
+            idempotent=True,  # (a session on its own doesn't change the object)
+        )
+        location = urllib.parse.urlsplit(response.headers['location'])
+        return f'{location.path}?{location.query}'
+
+    async def _upload_chunk(
+        self,
+        buffer: bytearray,
+        size: int,
+        offset: int,
+        total: int | None,
+    ) -> ObjectInfo | None:
+        """Uploads the first ``size`` bytes of ``buffer`` to ``offset``, and releases
+        the buffer - finishing the upload if it's the last chunk of the ``total`` size.
+
+        Returns:
+            The metadata of the written object if the upload is finished.
+        """
+        try:
+            with memoryview(buffer) as view:
+                info = await self._send(view[:size], offset, total)
+        finally:
+            if buffer:
+                self.pool.release(buffer)
+        return info
+
+    async def _send(
+        self,
+        data: memoryview,
+        offset: int,
+        total: int | None,
+    ) -> ObjectInfo | None:
+        persisted = offset
+        failures = 0
+        info = None
+        while persisted < offset + len(data) or (total is not None and info is None):
+            if failures:
+                await asyncio.sleep(random.uniform(0, 0.1 * 2**failures))
+            try:
+                # (After a failure, first ask how much of the data got persisted.)
+                chunk = data[persisted - offset :] if not failures else data[:0]
+                response = await self._put(chunk, persisted, total)
+            except (ConnectionError, asyncio.IncompleteReadError, TimeoutError):
+                if failures == self.client.retries:
+                    raise
+                failures += 1
+                continue
+            if response.status in RETRYABLE_STATUSES:
+                if failures == self.client.retries:
+                    message = error_message(response.body)
+                    raise status_error(response.status, message, self.path)
+                failures += 1
+                continue
+            failures = 0
+            if response.status == 308:
+                persisted = _persisted(response)
+                if not offset <= persisted <= offset + len(data):
+                    message = f'Unexpected persisted size of upload: {persisted}'
+                    raise OSError(errno.EIO, message, str(self.path))
+            else:
+                info = ObjectInfo.from_resource(self.path, json.loads(response.body))
+                persisted = offset + len(data)
+        return info
+
+    async def _put(
+        self,
+        chunk: memoryview,
+        start: int,
+        total: int | None,
+    ) -> Response:
+        """Sends ``chunk`` (or queries the upload status if empty), as the data at
+        ``start`` of an object of ``total`` size (if known yet).
+        """
+        size = '*' if total is None else str(total)
+        byte_range = f'{start}-{start + len(chunk) - 1}' if chunk else '*'
+        headers = {'Content-Range': f'bytes {byte_range}/{size}'}
+        if total is not None and self._crc is not None:
+            headers['X-Goog-Hash'] = f'crc32c={encode_crc32c(self._crc)}'
+        assert self._session is not None
+        return await self.client.request(
+            'PUT',
+            self._session,
+            filename=self.path,
+            headers=headers,
+            body=chunk,
+            ok_statuses=(200, 201, 308, *RETRYABLE_STATUSES),
+            retries=0,
+        )
+
+
+def _persisted(response: Response) -> int:
+    """The number of bytes persisted, from the ``Range`` header of a 308 response."""
+    byte_range = response.headers.get('range', '')
+    return int(byte_range.rpartition('-')[2]) + 1 if byte_range else 0
@@ -0,0 +1,24 @@
+"""Fakes of Cloud Storage, for testing and benchmarking I/O built on
+:mod:`gcspathlib` without a network or credentials.
+
+* :class:`MemoryBackend` and :class:`LocalBackend` are :class:`gcspathlib.Backend`
+  implementations keeping objects in memory and in a local directory tree,
+  respectively;
+* :class:`FakeServer` serves a backend over (a subset of) the JSON API, e.g. for
+  :mod:`gcspathlib.aio` clients.
+
+Run ``python -m gcspathlib.testing [--root DIR]`` to serve a backend standalone, e.g.
+for use with ``STORAGE_EMULATOR_HOST``.
+"""
+
+from ._backends import DEFAULT_PAGE_SIZE
+from ._backends import LocalBackend
+from ._backends import MemoryBackend
+from ._server import FakeServer
+
+__all__ = [
+    'DEFAULT_PAGE_SIZE',
+    'FakeServer',
+    'LocalBackend',
+    'MemoryBackend',
+]
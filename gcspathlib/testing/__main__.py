@@ -0,0 +1,30 @@
+import argparse
+import threading
+from . import FakeServer
+from . import LocalBackend
+from . import MemoryBackend
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m gcspathlib.testing',
+        description='Serves a fake Cloud Storage JSON API, printing its URL.',
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument(
+        '--root',
+        help='directory with a subdirectory per bucket to serve (default: in-memory)',
+    )
+    args = parser.parse_args()
+    backend = LocalBackend(args.root) if args.root else MemoryBackend()
+    server = FakeServer(backend, host=args.host, port=args.port).start()
+    print(server.url, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,573 @@
+import base64
+import bisect
+import datetime
+import errno
+import functools
+import hashlib
+import mmap
+import os
+import stat
+import tempfile
+import threading
+import time
+from .. import PureGCSPath
+from .._jsonapi import ListPage
+from .._jsonapi import ObjectInfo
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+
+DEFAULT_PAGE_SIZE = 1000
+
+_WRITABLE_FIELDS = frozenset(
+    {
+        'cacheControl',
+        'contentDisposition',
+        'contentEncoding',
+        'contentLanguage',
+        'contentType',
+        'metadata',
+    }
+)
+
+_ListEntry = tuple[str, Callable[[], dict[str, Any]] | None]
+"""A listing entry: an object name and a function returning its resource, or a
+delimiter-terminated prefix and ``None``.
+"""
+
+
+def _next_generation(previous: int) -> int:
+    """A new, strictly increasing generation - the current time in microseconds, as
+    with Cloud Storage.
+    """
+    return max(time.time_ns() // 1000, previous + 1)
+
+
+def _not_found(
+    path: PureGCSPath,
+    generation: int | None = None,
+) -> FileNotFoundError:
+    message = 'No such object' if generation is None else 'No such object generation'
+    return FileNotFoundError(errno.ENOENT, message, str(path))
+
+
+def _list_key(
+    name: str,
+    prefix: str,
+    delimiter: str,
+) -> tuple[str, bool]:
+    """The listing entry of an object: either its name itself, or the prefix up to the
+    first delimiter after ``prefix`` - along with whether it's a prefix.
+    """
+    index = name.find(delimiter, len(prefix)) if delimiter else -1
+    return (name, False) if index == -1 else (name[: index + len(delimiter)], True)
+
+
+def _list_page(
+    entries: Iterator[_ListEntry],
+    page_token: str | None,
+    max_results: int | None,
+) -> ListPage:
+    """Collects a page from ``entries`` in lexicographic order, where prefixes may be
+    repeated (for each of the objects they stand for).
+
+    Page tokens are simply the last name or prefix returned.
+    """
+    max_results = min(max_results or DEFAULT_PAGE_SIZE, DEFAULT_PAGE_SIZE)
+    items: list[dict[str, Any]] = []
+    prefixes: list[str] = []
+    last_key = page_token or ''
+    next_page_token: str | None = None
+    for key, resource in entries:
+        if key <= last_key:
+            continue  # (the rest of an already returned prefix)
+        if len(items) + len(prefixes) == max_results:
+            next_page_token = last_key
+            break
+        if resource is None:
+            prefixes.append(key)
+        else:
+            items.append(resource())
+        last_key = key
+    return ListPage(items, prefixes, next_page_token)
+
+
+def _patch_resource(
+    resource: dict[str, Any],
+    metadata: Mapping[str, Any],
+) -> dict[str, Any]:
+    """Returns a copy of ``resource`` updated with the writable ``metadata`` fields,
+    and with its metageneration bumped.
+    """
+    unsupported = set(metadata) - _WRITABLE_FIELDS
+    if unsupported:
+        raise ValueError(f'Unsupported metadata fields: {sorted(unsupported)}')
+    resource = {**resource, 'metageneration': str(int(resource['metageneration']) + 1)}
+    for key, value in metadata.items():
+        if key == 'metadata':
+            custom = {**resource.get('metadata', {}), **(value or {})}
+            value = {name: item for name, item in custom.items() if item is not None}
+        if value is None:
+            resource.pop(key, None)
+        else:
+            resource[key] = value
+    return resource
+
+
+def _check_name(path: PureGCSPath) -> None:
+    if not path.is_absolute():
+        raise ValueError(f'Path must have a bucket and an object name: {path!r}')
+
+
+class MemoryBackend:
+    """Backend keeping objects in memory, with object names kept in sorted order per
+    bucket for efficient listing.
+
+    Implements :class:`gcspathlib.Backend`; thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._objects: dict[tuple[str, str], tuple[bytes, dict[str, Any]]] = {}
+        self._names: dict[str, list[str]] = {}
+        self._generation = 0
+
+    def _get(
+        self,
+        path: PureGCSPath,
+        generation: int | None,
+    ) -> tuple[bytes, dict[str, Any]]:
+        _check_name(path)
+        if generation is None:
+            generation = path.generation
+        with self._lock:
+            entry = self._objects.get((path.bucket, path.obj))
+        if entry is None or generation not in (None, int(entry[1]['generation'])):
+            raise _not_found(path, generation)
+        return entry
+
+    def stat(
+        self,
+        path: PureGCSPath,
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        _, resource = self._get(path, generation)
+        return ObjectInfo.from_resource(path, resource)
+
+    def read(
+        self,
+        path: PureGCSPath,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> memoryview:
+        data, _ = self._get(path, generation)
+        return memoryview(data)[start:end]
+
+    def write(
+        self,
+        path: PureGCSPath,
+        data: bytes | bytearray | memoryview,
+    ) -> ObjectInfo:
+        _check_name(path)
+        return ObjectInfo.from_resource(path, self._put(path.bucket, path.obj, data))
+
+    def _put(
+        self,
+        bucket: str,
+        name: str,
+        data: bytes | bytearray | memoryview,
+    ) -> dict[str, Any]:
+        """Writes an object by name - which, unlike with :meth:`write`, may be one that
+        can't be expressed as a :class:`PureGCSPath`, such as ``dir/``.
+        """
+        data = bytes(data)
+        with self._lock:
+            self._generation = _next_generation(self._generation)
+            resource = {
+                'kind': 'storage#object',
+                'bucket': bucket,
+                'name': name,
+                'size': str(len(data)),
+                'generation': str(self._generation),
+                'metageneration': '1',
+                'contentType': 'application/octet-stream',
+                'md5Hash': base64.b64encode(hashlib.md5(data).digest()).decode(),
+                'updated': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            }
+            if (bucket, name) not in self._objects:
+                bisect.insort(self._names.setdefault(bucket, []), name)
+            self._objects[bucket, name] = (data, resource)
+        return resource
+
+    def patch(
+        self,
+        path: PureGCSPath,
+        metadata: Mapping[str, Any],
+    ) -> ObjectInfo:
+        _check_name(path)
+        with self._lock:
+            entry = self._objects.get((path.bucket, path.obj))
+            if entry is None:
+                raise _not_found(path)
+            data, resource = entry
+            resource = _patch_resource(resource, metadata)
+            self._objects[path.bucket, path.obj] = (data, resource)
+        return ObjectInfo.from_resource(path, resource)
+
+    def delete(
+        self,
+        path: PureGCSPath,
+    ) -> None:
+        _check_name(path)
+        with self._lock:
+            if self._objects.pop((path.bucket, path.obj), None) is None:
+                raise _not_found(path)
+            names = self._names[path.bucket]
+            del names[bisect.bisect_left(names, path.obj)]
+
+    def list_page(  # pylint: disable=too-many-arguments
+        self,
+        bucket: str,
+        *,
+        prefix: str = '',
+        delimiter: str = '',
+        start_offset: str = '',
+        end_offset: str = '',
+        page_token: str | None = None,
+        max_results: int | None = None,
+    ) -> ListPage:
+        with self._lock:
+            names = self._names.get(bucket, [])
+            index = bisect.bisect_left(names, max(prefix, start_offset))
+            if page_token:
+                index = max(index, bisect.bisect_right(names, page_token))
+            page = _list_page(
+                self._entries(
+                    bucket,
+                    names,
+                    index,
+                    prefix=prefix,
+                    delimiter=delimiter,
+                    end_offset=end_offset,
+                ),
+                page_token,
+                max_results,
+            )
+        return page
+
+    def _entries(  # pylint: disable=too-many-arguments
+        self,
+        bucket: str,
+        names: list[str],
+        index: int,
+        *,
+        prefix: str,
+        delimiter: str,
+        end_offset: str,
+    ) -> Iterator[_ListEntry]:
+        while index < len(names):
+            name = names[index]
+            if not name.startswith(prefix) or (end_offset and name >= end_offset):
+                break
+            key, is_prefix = _list_key(name, prefix, delimiter)
+            if is_prefix:
+                yield key, None
+                # Skip to the first name after the prefix.
+                index = bisect.bisect_left(names, key[:-1] + chr(ord(key[-1]) + 1))
+            else:
+                yield key, functools.partial(self._resource, bucket, name)
+                index += 1
+
+    def _resource(
+        self,
+        bucket: str,
+        name: str,
+    ) -> dict[str, Any]:
+        return dict(self._objects[bucket, name][1])
+
+
+class LocalBackend:
+    """Backend mapping ``gs://bucket/obj`` onto the local file ``root/bucket/obj``.
+
+    Existing directory trees can be served as is, e.g. to reproduce listing and read
+    throughput issues on a laptop.  Object generations are derived from file
+    modification times (in microseconds, as with Cloud Storage), with writes bumping
+    them monotonically.  Reads are zero-copy :class:`memoryview` slices of read-only
+    memory mappings of the files.
+
+    Object names that can't be mapped onto file paths - with empty, ``.``, or ``..``
+    segments - are rejected with :class:`ValueError`, as are objects that would
+    conflict with "directories" (e.g. ``a`` and ``a/b``) with :class:`OSError`.
+    Directories left empty by deletions are removed, and don't show up in listings.
+
+    Implements :class:`gcspathlib.Backend`; thread-safe.
+    """
+
+    def __init__(
+        self,
+        root: 'str | os.PathLike[str]',
+    ) -> None:
+        """
+        Args:
+            root: The directory containing a subdirectory for each bucket; created if
+                it doesn't exist yet.
+        """
+        self.root = os.fspath(root)
+        self._tmp = os.path.join(self.root, '.tmp')  # (not a valid bucket name)
+        self._lock = threading.Lock()
+        os.makedirs(self._tmp, exist_ok=True)
+
+    def _file(
+        self,
+        path: PureGCSPath,
+    ) -> str:
+        _check_name(path)
+        segments = path.obj.split(path._sep)  # pylint: disable=protected-access
+        if path.bucket.startswith('.') or {'', '.', '..'} & {path.bucket, *segments}:
+            raise ValueError(f'Path not supported by {type(self).__name__}: {path!r}')
+        return os.path.join(self.root, path.bucket, *segments)
+
+    def _stat(
+        self,
+        path: PureGCSPath,
+        file: str,
+        generation: int | None,
+    ) -> os.stat_result:
+        try:
+            file_stat = os.stat(file)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise _not_found(path) from e
+        _check_stat(path, file_stat, generation)
+        return file_stat
+
+    def stat(
+        self,
+        path: PureGCSPath,
+        *,
+        generation: int | None = None,
+    ) -> ObjectInfo:
+        file_stat = self._stat(path, self._file(path), generation)
+        return ObjectInfo.from_resource(
+            path, _file_resource(path.bucket, path.obj, file_stat)
+        )
+
+    def read(
+        self,
+        path: PureGCSPath,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        generation: int | None = None,
+    ) -> memoryview:
+        try:
+            file = open(self._file(path), 'rb')  # pylint: disable=consider-using-with
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError) as e:
+            raise _not_found(path) from e
+        with file:
+            file_stat = os.fstat(file.fileno())
+            _check_stat(path, file_stat, generation)
+            view = memoryview(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                if file_stat.st_size
+                else b''
+            )
+        return view[start:end]
+
+    def write(
+        self,
+        path: PureGCSPath,
+        data: bytes | bytearray | memoryview,
+    ) -> ObjectInfo:
+        file = self._file(path)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=self._tmp)
+        try:
+            with open(fd, 'wb') as tmp:
+                tmp.write(data)
+            with self._lock:
+                try:
+                    previous = os.stat(file).st_mtime_ns // 1000
+                except FileNotFoundError:
+                    previous = 0
+                generation_ns = _next_generation(previous) * 1000
+                os.utime(tmp_file, ns=(generation_ns, generation_ns))
+                file_stat = os.stat(tmp_file)
+                os.replace(tmp_file, file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+            raise
+        return ObjectInfo.from_resource(
+            path, _file_resource(path.bucket, path.obj, file_stat)
+        )
+
+    def patch(
+        self,
+        path: PureGCSPath,
+        metadata: Mapping[str, Any],  # pylint: disable=unused-argument
+    ) -> ObjectInfo:
+        """Not supported, since files have no place for object metadata.
+
+        Raises:
+            OSError: Always (or :class:`FileNotFoundError` if the object doesn't exist).
+        """
+        self.stat(path)
+        raise OSError(errno.ENOTSUP, 'Object metadata not supported', str(path))
+
+    def delete(
+        self,
+        path: PureGCSPath,
+    ) -> None:
+        file = self._file(path)
+        self._stat(path, file, None)
+        os.unlink(file)
+        bucket_dir = os.path.join(self.root, path.bucket)
+        directory = os.path.dirname(file)
+        try:
+            while directory != bucket_dir:
+                os.rmdir(directory)
+                directory = os.path.dirname(directory)
+        except OSError:
+            pass  # (not empty)
+
+    def list_page(  # pylint: disable=too-many-arguments
+        self,
+        bucket: str,
+        *,
+        prefix: str = '',
+        delimiter: str = '',
+        start_offset: str = '',
+        end_offset: str = '',
+        page_token: str | None = None,
+        max_results: int | None = None,
+    ) -> ListPage:
+        # Start at the deepest directory that's fully determined by the prefix.
+        directory, _, _ = prefix.rpartition('/')
+        segments = directory.split('/') if directory else []
+        entries: Iterator[_ListEntry] = iter(())
+        if not {'', '.', '..'} & {bucket, *segments} and not bucket.startswith('.'):
+            entries = self._walk(
+                bucket,
+                os.path.join(self.root, bucket, *segments),
+                f'{directory}/' if directory else '',
+                (prefix, delimiter, max(start_offset, page_token or ''), end_offset),
+            )
+        return _list_page(entries, page_token, max_results)
+
+    def _walk(
+        self,
+        bucket: str,
+        directory: str,
+        dir_name: str,
+        query: tuple[str, str, str, str],
+    ) -> Iterator[_ListEntry]:
+        """Yields the listing entries under ``directory`` (i.e. the object name prefix
+        ``dir_name``) in lexicographic order.
+
+        A subdirectory sorts as its name plus ``/`` - e.g. ``a.txt`` before ``a/`` before
+        ``a0`` - which is where its contents sort among the object names.
+        """
+        prefix, delimiter, start_offset, end_offset = query
+        for name, entry in _scan(directory, dir_name):
+            if end_offset and name >= end_offset:
+                break
+            is_dir = name.endswith('/')
+            if not name.startswith(prefix) and not (is_dir and prefix.startswith(name)):
+                continue  # (unless the directory may contain names with the prefix)
+            if name < start_offset and not (is_dir and start_offset.startswith(name)):
+                continue  # (before the start, including all of the directory)
+            if not is_dir:
+                key, is_prefix = _list_key(name, prefix, delimiter)
+                yield key, (
+                    None
+                    if is_prefix
+                    else functools.partial(_entry_resource, bucket, name, entry)
+                )
+            elif delimiter == '/' and name.find('/', len(prefix)) == len(name) - 1:
+                if _has_files(entry.path, name, start_offset, end_offset):
+                    yield name, None  # (without descending)
+            else:
+                yield from self._walk(bucket, entry.path, name, query)
+
+
+def _check_stat(
+    path: PureGCSPath,
+    file_stat: os.stat_result,
+    generation: int | None,
+) -> None:
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise _not_found(path)
+    if generation is None:
+        generation = path.generation
+    if generation not in (None, file_stat.st_mtime_ns // 1000):
+        raise _not_found(path, generation)
+
+
+def _scan(
+    directory: str,
+    dir_name: str,
+) -> list[tuple[str, os.DirEntry[str]]]:
+    """Returns the entries of ``directory`` with their names (subdirectories with a
+    trailing ``/``), sorted by name.
+    """
+    try:
+        with os.scandir(directory) as scandir:
+            entries = sorted(
+                (dir_name + entry.name + ('/' if entry.is_dir() else ''), entry)
+                for entry in scandir
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        entries = []
+    return entries
+
+
+def _has_files(
+    directory: str,
+    dir_name: str,
+    start_offset: str,
+    end_offset: str,
+) -> bool:
+    """Returns whether there are files under ``directory`` (i.e. the object name prefix
+    ``dir_name``) with names in the range of ``start_offset`` and ``end_offset``.
+    """
+    names = (
+        dir_name
+        + os.path.relpath(os.path.join(root, file), directory).replace(os.sep, '/')
+        for root, _, files in os.walk(directory)
+        for file in files
+    )
+    return any(
+        start_offset <= name and not (end_offset and name >= end_offset)
+        for name in names
+    )
+
+
+def _entry_resource(
+    bucket: str,
+    name: str,
+    entry: os.DirEntry[str],
+) -> dict[str, Any]:
+    return _file_resource(bucket, name, entry.stat())
+
+
+def _file_resource(
+    bucket: str,
+    name: str,
+    file_stat: os.stat_result,
+) -> dict[str, Any]:
+    return {
+        'kind': 'storage#object',
+        'bucket': bucket,
+        'name': name,
+        'size': str(file_stat.st_size),
+        'generation': str(file_stat.st_mtime_ns // 1000),
+        'metageneration': '1',
+        'contentType': 'application/octet-stream',
+        'updated': datetime.datetime.fromtimestamp(
+            file_stat.st_mtime_ns / 1e9, datetime.timezone.utc
+        ).isoformat(),
+    }
@@ -0,0 +1,504 @@
+import dataclasses
+import http
+import http.server
+import json
+import re
+import sys
+import threading
+import urllib.parse
+import uuid
+from .. import URI_PREFIX
+from .. import PureGCSPath
+from .._backend import Backend
+from .._crc32c import crc32c
+from .._crc32c import encode_crc32c
+from .._jsonapi import BATCH_TARGET
+from .._jsonapi import MAX_BATCH_SIZE
+from .._jsonapi import MAX_COMPOSE_SOURCES
+from .._jsonapi import RESUMABLE_CHUNK_ALIGNMENT
+from .._jsonapi import BatchPart
+from .._jsonapi import ObjectInfo
+from .._jsonapi import decode_batch
+from .._jsonapi import encode_batch
+from ._backends import DEFAULT_PAGE_SIZE
+from ._backends import MemoryBackend
+from collections.abc import Callable
+from collections.abc import Mapping
+from typing import Any
+from typing import ClassVar
+from typing import NamedTuple
+from typing import Self
+
+_POLL_INTERVAL = 0.01  # (how often the server checks for shutdown)
+
+_BUCKET = r'/b/(?P<bucket>[^/]+)'
+_OBJECT = r'/o/(?P<obj>[^/]+)'
+_DEST = r'/b/(?P<dest_bucket>[^/]+)/o/(?P<dest_obj>[^/]+)'
+
+
+class _Request(NamedTuple):
+    """An API request (or a sub-request of a batch request), with lowercased header
+    names.
+    """
+
+    method: str
+    target: str
+    headers: Mapping[str, str]
+    body: bytes
+
+    @property
+    def query(self) -> dict[str, str]:
+        query = urllib.parse.urlsplit(self.target).query
+        return dict(urllib.parse.parse_qsl(query, keep_blank_values=True))
+
+
+@dataclasses.dataclass(slots=True)
+class _Upload:
+    """The state of a resumable upload session."""
+
+    path: PureGCSPath
+    data: bytearray = dataclasses.field(default_factory=bytearray)
+    info: ObjectInfo | None = None  # (once finished)
+
+
+class _Fault(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(status)
+        self.status = status
+
+
+class _Reply(NamedTuple):
+    status: int
+    body: bytes | memoryview
+    headers: dict[str, str]
+
+
+def _json_reply(
+    status: int,
+    content: object,
+) -> _Reply:
+    body = json.dumps(content).encode()
+    return _Reply(status, body, {'Content-Type': 'application/json'})
+
+
+def _error_reply(
+    status: int,
+    message: str,
+) -> _Reply:
+    return _json_reply(status, {'error': {'code': status, 'message': message}})
+
+
+def _path(
+    bucket: str,
+    name: str,
+) -> PureGCSPath:
+    """Converts a (quoted) bucket and object name to a path, rejecting names that can't
+    be expressed as a :class:`PureGCSPath` (e.g. ``dir/``).
+    """
+    bucket = urllib.parse.unquote(bucket)
+    name = urllib.parse.unquote(name)
+    path = PureGCSPath(f'{URI_PREFIX}{bucket}', name)
+    if path.bucket != bucket or path.obj != name:
+        raise ValueError(f'Object name not supported: {name!r}')
+    return path
+
+
+def _generation(
+    request: _Request,
+    param: str = 'generation',
+) -> int | None:
+    generation = request.query.get(param)
+    return int(generation) if generation else None
+
+
+def _media_reply(
+    request: _Request,
+    data: bytes | memoryview,
+    headers: dict[str, str],
+) -> _Reply:
+    range_match = re.fullmatch(r'bytes=(\d+)-(\d*)', request.headers.get('range', ''))
+    reply = _Reply(200, data, headers)
+    if range_match is not None:
+        start = int(range_match[1])
+        end = int(range_match[2]) + 1 if range_match[2] else len(data)
+        if start >= len(data):
+            reply = _error_reply(416, 'Requested range not satisfiable')
+        else:
+            end = min(end, len(data))
+            headers['Content-Range'] = f'bytes {start}-{end - 1}/{len(data)}'
+            reply = _Reply(206, data[start:end], headers)
+    return reply
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: '_HTTPServer'
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    @property
+    def backend(self) -> Backend:
+        return self.server.fake.backend
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        reply = self._dispatch(_Request(self.command, self.path, headers, body))
+        self.send_response(reply.status)
+        for name, value in reply.headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(reply.body)))
+        self.end_headers()
+        if reply.body:
+            self.wfile.write(reply.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def _dispatch(self, request: _Request) -> _Reply:
+        url_path = urllib.parse.urlsplit(request.target).path
+        fault = self.server.fake.fault
+        status = fault(request.method, request.target) if fault else None
+        try:
+            if status is not None:
+                raise _Fault(status)
+            for method, pattern, handler in self.routes:
+                match = pattern.fullmatch(url_path)
+                if method == request.method and match is not None:
+                    reply: _Reply = getattr(self, handler)(request, match)
+                    break
+            else:
+                reply = _error_reply(404, f'Not found: {request.method} {url_path}')
+        except _Fault as e:
+            reply = _error_reply(e.status, 'Injected fault')
+        except FileNotFoundError as e:
+            reply = _error_reply(404, str(e))
+        except (ValueError, OSError) as e:
+            reply = _error_reply(400, str(e))
+        return reply
+
+    def _list(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        query = request.query
+        page_size = self.server.fake.page_size
+        page = self.backend.list_page(
+            urllib.parse.unquote(match['bucket']),
+            prefix=query.get('prefix', ''),
+            delimiter=query.get('delimiter', ''),
+            start_offset=query.get('startOffset', ''),
+            end_offset=query.get('endOffset', ''),
+            page_token=query.get('pageToken'),
+            max_results=min(int(query.get('maxResults', page_size)), page_size),
+        )
+        response: dict[str, Any] = {'kind': 'storage#objects'}
+        if page.items:
+            response['items'] = page.items
+        if page.prefixes:
+            response['prefixes'] = page.prefixes
+        if page.next_page_token is not None:
+            response['nextPageToken'] = page.next_page_token
+        return _json_reply(200, response)
+
+    def _get(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        path = _path(match['bucket'], match['obj'])
+        info = self.backend.stat(path, generation=_generation(request))
+        reply = _json_reply(200, info.to_resource())
+        if request.query.get('alt') == 'media':
+            reply = _media_reply(
+                request,
+                self.backend.read(path, generation=info.generation),
+                {'X-Goog-Generation': str(info.generation)},
+            )
+        return reply
+
+    def _upload(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        query = request.query
+        upload_type = query.get('uploadType')
+        path = _path(match['bucket'], urllib.parse.quote(query.get('name', '')))
+        if upload_type == 'media':
+            reply = _json_reply(
+                200, self.backend.write(path, request.body).to_resource()
+            )
+        elif upload_type == 'resumable':
+            upload_id = uuid.uuid4().hex
+            with self.server.fake.lock:
+                self.server.fake.uploads[upload_id] = _Upload(path)
+            host = request.headers.get('host', '')
+            location = f'http://{host}{request.target}&upload_id={upload_id}'
+            reply = _Reply(200, b'', {'Location': location})
+        else:
+            raise ValueError(f'Unsupported upload type: {upload_type}')
+        return reply
+
+    def _upload_chunk(
+        self,
+        request: _Request,
+        match: re.Match[str],  # pylint: disable=unused-argument
+    ) -> _Reply:
+        """Handles a chunk of a resumable upload, or a status query (without data)."""
+        range_match = re.fullmatch(
+            r'bytes (?:(\d+)-(\d+)|\*)/(\d+|\*)',
+            request.headers.get('content-range', ''),
+        )
+        if range_match is None:
+            raise ValueError('Invalid Content-Range')
+        total = None if range_match[3] == '*' else int(range_match[3])
+        with self.server.fake.lock:
+            upload = self._upload_session(request)
+            if upload.info is None and range_match[1] is not None:
+                start, end = int(range_match[1]), int(range_match[2]) + 1
+                if start > len(upload.data) or end - start != len(request.body):
+                    raise ValueError('Chunk doesn\'t match the persisted data')
+                if total is None and len(request.body) % RESUMABLE_CHUNK_ALIGNMENT:
+                    raise ValueError('Chunk size must be a multiple of 256 KiB')
+                upload.data[start:] = request.body
+            if upload.info is None and total is not None:
+                self._finish_upload(request, upload, total)
+            persisted = len(upload.data)
+            info = upload.info
+        if info is not None:
+            reply = _json_reply(200, info.to_resource())
+        elif persisted:
+            reply = _Reply(308, b'', {'Range': f'bytes=0-{persisted - 1}'})
+        else:
+            reply = _Reply(308, b'', {})
+        return reply
+
+    def _upload_session(self, request: _Request) -> '_Upload':
+        upload = self.server.fake.uploads.get(request.query.get('upload_id', ''))
+        if upload is None:
+            raise FileNotFoundError('No such upload')
+        return upload
+
+    def _finish_upload(
+        self,
+        request: _Request,
+        upload: '_Upload',
+        total: int,
+    ) -> None:
+        """Writes the object once all of its ``total`` bytes have been uploaded,
+        verifying the CRC32C checksum if given in ``X-Goog-Hash``.
+        """
+        if len(upload.data) > total:
+            raise ValueError('Upload exceeds the declared size')
+        if len(upload.data) == total:
+            hashes = request.headers.get('x-goog-hash', '').split(',')
+            for name, _, value in (item.strip().partition('=') for item in hashes):
+                if name == 'crc32c' and value != encode_crc32c(crc32c(upload.data)):
+                    raise ValueError('CRC32C checksum mismatch')
+            upload.info = self.backend.write(upload.path, upload.data)
+
+    def _cancel_upload(
+        self,
+        request: _Request,
+        match: re.Match[str],  # pylint: disable=unused-argument
+    ) -> _Reply:
+        with self.server.fake.lock:
+            self._upload_session(request)
+            del self.server.fake.uploads[request.query['upload_id']]
+        return _Reply(499, b'', {})
+
+    def _copy(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        source = _path(match['bucket'], match['obj'])
+        destination = _path(match['dest_bucket'], match['dest_obj'])
+        data = self.backend.read(
+            source, generation=_generation(request, 'sourceGeneration')
+        )
+        return _json_reply(200, self.backend.write(destination, data).to_resource())
+
+    def _compose(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        path = _path(match['bucket'], match['obj'])
+        sources = json.loads(request.body)['sourceObjects']
+        if not 0 < len(sources) <= MAX_COMPOSE_SOURCES:
+            raise ValueError(f'Must compose 1 to {MAX_COMPOSE_SOURCES} objects')
+        data = b''.join(
+            self.backend.read(
+                _path(match['bucket'], urllib.parse.quote(source['name'])),
+                generation=source.get('generation'),
+            )
+            for source in sources
+        )
+        return _json_reply(200, self.backend.write(path, data).to_resource())
+
+    def _patch(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        path = _path(match['bucket'], match['obj'])
+        metadata = json.loads(request.body or b'{}')
+        return _json_reply(200, self.backend.patch(path, metadata).to_resource())
+
+    def _delete(
+        self,
+        request: _Request,
+        match: re.Match[str],
+    ) -> _Reply:
+        path = _path(match['bucket'], match['obj'])
+        generation = _generation(request)
+        if_generation_match = _generation(request, 'ifGenerationMatch')
+        # (The backends keep only the current generation of each object, so deleting
+        # a specific generation can only delete the current one.)
+        current = self.backend.stat(path, generation=generation)  # (or not found)
+        if (
+            if_generation_match is not None
+            and if_generation_match != current.generation
+        ):
+            reply = _error_reply(412, 'Precondition failed: ifGenerationMatch')
+        else:
+            self.backend.delete(path)
+            reply = _Reply(204, b'', {})
+        return reply
+
+    def _batch(
+        self,
+        request: _Request,
+        match: re.Match[str],  # pylint: disable=unused-argument
+    ) -> _Reply:
+        parts = decode_batch(request.body, request.headers.get('content-type', ''))
+        if len(parts) > MAX_BATCH_SIZE:
+            raise ValueError(f'Too many calls in batch request: {len(parts)}')
+        reply_parts = []
+        for part in parts:
+            method, target, _ = part.start_line.split(' ', 2)
+            reply = self._dispatch(_Request(method, target, part.headers, part.body))
+            status_line = (
+                f'HTTP/1.1 {reply.status} {http.HTTPStatus(reply.status).phrase}'
+            )
+            reply_parts.append(
+                BatchPart(
+                    f'response-{part.content_id}',
+                    status_line,
+                    reply.headers,
+                    bytes(reply.body),
+                )
+            )
+        boundary = f'batch_{uuid.uuid4().hex}'
+        return _Reply(
+            200,
+            encode_batch(reply_parts, boundary),
+            {'Content-Type': f'multipart/mixed; boundary={boundary}'},
+        )
+
+    # (method, URL path pattern, handler method name)
+    routes: ClassVar[list[tuple[str, re.Pattern[str], str]]] = [
+        ('GET', re.compile(f'/storage/v1{_BUCKET}/o'), '_list'),
+        ('GET', re.compile(f'/storage/v1{_BUCKET}{_OBJECT}'), '_get'),
+        ('PATCH', re.compile(f'/storage/v1{_BUCKET}{_OBJECT}'), '_patch'),
+        ('DELETE', re.compile(f'/storage/v1{_BUCKET}{_OBJECT}'), '_delete'),
+        ('POST', re.compile(f'/storage/v1{_BUCKET}{_OBJECT}/copyTo{_DEST}'), '_copy'),
+        ('POST', re.compile(f'/storage/v1{_BUCKET}{_OBJECT}/compose'), '_compose'),
+        ('POST', re.compile(f'/upload/storage/v1{_BUCKET}/o'), '_upload'),
+        ('PUT', re.compile(f'/upload/storage/v1{_BUCKET}/o'), '_upload_chunk'),
+        ('DELETE', re.compile(f'/upload/storage/v1{_BUCKET}/o'), '_cancel_upload'),
+        ('POST', re.compile(BATCH_TARGET), '_batch'),
+    ]
+
+
+class _HTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    fake: 'FakeServer'
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # (Clients going away mid-response - e.g. cancelled reads - are no errors.)
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeServer:
+    """Fake Cloud Storage JSON API server, serving the objects of a :class:`Backend`.
+
+    Supports object metadata (and patching it), (ranged, optionally
+    generation-specific) media downloads, simple media and resumable uploads (with
+    CRC32C verification), copies, composition, deletion, paginated listing with
+    ``prefix``/``delimiter``/``startOffset``/``endOffset``, and batch requests of any
+    of these.  The server runs in a background
+    thread, and keeps connections alive like the real API.
+
+    Errors can be injected with :attr:`fault`, e.g. to test retries.
+
+    Example:
+        >>> with FakeServer(LocalBackend('/data')) as server:
+        ...     client = gcspathlib.aio.Client(server.url)
+    """
+
+    def __init__(
+        self,
+        backend: Backend | None = None,
+        *,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        """
+        Args:
+            backend: The backend holding the objects; a new :class:`MemoryBackend` if
+                omitted.
+            host: The host to listen on.
+            port: The port to listen on; an arbitrary free port if ``0``.
+            page_size: The default and maximum number of listing results per page.
+        """
+        self.backend: Backend = backend or MemoryBackend()
+        self.page_size = page_size
+        self.fault: Callable[[str, str], int | None] | None = None
+        """Called with the method and target of each request (including the
+        sub-requests of batch requests), returning an HTTP status to fail the request
+        with instead of handling it - or ``None`` to handle it as usual.
+        """
+        self.lock = threading.Lock()
+        self.uploads: dict[str, _Upload] = {}
+        """The resumable upload sessions in progress, by upload ID."""
+        self._server = _HTTPServer((host, port), _Handler, bind_and_activate=False)
+        self._server.fake = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server, for use as an API endpoint."""
+        host, port = self._server.socket.getsockname()[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> Self:
+        """Starts serving in a background thread."""
+        self._server.server_bind()
+        self._server.server_activate()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(_POLL_INTERVAL,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving, and waits for the background thread to finish."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
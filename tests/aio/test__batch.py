@@ -0,0 +1,226 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import pytest
+
+
+def _path(name):
+    return gcspathlib.PureGCSPath('gs://bucket', name)
+
+
+def _run(fake_server, method, items, **kwargs):
+    async def main():
+        client = gcspathlib.aio.Client(fake_server.url, retries=2)
+        async with client:
+            executor = gcspathlib.aio.BatchExecutor(client, **kwargs)
+            return [result async for result in getattr(executor, method)(items)]
+
+    return asyncio.run(main())
+
+
+class Test_BatchExecutor:
+    def test__delete(self, fake_server):
+        paths = [_path(f'{i:03d}') for i in range(250)]
+        for path in paths:
+            fake_server.backend.write(path, b'')
+        other = gcspathlib.PureGCSPath('gs://other/file')
+        fake_server.backend.write(other, b'')
+        missing = _path('missing')
+        results = _run(fake_server, 'delete', [*paths, other, missing], batch_size=50)
+        assert sorted(result.item for result in results) == sorted(
+            [*paths, other, missing]
+        )
+        errors = {result.item: result.error for result in results if result.error}
+        assert list(errors) == [missing]
+        assert isinstance(errors[missing], FileNotFoundError)
+        assert errors[missing].filename == missing
+        assert fake_server.backend.list_page('bucket').items == []
+        assert fake_server.backend.list_page('other').items == []
+
+    def test__delete_pinned(self, fake_server):
+        current = _path('current')
+        stale = _path('stale')
+        fake_server.backend.write(current, b'')
+        generation = fake_server.backend.stat(current).generation
+        fake_server.backend.write(stale, b'1')
+        stale_generation = fake_server.backend.stat(stale).generation
+        fake_server.backend.write(stale, b'2')
+        results = _run(
+            fake_server,
+            'delete',
+            [
+                current.with_generation(generation),
+                stale.with_generation(stale_generation),
+            ],
+        )
+        errors = {result.item: result.error for result in results if result.error}
+        assert list(errors) == [stale.with_generation(stale_generation)]
+        assert isinstance(
+            errors[stale.with_generation(stale_generation)], FileNotFoundError
+        )
+        assert bytes(fake_server.backend.read(stale)) == b'2'
+        with pytest.raises(FileNotFoundError):
+            fake_server.backend.stat(current)
+
+    def test__grouped_by_bucket(self, fake_server):
+        batches = []
+
+        def fault(method, target):
+            if method == 'DELETE':
+                batches[-1].append(target)
+            else:
+                batches.append([])
+
+        fake_server.fault = fault
+        paths = [gcspathlib.PureGCSPath(f'gs://bucket{i % 2}/{i}') for i in range(6)]
+        for path in paths:
+            fake_server.backend.write(path, b'')
+        results = _run(fake_server, 'delete', paths, batch_size=2, concurrency=1)
+        assert all(result.error is None for result in results)
+        assert sorted(len(batch) for batch in batches) == [1, 1, 2, 2]
+        for batch in batches:
+            assert len({target.split('/')[4] for target in batch}) == 1
+
+    def test__copy(self, fake_server):
+        source = _path('source')
+        fake_server.backend.write(source, b'data')
+        destination = gcspathlib.PureGCSPath('gs://other/destination')
+        results = _run(
+            fake_server, 'copy', [(source, destination), (_path('missing'), source)]
+        )
+        result = next(result for result in results if result.item[0] == source)
+        assert result.error is None
+        assert result.info.path == destination
+        assert result.info.size == 4
+        assert bytes(fake_server.backend.read(destination)) == b'data'
+        result = next(result for result in results if result.item[0] != source)
+        assert isinstance(result.error, FileNotFoundError)
+
+    def test__copy_pinned(self, fake_server):
+        targets = []
+        fake_server.fault = lambda method, target: targets.append(target)
+        source = _path('source')
+        fake_server.backend.write(source, b'1')
+        stale = source.with_generation(fake_server.backend.stat(source).generation)
+        fake_server.backend.write(source, b'2')
+        current = source.with_generation(fake_server.backend.stat(source).generation)
+        destination = _path('destination')
+        [result] = _run(fake_server, 'copy', [(stale, destination)])
+        assert isinstance(result.error, FileNotFoundError)
+        [result] = _run(fake_server, 'copy', [(current, destination)])
+        assert result.error is None
+        assert bytes(fake_server.backend.read(destination)) == b'2'
+        assert f'sourceGeneration={current.generation}' in targets[-1]
+
+    def test__patch(self, fake_server):
+        path = _path('file')
+        fake_server.backend.write(path, b'')
+        results = _run(
+            fake_server,
+            'patch',
+            [(path, {'contentType': 'text/plain', 'metadata': {'key': 'value'}})],
+        )
+        [result] = results
+        assert result.error is None
+        assert result.info.content_type == 'text/plain'
+        assert result.info.metageneration == 2
+        [item] = fake_server.backend.list_page('bucket').items
+        assert item['metadata'] == {'key': 'value'}
+        results = _run(fake_server, 'patch', [(path, {'size': '0'})])
+        assert type(results[0].error) is OSError
+
+    def test__retry_failed_calls(self, fake_server):
+        attempts = {}
+
+        def fault(method, target):
+            attempts[target] = attempts.get(target, 0) + 1
+            if target.endswith(('/1', '/3')) and attempts[target] == 1:
+                return 503
+            if target.endswith('/5'):
+                return 503
+            return None
+
+        fake_server.fault = fault
+        paths = [_path(str(i)) for i in range(6)]
+        for path in paths:
+            fake_server.backend.write(path, b'')
+        results = _run(fake_server, 'delete', paths)
+        errors = {result.item: result.error for result in results if result.error}
+        assert list(errors) == [_path('5')]
+        assert '503' in str(errors[_path('5')])
+        assert attempts['/batch/storage/v1'] == 3
+        assert attempts['/storage/v1/b/bucket/o/0'] == 1
+        assert attempts['/storage/v1/b/bucket/o/1'] == 2
+        assert attempts['/storage/v1/b/bucket/o/5'] == 3
+
+    def test__retry_applied_batch(self, fake_server):
+        # The first batch request is applied, but fails - so the retried deletes find
+        # the objects missing.
+        paths = [_path(str(i)) for i in range(3)]
+        for path in paths:
+            fake_server.backend.write(path, b'')
+        attempts = []
+
+        def fault(method, target):
+            if target == '/batch/storage/v1':
+                attempts.append(target)
+                if len(attempts) == 1:
+                    for path in paths[:2]:
+                        fake_server.backend.delete(path)
+                    return 503
+            return None
+
+        fake_server.fault = fault
+        results = _run(fake_server, 'delete', paths)
+        assert len(attempts) == 2
+        assert [result.error for result in results] == [None, None, None]
+        assert fake_server.backend.list_page('bucket').items == []
+
+    def test__incomplete_response(self, fake_server, monkeypatch):
+        send_once = gcspathlib.aio.BatchExecutor._send_once
+        calls = []
+
+        async def incomplete_once(self, batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise asyncio.IncompleteReadError(b'', 10)
+            return await send_once(self, batch)
+
+        monkeypatch.setattr(gcspathlib.aio.BatchExecutor, '_send_once', incomplete_once)
+        paths = [_path('0'), _path('1')]
+        for path in paths:
+            fake_server.backend.write(path, b'')
+        results = _run(fake_server, 'delete', paths)
+        assert len(calls) == 2
+        assert [result.error for result in results] == [None, None]
+        calls.clear()
+        results = _run(fake_server, 'delete', paths, retries=0)
+        assert all(isinstance(result.error, ConnectionError) for result in results)
+
+    def test__failed_batch(self, fake_server):
+        fake_server.fault = lambda method, target: 403
+        results = _run(fake_server, 'delete', [_path('0'), _path('1')])
+        assert len(results) == 2
+        assert all(isinstance(result.error, PermissionError) for result in results)
+
+    def test__async_input(self, fake_server):
+        paths = [_path(str(i)) for i in range(10)]
+        for path in paths:
+            fake_server.backend.write(path, b'')
+
+        async def items():
+            for path in paths:
+                await asyncio.sleep(0)
+                yield path
+
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url) as client:
+                executor = gcspathlib.aio.BatchExecutor(client, batch_size=3)
+                return [result async for result in executor.delete(items())]
+
+        results = asyncio.run(main())
+        assert sorted(result.item for result in results) == paths
+
+    def test__batch_size(self):
+        with pytest.raises(ValueError):
+            gcspathlib.aio.BatchExecutor(batch_size=101)
@@ -0,0 +1,270 @@
+import asyncio
+import gcspathlib
+import gcspathlib._jsonapi
+import gcspathlib.aio
+import pytest
+
+
+@pytest.fixture
+def client(fake_server):
+    return gcspathlib.aio.Client(fake_server.url, retries=0)
+
+
+class Test_Client:
+    def test__read_range(self, client):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+
+        async def main():
+            async with client:
+                await client.write(path, b'0123456789')
+                return [
+                    await client.read(path, 2),
+                    await client.read(path, 2, 5),
+                    await client.read(path, 8, 20),
+                    await client.read(path, 10),
+                ]
+
+        assert asyncio.run(main()) == [b'23456789', b'234', b'89', b'']
+
+    def test__large_body(self, client):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.bin')
+        data = bytes(range(256)) * 12345
+
+        async def main():
+            async with client:
+                await client.write(path, data)
+                return await client.read(path)
+
+        assert asyncio.run(main()) == data
+
+    def test__pinned(self, client):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+
+        async def main():
+            async with client:
+                first = await client.write(path, b'1')
+                pinned = path.with_generation(first.generation)
+                await client.write(path, b'2')
+                with pytest.raises(FileNotFoundError) as excinfo:
+                    await client.read(pinned)
+                return excinfo.value.filename, await client.read(path)
+
+        filename, data = asyncio.run(main())
+        assert str(filename).startswith('gs://bucket/file.txt#')
+        assert data == b'2'
+
+        async def pinned_read():
+            async with client:
+                info = await client.write(path, b'3')
+                pinned = path.with_generation(info.generation)
+                return await client.stat(pinned), await client.read(pinned, 0, 1)
+
+        info, data = asyncio.run(pinned_read())
+        assert data == b'3'
+        assert info.path.generation == info.generation
+
+    def test__delete_pinned(self, client):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+
+        async def main():
+            async with client:
+                first = await client.write(path, b'1')
+                second = await client.write(path, b'2')
+                with pytest.raises(FileNotFoundError):
+                    await client.delete(path.with_generation(first.generation))
+                data = await client.read(path)
+                await client.delete(path.with_generation(second.generation))
+                with pytest.raises(FileNotFoundError):
+                    await client.stat(path)
+                return data
+
+        assert asyncio.run(main()) == b'2'
+
+    def test__delete_pinned_precondition(self, fake_server, client):
+        # Never `?generation=`, which would delete noncurrent versions permanently.
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+        targets = []
+        fake_server.fault = lambda method, target: (
+            targets.append(target) if method == 'DELETE' else None
+        )
+
+        async def main():
+            async with client:
+                info = await client.write(path, b'1')
+                await client.delete(path.with_generation(info.generation))
+                return info.generation
+
+        generation = asyncio.run(main())
+        assert targets == [
+            f'/storage/v1/b/bucket/o/file.txt?ifGenerationMatch={generation}'
+        ]
+
+    def test__retry_idempotent(self, fake_server):
+        client = gcspathlib.aio.Client(fake_server.url, retries=2)
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+        methods = []
+
+        def fault(method, target):
+            methods.append(method)
+            return 503
+
+        fake_server.fault = fault
+
+        async def main():
+            async with client:
+                with pytest.raises(OSError):
+                    await client.stat(path)
+                with pytest.raises(OSError):
+                    await client.write(path, b'data')
+                with pytest.raises(OSError):
+                    await client.compose(path, [path])
+                with pytest.raises(OSError):
+                    await client.request(
+                        'POST',
+                        gcspathlib._jsonapi.upload_target(
+                            path.bucket, path.obj, ifGenerationMatch=0
+                        ),
+                    )
+
+        asyncio.run(main())
+        assert methods == ['GET'] * 3 + ['POST'] * 2 + ['POST'] * 3
+
+    def test__list_page(self, client):
+        async def main():
+            async with client:
+                for name in ['a', 'b/1', 'b/2', 'b/3', 'c', 'd']:
+                    await client.write(gcspathlib.PureGCSPath('gs://bucket', name), b'')
+                first = await client.list_page('bucket', delimiter='/')
+                second = await client.list_page(
+                    'bucket', delimiter='/', page_token=first.next_page_token
+                )
+                flat = await client.list_page('bucket', prefix='b/', max_results=2)
+                return first, second, flat
+
+        first, second, flat = asyncio.run(main())
+        assert [item['name'] for item in first.items] == ['a', 'c']
+        assert first.prefixes == ['b/']
+        assert first.next_page_token is not None
+        assert [item['name'] for item in second.items] == ['d']
+        assert second.prefixes == []
+        assert second.next_page_token is None
+        assert [item['name'] for item in flat.items] == ['b/1', 'b/2']
+
+    def test__compose(self, client):
+        paths = [gcspathlib.PureGCSPath('gs://bucket', name) for name in 'abc']
+        target = gcspathlib.PureGCSPath('gs://bucket/abc')
+
+        async def main():
+            async with client:
+                for path in paths:
+                    await client.write(path, path.name.encode() * 2)
+                info = await client.compose(target, paths)
+                return info, await client.read(target)
+
+        info, data = asyncio.run(main())
+        assert info.path == target
+        assert info.size == 6
+        assert data == b'aabbcc'
+
+    @pytest.mark.parametrize(
+        'sources',
+        [
+            [],
+            [gcspathlib.PureGCSPath('gs://bucket/a')] * 33,
+            [gcspathlib.PureGCSPath('gs://other/a')],
+        ],
+    )
+    def test__compose_invalid(self, client, sources):
+        target = gcspathlib.PureGCSPath('gs://bucket/target')
+        with pytest.raises(ValueError):
+            asyncio.run(client.compose(target, sources))
+
+    def test__token(self, fake_server):
+        tokens = iter(['token1', 'token2'])
+        client = gcspathlib.aio.Client(fake_server.url, token=lambda: next(tokens))
+        assert client._headers({})['Authorization'] == 'Bearer token1'
+        assert client._headers({'X': 'y'}) == {
+            'Authorization': 'Bearer token2',
+            'X': 'y',
+        }
+
+    def test__default_endpoint(self, monkeypatch):
+        monkeypatch.setenv('STORAGE_EMULATOR_HOST', 'localhost:4443')
+        assert gcspathlib.aio.Client().endpoint == 'http://localhost:4443'
+        monkeypatch.delenv('STORAGE_EMULATOR_HOST')
+        assert gcspathlib.aio.Client().endpoint == 'https://storage.googleapis.com'
+
+
+class Test_ConnectionPool:
+    def test__keep_alive(self, fake_server):
+        pool = gcspathlib.aio.ConnectionPool(fake_server.url, max_connections=2)
+
+        async def main():
+            responses = [
+                await pool.request('GET', '/storage/v1/b/b/o') for _ in range(3)
+            ]
+            idle = list(pool._idle)
+            responses += await asyncio.gather(
+                *(pool.request('GET', '/storage/v1/b/b/o') for _ in range(10))
+            )
+            idle_after = list(pool._idle)
+            await pool.close()
+            return responses, idle, idle_after
+
+        responses, idle, idle_after = asyncio.run(main())
+        assert {response.status for response in responses} == {200}
+        assert len(idle) == 1
+        assert len(idle_after) == 2
+        assert idle[0] in idle_after
+
+    def test__stale_connection(self, fake_server):
+        pool = gcspathlib.aio.ConnectionPool(fake_server.url)
+
+        async def main():
+            await pool.request('GET', '/storage/v1/b/b/o')
+            [connection] = pool._idle
+            connection.writer.transport.abort()
+            response = await pool.request('GET', '/storage/v1/b/b/o')
+            await pool.close()
+            return response
+
+        assert asyncio.run(main()).status == 200
+
+    def test__stale_connection_not_idempotent(self, fake_server):
+        pool = gcspathlib.aio.ConnectionPool(fake_server.url)
+
+        async def main():
+            await pool.request('GET', '/storage/v1/b/b/o')
+            [connection] = pool._idle
+            connection.writer.transport.abort()
+            try:
+                await pool.request('POST', '/storage/v1/b/b/o', idempotent=False)
+            finally:
+                await pool.close()
+
+        with pytest.raises((ConnectionError, asyncio.IncompleteReadError)):
+            asyncio.run(main())
+
+    def test__read_timeout(self):
+        async def stall(reader, writer):
+            await reader.read()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(stall, '127.0.0.1', 0)
+            host, port = server.sockets[0].getsockname()[:2]
+            pool = gcspathlib.aio.ConnectionPool(
+                f'http://{host}:{port}', read_timeout=0.1
+            )
+            async with server:
+                try:
+                    await pool.request('GET', '/storage/v1/b/b/o')
+                finally:
+                    await pool.close()
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(main())
+
+    def test__unsupported_url(self):
+        with pytest.raises(ValueError):
+            gcspathlib.aio.ConnectionPool('ftp://host')
@@ -0,0 +1,61 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import pytest
+
+PATH = gcspathlib.PureGCSPath('gs://bucket/manifest.json')
+
+
+class Test_AsyncSingleFlight:
+    def test__call(self):
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        async def main():
+            flight = gcspathlib.aio.AsyncSingleFlight()
+            results = await asyncio.gather(
+                *(flight.call(PATH, work, i + 21) for i in range(8)),
+                flight.call(PATH.with_name('other'), work, 1),
+            )
+            assert flight.coalesce_info() == (9, 7, 0)
+            assert await flight.call(PATH, work, 0) == 0
+            return results
+
+        assert asyncio.run(main()) == [42] * 8 + [2]
+        assert calls == [21, 1, 0]
+
+    def test__exception(self):
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise FileNotFoundError(str(PATH))
+
+        async def main():
+            flight = gcspathlib.aio.AsyncSingleFlight()
+            results = await asyncio.gather(
+                *(flight.call(PATH, fail) for _ in range(4)), return_exceptions=True
+            )
+            assert flight.coalesce_info() == (4, 3, 0)
+            return results
+
+        assert all(isinstance(e, FileNotFoundError) for e in asyncio.run(main()))
+
+    def test__cancelled_caller(self):
+        async def work():
+            await asyncio.sleep(0.01)
+            return 'done'
+
+        async def main():
+            flight = gcspathlib.aio.AsyncSingleFlight()
+            first = asyncio.create_task(flight.call(PATH, work))
+            second = asyncio.create_task(flight.call(PATH, work))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == 'done'
@@ -0,0 +1,166 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import pytest
+
+
+@pytest.fixture
+def path_type(fake_server):
+    class FakeAsyncGCSPath(gcspathlib.aio.AsyncGCSPath):
+        client = gcspathlib.aio.Client(fake_server.url, max_connections=4)
+
+    return FakeAsyncGCSPath
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _listdir(path):
+    return [child async for child in path.iterdir()]
+
+
+class Test_AsyncGCSPath:
+    def test__write_read(self, path_type):
+        path = path_type('gs://bucket/dir/file.txt')
+        assert _run(path.write_bytes(b'data')) == 4
+        assert _run(path.read_bytes()) == b'data'
+
+    def test__stat(self, path_type):
+        path = path_type('gs://bucket/dir/file.txt')
+        _run(path.write_bytes(b'data'))
+        info = _run(path.stat())
+        assert info.path is path
+        assert info.size == info.st_size == 4
+        assert info.generation > 0
+        assert info.updated is not None
+        assert info.st_mtime == info.updated.timestamp()
+
+    def test__missing(self, path_type):
+        path = path_type('gs://bucket/missing.txt')
+        assert _run(path.exists()) is False
+        with pytest.raises(FileNotFoundError) as excinfo:
+            _run(path.read_bytes())
+        assert excinfo.value.filename == path
+        with pytest.raises(FileNotFoundError):
+            _run(path.stat())
+        with pytest.raises(FileNotFoundError):
+            _run(path.unlink())
+        _run(path.unlink(missing_ok=True))
+
+    def test__unlink(self, path_type):
+        path = path_type('gs://bucket/file.txt')
+        _run(path.write_bytes(b'data'))
+        assert _run(path.exists()) is True
+        _run(path.unlink())
+        assert _run(path.exists()) is False
+
+    def test__unlink_pinned(self, path_type):
+        path = path_type('gs://bucket/file.txt')
+        _run(path.write_bytes(b'1'))
+        pinned = path.with_generation(_run(path.stat()).generation)
+        _run(path.write_bytes(b'2'))
+        with pytest.raises(FileNotFoundError):
+            _run(pinned.unlink())
+        _run(pinned.unlink(missing_ok=True))
+        assert _run(path.read_bytes()) == b'2'
+
+    def test__stat_cache(self, fake_server, path_type):
+        stats = []
+        fake_server.fault = lambda method, target: (
+            stats.append(target) if method == 'GET' else None
+        )
+
+        class CachedPath(path_type):
+            stat_cache = gcspathlib.StatCache()
+
+        path = CachedPath('gs://bucket/file.txt')
+        assert _run(path.exists()) is False
+        assert _run(path.exists()) is False
+        assert len(stats) == 1
+        _run(path.write_bytes(b'data'))
+        assert _run(path.stat()).size == 4
+        assert _run(path.stat()).size == 4
+        assert len(stats) == 2
+        fake_server.backend.write(path, b'changed')
+        assert _run(path.stat()).size == 4
+        _run(path.unlink())
+        assert _run(path.exists()) is False
+        assert len(stats) == 3
+
+    def test__single_flight(self, fake_server, path_type):
+        targets = []
+        fake_server.fault = lambda method, target: targets.append(target)
+
+        class CoalescedPath(path_type):
+            single_flight = gcspathlib.aio.AsyncSingleFlight()
+
+        paths = [CoalescedPath('gs://bucket/file.txt') for _ in range(8)]
+        fake_server.backend.write(paths[0], b'data')
+
+        async def main():
+            infos = await asyncio.gather(*(path.stat() for path in paths))
+            data = await asyncio.gather(*(path.read_bytes() for path in paths))
+            return infos, data
+
+        infos, data = _run(main())
+        assert {info.size for info in infos} == {4}
+        assert data == [b'data'] * 8
+        assert len(targets) == 2
+        info = CoalescedPath.single_flight.coalesce_info()
+        assert (info.calls, info.coalesced, info.in_flight) == (16, 14, 0)
+
+    def test__special_characters(self, path_type):
+        path = path_type('gs://bucket/dir with spaces/file?#%.txt')
+        _run(path.write_bytes(b'data'))
+        assert _run(path.read_bytes()) == b'data'
+        assert _run(_listdir(path.parent)) == [path]
+
+    def test__iterdir(self, path_type, fake_server):
+        names = ['a.txt', 'b/1.txt', 'b/2.txt', 'c.txt', 'd/e/3.txt', 'f.txt', 'g.txt']
+
+        async def write_all():
+            await asyncio.gather(
+                *(path_type('gs://bucket/dir', name).write_bytes(b'') for name in names)
+            )
+
+        _run(write_all())
+        fake_server.backend._put('bucket', 'dir/', b'')  # (placeholder)
+        _run(path_type('gs://bucket/other.txt').write_bytes(b''))
+        children = _run(_listdir(path_type('gs://bucket/dir')))
+        assert [str(child) for child in children] == [
+            'gs://bucket/dir/a.txt',
+            'gs://bucket/dir/b',
+            'gs://bucket/dir/c.txt',
+            'gs://bucket/dir/d',
+            'gs://bucket/dir/f.txt',
+            'gs://bucket/dir/g.txt',
+        ]
+        assert all(type(child) is path_type for child in children)
+        fake_server.backend._put('bucket', 'dir/gs://evil/secret', b'')
+        with pytest.warns(UserWarning, match='dir/gs:'):
+            assert _run(_listdir(path_type('gs://bucket/dir/gs:'))) == []
+        assert [str(child) for child in _run(_listdir(path_type('gs://bucket')))] == [
+            'gs://bucket/dir',
+            'gs://bucket/other.txt',
+        ]
+
+    def test__concurrency(self, path_type):
+        paths = [path_type(f'gs://bucket/{i}.txt') for i in range(50)]
+
+        async def write_and_read_all():
+            await asyncio.gather(
+                *(path.write_bytes(str(path).encode()) for path in paths)
+            )
+            return await asyncio.gather(*(path.read_bytes() for path in paths))
+
+        assert _run(write_and_read_all()) == [str(path).encode() for path in paths]
+        assert len(path_type.client._pool._idle) <= 4
+
+    def test__incomplete(self, path_type):
+        with pytest.raises(ValueError):
+            _run(path_type('gs://bucket').read_bytes())
+        with pytest.raises(ValueError):
+            _run(path_type('file.txt').stat())
+        with pytest.raises(ValueError):
+            _run(_listdir(path_type('dir')))
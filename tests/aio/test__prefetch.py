@@ -0,0 +1,64 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import pytest
+
+PATHS = [gcspathlib.PureGCSPath(f'gs://bucket/samples/{i:03}.bin') for i in range(50)]
+
+
+@pytest.fixture
+def paths(fake_server):
+    for i, path in enumerate(PATHS):
+        fake_server.backend.write(path, bytes([i]) * 100)
+    return PATHS
+
+
+def _read_many(fake_server, paths, **kwargs):
+    async def main():
+        async with gcspathlib.aio.Client(fake_server.url, retries=0) as client:
+            return [
+                item async for item in gcspathlib.aio.read_many(paths, client, **kwargs)
+            ]
+
+    return asyncio.run(main())
+
+
+class Test_read_many:
+    def test__ordered(self, fake_server, paths):
+        results = _read_many(fake_server, paths, concurrency=8)
+        assert [path for path, _ in results] == paths
+        assert all(data == bytes([i]) * 100 for i, (_, data) in enumerate(results))
+
+    def test__unordered(self, fake_server, paths):
+        results = _read_many(fake_server, paths, ordered=False, max_buffered=250)
+        assert sorted(path for path, _ in results) == paths
+        assert all(data == fake_server.backend.read(path) for path, data in results)
+
+    def test__missing(self, fake_server, paths):
+        with pytest.raises(FileNotFoundError):
+            _read_many(fake_server, [*paths, paths[0].with_name('missing.bin')])
+
+    def test__default_client(self, fake_server, paths, monkeypatch):
+        monkeypatch.setenv('STORAGE_EMULATOR_HOST', fake_server.url)
+        gcspathlib.aio.default_client.cache_clear()
+
+        async def main():
+            try:
+                return [item async for item in gcspathlib.aio.read_many(paths[:3])]
+            finally:
+                await gcspathlib.aio.default_client().close()
+                gcspathlib.aio.default_client.cache_clear()
+
+        assert [path for path, _ in asyncio.run(main())] == paths[:3]
+
+    def test__close(self, fake_server, paths):
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url, retries=0) as client:
+                results = gcspathlib.aio.read_many(
+                    [*paths[:3], paths[0].with_name('missing.bin')], client
+                )
+                first = await anext(results)
+                await results.aclose()
+                return first
+
+        assert asyncio.run(main())[0] == paths[0]
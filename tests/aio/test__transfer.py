@@ -0,0 +1,192 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import os
+import pytest
+from gcspathlib._jsonapi import MAX_COMPOSE_SOURCES
+
+_DATA = bytes(range(256)) * 40 + b'tail'
+
+
+def _path(name):
+    return gcspathlib.aio.AsyncGCSPath('gs://bucket', name)
+
+
+def _run(fake_server, function, *args, **kwargs):
+    async def main():
+        client = gcspathlib.aio.Client(fake_server.url, retries=0)
+        async with client:
+            return await function(client, *args, **kwargs)
+
+    return asyncio.run(main())
+
+
+class Test_download:
+    @pytest.mark.parametrize('use_mmap', [False, True])
+    def test__sliced(self, fake_server, tmp_path, use_mmap):
+        path = _path('dir/large')
+        fake_server.backend.write(path, _DATA)
+        ranges = []
+
+        def fault(method, target):
+            if method == 'GET' and 'alt=media' in target:
+                ranges.append(target)
+
+        fake_server.fault = fault
+        filename = tmp_path / 'large'
+        info = _run(
+            fake_server,
+            gcspathlib.aio.download,
+            path,
+            filename,
+            chunk_size=1000,
+            concurrency=3,
+            use_mmap=use_mmap,
+        )
+        assert filename.read_bytes() == _DATA
+        assert info.size == len(_DATA)
+        assert len(ranges) == 11
+        assert all(f'generation={info.generation}' in target for target in ranges)
+
+    def test__empty(self, fake_server, tmp_path):
+        path = _path('empty')
+        fake_server.backend.write(path, b'')
+        filename = tmp_path / 'empty'
+        filename.write_bytes(b'stale')
+        for use_mmap in [False, True]:
+            _run(
+                fake_server, gcspathlib.aio.download, path, filename, use_mmap=use_mmap
+            )
+            assert filename.read_bytes() == b''
+
+    def test__failure(self, fake_server, tmp_path):
+        path = _path('large')
+        fake_server.backend.write(path, _DATA)
+        fake_server.fault = lambda method, target: (
+            404 if 'alt=media' in target else None
+        )
+        filename = tmp_path / 'large'
+        with pytest.raises(FileNotFoundError):
+            _run(
+                fake_server,
+                gcspathlib.aio.download,
+                path,
+                filename,
+                chunk_size=1000,
+            )
+        assert not filename.exists()
+
+    def test__failure_existing_file(self, fake_server, tmp_path):
+        path = _path('large')
+        fake_server.backend.write(path, _DATA)
+        fake_server.fault = lambda method, target: (
+            404 if 'alt=media' in target else None
+        )
+        filename = tmp_path / 'large'
+        filename.write_bytes(b'old')
+        with pytest.raises(FileNotFoundError):
+            _run(fake_server, gcspathlib.aio.download, path, filename)
+        assert filename.exists()
+
+    def test__missing(self, fake_server, tmp_path):
+        filename = tmp_path / 'missing'
+        with pytest.raises(FileNotFoundError):
+            _run(fake_server, gcspathlib.aio.download, _path('missing'), filename)
+        assert not filename.exists()
+
+
+class Test_upload:
+    def test__single(self, fake_server, tmp_path):
+        filename = tmp_path / 'small'
+        filename.write_bytes(b'contents')
+        info = _run(
+            fake_server,
+            gcspathlib.aio.upload,
+            _path('small'),
+            filename,
+            content_type='text/plain',
+        )
+        assert info.size == 8
+        assert fake_server.backend.read(_path('small')) == b'contents'
+
+    @pytest.mark.parametrize('chunk_size', [1000, 100])
+    def test__composite(self, fake_server, tmp_path, chunk_size):
+        filename = tmp_path / 'large'
+        filename.write_bytes(_DATA)
+        path = _path('dir/large')
+        info = _run(
+            fake_server,
+            gcspathlib.aio.upload,
+            path,
+            filename,
+            chunk_size=chunk_size,
+            concurrency=4,
+            content_type='text/plain',
+        )
+        assert info.size == len(_DATA)
+        assert fake_server.backend.read(path) == _DATA
+        names = [item['name'] for item in fake_server.backend.list_page('bucket').items]
+        assert names == ['dir/large']
+
+    def test__retry_components(self, fake_server, tmp_path):
+        # Components (and intermediate composites) have unique names, so transient
+        # failures of them are retried - unlike of the final composition.
+        filename = tmp_path / 'large'
+        filename.write_bytes(_DATA)
+        failed = set()
+
+        def fault(method, target):
+            if '.part' in target and target not in failed:
+                failed.add(target)
+                return 503
+            return None
+
+        fake_server.fault = fault
+
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url, retries=1) as client:
+                return await gcspathlib.aio.upload(
+                    client, _path('large'), filename, chunk_size=100
+                )
+
+        info = asyncio.run(main())
+        assert info.size == len(_DATA)
+        assert fake_server.backend.read(_path('large')) == _DATA
+        assert any(target.endswith('c/compose') for target in failed)
+        assert len(failed) > MAX_COMPOSE_SOURCES
+
+    def test__cleanup(self, fake_server, tmp_path):
+        filename = tmp_path / 'large'
+        filename.write_bytes(_DATA)
+        fake_server.fault = lambda method, target: (
+            500 if target.endswith('/compose') else None
+        )
+        with pytest.raises(OSError):
+            _run(
+                fake_server,
+                gcspathlib.aio.upload,
+                _path('large'),
+                filename,
+                chunk_size=1000,
+            )
+        assert fake_server.backend.list_page('bucket').items == []
+
+
+class Test_AsyncGCSPath:
+    def test__round_trip(self, fake_server, tmp_path):
+        source = tmp_path / 'source'
+        source.write_bytes(_DATA)
+        destination = tmp_path / 'destination'
+
+        class Path(gcspathlib.aio.AsyncGCSPath):
+            client = gcspathlib.aio.Client(fake_server.url, retries=0)
+
+        async def main():
+            path = Path('gs://bucket/file')
+            async with path.client:
+                await path.upload_from(source, chunk_size=4096)
+                return await path.download_to(os.fspath(destination), chunk_size=4096)
+
+        info = asyncio.run(main())
+        assert info.size == len(_DATA)
+        assert destination.read_bytes() == _DATA
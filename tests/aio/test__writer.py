@@ -0,0 +1,182 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import pytest
+
+CHUNK = 256 * 2**10
+DATA = bytes(range(256)) * (3 * CHUNK // 256) + b'tail'
+PATH = gcspathlib.PureGCSPath('gs://bucket/dir/export.bin')
+
+
+def _write(fake_server, pieces, *, retries=0, **kwargs):
+    async def main():
+        client = gcspathlib.aio.Client(fake_server.url, retries=retries)
+        async with client:
+            kwargs.setdefault('pool', gcspathlib.aio.BufferPool(CHUNK))
+            writer = gcspathlib.aio.ObjectWriter(client, PATH, **kwargs)
+            async with writer:
+                for piece in pieces:
+                    await writer.write(piece)
+            return writer.info
+
+    return asyncio.run(main())
+
+
+def _pieces(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def requests(fake_server):
+    requests = []
+
+    def fault(method, target):
+        if target.startswith('/upload/'):
+            requests.append(method)
+
+    fake_server.fault = fault
+    return requests
+
+
+class Test_ObjectWriter:
+    def test__resumable(self, fake_server, requests):
+        info = _write(fake_server, _pieces(DATA, 100_000), content_type='text/plain')
+        assert info.size == len(DATA)
+        assert fake_server.backend.read(PATH) == DATA
+        assert requests == ['POST', 'PUT', 'PUT', 'PUT', 'PUT']
+        assert fake_server.uploads[next(iter(fake_server.uploads))].info == info
+
+    def test__aligned(self, fake_server, requests):
+        data = DATA[: 2 * CHUNK]
+        info = _write(fake_server, [data])
+        assert info.size == 2 * CHUNK
+        assert fake_server.backend.read(PATH) == data
+        assert requests == ['POST', 'PUT', 'PUT', 'PUT']
+
+    @pytest.mark.parametrize('data', [b'', b'small'])
+    def test__single_request(self, fake_server, requests, data):
+        info = _write(fake_server, [data, b''])
+        assert info.size == len(data)
+        assert fake_server.backend.read(PATH) == data
+        assert requests == ['POST']
+
+    def test__resume(self, fake_server):
+        requests = []
+
+        def fault(method, target):
+            requests.append(method)
+            return 503 if method == 'PUT' and len(requests) in (3, 4) else None
+
+        fake_server.fault = fault
+        info = _write(fake_server, [DATA], retries=2)
+        assert info.size == len(DATA)
+        assert fake_server.backend.read(PATH) == DATA
+        # (chunk 1 and the status query fail, then a status query and chunks 1-3)
+        assert requests == ['POST', *['PUT'] * 7]
+
+    def test__failure(self, fake_server):
+        fake_server.fault = lambda method, target: 503 if method == 'PUT' else None
+        with pytest.raises(OSError) as excinfo:
+            _write(fake_server, [DATA], retries=1)
+        assert excinfo.value.filename == PATH
+        assert fake_server.uploads == {}
+        with pytest.raises(FileNotFoundError):
+            fake_server.backend.stat(PATH)
+
+    def test__abort(self, fake_server):
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url, retries=0) as client:
+                pool = gcspathlib.aio.BufferPool(CHUNK)
+                async with gcspathlib.aio.ObjectWriter(client, PATH, pool=pool) as f:
+                    await f.write(DATA)
+                    raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
+        assert fake_server.uploads == {}
+        with pytest.raises(FileNotFoundError):
+            fake_server.backend.stat(PATH)
+
+    def test__checksum_mismatch(self, fake_server):
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url, retries=0) as client:
+                pool = gcspathlib.aio.BufferPool(CHUNK)
+                writer = gcspathlib.aio.ObjectWriter(
+                    client, PATH, pool=pool, checksum=True
+                )
+                await writer.write(DATA)
+                writer._crc ^= 1
+                await writer.close()
+
+        with pytest.raises(OSError):
+            asyncio.run(main())
+        with pytest.raises(FileNotFoundError):
+            fake_server.backend.stat(PATH)
+
+    @pytest.mark.parametrize('accelerated', [False, True])
+    def test__checksum_default(self, fake_server, monkeypatch, accelerated):
+        monkeypatch.setattr(gcspathlib.aio._writer, 'ACCELERATED', accelerated)
+        client = gcspathlib.aio.Client(fake_server.url)
+        writer = gcspathlib.aio.ObjectWriter(client, PATH)
+        assert (writer._crc is not None) is accelerated
+        writer = gcspathlib.aio.ObjectWriter(client, PATH, checksum=not accelerated)
+        assert (writer._crc is not None) is not accelerated
+
+    def test__shared_pool(self, fake_server):
+        paths = [PATH.with_name(f'{i}.bin') for i in range(4)]
+
+        async def write(client, pool, path):
+            writer = gcspathlib.aio.ObjectWriter(
+                client, path, pool=pool, checksum=False
+            )
+            async with writer:
+                for piece in _pieces(DATA, 50_000):
+                    await writer.write(piece)
+                    await asyncio.sleep(0)
+            return pool
+
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url, retries=0) as client:
+                pool = gcspathlib.aio.BufferPool(CHUNK, count=3)
+                await asyncio.gather(*(write(client, pool, path) for path in paths))
+                return pool
+
+        pool = asyncio.run(main())
+        assert len(pool._free) <= 3
+        for path in paths:
+            assert fake_server.backend.read(path) == DATA
+
+    def test__closed(self, fake_server):
+        async def main():
+            async with gcspathlib.aio.Client(fake_server.url, retries=0) as client:
+                writer = gcspathlib.aio.ObjectWriter(client, PATH)
+                await writer.write(b'data')
+                info = await writer.close()
+                assert await writer.close() is info
+                assert writer.closed
+                with pytest.raises(ValueError):
+                    await writer.write(b'more')
+
+        asyncio.run(main())
+
+    def test__open_writer(self, fake_server):
+        class Path(gcspathlib.aio.AsyncGCSPath):
+            client = gcspathlib.aio.Client(fake_server.url, retries=0)
+
+        async def main():
+            async with Path.client:
+                async with Path('gs://bucket/file').open_writer() as writer:
+                    await writer.write(b'data')
+                    assert writer.tell() == 4
+                return writer.info
+
+        assert asyncio.run(main()).size == 4
+        assert fake_server.backend.read(Path('gs://bucket/file')) == b'data'
+
+
+class Test_BufferPool:
+    def test__invalid(self):
+        with pytest.raises(ValueError):
+            gcspathlib.aio.BufferPool(CHUNK + 1)
+        with pytest.raises(ValueError):
+            gcspathlib.aio.BufferPool(CHUNK, count=0)
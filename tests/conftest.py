@@ -0,0 +1,8 @@
+import pytest
+from gcspathlib.testing import FakeServer
+
+
+@pytest.fixture
+def fake_server():
+    with FakeServer(page_size=3) as server:
+        yield server
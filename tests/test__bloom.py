@@ -0,0 +1,116 @@
+import gcspathlib
+import gcspathlib.testing
+import pytest
+import struct
+from pathlib import PurePosixPath
+
+BUCKET = gcspathlib.PureGCSPath('gs://bucket/')
+PATHS = [BUCKET / f'data/object-{i}.json' for i in range(1000)]
+ABSENT = [BUCKET / f'other/object-{i}.json' for i in range(10000)]
+
+
+def _false_positive_rate(bloom_filter):
+    return sum(path in bloom_filter for path in ABSENT) / len(ABSENT)
+
+
+class Test_PathBloomFilter:
+    def test__contains(self):
+        bloom_filter = gcspathlib.PathBloomFilter(len(PATHS))
+        for path in PATHS:
+            bloom_filter.add(path)
+        assert all(path in bloom_filter for path in PATHS)
+        assert all(str(path) in bloom_filter for path in PATHS)
+        assert _false_positive_rate(bloom_filter) < 0.02
+        assert 0.3 < bloom_filter.fill_ratio < 0.7
+        assert 1 not in bloom_filter
+        assert PurePosixPath('data/object-0.json') not in bloom_filter
+
+    def test__keys(self):
+        bloom_filter = gcspathlib.PathBloomFilter(10)
+        bloom_filter.add('gs://bucket/dir/file#123')
+        # Paths are hashed by their canonical strings, without generations.
+        assert 'gs://bucket/dir/file' in bloom_filter
+        assert 'gs://bucket//dir/./file/' in bloom_filter
+        assert BUCKET / 'dir/file' in bloom_filter
+        assert (BUCKET / 'dir/file').with_generation(1) in bloom_filter
+
+    def test__error_rate(self):
+        bloom_filter = gcspathlib.PathBloomFilter.from_paths(PATHS, 0.001)
+        assert bloom_filter.hash_count == 10
+        assert _false_positive_rate(bloom_filter) < 0.005
+
+    def test__from_listing(self):
+        backend = gcspathlib.testing.MemoryBackend()
+        for path in PATHS[:50]:
+            backend.write(path, b'')
+        bloom_filter = gcspathlib.PathBloomFilter.from_paths(
+            gcspathlib.rglob(BUCKET, '*', backend)
+        )
+        assert all(path in bloom_filter for path in PATHS[:50])
+        assert sum(path in bloom_filter for path in PATHS[50:]) < 50
+
+    def test__merge(self):
+        shards = [
+            gcspathlib.PathBloomFilter.from_paths(PATHS[i::3], capacity=len(PATHS))
+            for i in range(3)
+        ]
+        merged = shards[0] | shards[1]
+        assert all(path in merged for path in PATHS[0::3] + PATHS[1::3])
+        assert not all(path in shards[0] for path in PATHS[1::3])
+        merged |= shards[2]
+        assert all(path in merged for path in PATHS)
+        assert _false_positive_rate(merged) < 0.02
+        with pytest.raises(ValueError, match='same size'):
+            merged |= gcspathlib.PathBloomFilter(10)
+
+    @pytest.mark.parametrize('mapped', [True, False])
+    def test__save_load(self, tmp_path, mapped):
+        filename = tmp_path / 'paths.bloom'
+        bloom_filter = gcspathlib.PathBloomFilter.from_paths(PATHS)
+        bloom_filter.save(filename)
+        assert filename.stat().st_size == 24 + bloom_filter.bit_count // 8
+        with gcspathlib.PathBloomFilter.load(filename, mapped=mapped) as loaded:
+            assert (loaded.bit_count, loaded.hash_count) == (
+                bloom_filter.bit_count,
+                bloom_filter.hash_count,
+            )
+            assert all(path in loaded for path in PATHS)
+            assert _false_positive_rate(loaded) == _false_positive_rate(bloom_filter)
+            assert loaded.fill_ratio == bloom_filter.fill_ratio
+            merged = loaded | bloom_filter
+            if mapped:
+                with pytest.raises(TypeError):
+                    loaded.add(ABSENT[0])
+            else:
+                loaded.add(ABSENT[0])
+                assert ABSENT[0] in loaded
+        assert all(path in merged for path in PATHS)
+
+    @pytest.mark.parametrize(
+        'data',
+        [
+            b'',
+            b'not a bloom filter at all',
+            b'GCSBLOOM' + b'\0' * 16,
+            struct.pack('<8sIIQ', b'GCSBLOOM', 1, 7, 0),
+            struct.pack('<8sIIQ', b'GCSBLOOM', 1, 7, 12) + b'\xff',
+            struct.pack('<8sIIQ', b'GCSBLOOM', 1, 0, 8) + b'\xff',
+        ],
+    )
+    def test__load_invalid(self, tmp_path, data):
+        filename = tmp_path / 'paths.bloom'
+        filename.write_bytes(data)
+        with pytest.raises(ValueError):
+            gcspathlib.PathBloomFilter.load(filename)
+
+    def test__load_truncated(self, tmp_path):
+        filename = tmp_path / 'paths.bloom'
+        gcspathlib.PathBloomFilter.from_paths(PATHS).save(filename)
+        filename.write_bytes(filename.read_bytes()[:-1])
+        with pytest.raises(ValueError, match='Truncated'):
+            gcspathlib.PathBloomFilter.load(filename)
+
+    @pytest.mark.parametrize('capacity, error_rate', [(0, 0.01), (1, 0), (1, 1)])
+    def test__invalid(self, capacity, error_rate):
+        with pytest.raises(ValueError):
+            gcspathlib.PathBloomFilter(capacity, error_rate)
@@ -0,0 +1,176 @@
+import gcspathlib
+import gcspathlib.testing
+import pytest
+
+
+class Test_PathCache:
+    def test__hit(self):
+        cache = gcspathlib.PathCache(gcspathlib.PureGCSPath)
+        path = cache('gs://bucket/dir/file.txt')
+        assert path == gcspathlib.PureGCSPath('gs://bucket/dir/file.txt')
+        assert cache('gs://bucket/dir/file.txt') is path
+        assert cache('gs://bucket/dir/other.txt') is not path
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test__warmed(self):
+        path = gcspathlib.PathCache(gcspathlib.PureGCSPath)('gs://bucket/file.txt')
+        assert hasattr(path, '_str')
+        assert hasattr(path, '_hash')
+
+    def test__maxsize(self):
+        cache = gcspathlib.PathCache(gcspathlib.PureGCSPath, maxsize=2)
+        first = cache('gs://bucket/1')
+        cache('gs://bucket/2')
+        cache('gs://bucket/3')
+        assert cache.cache_info().currsize == 2
+        assert cache('gs://bucket/1') is not first
+
+    def test__cache_clear(self):
+        cache = gcspathlib.PathCache(gcspathlib.PureGCSPath)
+        cache('gs://bucket/file.txt')
+        cache.cache_clear()
+        assert cache.cache_info().currsize == 0
+
+    def test__invalid(self):
+        cache = gcspathlib.PathCache(gcspathlib.PureGCSPath)
+        with pytest.raises(ValueError):
+            cache('gs:///file.txt')
+        assert cache.cache_info().currsize == 0
+
+
+class Test_PureGCSPath_cached:
+    def test__cached(self):
+        path = gcspathlib.PureGCSPath.cached('gs://bucket/dir/file.txt')
+        assert gcspathlib.PureGCSPath.cached('gs://bucket/dir/file.txt') is path
+        assert (
+            gcspathlib.PureGCSPath.path_cache() is gcspathlib.PureGCSPath.path_cache()
+        )
+        info = gcspathlib.PureGCSPath.path_cache().cache_info()
+        assert info.maxsize == gcspathlib.DEFAULT_PATH_CACHE_SIZE
+
+    def test__subclass(self):
+        class SubPath(gcspathlib.PureGCSPath):
+            pass
+
+        uri = 'gs://bucket/dir/file.txt'
+        assert type(SubPath.cached(uri)) is SubPath
+        assert type(gcspathlib.PureGCSPath.cached(uri)) is gcspathlib.PureGCSPath
+        assert SubPath.path_cache() is not gcspathlib.PureGCSPath.path_cache()
+
+
+class CountingBackend(gcspathlib.testing.MemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.stats = 0
+
+    def stat(self, path, **kwargs):
+        self.stats += 1
+        return super().stat(path, **kwargs)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _path(name):
+    return gcspathlib.PureGCSPath('gs://bucket', name)
+
+
+class Test_StatCache:
+    def test__stat(self):
+        backend = CountingBackend()
+        info = backend.write(_path('file'), b'data')
+        clock = Clock()
+        cache = gcspathlib.StatCache(ttl=10, clock=clock)
+        assert cache.stat(_path('file'), backend) == info
+        assert cache.stat(_path('file'), backend) == info
+        assert backend.stats == 1
+        clock.now = 10
+        assert cache.stat(_path('file'), backend) == info
+        assert backend.stats == 2
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 1)
+
+    def test__negative(self):
+        backend = CountingBackend()
+        clock = Clock()
+        cache = gcspathlib.StatCache(ttl=10, negative_ttl=1, clock=clock)
+        for _ in range(2):
+            with pytest.raises(FileNotFoundError) as excinfo:
+                cache.stat(_path('missing'), backend)
+            assert excinfo.value.filename == str(_path('missing'))
+        assert backend.stats == 1
+        backend.write(_path('missing'), b'')
+        clock.now = 1
+        assert cache.stat(_path('missing'), backend).size == 0
+        assert backend.stats == 2
+
+    def test__generation(self):
+        backend = CountingBackend()
+        first = backend.write(_path('file'), b'1')
+        clock = Clock()
+        cache = gcspathlib.StatCache(ttl=10, clock=clock)
+        pinned = cache.stat(_path('file'), backend, generation=first.generation)
+        assert pinned == first
+        second = backend.write(_path('file'), b'22')
+        clock.now = 1e9
+        assert cache.stat(_path('file'), backend, generation=first.generation) == first
+        assert cache.stat(_path('file'), backend) == second
+        assert backend.stats == 2
+        with pytest.raises(KeyError):
+            cache.get(_path('file'), generation=second.generation)
+
+    def test__pinned(self):
+        backend = CountingBackend()
+        info = backend.write(_path('file'), b'1')
+        clock = Clock()
+        cache = gcspathlib.StatCache(ttl=10, clock=clock)
+        pinned = _path('file').with_generation(info.generation)
+        assert cache.stat(pinned, backend).generation == info.generation
+        backend.write(_path('file'), b'22')
+        clock.now = 1e9
+        assert cache.stat(pinned, backend).generation == info.generation
+        assert backend.stats == 1
+
+    def test__lru(self):
+        cache = gcspathlib.StatCache(maxsize=2)
+        for name in ['a', 'b']:
+            cache.put(_path(name), None)
+        cache.get(_path('a'))
+        cache.put(_path('c'), None)
+        assert len(cache) == 2
+        assert cache.get(_path('a')) is None
+        with pytest.raises(KeyError):
+            cache.get(_path('b'))
+        assert cache._root.children['gs://bucket/'].children.keys() == {'a', 'c'}
+
+    def test__invalidate(self):
+        cache = gcspathlib.StatCache()
+        names = ['dir', 'dir/a', 'dir/b/c', 'dir/b/d', 'dirt', 'other/a']
+        for name in names:
+            cache.put(_path(name), None)
+        cache.put(_path('dir/a'), None, generation=1)
+        assert cache.invalidate(_path('dir/b'), recursive=False) == 0
+        assert cache.invalidate(_path('dir/a'), recursive=False) == 2
+        assert cache.invalidate(_path('dir')) == 3
+        assert cache.invalidate(_path('missing/x')) == 0
+        for name in ['dirt', 'other/a']:
+            assert cache.get(_path(name)) is None
+        assert len(cache) == 2
+        assert cache._root.children['gs://bucket/'].children.keys() == {'dirt', 'other'}
+        assert cache.invalidate(gcspathlib.PureGCSPath('gs://bucket')) == 2
+        assert cache._root.children == {}
+
+    def test__cache_clear(self):
+        cache = gcspathlib.StatCache()
+        cache.put(_path('file'), None)
+        cache.get(_path('file'))
+        cache.cache_clear()
+        assert cache.cache_info() == (0, 0, cache.maxsize, 0)
+        with pytest.raises(KeyError):
+            cache.get(_path('file'))
@@ -0,0 +1,111 @@
+import concurrent.futures
+import gcspathlib
+import gcspathlib.testing
+import pytest
+import threading
+
+PATH = gcspathlib.PureGCSPath('gs://bucket/manifest.json')
+
+
+class Test_SingleFlight:
+    def test__call(self):
+        flight = gcspathlib.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work(value):
+            calls.append(value)
+            started.set()
+            release.wait()
+            return value * 2
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            first = executor.submit(flight.call, PATH, work, 21)
+            started.wait()
+            others = [executor.submit(flight.call, PATH, work, 0) for _ in range(7)]
+            while flight.coalesce_info().calls < 8:
+                pass
+            assert flight.coalesce_info().in_flight == 1
+            release.set()
+            results = [first.result(), *(future.result() for future in others)]
+        assert results == [42] * 8
+        assert calls == [21]
+        assert flight.coalesce_info() == (8, 7, 0)
+        assert flight.call(PATH, work, 1) == 2
+        assert flight.coalesce_info() == (9, 7, 0)
+
+    def test__distinct_keys(self):
+        flight = gcspathlib.SingleFlight()
+        assert flight.call(PATH, str, 1) == '1'
+        assert flight.call(PATH.with_name('other'), str, 2) == '2'
+        assert flight.coalesce_info().coalesced == 0
+
+    def test__exception(self):
+        flight = gcspathlib.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fail():
+            started.set()
+            release.wait()
+            raise FileNotFoundError(str(PATH))
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(flight.call, PATH, fail)]
+            started.wait()
+            futures += [executor.submit(flight.call, PATH, fail) for _ in range(3)]
+            while flight.coalesce_info().calls < 4:
+                pass
+            release.set()
+            for future in futures:
+                with pytest.raises(FileNotFoundError):
+                    future.result()
+        assert flight.coalesce_info() == (4, 3, 0)
+
+
+class Test_CoalescingBackend:
+    def test__stat_read(self):
+        backend = gcspathlib.testing.MemoryBackend()
+        backend.write(PATH, b'{}')
+        coalescing = gcspathlib.CoalescingBackend(backend)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        stat, read = backend.stat, backend.read
+
+        def blocking(function):
+            def wrapper(*args, **kwargs):
+                calls.append(function.__name__)
+                started.set()
+                release.wait()
+                return function(*args, **kwargs)
+
+            return wrapper
+
+        backend.stat, backend.read = blocking(stat), blocking(read)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(coalescing.stat, PATH)]
+            started.wait()
+            futures += [executor.submit(coalescing.stat, PATH) for _ in range(3)]
+            futures += [executor.submit(coalescing.read, PATH) for _ in range(4)]
+            while coalescing.coalesce_info().calls < 8:
+                pass
+            release.set()
+            results = [future.result() for future in futures]
+        assert {info.size for info in results[:4]} == {2}
+        assert results[4:] == [b'{}'] * 4
+        assert sorted(calls) == ['read', 'stat']
+        assert coalescing.coalesce_info() == (8, 6, 0)
+
+    def test__passthrough(self):
+        coalescing = gcspathlib.CoalescingBackend(gcspathlib.testing.MemoryBackend())
+        info = coalescing.write(PATH, b'data')
+        assert coalescing.read(PATH, 1, generation=info.generation) == b'ata'
+        assert coalescing.patch(PATH, {'contentType': 'text/plain'}).metageneration == 2
+        assert [item['name'] for item in coalescing.list_page('bucket').items] == [
+            'manifest.json'
+        ]
+        coalescing.delete(PATH)
+        with pytest.raises(FileNotFoundError):
+            coalescing.stat(PATH)
@@ -0,0 +1,180 @@
+import gcspathlib
+import pytest
+from gcspathlib._containers import is_canonical
+
+URIS = ['gs://b/x/1', 'gs://b/x/2', 'gs://b/x2', 'gs://b/y', 'gs://c/x/1']
+
+
+class Test_is_canonical:
+    @pytest.mark.parametrize(
+        'key, canonical',
+        [
+            ('gs://b/x', True),
+            ('gs://b/x/y.txt', True),
+            ('x/y', True),
+            ('gs://b/x%2312', True),
+            ('gs://b', False),
+            ('gs://b/', False),
+            ('/b/x', False),
+            ('gs:///x', False),
+            ('gs://b/x#5', False),
+            ('gs://b/x#05', False),
+            ('x#5', False),
+            ('gs://b//x', False),
+            ('gs://b/./x', False),
+            ('gs://b/x/', False),
+            ('.', False),
+            ('', False),
+        ],
+    )
+    def test__is_canonical(self, key, canonical):
+        assert is_canonical(key) is canonical
+        if canonical:
+            assert str(gcspathlib.PureGCSPath(key)) == key
+
+    def test__lookup(self):
+        paths = gcspathlib.PathSet(['gs://b/', 'b/x', 'gs://b/x#5'])
+        assert 'gs://b' in paths
+        assert '/b/x' in paths
+        assert 'gs://b/x#05' in paths
+        assert 'gs://b/x' not in paths
+
+
+class Test_PathSet:
+    def test__contains(self):
+        paths = gcspathlib.PathSet(URIS)
+        assert len(paths) == 5
+        assert 'gs://b/x/1' in paths
+        assert gcspathlib.PureGCSPath('gs://b/x/1') in paths
+        # Non-canonical strings are looked up by the path constructed from them.
+        assert 'gs://b//x/./1' in paths
+        assert 'gs://b/x/1/' in paths
+        assert 'gs://b/x' not in paths
+        assert 1 not in paths
+
+    def test__iter(self):
+        paths = gcspathlib.PathSet(gcspathlib.PureGCSPath(uri) for uri in URIS)
+        assert sorted(paths) == [gcspathlib.PureGCSPath(uri) for uri in URIS]
+        assert paths == {gcspathlib.PureGCSPath(uri) for uri in URIS}
+
+    def test__add_discard(self):
+        paths = gcspathlib.PathSet[gcspathlib.PureGCSPath]()
+        paths.add('gs://b/x')
+        paths.add(gcspathlib.PureGCSPath('gs://b/x'))
+        paths.add('gs://b/y#1')
+        assert len(paths) == 2
+        assert gcspathlib.PureGCSPath('gs://b/y', generation=1) in paths
+        assert 'gs://b/y' not in paths
+        paths.discard('gs://b/x')
+        paths.discard('gs://b/missing')
+        with pytest.raises(KeyError):
+            paths.remove('gs://b/missing')
+        assert list(paths) == [gcspathlib.PureGCSPath('gs://b/y#1')]
+        assert list(paths)[0].generation == 1
+
+    def test__malformed(self):
+        paths = gcspathlib.PathSet(URIS)
+        assert 'gs://' not in paths
+        paths.discard('gs://')
+        assert len(paths) == 5
+        with pytest.raises(KeyError):
+            paths.remove('gs://')
+        with pytest.raises(ValueError):
+            paths.add('gs://')
+
+    def test__scan(self):
+        paths = gcspathlib.PathSet(URIS)
+        assert list(paths.scan('gs://b/x')) == [
+            gcspathlib.PureGCSPath('gs://b/x/1'),
+            gcspathlib.PureGCSPath('gs://b/x/2'),
+            gcspathlib.PureGCSPath('gs://b/x2'),
+        ]
+        # A path prefix scans the paths under it.
+        assert [
+            str(path) for path in paths.scan(gcspathlib.PureGCSPath('gs://b/x'))
+        ] == [
+            'gs://b/x/1',
+            'gs://b/x/2',
+        ]
+        assert len(list(paths.scan(gcspathlib.PureGCSPath('gs://b')))) == 4
+        assert len(list(paths.scan())) == 5
+        assert not list(paths.scan('gs://d/'))
+
+    def test__scan_modified(self):
+        paths = gcspathlib.PathSet(URIS)
+        assert len(list(paths.scan('gs://b/x/'))) == 2
+        paths.add('gs://b/x/0')
+        paths.add('gs://b/x/3')
+        assert [str(path) for path in paths.scan('gs://b/x/')] == [
+            'gs://b/x/0',
+            'gs://b/x/1',
+            'gs://b/x/2',
+            'gs://b/x/3',
+        ]
+        paths.discard('gs://b/x/1')
+        paths.add('gs://b/x/4')
+        assert [str(path) for path in paths.scan('gs://b/x/')] == [
+            'gs://b/x/0',
+            'gs://b/x/2',
+            'gs://b/x/3',
+            'gs://b/x/4',
+        ]
+
+    def test__path_type(self):
+        class Path(gcspathlib.PureGCSPath):
+            pass
+
+        paths = gcspathlib.PathSet(URIS, path_type=Path)
+        assert {type(path) for path in paths} == {Path}
+        assert {type(path) for path in paths.scan('gs://b/')} == {Path}
+
+
+class Test_PathDict:
+    def test__items(self):
+        sizes = gcspathlib.PathDict({uri: i for i, uri in enumerate(URIS)})
+        assert sizes['gs://b/x/2'] == 1
+        assert sizes[gcspathlib.PureGCSPath('gs://b/x/2')] == 1
+        assert sizes['gs://b//x/2'] == 1
+        assert sizes.get('gs://b/x') is None
+        assert 'gs://b/y' in sizes
+        assert list(sizes) == [gcspathlib.PureGCSPath(uri) for uri in URIS]
+        assert dict(sizes) == {
+            gcspathlib.PureGCSPath(uri): i for i, uri in enumerate(URIS)
+        }
+        with pytest.raises(KeyError):
+            sizes['gs://b/missing']
+        with pytest.raises(KeyError):
+            sizes[1]
+
+    def test__set_delete(self):
+        sizes = gcspathlib.PathDict([('gs://b/x', 1)])
+        sizes[gcspathlib.PureGCSPath('gs://b/x')] = 2
+        sizes['gs://b/y'] = 3
+        assert len(sizes) == 2
+        assert sizes['gs://b/x'] == 2
+        del sizes['gs://b/x']
+        with pytest.raises(KeyError):
+            del sizes['gs://b/x']
+        assert list(sizes.items()) == [(gcspathlib.PureGCSPath('gs://b/y'), 3)]
+
+    def test__malformed(self):
+        sizes = gcspathlib.PathDict([('gs://b/x', 1)])
+        assert 'gs://' not in sizes
+        assert sizes.get('gs://') is None
+        assert sizes.pop('gs://', None) is None
+        with pytest.raises(KeyError):
+            sizes['gs://']
+        with pytest.raises(KeyError):
+            del sizes['gs://']
+        with pytest.raises(ValueError):
+            sizes['gs://'] = 2
+
+    def test__scan(self):
+        sizes = gcspathlib.PathDict({uri: i for i, uri in enumerate(URIS)})
+        sizes['gs://b/x/0'] = 5
+        assert list(sizes.scan_items(gcspathlib.PureGCSPath('gs://b/x'))) == [
+            (gcspathlib.PureGCSPath('gs://b/x/0'), 5),
+            (gcspathlib.PureGCSPath('gs://b/x/1'), 0),
+            (gcspathlib.PureGCSPath('gs://b/x/2'), 1),
+        ]
+        assert list(sizes.scan('gs://c')) == [gcspathlib.PureGCSPath('gs://c/x/1')]
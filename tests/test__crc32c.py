@@ -0,0 +1,30 @@
+import gcspathlib._crc32c
+import pytest
+
+
+@pytest.mark.parametrize(
+    'data, expected',
+    [
+        (b'', 0),
+        (b'123456789', 0xE3069283),
+        (b'\x00' * 32, 0x8A9136AA),
+        (b'\xff' * 32, 0x62A8AB43),
+        (bytes(range(32)), 0x46DD794E),
+    ],
+)
+def test__crc32c(data, expected):
+    assert gcspathlib._crc32c.crc32c(data) == expected
+    assert gcspathlib._crc32c._extend_python(0, data) == expected
+
+
+def test__incremental():
+    data = bytes(range(256)) * 3
+    expected = gcspathlib._crc32c.crc32c(data)
+    for split in [0, 1, 7, 8, 9, 500, len(data)]:
+        value = gcspathlib._crc32c.crc32c(data[:split])
+        assert gcspathlib._crc32c.crc32c(memoryview(data)[split:], value) == expected
+
+
+def test__encode_crc32c():
+    value = gcspathlib._crc32c.crc32c(b'hello world')
+    assert gcspathlib._crc32c.encode_crc32c(value) == 'yZRlqg=='
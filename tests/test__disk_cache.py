@@ -0,0 +1,182 @@
+import concurrent.futures
+import gcspathlib
+import gcspathlib.testing
+import os
+import pytest
+import threading
+
+PATH = gcspathlib.PureGCSPath('gs://bucket/dir/weights.bin')
+DATA = bytes(range(256)) * 40
+
+
+class CountingBackend(gcspathlib.testing.MemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        self.stats = 0
+        self.delay = None
+
+    def stat(self, path, **kwargs):
+        self.stats += 1
+        return super().stat(path, **kwargs)
+
+    def read(self, path, start=0, end=None, **kwargs):
+        self.reads += 1
+        if self.delay is not None:
+            self.delay.wait()
+        return super().read(path, start, end, **kwargs)
+
+
+@pytest.fixture
+def backend():
+    backend = CountingBackend()
+    backend.write(PATH, DATA)
+    return backend
+
+
+class Test_DiskCache:
+    def test__read(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend, chunk_size=1000)
+        data = cache.read(PATH)
+        assert data == DATA
+        assert data.readonly
+        assert backend.reads == 11
+        assert cache.read(PATH) == DATA
+        assert backend.reads == 11
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, len(DATA))
+        assert os.listdir(tmp_path) == [
+            os.path.basename(cache.filename(PATH, backend.stat(PATH).generation))
+        ]
+
+    def test__open(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        with cache.open(PATH) as file:
+            file.seek(-6, os.SEEK_END)
+            assert file.read() == DATA[-6:]
+
+    def test__generation(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        old = backend.stat(PATH).generation
+        assert cache.read(PATH) == DATA
+        backend.write(PATH, b'new')
+        assert cache.read(PATH) == b'new'
+        assert cache.read(PATH, generation=old) == DATA
+        assert len(cache) == 2
+
+    def test__pinned(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        pinned = PATH.with_generation(backend.stat(PATH).generation)
+        assert cache.read(pinned) == DATA
+        backend.write(PATH, b'new')
+        stats = backend.stats
+        assert cache.read(pinned) == DATA
+        assert backend.stats == stats  # (no lookup of the current generation)
+        assert backend.reads == 1
+
+    def test__empty(self, tmp_path, backend):
+        backend.write(PATH, b'')
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        assert cache.read(PATH) == b''
+        assert len(cache) == 1
+
+    def test__not_found(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        with pytest.raises(FileNotFoundError):
+            cache.read(PATH.with_name('missing.bin'))
+        with pytest.raises(FileNotFoundError):
+            cache.read(PATH, generation=123)
+        assert os.listdir(tmp_path) == []
+
+    def test__eviction(self, tmp_path, backend):
+        paths = [PATH.with_name(f'{i}.bin') for i in range(4)]
+        for path in paths:
+            backend.write(path, DATA)
+        cache = gcspathlib.DiskCache(tmp_path, backend, max_size=3 * len(DATA))
+        for path in paths[:3]:
+            cache.read(path)
+        cache.read(paths[0])
+        mapped = cache.read(paths[1])
+        cache.read(paths[3])
+        assert len(cache) == 3
+        assert cache.size == 3 * len(DATA)
+        assert len(os.listdir(tmp_path)) == 3
+        reads = backend.reads
+        cache.read(paths[0])
+        cache.read(paths[3])
+        assert backend.reads == reads
+        assert mapped == DATA  # (evicted, but still mapped)
+
+    def test__oversized(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend, max_size=10)
+        assert cache.read(PATH) == DATA
+        assert len(cache) == 1
+
+    def test__single_download(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        backend.delay = threading.Event()
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(cache.read, PATH) for _ in range(8)]
+            backend.delay.set()
+            assert all(future.result() == DATA for future in futures)
+        assert backend.reads == 1
+        assert cache._key_locks == {}
+
+    def test__failure(self, tmp_path, backend):
+        class FailingBackend(CountingBackend):
+            def read(self, path, start=0, end=None, **kwargs):
+                raise ConnectionError
+
+        failing = FailingBackend()
+        failing.write(PATH, DATA)
+        cache = gcspathlib.DiskCache(tmp_path, failing)
+        with pytest.raises(ConnectionError):
+            cache.read(PATH)
+        assert os.listdir(tmp_path) == []
+        assert len(cache) == 0
+
+    def test__persistent(self, tmp_path, backend):
+        gcspathlib.DiskCache(tmp_path, backend).read(PATH)
+        (tmp_path / 'tmpleftover.tmp').write_bytes(b'partial')
+        reads = backend.reads
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        assert (len(cache), cache.size) == (1, len(DATA))
+        assert cache.read(PATH) == DATA
+        assert backend.reads == reads
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test__foreign_files(self, tmp_path, backend):
+        foreign = ['notes.txt', 'user.tmp', 'A' * 64, '0' * 63, '0' * 65]
+        for name in foreign:
+            (tmp_path / name).write_bytes(b'x' * 100)
+        backend.write(PATH.with_name('other'), DATA)
+        cache = gcspathlib.DiskCache(tmp_path, backend, max_size=len(DATA))
+        assert (len(cache), cache.size) == (0, 0)
+        cache.read(PATH)
+        cache.read(PATH.with_name('other'))
+        assert len(cache) == 1
+        assert set(foreign) <= set(os.listdir(tmp_path))
+
+    def test__shared_directory(self, tmp_path, backend):
+        first = gcspathlib.DiskCache(tmp_path, backend)
+        second = gcspathlib.DiskCache(tmp_path, backend)
+        first.read(PATH)
+        assert second.read(PATH) == DATA
+        assert backend.reads == 1
+        assert len(second) == 1
+
+    def test__evict(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        cache.read(PATH)
+        generation = backend.stat(PATH).generation
+        assert cache.evict(PATH, generation)
+        assert not cache.evict(PATH, generation)
+        assert os.listdir(tmp_path) == []
+
+    def test__cache_clear(self, tmp_path, backend):
+        cache = gcspathlib.DiskCache(tmp_path, backend)
+        cache.read(PATH)
+        cache.cache_clear()
+        assert (len(cache), cache.size) == (0, 0)
+        assert cache.cache_info().misses == 0
+        assert os.listdir(tmp_path) == []
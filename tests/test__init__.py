@@ -1,5 +1,7 @@
+import copy
 import factory  # type: ignore
 import gcspathlib
+import pickle
 import pytest
 from pathlib import PurePosixPath
 
@@ -226,3 +228,233 @@ class Test_PureGCSPath:
             path.suffix = faker.lexify()
         with pytest.raises(AttributeError):
             path.obj = faker.lexify()
+
+    def test__case_sensitivity(self):
+        path = gcspathlib.PureGCSPath('gs://bucket/Dir/File.txt')
+        assert path != gcspathlib.PureGCSPath('gs://bucket/dir/file.txt')
+        assert hash(path) == hash(gcspathlib.PureGCSPath('gs://bucket/Dir/File.txt'))
+        assert path.match('*.txt')
+        assert not path.match('*.TXT')
+        assert path.match('*.TXT', case_sensitive=False)
+
+    @pytest.mark.parametrize(
+        'path, pattern, expected',
+        [
+            ('gs://b/x', 'x', True),
+            ('gs://b/x', '*', True),
+            # Leading segments of relative patterns match the anchor too (as they
+            # did with the legacy pathlib), on all Python versions.
+            ('gs://b/x', '*/x', True),
+            ('gs://b/x', '*/*', True),
+            ('gs://b/d/x', '*/*/x', True),
+            ('gs://b/x', 'b/x', False),
+            ('gs://b/x', '*/*/x', False),
+            ('gs://b/x', 'gs://b/x', True),
+            ('gs://b/x', 'gs://b/*', True),
+            ('gs://b/d/x', 'gs://b/x', False),
+            ('gs://b/d/x', 'gs://b/*/x', True),
+            ('gs://b/x', 'gs://c/x', False),
+            ('gs://b/x#1', '*/x', True),
+        ],
+    )
+    def test__match(self, path, pattern, expected):
+        assert gcspathlib.PureGCSPath(path).match(pattern) is expected
+
+    @pytest.mark.parametrize('parent', ['gs://bucket', 'gs://bucket/dir', 'dir', ''])
+    def test__make_child_relpath(self, parent):
+        parent = gcspathlib.PureGCSPath(parent)
+        for name in ['a', 'a/b', 'gs:/a', 'a#1', '..']:
+            child = parent._make_child_relpath(name)
+            assert child == parent / name
+            assert str(child) == str(parent / name)
+            assert child.generation is None
+        for name in ['gs://evil/secret', 'a//b', '/a', 'a/', './a', 'a/./b', '.', '']:
+            with pytest.raises(ValueError):
+                parent._make_child_relpath(name)
+
+    def test__match_empty(self):
+        with pytest.raises(ValueError):
+            gcspathlib.PureGCSPath('gs://b/x').match('')
+
+    def test__sorting(self):
+        paths = [
+            gcspathlib.PureGCSPath('gs://bucket2/file.txt'),
+            gcspathlib.PureGCSPath('gs://bucket1/dir/file.txt'),
+            gcspathlib.PureGCSPath('gs://bucket1/dir'),
+        ]
+        assert sorted(paths) == [paths[2], paths[1], paths[0]]
+
+    def test__generation(self):
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/file.txt#123')
+        assert path.generation == 123
+        assert path.obj == 'dir/file.txt'
+        assert path.name == 'file.txt'
+        assert path.suffix == '.txt'
+        assert str(path) == 'gs://bucket/dir/file.txt#123'
+        assert path.as_uri() == 'gs://bucket/dir/file.txt#123'
+        assert repr(path) == "PureGCSPath('gs://bucket/dir/file.txt#123')"
+        assert path.match('*.txt')
+        assert path == gcspathlib.PureGCSPath(
+            'gs://bucket/dir/file.txt', generation=123
+        )
+        assert path == gcspathlib.PureGCSPath(path)
+        assert path == gcspathlib.PureGCSPath.cached('gs://bucket/dir/file.txt#123')
+        assert path == pickle.loads(pickle.dumps(path))
+        assert path == copy.copy(path)
+
+    def test__generation_equality(self):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt#1')
+        unpinned = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+        assert path != unpinned
+        assert path != gcspathlib.PureGCSPath('gs://bucket/file.txt#2')
+        assert hash(path) == hash(gcspathlib.PureGCSPath('gs://bucket/file.txt#1'))
+        assert len({path, unpinned, path.with_generation(2)}) == 3
+        assert path.without_generation() == unpinned
+        assert unpinned.with_generation(1) == path
+        assert unpinned.without_generation() is unpinned
+        assert sorted([path.with_generation(2), path, unpinned]) == [
+            unpinned,
+            path,
+            path.with_generation(2),
+        ]
+
+    def test__generation_derived(self):
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/file.txt#1')
+        for derived in [
+            path.parent,
+            path / 'child',
+            path.with_name('other.txt'),
+            path.with_suffix('.csv'),
+            path.with_bucket('other'),
+            path.with_obj('other.txt'),
+        ]:
+            assert derived.generation is None
+            assert '#' not in str(derived)
+
+    def test__generation_suffix_in_name(self):
+        # Only a URI's suffix is parsed as a generation; joined names are kept as-is.
+        for path in [
+            gcspathlib.PureGCSPath('gs://bucket/dir') / 'issue#12',
+            gcspathlib.PureGCSPath('gs://bucket/dir', 'issue#12'),
+            gcspathlib.PureGCSPath('gs://bucket/dir/issue#12/file').parent,
+            gcspathlib.PureGCSPath('issue#12'),
+        ]:
+            assert path.generation is None
+            assert path.name == 'issue#12'
+        path = gcspathlib.PureGCSPath('gs://bucket/issue#12#3')
+        assert (path.name, path.generation) == ('issue#12', 3)
+        assert path.as_uri() == 'gs://bucket/issue%2312#3'
+
+    @pytest.mark.parametrize(
+        'path, string',
+        [
+            (
+                gcspathlib.PureGCSPath('gs://bucket/issue') / '12',
+                'gs://bucket/issue/12',
+            ),
+            (
+                gcspathlib.PureGCSPath('gs://bucket') / 'issue#12',
+                'gs://bucket/issue%2312',
+            ),
+            (gcspathlib.PureGCSPath('gs://bucket') / 'a#1#2', 'gs://bucket/a#1%232'),
+            (gcspathlib.PureGCSPath('gs://bucket') / 'x%2312', 'gs://bucket/x%252312'),
+            (
+                gcspathlib.PureGCSPath('gs://bucket') / 'x%252312',
+                'gs://bucket/x%25252312',
+            ),
+            (gcspathlib.PureGCSPath('gs://bucket') / 'x%23', 'gs://bucket/x%23'),
+            (gcspathlib.PureGCSPath('gs://bucket') / '100%', 'gs://bucket/100%'),
+            (
+                gcspathlib.PureGCSPath('gs://bucket/issue#12#3'),
+                'gs://bucket/issue%2312#3',
+            ),
+            (gcspathlib.PureGCSPath('gs://bucket/x%2312#3'), 'gs://bucket/x%2312#3'),
+            (gcspathlib.PureGCSPath('issue#12'), 'issue#12'),
+        ],
+    )
+    def test__generation_suffix_escaped(self, path, string):
+        # The string of any path parses back into it (on every Python version).
+        assert str(path) == string
+        assert gcspathlib.PureGCSPath(string) == path
+        assert gcspathlib.PureGCSPath(string).obj == path.obj
+        assert gcspathlib.PureGCSPath(string).generation == path.generation
+
+    def test__generation_suffix_equality(self):
+        pinned = gcspathlib.PureGCSPath('gs://bucket/x#5')
+        named = gcspathlib.PureGCSPath('gs://bucket') / 'x#5'
+        assert pinned != named
+        assert len({pinned, named}) == 2
+        assert gcspathlib.PathSet([pinned, named]) == {pinned, named}
+        assert named in gcspathlib.PathSet([named])
+        assert pinned not in gcspathlib.PathSet([named])
+        assert str(named) not in gcspathlib.PathSet([pinned])
+
+    def test__generation_sorting(self):
+        path = gcspathlib.PureGCSPath('gs://bucket/file')
+        paths = [path.with_generation(12), path.with_generation(2), path]
+        assert sorted(paths) == [path, paths[1], paths[0]]
+        assert path.with_generation(2) < path.with_generation(12)
+        assert path.with_generation(12) >= path.with_generation(2)
+        assert path < gcspathlib.PureGCSPath('gs://bucket/file2')
+
+    @pytest.mark.parametrize(
+        'args, kwargs',
+        [
+            (['gs://bucket#1'], {}),
+            (['gs://bucket/#1'], {}),
+            (['gs://bucket/file'], {'generation': -1}),
+            (['file'], {'generation': 1}),
+        ],
+    )
+    def test__generation_invalid(self, args, kwargs):
+        with pytest.raises(ValueError):
+            gcspathlib.PureGCSPath(*args, **kwargs)
+
+    def test__hash_prefix(self):
+        paths = [
+            gcspathlib.PureGCSPath(f'gs://bucket/logs/2024-01-01T00:00:{i:02}.json')
+            for i in range(20)
+        ]
+        hashed = [path.with_hash_prefix(4) for path in paths]
+        assert hashed[0] == paths[0].with_hash_prefix(4)
+        assert hashed[0].bucket == 'bucket'
+        assert hashed[0].obj.endswith('/logs/2024-01-01T00:00:00.json')
+        assert len(hashed[0].parts[1]) == 4
+        assert len({path.parts[1] for path in hashed}) > 1
+        assert [path.strip_hash_prefix() for path in hashed] == paths
+        assert paths[0].with_hash_prefix(32).strip_hash_prefix() == paths[0]
+
+    @pytest.mark.parametrize(
+        'path, length',
+        [('gs://bucket/', 4), ('gs://bucket/file', 0), ('gs://bucket/file', 33)],
+    )
+    def test__hash_prefix_invalid(self, path, length):
+        with pytest.raises(ValueError):
+            gcspathlib.PureGCSPath(path).with_hash_prefix(length)
+
+    @pytest.mark.parametrize(
+        'path',
+        ['gs://bucket/file', 'gs://bucket/dir/file', 'gs://bucket/0000/file'],
+    )
+    def test__strip_hash_prefix_invalid(self, path):
+        with pytest.raises(ValueError, match='no hash prefix'):
+            gcspathlib.PureGCSPath(path).strip_hash_prefix()
+
+    def test__partitions(self):
+        path = gcspathlib.PureGCSPath(
+            'gs://lake/events/dt=2026-10-16/hr=07/part-0001.parquet'
+        )
+        assert path.partitions == {'dt': '2026-10-16', 'hr': '07'}
+        assert path.partitions is path.partitions
+        with pytest.raises(TypeError):
+            path.partitions['dt'] = 'other'  # type: ignore[index]
+        assert not gcspathlib.PureGCSPath('gs://lake/events/file').partitions
+        assert not gcspathlib.PureGCSPath('gs://lake/').partitions
+        assert gcspathlib.PureGCSPath('dt=1/=2/k=a=b').partitions == {
+            'dt': '1',
+            'k': 'a=b',
+        }
+        # Hive escapes special characters in keys and values.
+        assert gcspathlib.PureGCSPath(
+            'gs://lake/ts=2026-10-16 07%3A00%3A00/a%3Db=c%2Fd'
+        ).partitions == {'ts': '2026-10-16 07:00:00', 'a=b': 'c/d'}
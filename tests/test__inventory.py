@@ -0,0 +1,138 @@
+import csv
+import gcspathlib
+import gcspathlib.testing
+import importlib.util
+import io
+import pytest
+import warnings
+
+HEADER = ['project', 'bucket', 'name', 'size']
+
+
+def _csv(rows):
+    file = io.StringIO(newline='')
+    writer = csv.writer(file)
+    writer.writerow(HEADER)
+    writer.writerows(['p', bucket, name, '1'] for bucket, name in rows)
+    return file.getvalue().encode()
+
+
+ROWS = [
+    ('bucket-a', 'dir/file.txt'),
+    ('bucket-a', 'dir/with, comma "and quotes".txt'),
+    ('bucket-b', 'dir//double/slash'),
+    ('bucket-b', 'dir/'),
+    ('bucket-a', 'other/файл.bin'),
+]
+PATH_ROWS = [ROWS[0], ROWS[1], ROWS[4]]  # (without the names that can't be paths)
+
+
+@pytest.fixture
+def shards(tmp_path):
+    shards = []
+    for i in range(3):
+        shard = tmp_path / f'shard-{i}.csv'
+        shard.write_bytes(_csv([(bucket, f'{i}/{name}') for bucket, name in ROWS]))
+        shards.append(shard)
+    return shards
+
+
+class Test_read_inventory_shard:
+    def test__chunks(self, shards):
+        chunks = list(gcspathlib.read_inventory_shard(shards[0], chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [
+            (bucket, name)
+            for chunk in chunks
+            for bucket, name in zip(chunk.buckets, chunk.names)
+        ] == [(bucket, f'0/{name}') for bucket, name in ROWS]
+
+    def test__shared_buckets(self, shards):
+        (chunk,) = gcspathlib.read_inventory_shard(shards[0])
+        assert chunk.buckets[0] is chunk.buckets[1] is chunk.buckets[4]
+
+    def test__paths(self, shards):
+        (chunk,) = gcspathlib.read_inventory_shard(shards[0])
+        with pytest.warns(UserWarning, match='double/slash') as warnings:
+            paths = chunk.paths()
+        assert len(warnings) == 1  # (not for the placeholder)
+        assert paths == [
+            gcspathlib.PureGCSPath(f'gs://{bucket}/0/{name}')
+            for bucket, name in PATH_ROWS
+        ]
+        assert [str(path) for path in paths] == [
+            str(gcspathlib.PureGCSPath(f'gs://{bucket}/0/{name}'))
+            for bucket, name in PATH_ROWS
+        ]
+        assert [(path.bucket, path.obj) for path in paths[:2]] == [
+            ('bucket-a', '0/dir/file.txt'),
+            ('bucket-a', '0/dir/with, comma "and quotes".txt'),
+        ]
+
+    def test__path_type(self, shards):
+        class SubPath(gcspathlib.PureGCSPath):
+            pass
+
+        (chunk,) = gcspathlib.read_inventory_shard(shards[0])
+        with pytest.warns(UserWarning):
+            assert {type(path) for path in chunk.paths(SubPath)} == {SubPath}
+
+    @pytest.mark.parametrize(
+        'name', ['gs://evil/secret', '/abs', 'a//b', './a', 'a/./b', 'a/.', 'a/']
+    )
+    def test__hostile_names(self, name):
+        data = _csv([('bucket', name), ('bucket', 'ok')])
+        (chunk,) = gcspathlib.read_inventory_shard(io.BytesIO(data))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            assert chunk.paths() == [gcspathlib.PureGCSPath('gs://bucket/ok')]
+
+    def test__file_object(self):
+        backend = gcspathlib.testing.MemoryBackend()
+        report = gcspathlib.PureGCSPath('gs://reports/inventory/shard-0.csv')
+        backend.write(report, _csv(ROWS))
+        with gcspathlib.open(report, 'rb', backend, chunk_size=16) as file:
+            (chunk,) = gcspathlib.read_inventory_shard(file)
+        assert chunk.names == [name for _, name in ROWS]
+
+    def test__columns(self):
+        data = b'Bucket,Object\nbucket,file.txt\n'
+        chunks = gcspathlib.read_inventory_shard(
+            io.BytesIO(data), bucket_column='Bucket', name_column='Object'
+        )
+        assert [chunk.paths() for chunk in chunks] == [
+            [gcspathlib.PureGCSPath('gs://bucket/file.txt')]
+        ]
+        with pytest.raises(ValueError):
+            list(gcspathlib.read_inventory_shard(io.BytesIO(data)))
+
+    def test__empty(self):
+        assert list(gcspathlib.read_inventory_shard(io.BytesIO(_csv([])))) == []
+
+    def test__format(self, tmp_path):
+        with pytest.raises(ValueError):
+            list(gcspathlib.read_inventory_shard(io.BytesIO(), format='json'))
+        if importlib.util.find_spec('pyarrow') is None:
+            shard = tmp_path / 'shard.parquet'
+            shard.write_bytes(b'')
+            with pytest.raises(ImportError):
+                list(gcspathlib.read_inventory_shard(shard))
+
+
+class Test_read_inventory:
+    def test__sequential(self, shards):
+        with pytest.warns(UserWarning):
+            paths = list(gcspathlib.read_inventory_paths(shards, chunk_size=2))
+        assert paths == [
+            gcspathlib.PureGCSPath(f'gs://{bucket}/{i}/{name}')
+            for i in range(3)
+            for bucket, name in PATH_ROWS
+        ]
+
+    def test__processes(self, shards):
+        chunks = list(gcspathlib.read_inventory(shards, chunk_size=2, processes=2))
+        assert [chunk.names for chunk in chunks] == [
+            chunk.names for chunk in gcspathlib.read_inventory(shards, chunk_size=2)
+        ]
+        with pytest.raises(TypeError):
+            list(gcspathlib.read_inventory([io.BytesIO()], processes=2))
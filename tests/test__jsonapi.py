@@ -0,0 +1,43 @@
+import gcspathlib
+import pytest
+from gcspathlib._jsonapi import BatchPart
+from gcspathlib._jsonapi import copy_target
+from gcspathlib._jsonapi import decode_batch
+from gcspathlib._jsonapi import encode_batch
+
+
+def test_copy_target():
+    source = gcspathlib.PureGCSPath('gs://bucket/dir/file')
+    destination = gcspathlib.PureGCSPath('gs://other/a b')
+    assert copy_target(source, destination) == (
+        '/storage/v1/b/bucket/o/dir%2Ffile/copyTo/b/other/o/a%20b'
+    )
+
+
+def test_batch_roundtrip():
+    parts = [
+        BatchPart('1', 'DELETE /storage/v1/b/bucket/o/a HTTP/1.1', {}, b''),
+        BatchPart(
+            '2',
+            'PATCH /storage/v1/b/bucket/o/b HTTP/1.1',
+            {'content-type': 'application/json'},
+            b'{"a": 1}\r\n',
+        ),
+    ]
+    body = encode_batch(parts, 'boundary')
+    decoded = decode_batch(body, 'multipart/mixed; boundary="boundary"')
+    assert [part.content_id for part in decoded] == ['1', '2']
+    assert [part.start_line for part in decoded] == [part.start_line for part in parts]
+    assert [part.body for part in decoded] == [b'', b'{"a": 1}\r\n']
+    assert decoded[1].headers['content-type'] == 'application/json'
+    assert (
+        decode_batch(encode_batch([], 'boundary'), 'multipart/mixed; boundary=boundary')
+        == []
+    )
+
+
+def test_decode_batch_invalid():
+    with pytest.raises(ValueError):
+        decode_batch(b'', 'application/json')
+    with pytest.raises(ValueError):
+        decode_batch(b'--x\r\nno headers--x--', 'multipart/mixed; boundary=x')
@@ -0,0 +1,50 @@
+import gcspathlib
+import pytest
+
+BUCKET = gcspathlib.PureGCSPath('gs://bucket/')
+
+
+class Test_analyze_key_ranges:
+    def test__sequential(self):
+        paths = [BUCKET / f'logs/2024-01-01/{i:06}.json' for i in range(100)]
+        report = gcspathlib.analyze_key_ranges(paths)
+        assert report.count == 100
+        assert report.prefixes == [('gs://bucket/logs', 100)]
+        assert report.concentration == 1.0
+        assert report.sequential == pytest.approx(0.99)
+        assert report.patterns == [('gs://bucket/logs/#-#-#/#.json', 99)]
+
+    def test__hash_prefix(self):
+        paths = [
+            (BUCKET / f'logs/2024-01-01/{i:06}.json').with_hash_prefix(4)
+            for i in range(100)
+        ]
+        report = gcspathlib.analyze_key_ranges(paths, top=3)
+        assert report.count == 100
+        assert len(report.prefixes) == 3
+        assert report.concentration < 0.1
+        assert report.sequential < 0.2
+
+    def test__buckets(self):
+        # Names are sequential within each bucket, even when the buckets interleave.
+        paths = [
+            gcspathlib.PureGCSPath(f'gs://bucket-{i % 2}/{i // 2:04}')
+            for i in range(10)
+        ]
+        report = gcspathlib.analyze_key_ranges(paths, prefix_length=2)
+        assert report.prefixes == [('gs://bucket-0/00', 5), ('gs://bucket-1/00', 5)]
+        assert report.concentration == 0.5
+        assert report.sequential == 0.8
+        assert report.patterns == [('gs://bucket-0/#', 4), ('gs://bucket-1/#', 4)]
+
+    def test__not_sequential(self):
+        names = ['b/2', 'b/1', 'a/3', 'c/x', 'c/y', 'c/9', 'c/10']
+        report = gcspathlib.analyze_key_ranges(BUCKET / name for name in names)
+        assert report.sequential == 0.0
+        assert not report.patterns
+
+    def test__empty(self):
+        report = gcspathlib.analyze_key_ranges([])
+        assert report.count == 0
+        assert report.concentration == 0.0
+        assert report.sequential == 0.0
@@ -0,0 +1,146 @@
+import gcspathlib
+import gcspathlib.testing
+import io
+import json
+import pytest
+import urllib.request
+from gcspathlib._jsonapi import bucket_target
+
+BUCKET = gcspathlib.PureGCSPath('gs://bucket/')
+NAMES = [
+    'a.txt',
+    'dir/b.txt',
+    'dir/sub/c.txt',
+    'dir/sub/d.txt',
+    'dir/with "quotes" and \\backslash',
+    'файл.bin',
+]
+
+
+@pytest.fixture
+def server(fake_server):
+    for i, name in enumerate(NAMES):
+        fake_server.backend.write(BUCKET / name, b'x' * i)
+    return fake_server
+
+
+def _record(server, **params):
+    """Fetches a listing page from the fake server, as the raw response body."""
+    with urllib.request.urlopen(server.url + bucket_target('bucket', **params)) as r:
+        return r.read()
+
+
+def _record_all(server, **params):
+    pages, token = [], None
+    while True:
+        pages.append(_record(server, pageToken=token, **params))
+        token = json.loads(pages[-1]).get('nextPageToken')
+        if token is None:
+            return pages
+
+
+class Test_ListPageParser:
+    def test__pages(self, server):
+        paths = []
+        pages = _record_all(server)
+        assert len(pages) > 1
+        for page in pages:
+            parser = gcspathlib.ListPageParser(page, BUCKET)
+            paths.extend(path for path, values in parser)
+            assert parser.next_page_token == json.loads(page).get('nextPageToken')
+        assert paths == sorted(BUCKET / name for name in NAMES)
+        assert [str(path) for path in paths] == sorted(
+            f'gs://bucket/{name}' for name in NAMES
+        )
+
+    def test__fields(self, server):
+        for page in _record_all(server, maxResults=4):
+            parser = gcspathlib.ListPageParser(
+                page, BUCKET, ['size', 'generation', 'metadata', 'missing']
+            )
+            expected = [
+                (
+                    BUCKET / item['name'],
+                    (int(item['size']), int(item['generation']), None, None),
+                )
+                for item in json.loads(page)['items']
+            ]
+            assert list(parser) == expected
+
+    def test__prefixes(self, server):
+        page = _record(server, delimiter='/', prefix='dir/')
+        parser = gcspathlib.ListPageParser(page, BUCKET)
+        assert list(parser) == [
+            (BUCKET / 'dir/b.txt', ()),
+            (BUCKET / 'dir/with "quotes" and \\backslash', ()),
+        ]
+        assert parser.prefixes == ['dir/sub/']
+        assert parser.next_page_token is None
+
+    def test__empty(self, server):
+        parser = gcspathlib.ListPageParser(_record(server, prefix='none/'), BUCKET)
+        assert not list(parser)
+        assert not parser.prefixes
+
+    def test__file(self, server):
+        page = _record(server, maxResults=2)
+        with pytest.raises(TypeError):
+            gcspathlib.ListPageParser(io.BytesIO(page), BUCKET)  # type: ignore[arg-type]
+        parser = gcspathlib.ListPageParser(memoryview(page), BUCKET)
+        assert [path for path, _ in parser] == [
+            BUCKET / 'a.txt',
+            BUCKET / 'dir/b.txt',
+        ]
+
+    def test__whitespace(self):
+        page = json.dumps(
+            {'items': [{'name': 'a', 'size': '1'}, {'name': 'b'}], 'kind': 'x'},
+            indent=4,
+        )
+        parser = gcspathlib.ListPageParser(page, BUCKET, ['size'])
+        assert list(parser) == [(BUCKET / 'a', (1,)), (BUCKET / 'b', (None,))]
+
+    def test__path_type(self):
+        class Path(gcspathlib.PureGCSPath):
+            pass
+
+        bucket = Path('gs://bucket')
+        ((path, _),) = gcspathlib.ListPageParser('{"items": [{"name": "a"}]}', bucket)
+        assert type(path) is Path
+        assert path == bucket / 'a'
+
+    @pytest.mark.parametrize(
+        'page',
+        [
+            '',
+            '{"items": [{"name": "a"}',
+            '{"items": [{"name": "a"} {"name": "b"}]}',
+            '{"items": [{"name": "a"},]}',
+            '{"items" [{"name": "a"}]}',
+            '[]',
+        ],
+    )
+    def test__malformed(self, page):
+        with pytest.raises(json.JSONDecodeError):
+            list(gcspathlib.ListPageParser(page, BUCKET))
+
+    @pytest.mark.parametrize(
+        'page',
+        ['{"items": [{"size": "1"}]}', '{"items": [1]}', '{"items": [{"name": 1}]}'],
+    )
+    def test__invalid_item(self, page):
+        with pytest.raises(ValueError, match='without a name'):
+            list(gcspathlib.ListPageParser(page, BUCKET))
+
+    def test__hostile_names(self):
+        page = json.dumps(
+            {'items': [{'name': name} for name in ['gs://evil/x', 'a//b', 'a/', 'a/b']]}
+        )
+        with pytest.warns(UserWarning) as warnings:
+            paths = [path for path, _ in gcspathlib.ListPageParser(page, BUCKET)]
+        assert paths == [BUCKET / 'a/b']
+        assert len(warnings) == 2  # (not for the placeholder)
+
+    def test__not_bucket(self):
+        with pytest.raises(ValueError, match='bucket-only'):
+            gcspathlib.ListPageParser('{}', BUCKET / 'a')
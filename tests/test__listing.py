@@ -0,0 +1,160 @@
+import gcspathlib
+import gcspathlib.testing
+import pytest
+import threading
+import time
+
+
+class SlowBackend(gcspathlib.testing.MemoryBackend):
+    """Serves listing pages of 2 entries with a delay, counting requests."""
+
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._counter_lock = threading.Lock()
+
+    def list_page(self, bucket, **kwargs):
+        with self._counter_lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        try:
+            return super().list_page(bucket, **{**kwargs, 'max_results': 2})
+        finally:
+            with self._counter_lock:
+                self.active -= 1
+
+
+NAMES = [
+    'a.txt',
+    'b/1.txt',
+    'b/2.csv',
+    'b/c/3.txt',
+    'b/d/',
+    'c/4.txt',
+    'd.csv',
+    'e/5.txt',
+    'e/6.txt',
+    'e/7.txt',
+]
+
+
+@pytest.fixture
+def backend():
+    backend = SlowBackend()
+    for name in NAMES:
+        backend._put('bucket', name, b'')
+    return backend
+
+
+def _path(name=''):
+    return gcspathlib.PureGCSPath('gs://bucket', name)
+
+
+class Test_iter_pages:
+    def test__pages(self, backend):
+        pages = list(gcspathlib.iter_pages(backend, 'bucket', prefix='e/'))
+        assert [[item['name'] for item in page.items] for page in pages] == [
+            ['e/5.txt', 'e/6.txt'],
+            ['e/7.txt'],
+        ]
+        assert backend.calls == 2
+
+    def test__prefetch(self, backend):
+        pages = gcspathlib.iter_pages(backend, 'bucket', delimiter='/')
+        next(pages)
+        deadline = time.monotonic() + 5
+        while backend.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert backend.calls == 2
+        pages.close()
+
+    def test__no_prefetch(self, backend):
+        pages = gcspathlib.iter_pages(backend, 'bucket', prefetch=False)
+        next(pages)
+        time.sleep(0.01)
+        assert backend.calls == 1
+
+
+class Test_iterdir:
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test__iterdir(self, backend, prefetch):
+        children = list(gcspathlib.iterdir(_path(), backend, prefetch=prefetch))
+        assert children == [_path(name) for name in ['a.txt', 'b', 'c', 'd.csv', 'e']]
+        children = list(gcspathlib.iterdir(_path('b'), backend, prefetch=prefetch))
+        assert children == [
+            _path(name) for name in ['b/1.txt', 'b/2.csv', 'b/c', 'b/d']
+        ]
+        assert list(gcspathlib.iterdir(_path('b/d'), backend)) == []
+
+    def test__children(self, backend):
+        class MyPath(gcspathlib.PureGCSPath):
+            __slots__ = ()
+
+        parent = MyPath('gs://bucket/b')
+        for child in gcspathlib.iterdir(parent, backend):
+            assert type(child) is MyPath
+            assert child.parent == parent
+            assert str(child) == f'{parent}/{child.name}'
+            assert child.parts == (parent / child.name).parts
+
+    def test__hostile_names(self, backend):
+        for name in ['gs://evil/secret', 'x//y', 'x/./y', 'x/z']:
+            backend._put('bucket', f'h/{name}', b'')
+        # (`gs:` and `x` are "subdirectories", while `gs:/` and `x/` and `x/.` can't
+        # be paths.)
+        children = list(gcspathlib.iterdir(_path('h'), backend))
+        assert children == [_path('h/gs:'), _path('h/x')]
+        with pytest.warns(UserWarning, match='h/gs:'):
+            assert list(gcspathlib.iterdir(_path('h/gs:'), backend)) == []
+        with pytest.warns(UserWarning) as warnings:
+            children = list(gcspathlib.iterdir(_path('h/x'), backend))
+        assert children == [_path('h/x/z')]
+        assert len(warnings) == 2
+        with pytest.warns(UserWarning) as warnings:
+            paths = list(gcspathlib.rglob(_path('h'), '*', backend))
+        assert paths == [_path('h/x/z')]
+        assert len(warnings) == 3
+
+    def test__bucketless(self, backend):
+        with pytest.raises(ValueError):
+            list(gcspathlib.iterdir(gcspathlib.PureGCSPath('dir'), backend))
+
+
+class Test_rglob:
+    @pytest.mark.parametrize('concurrency', [1, 2, 8])
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test__rglob(self, backend, concurrency, prefetch):
+        def rglob(path, pattern):
+            return list(
+                gcspathlib.rglob(
+                    path,
+                    pattern,
+                    backend,
+                    concurrency=concurrency,
+                    prefetch=prefetch,
+                )
+            )
+
+        objects = [name for name in NAMES if not name.endswith('/')]
+        assert rglob(_path(), '*') == [_path(name) for name in objects]
+        assert rglob(_path(), '*.txt') == [
+            _path(name) for name in objects if name.endswith('.txt')
+        ]
+        assert rglob(_path('b'), '*.txt') == [
+            _path(name) for name in ['b/1.txt', 'b/c/3.txt']
+        ]
+        assert rglob(_path(), 'c/*.txt') == [
+            _path(name) for name in ['b/c/3.txt', 'c/4.txt']
+        ]
+        assert rglob(_path('missing'), '*') == []
+
+    def test__concurrency(self, backend):
+        backend.delay = 0.02
+        paths = list(gcspathlib.rglob(_path(), '*', backend, concurrency=4))
+        assert len(paths) == 9
+        assert backend.max_active > 1
@@ -0,0 +1,132 @@
+import dataclasses
+import datetime
+import gcspathlib
+import json
+import pytest
+
+
+@dataclasses.dataclass
+class Message:
+    attributes: dict
+    data: bytes | memoryview = b''
+
+
+def _message(bucket, name, generation, event_type='OBJECT_FINALIZE', payload=True):
+    resource = gcspathlib.ObjectInfo(
+        gcspathlib.PureGCSPath(f'gs://{bucket}/{name}'),
+        size=10,
+        generation=generation,
+        content_type='text/plain',
+    ).to_resource()
+    return Message(
+        attributes={
+            'notificationConfig': 'projects/_/buckets/bucket/notificationConfigs/1',
+            'eventType': event_type,
+            'payloadFormat': 'JSON_API_V1' if payload else 'NONE',
+            'bucketId': bucket,
+            'objectId': name,
+            'objectGeneration': str(generation),
+            'eventTime': '2024-01-01T12:00:00.123456Z',
+        },
+        data=json.dumps(resource).encode() if payload else b'',
+    )
+
+
+class Test_parse_notifications:
+    def test__attributes(self):
+        message = _message('bucket', 'dir/файл.txt', 5)
+        message.attributes['overwroteGeneration'] = '4'
+        (notification,) = gcspathlib.parse_notifications([message])
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/файл.txt')
+        assert notification == gcspathlib.ObjectNotification(
+            path=path,
+            event_type='OBJECT_FINALIZE',
+            generation=5,
+            event_time=datetime.datetime(
+                2024, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.timezone.utc
+            ),
+            overwrote_generation=4,
+            info=gcspathlib.ObjectInfo(
+                path, size=10, generation=5, content_type='text/plain'
+            ),
+        )
+        assert str(notification.path) == 'gs://bucket/dir/файл.txt'
+
+    def test__batch(self):
+        messages = [
+            _message('bucket-a', 'a', 1),
+            _message('bucket-b', 'b', 2, 'OBJECT_DELETE', payload=False),
+            _message('bucket-a', 'dir/c', 3, 'OBJECT_METADATA_UPDATE'),
+        ]
+        notifications = gcspathlib.parse_notifications(messages)
+        assert [n.path for n in notifications] == [
+            gcspathlib.PureGCSPath('gs://bucket-a/a'),
+            gcspathlib.PureGCSPath('gs://bucket-b/b'),
+            gcspathlib.PureGCSPath('gs://bucket-a/dir/c'),
+        ]
+        assert [n.event_type for n in notifications] == [
+            'OBJECT_FINALIZE',
+            'OBJECT_DELETE',
+            'OBJECT_METADATA_UPDATE',
+        ]
+        assert [n.info is None for n in notifications] == [False, True, False]
+        assert notifications[0].path.drive is notifications[2].path.drive
+
+    def test__memoryview(self):
+        message = _message('bucket', 'a', 1)
+        message.data = memoryview(bytearray(message.data))
+        (notification,) = gcspathlib.parse_notifications([message])
+        assert notification.info.size == 10
+
+    def test__without_payloads(self):
+        message = _message('bucket', 'a', 1)
+        message.data = b'not json'
+        (notification,) = gcspathlib.parse_notifications([message], payloads=False)
+        assert notification.path == gcspathlib.PureGCSPath('gs://bucket/a')
+        assert notification.generation == 1
+        assert notification.info is None
+
+    def test__payload_only(self):
+        message = _message('bucket', 'a', 7)
+        for key in ('bucketId', 'objectId', 'objectGeneration'):
+            del message.attributes[key]
+        (notification,) = gcspathlib.parse_notifications([message], payloads=False)
+        assert notification.path == gcspathlib.PureGCSPath('gs://bucket/a')
+        assert notification.generation == 7
+
+    def test__path_type(self):
+        class Path(gcspathlib.PureGCSPath):
+            pass
+
+        (notification,) = gcspathlib.parse_notifications(
+            [_message('bucket', 'a', 1)], path_type=Path
+        )
+        assert type(notification.path) is Path
+        assert type(notification.info.path) is Path
+
+    @pytest.mark.parametrize('payload', [False, True])
+    def test__missing_name(self, payload):
+        message = _message('bucket', 'a', 1, payload=payload)
+        del message.attributes['objectId']
+        if payload:
+            message.data = b'{"bucket": "bucket"}'
+        with pytest.raises(ValueError, match='lacks'):
+            gcspathlib.parse_notifications([message])
+
+    def test__hostile_names(self):
+        messages = [
+            _message('bucket', name, 1)
+            for name in ['gs://evil/x', 'a/./b', 'dir/', 'a']
+        ]
+        with pytest.warns(UserWarning) as warnings:
+            notifications = gcspathlib.parse_notifications(messages)
+        assert [notification.path for notification in notifications] == [
+            gcspathlib.PureGCSPath('gs://bucket/a')
+        ]
+        assert len(warnings) == 2
+
+    def test__invalid_payload(self):
+        message = _message('bucket', 'a', 1)
+        message.data = b'[]'
+        with pytest.raises(ValueError, match='object resource'):
+            gcspathlib.parse_notifications([message])
@@ -0,0 +1,69 @@
+import gcspathlib
+
+LAKE = gcspathlib.PureGCSPath('gs://lake/events')
+
+
+def _paths():
+    return [
+        LAKE / 'dt=2026-10-16/hr=07/part-0001.parquet',
+        LAKE / 'dt=2026-10-16/hr=07/part-0002.parquet',
+        LAKE / 'dt=2026-10-16/hr=08/part-0001.parquet',
+        LAKE / 'dt=2026-10-17/part-0001.parquet',
+        LAKE / 'other/part-0001.parquet',
+    ]
+
+
+class Test_partition_columns:
+    def test__all_keys(self):
+        assert gcspathlib.partition_columns(_paths()) == {
+            'dt': ['2026-10-16', '2026-10-16', '2026-10-16', '2026-10-17', None],
+            'hr': ['07', '07', '08', None, None],
+        }
+
+    def test__keys(self):
+        assert gcspathlib.partition_columns(_paths(), ['hr', 'missing']) == {
+            'hr': ['07', '07', '08', None, None],
+            'missing': [None] * 5,
+        }
+
+    def test__late_key(self):
+        paths = [LAKE / 'a', LAKE / 'k=1/a', LAKE / 'k=2/j=3']
+        assert gcspathlib.partition_columns(paths) == {
+            'k': [None, '1', '2'],
+            'j': [None, None, '3'],
+        }
+
+    def test__cached(self):
+        paths = _paths()
+        gcspathlib.partition_columns(paths)
+        # The partitions of the paths in a "directory" are parsed once, and shared.
+        assert paths[0].partitions is paths[1].partitions
+        assert paths[0].partitions == {'dt': '2026-10-16', 'hr': '07'}
+
+    def test__empty(self):
+        assert not gcspathlib.partition_columns([])
+        assert gcspathlib.partition_columns([], ['dt']) == {'dt': []}
+
+
+class Test_prune_partitions:
+    def test__predicate(self):
+        calls = []
+
+        def predicate(partitions):
+            calls.append(dict(partitions))
+            return partitions.get('hr') == '07'
+
+        paths = _paths()
+        assert list(gcspathlib.prune_partitions(paths, predicate)) == paths[:2]
+        assert calls == [
+            {'dt': '2026-10-16', 'hr': '07'},
+            {'dt': '2026-10-16', 'hr': '08'},
+            {'dt': '2026-10-17'},
+            {},
+        ]
+
+    def test__lazy(self):
+        paths = iter(_paths())
+        pruned = gcspathlib.prune_partitions(paths, lambda partitions: True)
+        assert next(pruned) == LAKE / 'dt=2026-10-16/hr=07/part-0001.parquet'
+        assert len(list(paths)) == 4
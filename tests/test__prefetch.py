@@ -0,0 +1,87 @@
+import gcspathlib
+import gcspathlib.testing
+import pytest
+import random
+import threading
+import time
+
+PATHS = [gcspathlib.PureGCSPath(f'gs://bucket/samples/{i:03}.bin') for i in range(50)]
+
+
+class SlowBackend(gcspathlib.testing.MemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def read(self, path, start=0, end=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(random.uniform(0, 0.005))
+            return super().read(path, start, end, **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def backend():
+    backend = SlowBackend()
+    for i, path in enumerate(PATHS):
+        backend.write(path, bytes([i]) * 100)
+    return backend
+
+
+class Test_read_many:
+    def test__ordered(self, backend):
+        results = list(gcspathlib.read_many(PATHS, backend, concurrency=8))
+        assert [path for path, _ in results] == PATHS
+        assert all(data == bytes([i]) * 100 for i, (_, data) in enumerate(results))
+        assert 1 < backend.max_in_flight <= 8
+
+    def test__unordered(self, backend):
+        results = list(gcspathlib.read_many(PATHS, backend, ordered=False))
+        assert sorted(path for path, _ in results) == PATHS
+        assert all(data == backend.read(path) for path, data in results)
+
+    def test__max_buffered(self, backend):
+        started = []
+        paths = (started.append(path) or path for path in PATHS)
+        results = gcspathlib.read_many(
+            paths, backend, concurrency=4, ordered=False, max_buffered=250
+        )
+        next(results)
+        time.sleep(0.05)
+        # (At most 3 unconsumed 100-byte reads finish before reads stop being started.)
+        assert len(started) <= 1 + 3 + 4
+        assert len(list(results)) == len(PATHS) - 1
+
+    def test__window(self, backend):
+        started = []
+        paths = (started.append(path) or path for path in PATHS)
+        results = gcspathlib.read_many(paths, backend, concurrency=4, window=6)
+        next(results)
+        time.sleep(0.05)
+        assert len(started) <= 6
+        assert [path for path, _ in results] == PATHS[1:]
+
+    def test__missing(self, backend):
+        paths = [*PATHS[:5], PATHS[0].with_name('missing.bin'), *PATHS[5:]]
+        results = gcspathlib.read_many(paths, backend)
+        assert [path for path, _ in (next(results) for _ in range(5))] == PATHS[:5]
+        with pytest.raises(FileNotFoundError):
+            next(results)
+
+    def test__close(self, backend):
+        results = gcspathlib.read_many(PATHS, backend, concurrency=4)
+        next(results)
+        results.close()
+        time.sleep(0.02)
+        assert backend.in_flight == 0
+
+    def test__invalid(self, backend):
+        with pytest.raises(ValueError):
+            list(gcspathlib.read_many(PATHS, backend, concurrency=0))
@@ -0,0 +1,85 @@
+import gcspathlib
+import gcspathlib._stats
+import pytest
+import time
+
+
+@pytest.fixture
+def enabled_stats():
+    gcspathlib.reset_stats()
+    gcspathlib.enable_stats()
+    yield
+    gcspathlib.disable_stats()
+    gcspathlib.reset_stats()
+
+
+def _calls(name):
+    return gcspathlib.stats().get(name, {}).get('calls', 0)
+
+
+class Test_stats:
+    def test__disabled(self):
+        str_method = gcspathlib.PureGCSPath.__str__
+        gcspathlib.enable_stats()
+        gcspathlib.disable_stats()
+        gcspathlib.reset_stats()
+        assert gcspathlib.PureGCSPath.__str__ is str_method
+        assert '__truediv__' not in vars(gcspathlib.PureGCSPath)
+        str(gcspathlib.PureGCSPath('gs://bucket/file.txt'))
+        assert not gcspathlib.stats()
+
+    def test__parse(self, enabled_stats):
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/file.txt')
+        assert path.bucket == 'bucket'
+        assert _calls('parse') == 1
+        assert _calls('splitroot') >= 1
+
+    def test__join(self, enabled_stats):
+        path = gcspathlib.PureGCSPath('gs://bucket/dir')
+        path / 'file.txt'
+        'dir' / gcspathlib.PureGCSPath('file.txt')
+        path.joinpath('a', 'b')
+        assert _calls('join') == 3
+
+    def test__quote(self, enabled_stats):
+        gcspathlib.PureGCSPath('gs://bucket/dir/file.txt').as_uri()
+        with pytest.raises(ValueError):
+            gcspathlib.PureGCSPath('gs://bucket').as_uri()
+        assert _calls('quote') == 1
+
+    def test__cache_misses(self, enabled_stats):
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/file.txt')
+        assert str(path) == str(path)
+        assert hash(path) == hash(path)
+        assert _calls('str_miss') == 1
+        assert _calls('hash_miss') == 1
+
+    def test__reset(self, enabled_stats):
+        str(gcspathlib.PureGCSPath('gs://bucket/dir/file.txt'))
+        assert gcspathlib.stats(reset=True)['str_miss']['calls'] == 1
+        assert not gcspathlib.stats()
+
+    def test__timing_and_callers(self, enabled_stats):
+        gcspathlib.enable_stats(timing=True, callers=True)
+        str(gcspathlib.PureGCSPath('gs://bucket/dir/file.txt'))
+        stat = gcspathlib.stats()['str_miss']
+        assert stat['calls'] == 1
+        assert stat['time_ns'] > 0
+        [(caller, count)] = stat['callers'].items()
+        assert caller.startswith(__file__)
+        assert 'test__timing_and_callers' in caller
+        assert count == 1
+
+    def test__timing_excludes_callers(self, enabled_stats, monkeypatch):
+        def slow_caller(caller=gcspathlib._stats._caller):
+            time.sleep(0.05)
+            return caller()
+
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/file.txt')
+        str(path)
+        monkeypatch.setattr(gcspathlib._stats, '_caller', slow_caller)
+        gcspathlib.enable_stats(timing=True, callers=True)
+        gcspathlib.reset_stats()
+        path.as_uri()
+        assert list(gcspathlib.stats()) == ['quote']
+        assert gcspathlib.stats()['quote']['time_ns'] < 50_000_000
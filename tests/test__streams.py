@@ -0,0 +1,111 @@
+import gcspathlib
+import gcspathlib.testing
+import io
+import pytest
+import threading
+
+DATA = bytes(range(256)) * 4 + b'tail'
+PATH = gcspathlib.PureGCSPath('gs://bucket/data.bin')
+
+
+class RecordingBackend(gcspathlib.testing.MemoryBackend):
+    """Records the byte ranges read."""
+
+    def __init__(self):
+        super().__init__()
+        self.ranges = []
+        self._ranges_lock = threading.Lock()
+
+    def read(self, path, start=0, end=None, **kwargs):
+        with self._ranges_lock:
+            self.ranges.append((start, end))
+        return super().read(path, start, end, **kwargs)
+
+
+@pytest.fixture
+def backend():
+    backend = RecordingBackend()
+    backend.write(PATH, DATA)
+    return backend
+
+
+class Test_open:
+    def test__sequential(self, backend):
+        with gcspathlib.open(PATH, 'rb', backend, chunk_size=100, read_ahead=2) as file:
+            assert file.read(10) == DATA[:10]
+            assert file.read(150) == DATA[10:160]
+            assert file.read() == DATA[160:]
+            assert file.read() == b''
+            assert file.tell() == len(DATA)
+        assert sorted(backend.ranges) == [
+            (start, min(start + 100, len(DATA))) for start in range(0, len(DATA), 100)
+        ]
+
+    def test__readinto(self, backend):
+        with gcspathlib.open(PATH, 'rb', backend, chunk_size=100) as file:
+            buffer = bytearray(250)
+            assert file.readinto(buffer) == 250
+            assert buffer == DATA[:250]
+            file.seek(-4, io.SEEK_END)
+            assert file.readinto(memoryview(buffer)[10:20]) == 4
+            assert buffer[10:14] == b'tail'
+
+    def test__random_access(self, backend):
+        with gcspathlib.open(PATH, 'rb', backend, chunk_size=100, read_ahead=3) as file:
+            assert file.seek(-8, io.SEEK_END) == len(DATA) - 8
+            assert file.read(8) == DATA[-8:]
+            assert backend.ranges == [(1000, 1028)]
+            file.seek(150)
+            assert file.read(100) == DATA[150:250]
+            assert sorted(backend.ranges[1:]) == [(100, 200), (200, 300)]
+            assert file.seek(-50, io.SEEK_CUR) == 200
+            assert file.read(10) == DATA[200:210]
+            assert len(backend.ranges) == 3
+            file.seek(2000)
+            assert file.read(10) == b''
+
+    def test__buffered(self, backend):
+        raw = gcspathlib.open(PATH, 'rb', backend, chunk_size=64, read_ahead=1)
+        with io.BufferedReader(raw, buffer_size=10) as file:
+            assert b''.join(iter(lambda: file.read(7), b'')) == DATA
+
+    def test__empty(self, backend):
+        backend.write(PATH, b'')
+        with gcspathlib.open(PATH, 'rb', backend) as file:
+            assert file.read() == b''
+            assert file.read(10) == b''
+        assert backend.ranges == []
+
+    def test__generation(self, backend):
+        with gcspathlib.open(PATH, 'rb', backend, chunk_size=100, read_ahead=0) as file:
+            assert file.read(10) == DATA[:10]
+            backend.write(PATH, b'new')
+            file.seek(500)
+            with pytest.raises(FileNotFoundError):
+                file.read(10)
+
+    def test__errors(self, backend):
+        with pytest.raises(ValueError):
+            gcspathlib.open(PATH, 'wb', backend)
+        with pytest.raises(FileNotFoundError):
+            gcspathlib.open(PATH.with_name('missing'), 'rb', backend)
+        file = gcspathlib.open(PATH, 'rb', backend)
+        with pytest.raises(ValueError):
+            file.seek(-1)
+        file.close()
+        with pytest.raises(ValueError):
+            file.read()
+
+    def test__readall(self, backend):
+        with gcspathlib.open(PATH, 'rb', backend, chunk_size=100, read_ahead=1) as file:
+            file.seek(150)
+            data = file.readall()
+            assert type(data) is bytes
+            assert data == DATA[150:]
+            assert file.readall() == b''
+
+    def test__not_exported(self):
+        namespace = {}
+        exec('from gcspathlib import *', namespace)
+        assert namespace['PureGCSPath'] is gcspathlib.PureGCSPath
+        assert 'open' not in namespace
@@ -0,0 +1,121 @@
+import datetime
+import gcspathlib
+import pytest
+
+DAYS = [datetime.date(2026, 10, 31), datetime.date(2026, 11, 1)]
+
+
+class Test_PathTemplate:
+    def test__expand(self):
+        template = gcspathlib.PathTemplate(
+            'gs://b/logs/{date:%Y-%m-%d}/{hour:02d}/*.gz'
+        )
+        assert template.fields == ('date', 'hour')
+        assert template.root == gcspathlib.PureGCSPath('gs://b/logs')
+        assert list(template.expand(date=DAYS, hour=range(2))) == [
+            gcspathlib.PureGCSPath('gs://b/logs/2026-10-31/00/*.gz'),
+            gcspathlib.PureGCSPath('gs://b/logs/2026-10-31/01/*.gz'),
+            gcspathlib.PureGCSPath('gs://b/logs/2026-11-01/00/*.gz'),
+            gcspathlib.PureGCSPath('gs://b/logs/2026-11-01/01/*.gz'),
+        ]
+
+    def test__lazy(self):
+        template = gcspathlib.PathTemplate('gs://b/{i}')
+        paths = template.expand(i=range(10**12))
+        assert next(paths) == gcspathlib.PureGCSPath('gs://b/0')
+        assert next(paths) == gcspathlib.PureGCSPath('gs://b/1')
+
+    def test__iterators(self):
+        template = gcspathlib.PathTemplate('gs://b/{day}/{hour}')
+        paths = template.expand(day=iter(['a', 'b']), hour=(h for h in range(2)))
+        assert [str(path) for path in paths] == [
+            'gs://b/a/0',
+            'gs://b/a/1',
+            'gs://b/b/0',
+            'gs://b/b/1',
+        ]
+
+    def test__fields(self):
+        template = gcspathlib.PathTemplate(
+            'gs://b/{date.year}/{{literal}}/{name}/{date:%m}-{name!r}'
+        )
+        assert template.fields == ('date', 'name')
+        (path,) = template.expand(date=DAYS[0], name='a')
+        assert path == gcspathlib.PureGCSPath("gs://b/2026/{literal}/a/10-'a'")
+
+    def test__same_segment(self):
+        template = gcspathlib.PathTemplate('gs://b/logs/{kind}-{n}.json')
+        assert template.root == gcspathlib.PureGCSPath('gs://b/logs')
+        assert [str(path) for path in template.expand(kind='x', n=[1, 2])] == [
+            'gs://b/logs/x-1.json',
+            'gs://b/logs/x-2.json',
+        ]
+
+    def test__relative(self):
+        template = gcspathlib.PathTemplate('{kind}/file')
+        assert list(template.expand(kind=['a', 'b'])) == [
+            gcspathlib.PureGCSPath('a/file'),
+            gcspathlib.PureGCSPath('b/file'),
+        ]
+        assert list(template.prefixes(kind=['a', 'b'])) == ['a/file', 'b/file']
+
+    def test__path_type(self):
+        class Path(gcspathlib.PureGCSPath):
+            pass
+
+        template = gcspathlib.PathTemplate('gs://b/{i}', path_type=Path)
+        assert [type(path) for path in template.expand(i=range(2))] == [Path, Path]
+
+    def test__prefixes(self):
+        template = gcspathlib.PathTemplate(
+            'gs://b/logs/{date:%Y-%m-%d}/{hour:02d}/part-*.gz'
+        )
+        assert list(template.prefixes(date=DAYS, hour=range(2))) == [
+            'logs/2026-10-31/00/part-',
+            'logs/2026-10-31/01/part-',
+            'logs/2026-11-01/00/part-',
+            'logs/2026-11-01/01/part-',
+        ]
+
+    def test__prefixes_collapsed(self):
+        template = gcspathlib.PathTemplate('gs://b/{date:%Y-%m-%d}/*/{kind}.json')
+        assert list(template.prefixes(date=DAYS, kind=['a', 'b'])) == [
+            '2026-10-31/',
+            '2026-11-01/',
+        ]
+        template = gcspathlib.PathTemplate('gs://b/{shard}')
+        assert list(template.prefixes(shard=[1, 10, 11, 2, 20])) == ['1', '2']
+
+    @pytest.mark.parametrize(
+        'template, prefixes',
+        [
+            ('gs://b/*/logs/{n}/x', ['']),
+            ('gs://b/logs-?/{n}/x', ['logs-']),
+            ('gs://b/logs/[ab]/{n}', ['logs/']),
+            ('b*/logs/{n}', ['b']),
+        ],
+    )
+    def test__prefixes_wildcard_root(self, template, prefixes):
+        template = gcspathlib.PathTemplate(template)
+        assert list(template.prefixes(n=range(3))) == prefixes
+
+    @pytest.mark.parametrize(
+        'values', [{}, {'date': DAYS}, {'date': DAYS, 'hour': 1, 'other': 1}]
+    )
+    def test__invalid_values(self, values):
+        template = gcspathlib.PathTemplate('gs://b/{date}/{hour}')
+        with pytest.raises(ValueError, match='exactly the fields'):
+            list(template.expand(**values))
+
+    @pytest.mark.parametrize('value', ['', '.', 'gs://evil/secret', 'a//b', 'a/'])
+    def test__hostile_values(self, value):
+        template = gcspathlib.PathTemplate('gs://b/logs/{name}/x')
+        with pytest.raises(ValueError, match='segments'):
+            list(template.expand(name=value))
+
+    @pytest.mark.parametrize(
+        'template', ['gs://{bucket}/a', 'gs://b{i}/a', 'gs://b/{}', 'gs://b/{0}']
+    )
+    def test__invalid(self, template):
+        with pytest.raises(ValueError):
+            gcspathlib.PathTemplate(template)
@@ -0,0 +1,231 @@
+import gcspathlib
+import gcspathlib.testing
+import mmap
+import os
+import pytest
+
+
+@pytest.fixture(params=['memory', 'local'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        backend = gcspathlib.testing.MemoryBackend()
+    else:
+        backend = gcspathlib.testing.LocalBackend(tmp_path)
+    return backend
+
+
+def _path(name):
+    return gcspathlib.PureGCSPath('gs://bucket', name)
+
+
+def _list_all(backend, max_results=2, **kwargs):
+    pages = []
+    page_token = None
+    while True:
+        page = backend.list_page(
+            'bucket', page_token=page_token, max_results=max_results, **kwargs
+        )
+        pages.append(([item['name'] for item in page.items], page.prefixes))
+        page_token = page.next_page_token
+        if page_token is None:
+            break
+    return pages
+
+
+class Test_Backend:
+    def test__write_read(self, backend):
+        path = _path('dir/file.txt')
+        info = backend.write(path, b'0123456789')
+        assert info.path == path
+        assert info.size == 10
+        assert bytes(backend.read(path)) == b'0123456789'
+        assert bytes(backend.read(path, 2, 5)) == b'234'
+        assert bytes(backend.read(path, 8)) == b'89'
+        assert backend.stat(path) == info
+
+    def test__empty(self, backend):
+        path = _path('empty.txt')
+        backend.write(path, b'')
+        assert bytes(backend.read(path)) == b''
+        assert backend.stat(path).size == 0
+
+    def test__generations(self, backend):
+        path = _path('file.txt')
+        first = backend.write(path, b'1').generation
+        second = backend.write(path, b'2').generation
+        assert second > first
+        assert backend.stat(path, generation=second).generation == second
+        assert bytes(backend.read(path, generation=second)) == b'2'
+        with pytest.raises(FileNotFoundError):
+            backend.stat(path, generation=first)
+        with pytest.raises(FileNotFoundError):
+            backend.read(path, generation=first)
+
+    def test__pinned(self, backend):
+        path = _path('file.txt')
+        first = backend.write(path, b'1').generation
+        pinned = path.with_generation(first)
+        assert bytes(backend.read(pinned)) == b'1'
+        assert backend.stat(pinned).generation == first
+        second = backend.write(path, b'2').generation
+        assert bytes(backend.read(pinned, generation=second)) == b'2'
+        for method in (backend.stat, backend.read):
+            with pytest.raises(FileNotFoundError) as excinfo:
+                method(pinned)
+            assert excinfo.value.filename == f'gs://bucket/file.txt#{first}'
+
+    def test__missing(self, backend):
+        path = _path('dir/missing.txt')
+        backend.write(_path('dir/file.txt'), b'')
+        for method in (backend.stat, backend.read, backend.delete):
+            with pytest.raises(FileNotFoundError) as excinfo:
+                method(path)
+            assert excinfo.value.filename == str(path)
+        with pytest.raises(FileNotFoundError):
+            backend.stat(_path('dir'))  # (only a "directory")
+
+    def test__delete(self, backend):
+        path = _path('dir/sub/file.txt')
+        backend.write(path, b'data')
+        backend.write(_path('other.txt'), b'data')
+        backend.delete(path)
+        with pytest.raises(FileNotFoundError):
+            backend.stat(path)
+        assert _list_all(backend, delimiter='/') == [(['other.txt'], [])]
+
+    def test__incomplete(self, backend):
+        with pytest.raises(ValueError):
+            backend.write(gcspathlib.PureGCSPath('gs://bucket'), b'')
+        with pytest.raises(ValueError):
+            backend.stat(gcspathlib.PureGCSPath('file.txt'))
+
+    def test__list(self, backend):
+        names = ['a-c', 'a/b', 'a/c/d', 'a0', 'b/1', 'b/2', 'b/3', 'z', 'é']
+        for name in reversed(names):
+            backend.write(_path(name), b'')
+        assert _list_all(backend, max_results=1000) == [(names, [])]
+        assert _list_all(backend) == [
+            (['a-c', 'a/b'], []),
+            (['a/c/d', 'a0'], []),
+            (['b/1', 'b/2'], []),
+            (['b/3', 'z'], []),
+            (['é'], []),
+        ]
+        assert _list_all(backend, delimiter='/') == [
+            (['a-c'], ['a/']),
+            (['a0'], ['b/']),
+            (['z', 'é'], []),
+        ]
+        assert _list_all(backend, prefix='a/', delimiter='/') == [(['a/b'], ['a/c/'])]
+        assert _list_all(backend, prefix='a', delimiter='/', max_results=10) == [
+            (['a-c', 'a0'], ['a/'])
+        ]
+        assert _list_all(backend, prefix='b/', start_offset='b/2') == [
+            (['b/2', 'b/3'], [])
+        ]
+        assert _list_all(backend, start_offset='a/c', end_offset='b/3') == [
+            (['a/c/d', 'a0'], []),
+            (['b/1', 'b/2'], []),
+        ]
+        assert _list_all(backend, prefix='missing/', delimiter='/') == [([], [])]
+        assert backend.list_page('other').items == []
+
+
+class Test_MemoryBackend:
+    def test__patch(self):
+        backend = gcspathlib.testing.MemoryBackend()
+        path = _path('file.txt')
+        backend.write(path, b'')
+        info = backend.patch(
+            path, {'contentType': 'text/plain', 'metadata': {'a': '1'}}
+        )
+        assert info.content_type == 'text/plain'
+        assert info.metageneration == 2
+        backend.patch(path, {'metadata': {'a': None, 'b': '2'}, 'cacheControl': 'no'})
+        [item] = backend.list_page('bucket').items
+        assert item['metadata'] == {'b': '2'}
+        assert item['cacheControl'] == 'no'
+        assert item['metageneration'] == '3'
+        with pytest.raises(ValueError):
+            backend.patch(path, {'generation': '1'})
+        with pytest.raises(FileNotFoundError):
+            backend.patch(_path('missing'), {})
+
+
+class Test_LocalBackend:
+    def test__layout(self, tmp_path):
+        backend = gcspathlib.testing.LocalBackend(tmp_path)
+        (tmp_path / 'bucket' / 'dir').mkdir(parents=True)
+        (tmp_path / 'bucket' / 'dir' / 'existing.txt').write_bytes(b'existing')
+        (tmp_path / 'bucket' / 'empty').mkdir()
+        backend.write(_path('dir/new.txt'), b'new')
+        assert (tmp_path / 'bucket' / 'dir' / 'new.txt').read_bytes() == b'new'
+        assert bytes(backend.read(_path('dir/existing.txt'))) == b'existing'
+        assert _list_all(backend, delimiter='/') == [([], ['dir/'])]
+        info = backend.stat(_path('dir/existing.txt'))
+        assert (
+            info.generation
+            == os.stat(tmp_path / 'bucket/dir/existing.txt').st_mtime_ns // 1000
+        )
+
+    def test__mmap(self, tmp_path):
+        backend = gcspathlib.testing.LocalBackend(tmp_path)
+        backend.write(_path('file.txt'), b'data')
+        view = backend.read(_path('file.txt'), 1, 3)
+        assert isinstance(view.obj, mmap.mmap)
+        assert view.readonly
+        assert bytes(view) == b'at'
+
+    def test__prune_directories(self, tmp_path):
+        backend = gcspathlib.testing.LocalBackend(tmp_path)
+        backend.write(_path('dir/sub/file.txt'), b'')
+        backend.delete(_path('dir/sub/file.txt'))
+        assert not (tmp_path / 'bucket' / 'dir').exists()
+        assert (tmp_path / 'bucket').exists()
+
+    @pytest.mark.parametrize('prefix', ['', 'a', 'a.', 'di', 'dir/', 'dir/c/', 'dir/s'])
+    @pytest.mark.parametrize('delimiter', ['', '/'])
+    def test__list_like_memory(self, tmp_path, prefix, delimiter):
+        local = gcspathlib.testing.LocalBackend(tmp_path)
+        memory = gcspathlib.testing.MemoryBackend()
+        names = [
+            'a',
+            'a.txt',
+            'ab/x',
+            'dir/a',
+            'dir/b',
+            'dir/c/x',
+            'dir/c/y',
+            'dir/d',
+            'dir/sub/e',
+            'é',
+        ]
+        for name in names:
+            local.write(_path(name), b'')
+            memory.write(_path(name), b'')
+        for start_offset in ['', 'a.', 'dir/c', 'dir/c/y', 'dir/c0', 'dir/sub/f']:
+            for end_offset in ['', 'dir/b', 'dir/c/', 'dir/c/y', 'dir/sub/a']:
+                for max_results in [1, 1000]:
+                    query = dict(
+                        prefix=prefix,
+                        delimiter=delimiter,
+                        start_offset=start_offset,
+                        end_offset=end_offset,
+                        max_results=max_results,
+                    )
+                    assert _list_all(local, **query) == _list_all(memory, **query)
+
+    def test__unsupported(self, tmp_path):
+        backend = gcspathlib.testing.LocalBackend(tmp_path)
+        with pytest.raises(ValueError):
+            backend.write(_path('../escape.txt'), b'')
+        with pytest.raises(ValueError):
+            backend.write(gcspathlib.PureGCSPath('gs://.tmp/file.txt'), b'')
+        assert backend.list_page('bucket', prefix='../').items == []
+        backend.write(_path('file'), b'')
+        with pytest.raises(OSError):
+            backend.write(_path('file/conflict'), b'')
+        with pytest.raises(OSError):
+            backend.patch(_path('file'), {'contentType': 'text/plain'})
+        with pytest.raises(FileNotFoundError):
+            backend.patch(_path('missing'), {})
@@ -0,0 +1,99 @@
+import asyncio
+import gcspathlib
+import gcspathlib.aio
+import gcspathlib.testing
+import pytest
+from gcspathlib._jsonapi import object_target
+
+
+@pytest.fixture
+def local_server(tmp_path):
+    backend = gcspathlib.testing.LocalBackend(tmp_path)
+    with gcspathlib.testing.FakeServer(backend, page_size=3) as server:
+        yield server
+
+
+def _run(server, request):
+    async def main():
+        async with gcspathlib.aio.Client(server.url, retries=0) as client:
+            return await request(client)
+
+    return asyncio.run(main())
+
+
+class Test_FakeServer:
+    def test__local_backend(self, local_server, tmp_path):
+        path = gcspathlib.PureGCSPath('gs://bucket/dir/file.txt')
+
+        async def request(client):
+            info = await client.write(path, b'0123456789')
+            return info, await client.stat(path), await client.read(path, 2, 5)
+
+        info, stat, data = _run(local_server, request)
+        assert info == stat
+        assert data == b'234'
+        assert (tmp_path / 'bucket' / 'dir' / 'file.txt').read_bytes() == b'0123456789'
+
+    def test__generation(self, fake_server):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+
+        async def request(client):
+            first = (await client.write(path, b'1')).generation
+            second = (await client.write(path, b'2')).generation
+            data = await client.read(path, generation=second)
+            with pytest.raises(FileNotFoundError):
+                await client.read(path, generation=first)
+            with pytest.raises(FileNotFoundError):
+                await client.stat(path, generation=first)
+            return data
+
+        assert _run(fake_server, request) == b'2'
+
+    def test__delete_generation(self, fake_server):
+        path = gcspathlib.PureGCSPath('gs://bucket/file.txt')
+
+        async def request(client):
+            first = (await client.write(path, b'1')).generation
+            second = (await client.write(path, b'2')).generation
+            with pytest.raises(FileNotFoundError):
+                await client.request(
+                    'DELETE', object_target('bucket', 'file.txt', generation=first)
+                )
+            with pytest.raises(OSError, match='412'):
+                await client.request(
+                    'DELETE',
+                    object_target('bucket', 'file.txt', ifGenerationMatch=first),
+                )
+            await client.stat(path)
+            await client.request(
+                'DELETE',
+                object_target('bucket', 'file.txt', ifGenerationMatch=second),
+                ok_statuses=(204,),
+            )
+            with pytest.raises(FileNotFoundError):
+                await client.stat(path)
+
+        _run(fake_server, request)
+
+    def test__offsets(self, fake_server):
+        async def request(client):
+            for name in ['a', 'b', 'c', 'd']:
+                await client.write(gcspathlib.PureGCSPath('gs://bucket', name), b'')
+            return await client.list_page('bucket', start_offset='b', end_offset='d')
+
+        page = _run(fake_server, request)
+        assert [item['name'] for item in page.items] == ['b', 'c']
+
+    def test__errors(self, fake_server):
+        async def request(client):
+            with pytest.raises(FileNotFoundError):
+                await client.request('GET', '/storage/v1/b/bucket/o/missing')
+            with pytest.raises(FileNotFoundError):
+                await client.request('GET', '/storage/v1/unknown')
+            with pytest.raises(OSError) as excinfo:
+                await client.request('GET', '/storage/v1/b/bucket/o/dir%2F')
+            return excinfo.value
+
+        error = _run(fake_server, request)
+        assert not isinstance(error, FileNotFoundError)
+        assert 'dir/' in str(error)